@@ -384,14 +384,9 @@ def get_assets_for_run_id(graphene_info: "ResolveInfo", run_id: str) -> Sequence
 
     check.str_param(run_id, "run_id")
 
-    records = graphene_info.context.instance.all_logs(run_id, of_type=ASSET_EVENTS)
-    asset_keys = set(
-        [
-            record.get_dagster_event().asset_key
-            for record in records
-            if record.is_dagster_event and record.get_dagster_event().asset_key
-        ]
-    )
+    # only the asset keys are needed, so avoid deserializing the full event payloads
+    records = graphene_info.context.instance.get_lazy_records_for_run(run_id, of_type=ASSET_EVENTS)
+    asset_keys = set([record.asset_key for record in records if record.asset_key])
     return [GrapheneAsset(key=asset_key) for asset_key in asset_keys]
 
 
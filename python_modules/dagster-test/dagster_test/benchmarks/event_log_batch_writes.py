@@ -0,0 +1,166 @@
+# ruff: noqa: T201
+import argparse
+import tempfile
+import time
+from typing import Callable, Sequence, Tuple
+
+from dagster import AssetKey, AssetMaterialization, AssetObservation
+from dagster._core.events import (
+    AssetObservationData,
+    DagsterEvent,
+    DagsterEventType,
+    StepMaterializationData,
+)
+from dagster._core.events.log import EventLogEntry
+from dagster._core.storage.event_log import (
+    ConsolidatedSqliteEventLogStorage,
+    SqliteEventLogStorage,
+)
+from dagster._core.storage.event_log.base import EventLogStorage
+from dagster._core.utils import make_new_run_id
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Compare event log write throughput for the SQLite event log storages when events are written one
+at a time with `store_event` versus in batches with `store_event_batch`. Each run writes
+`--num-events` events, a third of which are asset materializations and observations (which are
+mirrored into the index shard and update the asset key index), with the remainder being plain log
+messages.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="event_log_batch_writes",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-events",
+    type=int,
+    default=3000,
+    help="Number of events to write for each storage/write-mode combination.",
+)
+
+parser.add_argument(
+    "--batch-size",
+    type=int,
+    default=500,
+    help="Number of events passed to each `store_event_batch` call.",
+)
+
+parser.add_argument(
+    "--num-assets",
+    type=int,
+    default=10,
+    help="Number of distinct asset keys the asset events are spread across.",
+)
+
+# ########################
+# ##### EVENTS
+# ########################
+
+
+def _log_event(run_id: str, i: int) -> EventLogEntry:
+    return EventLogEntry(
+        error_info=None,
+        level="debug",
+        user_message=f"log message {i}",
+        run_id=run_id,
+        timestamp=time.time(),
+        step_key="my_step",
+        job_name="my_job",
+    )
+
+
+def _asset_event(run_id: str, i: int, num_assets: int) -> EventLogEntry:
+    asset_key = AssetKey(f"asset_{i % num_assets}")
+    if i % 2:
+        dagster_event = DagsterEvent(
+            DagsterEventType.ASSET_MATERIALIZATION.value,
+            "my_job",
+            event_specific_data=StepMaterializationData(
+                AssetMaterialization(asset_key=asset_key, partition=str(i))
+            ),
+        )
+    else:
+        dagster_event = DagsterEvent(
+            DagsterEventType.ASSET_OBSERVATION.value,
+            "my_job",
+            event_specific_data=AssetObservationData(
+                AssetObservation(asset_key=asset_key, partition=str(i))
+            ),
+        )
+    return EventLogEntry(
+        error_info=None,
+        level="debug",
+        user_message="",
+        run_id=run_id,
+        timestamp=time.time(),
+        step_key="my_step",
+        job_name="my_job",
+        dagster_event=dagster_event,
+    )
+
+
+def build_events(num_events: int, num_assets: int) -> Sequence[EventLogEntry]:
+    run_id = make_new_run_id()
+    return [
+        _asset_event(run_id, i, num_assets) if i % 3 == 0 else _log_event(run_id, i)
+        for i in range(num_events)
+    ]
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def _write_one_at_a_time(storage: EventLogStorage, events: Sequence[EventLogEntry], _: int):
+    for event in events:
+        storage.store_event(event)
+
+
+def _write_batched(storage: EventLogStorage, events: Sequence[EventLogEntry], batch_size: int):
+    for i in range(0, len(events), batch_size):
+        storage.store_event_batch(events[i : i + batch_size])
+
+
+def main(num_events: int, batch_size: int, num_assets: int) -> None:
+    session = ProfilingSession(
+        name="Event log batch writes",
+        experiment_settings={
+            "num_events": num_events,
+            "batch_size": batch_size,
+            "num_assets": num_assets,
+        },
+    ).start()
+    session.log_start_message()
+
+    storage_classes = [SqliteEventLogStorage, ConsolidatedSqliteEventLogStorage]
+    write_modes: Sequence[Tuple[str, Callable]] = [
+        ("store_event", _write_one_at_a_time),
+        ("store_event_batch", _write_batched),
+    ]
+    throughputs = {}
+    for storage_class in storage_classes:
+        for mode_name, write_fn in write_modes:
+            events = build_events(num_events, num_assets)
+            with tempfile.TemporaryDirectory() as tmpdir:
+                storage = storage_class(tmpdir)
+                label = f"{storage_class.__name__}.{mode_name}"
+                start = time.time()
+                with session.logged_execution_time(label):
+                    write_fn(storage, events, batch_size)
+                throughputs[label] = num_events / (time.time() - start)
+                assert len(storage.get_logs_for_run(events[0].run_id)) == num_events
+                storage.dispose()
+
+    session.log_result_summary()
+    print()
+    for label, events_per_second in throughputs.items():
+        print(f"{label}: {events_per_second:,.0f} events/sec")
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_events, args.batch_size, args.num_assets)
@@ -0,0 +1,190 @@
+# ruff: noqa: T201
+import argparse
+import gc
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Sequence, Tuple
+
+from dagster import AssetKey, AssetMaterialization
+from dagster._core.events import DagsterEvent, DagsterEventType, StepMaterializationData
+from dagster._core.events.log import EventLogEntry
+from dagster._core.storage.event_log import ConsolidatedSqliteEventLogStorage
+from dagster._core.storage.event_log.base import EventLogStorage
+from dagster._core.utils import make_new_run_id
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Compare reading the event log of a single large run with `get_records_for_run`, which fully
+deserializes every EventLogEntry, against `get_lazy_records_for_run`, which only decodes the
+envelope of each record (run id, timestamp, step key, event type, asset key) and defers the
+deserialization of the nested DagsterEvent payload until it is accessed. Every `--asset-every`th
+event is an asset materialization carrying `--num-metadata-entries` metadata entries; the rest are
+log messages. For each read mode, reports the time to fetch the records and read the envelope of
+every record, and the memory retained by the fetched records. The last mode only reads the run id
+and asset key of each record, which lazy records get from indexed columns without parsing the event.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="lazy_event_records",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-events",
+    type=int,
+    default=100_000,
+    help="Number of events in the run.",
+)
+
+parser.add_argument(
+    "--asset-every",
+    type=int,
+    default=5,
+    help="Every nth event is an asset materialization.",
+)
+
+parser.add_argument(
+    "--num-metadata-entries",
+    type=int,
+    default=10,
+    help="Number of metadata entries on each asset materialization.",
+)
+
+parser.add_argument(
+    "--batch-size",
+    type=int,
+    default=1000,
+    help="Number of events written per `store_event_batch` call while populating the storage.",
+)
+
+# ########################
+# ##### EVENTS
+# ########################
+
+
+def _build_event(run_id: str, i: int, asset_every: int, num_metadata_entries: int):
+    dagster_event = None
+    if i % asset_every == 0:
+        dagster_event = DagsterEvent(
+            DagsterEventType.ASSET_MATERIALIZATION.value,
+            "my_job",
+            event_specific_data=StepMaterializationData(
+                AssetMaterialization(
+                    asset_key=AssetKey(["my_prefix", f"asset_{i % 100}"]),
+                    partition=str(i),
+                    metadata={
+                        f"entry_{j}": f"value {j} for event {i}"
+                        for j in range(num_metadata_entries)
+                    },
+                )
+            ),
+        )
+    return EventLogEntry(
+        error_info=None,
+        level="debug",
+        user_message=f"log message {i}",
+        run_id=run_id,
+        timestamp=time.time(),
+        step_key=f"step_{i % 20}",
+        job_name="my_job",
+        dagster_event=dagster_event,
+    )
+
+
+def populate(
+    storage: EventLogStorage,
+    num_events: int,
+    asset_every: int,
+    num_metadata_entries: int,
+    batch_size: int,
+) -> str:
+    run_id = make_new_run_id()
+    for start in range(0, num_events, batch_size):
+        storage.store_event_batch(
+            [
+                _build_event(run_id, i, asset_every, num_metadata_entries)
+                for i in range(start, min(start + batch_size, num_events))
+            ]
+        )
+    return run_id
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def _read_envelopes(records: Sequence[Any]) -> int:
+    # touch the fields commonly needed by summary readers
+    asset_keys = set()
+    for record in records:
+        _ = (record.run_id, record.timestamp, record.storage_id)
+        if record.asset_key:
+            asset_keys.add(record.asset_key)
+    return len(asset_keys)
+
+
+def _read_indexed_fields(records: Sequence[Any]) -> int:
+    return len({record.asset_key for record in records if record.run_id and record.asset_key})
+
+
+def _measure(
+    fn: Callable[[], Sequence[Any]],
+    read_fn: Callable[[Sequence[Any]], int] = _read_envelopes,
+) -> Tuple[float, int, Sequence[Any]]:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    records = fn()
+    read_fn(records)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    retained, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, retained, records
+
+
+def main(num_events: int, asset_every: int, num_metadata_entries: int, batch_size: int) -> None:
+    session = ProfilingSession(
+        name="Lazy event log records",
+        experiment_settings={
+            "num_events": num_events,
+            "asset_every": asset_every,
+            "num_metadata_entries": num_metadata_entries,
+        },
+    ).start()
+    session.log_start_message()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage = ConsolidatedSqliteEventLogStorage(tmpdir)
+        with session.logged_execution_time("Populate storage"):
+            run_id = populate(storage, num_events, asset_every, num_metadata_entries, batch_size)
+
+        results = {}
+        with session.logged_execution_time("get_records_for_run"):
+            results["get_records_for_run"] = _measure(
+                lambda: storage.get_records_for_run(run_id).records
+            )
+        with session.logged_execution_time("get_lazy_records_for_run"):
+            results["get_lazy_records_for_run"] = _measure(
+                lambda: storage.get_lazy_records_for_run(run_id)
+            )
+        with session.logged_execution_time("get_lazy_records_for_run (indexed fields)"):
+            results["get_lazy_records_for_run (indexed)"] = _measure(
+                lambda: storage.get_lazy_records_for_run(run_id), _read_indexed_fields
+            )
+        storage.dispose()
+
+    session.log_result_summary()
+    print()
+    print(f"{'read mode':<38}{'time (s)':>10}{'retained (MB)':>16}")
+    for label, (elapsed, retained, records) in results.items():
+        assert len(records) == num_events
+        print(f"{label:<38}{elapsed:>10.2f}{retained / 1024 / 1024:>16.1f}")
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_events, args.asset_every, args.num_metadata_entries, args.batch_size)
@@ -0,0 +1,159 @@
+# ruff: noqa: T201
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from typing import List
+
+from dagster import Field, In, Nothing, OpExecutionContext, job, op
+from dagster._core.definitions.reconstruct import build_reconstructable_job
+from dagster._core.events import DagsterEventType
+from dagster._core.execution.api import execute_job
+from dagster._core.test_utils import instance_for_test
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Measure how quickly the multiprocess executor reacts to steps finishing while many other steps are
+running. The job runs `--num-quiet` steps that do nothing until the run is over alongside a chain
+of `--chain-length` steps that each depend on the previous one. For every link of the chain, the
+latency between the upstream step succeeding (in its child process) and the parent process
+launching the downstream step is reported. With a warm worker pool, process startup is excluded
+from the measured time for all but the first steps.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="multiprocess_step_latency",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-quiet",
+    type=int,
+    default=31,
+    help="Number of steps that stay running without emitting events.",
+)
+
+parser.add_argument(
+    "--chain-length",
+    type=int,
+    default=20,
+    help="Number of sequentially dependent steps that are timed.",
+)
+
+parser.add_argument(
+    "--worker-pool",
+    action="store_true",
+    help="Execute steps in a warm worker pool instead of a new process per step.",
+)
+
+# ########################
+# ##### JOB
+# ########################
+
+
+@op(config_schema={"done_path": Field(str)})
+def quiet(context: OpExecutionContext) -> None:
+    while not os.path.exists(context.op_config["done_path"]):
+        time.sleep(0.1)
+
+
+@op(ins={"start_after": In(Nothing)}, config_schema={"done_path": Field(str), "last": Field(bool)})
+def chain_link(context: OpExecutionContext) -> None:
+    if context.op_config["last"]:
+        with open(context.op_config["done_path"], "w"):
+            pass
+
+
+def make_latency_job(num_quiet: int, chain_length: int):
+    @job
+    def latency_job():
+        for i in range(num_quiet):
+            quiet.alias(f"quiet_{i}")()
+        upstream = None
+        for i in range(chain_length):
+            link = chain_link.alias(f"chain_{i}")
+            upstream = link(upstream) if upstream is not None else link()
+
+    return latency_job
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_quiet: int, chain_length: int, worker_pool: bool) -> None:
+    session = ProfilingSession(
+        name="Multiprocess executor step launch latency",
+        experiment_settings={
+            "num_quiet": num_quiet,
+            "chain_length": chain_length,
+            "worker_pool": worker_pool,
+        },
+    ).start()
+    session.log_start_message()
+
+    recon_job = build_reconstructable_job(
+        "dagster_test.benchmarks.multiprocess_step_latency",
+        "make_latency_job",
+        reconstructable_kwargs={"num_quiet": num_quiet, "chain_length": chain_length},
+    )
+
+    with tempfile.TemporaryDirectory() as temp_dir, instance_for_test() as instance:
+        done_path = os.path.join(temp_dir, "done")
+        run_config = {
+            "execution": {
+                "config": {
+                    "multiprocess": {
+                        "max_concurrent": num_quiet + 1,
+                        **({"worker_pool": {}} if worker_pool else {}),
+                    }
+                }
+            },
+            "ops": {
+                **{f"quiet_{i}": {"config": {"done_path": done_path}} for i in range(num_quiet)},
+                **{
+                    f"chain_{i}": {
+                        "config": {"done_path": done_path, "last": i == chain_length - 1}
+                    }
+                    for i in range(chain_length)
+                },
+            },
+        }
+
+        with session.logged_execution_time("Execute job"):
+            with execute_job(recon_job, instance=instance, run_config=run_config) as result:
+                assert result.success
+                run_id = result.run_id
+
+        success_times = {}
+        starting_times = {}
+        for record in instance.all_logs(run_id):
+            if record.step_key is None or not record.step_key.startswith("chain_"):
+                continue
+            if record.dagster_event_type == DagsterEventType.STEP_SUCCESS:
+                success_times[record.step_key] = record.timestamp
+            elif record.dagster_event_type == DagsterEventType.STEP_WORKER_STARTING:
+                starting_times[record.step_key] = record.timestamp
+
+    latencies: List[float] = [
+        starting_times[f"chain_{i}"] - success_times[f"chain_{i - 1}"]
+        for i in range(1, chain_length)
+    ]
+
+    session.log_result_summary()
+    print()
+    print(f"{'statistic':<20}{'launch latency (ms)':>22}")
+    for name, value in [
+        ("min", min(latencies)),
+        ("median", statistics.median(latencies)),
+        ("max", max(latencies)),
+    ]:
+        print(f"{name:<20}{value * 1000:>22.1f}")
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_quiet, args.chain_length, args.worker_pool)
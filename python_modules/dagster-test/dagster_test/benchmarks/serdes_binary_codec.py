@@ -0,0 +1,171 @@
+# ruff: noqa: T201
+import argparse
+import os
+import time
+from typing import Any, Callable, List, Sequence
+
+from dagster import (
+    AssetExecutionContext,
+    DagsterInstance,
+    DailyPartitionsDefinition,
+    Definitions,
+    MaterializeResult,
+    asset,
+    define_asset_job,
+)
+from dagster._core.events.log import EventLogEntry
+from dagster._core.remote_representation.external_data import (
+    ExternalRepositoryData,
+    external_repository_data_from_def,
+)
+from dagster._serdes import (
+    deserialize_value,
+    deserialize_value_from_bytes,
+    serialize_value,
+    serialize_value_to_bytes,
+)
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Compare the JSON serdes path (`serialize_value`/`deserialize_value`) with the msgpack encoding of
+`serialize_value_to_bytes`/`deserialize_value_from_bytes` (DAGSTER_SERDES_MSGPACK=1) on two
+corpora: the `ExternalRepositoryData` snapshot of a repository with `--num-assets` partitioned
+assets, and the `EventLogEntry` records produced by materializing those assets. Reports encoded
+size and the best of `--num-iterations` timings for encoding and decoding each corpus.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="serdes_binary_codec",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-assets",
+    type=int,
+    default=200,
+    help="Number of assets in the repository.",
+)
+
+parser.add_argument(
+    "--num-iterations",
+    type=int,
+    default=5,
+    help="Number of times each corpus is encoded and decoded.",
+)
+
+# ########################
+# ##### CORPORA
+# ########################
+
+
+def build_definitions(num_assets: int) -> Definitions:
+    partitions_def = DailyPartitionsDefinition(start_date="2023-01-01")
+    assets = []
+    for i in range(num_assets):
+
+        @asset(
+            name=f"asset_{i}",
+            deps=[f"asset_{i - 1}"] if i > 0 else [],
+            partitions_def=partitions_def,
+            group_name=f"group_{i % 10}",
+            metadata={"owner": "team@example.com", "index": i},
+            description=f"Asset number {i}.",
+        )
+        def _asset(context: AssetExecutionContext) -> MaterializeResult:
+            return MaterializeResult(metadata={"partition": context.partition_key, "rows": 100})
+
+        assets.append(_asset)
+
+    return Definitions(
+        assets=assets, jobs=[define_asset_job("all_assets", partitions_def=partitions_def)]
+    )
+
+
+def build_repository_data(defs: Definitions) -> ExternalRepositoryData:
+    return external_repository_data_from_def(defs.get_repository_def())
+
+
+def build_event_log_entries(defs: Definitions) -> Sequence[EventLogEntry]:
+    with DagsterInstance.ephemeral() as instance:
+        result = defs.get_job_def("all_assets").execute_in_process(
+            instance=instance, partition_key="2023-01-01"
+        )
+        return [
+            record.event_log_entry for record in instance.get_records_for_run(result.run_id).records
+        ]
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def _best_time(fn: Callable[[], Any], num_iterations: int) -> float:
+    timings: List[float] = []
+    for _ in range(num_iterations):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(num_assets: int, num_iterations: int) -> None:
+    session = ProfilingSession(
+        name="Serdes binary codec",
+        experiment_settings={"num_assets": num_assets, "num_iterations": num_iterations},
+    ).start()
+    session.log_start_message()
+
+    defs = build_definitions(num_assets)
+    with session.logged_execution_time("Build corpora"):
+        repository_data = build_repository_data(defs)
+        event_log_entries = build_event_log_entries(defs)
+
+    corpora = {
+        "ExternalRepositoryData": [repository_data],
+        f"EventLogEntry (x{len(event_log_entries)})": event_log_entries,
+    }
+    codecs = {
+        "json": (serialize_value, deserialize_value, False),
+        "msgpack": (serialize_value_to_bytes, deserialize_value_from_bytes, True),
+    }
+    results = []
+    for corpus_name, values in corpora.items():
+        for codec_name, (serialize, deserialize, use_msgpack) in codecs.items():
+            if use_msgpack:
+                os.environ["DAGSTER_SERDES_MSGPACK"] = "1"
+            else:
+                os.environ.pop("DAGSTER_SERDES_MSGPACK", None)
+            serialized = [serialize(value) for value in values]
+            assert [deserialize(s) for s in serialized] == values
+            with session.logged_execution_time(f"{corpus_name} {codec_name}"):
+                encode_time = _best_time(
+                    lambda: [serialize(value) for value in values], num_iterations
+                )
+                decode_time = _best_time(
+                    lambda: [deserialize(s) for s in serialized], num_iterations
+                )
+            results.append(
+                (
+                    corpus_name,
+                    codec_name,
+                    sum(len(s) for s in serialized),
+                    encode_time,
+                    decode_time,
+                )
+            )
+
+    session.log_result_summary()
+    print()
+    print(f"{'corpus':<28}{'codec':<8}{'bytes':>12}{'encode (ms)':>14}{'decode (ms)':>14}")
+    for corpus_name, codec_name, size, encode_time, decode_time in results:
+        print(
+            f"{corpus_name:<28}{codec_name:<8}{size:>12,}"
+            f"{encode_time * 1000:>14.1f}{decode_time * 1000:>14.1f}"
+        )
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_assets, args.num_iterations)
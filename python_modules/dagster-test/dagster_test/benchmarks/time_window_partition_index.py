@@ -0,0 +1,142 @@
+# ruff: noqa: T201
+import argparse
+import time
+from datetime import datetime
+from typing import Any, Callable, List, Tuple
+
+import pendulum
+from dagster import HourlyPartitionsDefinition
+from dagster._core.definitions.time_window_partitions import TimeWindowPartitionsDefinition
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Measure the cost of partition index, key and timestamp conversions on a
+`HourlyPartitionsDefinition` spanning `--num-years` years (87,600 partitions for the default of 10
+years). Operations near the end of the partition range are the worst case for implementations that
+walk the cron schedule from the start of the partitions definition. Reports the best of
+`--num-iterations` timings for each operation, for both a UTC and a DST-observing timezone.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="time_window_partition_index",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-years",
+    type=int,
+    default=10,
+    help="Number of years of hourly partitions.",
+)
+
+parser.add_argument(
+    "--num-iterations",
+    type=int,
+    default=5,
+    help="Number of times each operation is timed.",
+)
+
+# ########################
+# ##### OPERATIONS
+# ########################
+
+
+def build_operations(
+    partitions_def: TimeWindowPartitionsDefinition,
+    end_offset_partitions_def: TimeWindowPartitionsDefinition,
+    current_time: datetime,
+) -> List[Tuple[str, Callable[[], Any]]]:
+    num_partitions = partitions_def.get_num_partitions(current_time=current_time)
+    last_partition_key = partitions_def.get_partition_keys_between_indexes(
+        num_partitions - 1, num_partitions, current_time=current_time
+    )[0]
+    last_timestamp = partitions_def.time_window_for_partition_key(
+        last_partition_key
+    ).start.timestamp()
+    recent_partition_keys = frozenset(
+        partitions_def.get_partition_keys_between_indexes(
+            num_partitions - 1000, num_partitions, current_time=current_time
+        )
+    )
+
+    return [
+        ("get_num_partitions", lambda: partitions_def.get_num_partitions(current_time)),
+        (
+            "get_partition_keys_between_indexes (last 100)",
+            lambda: partitions_def.get_partition_keys_between_indexes(
+                num_partitions - 100, num_partitions, current_time=current_time
+            ),
+        ),
+        (
+            "get_last_partition_key (end_offset=1)",
+            lambda: end_offset_partitions_def.get_last_partition_key(current_time),
+        ),
+        (
+            "get_partition_key_for_timestamp (x1000)",
+            lambda: [
+                partitions_def.get_partition_key_for_timestamp(last_timestamp - i * 1800)
+                for i in range(1000)
+            ],
+        ),
+        (
+            "has_partition_key (x1000)",
+            lambda: [
+                partitions_def.has_partition_key(key, current_time=current_time)
+                for key in recent_partition_keys
+            ],
+        ),
+        (
+            "time_windows_for_partition_keys (1000 keys)",
+            lambda: partitions_def.time_windows_for_partition_keys.__wrapped__(
+                partitions_def, recent_partition_keys
+            ),
+        ),
+    ]
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def _best_time(fn: Callable[[], Any], num_iterations: int) -> float:
+    timings: List[float] = []
+    for _ in range(num_iterations):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(num_years: int, num_iterations: int) -> None:
+    session = ProfilingSession(
+        name="Time window partition index arithmetic",
+        experiment_settings={"num_years": num_years, "num_iterations": num_iterations},
+    ).start()
+    session.log_start_message()
+
+    current_time = pendulum.datetime(2024, 1, 1, tz="UTC")
+    start_date = f"{2024 - num_years}-01-01-00:00"
+
+    results = []
+    for timezone in ["UTC", "America/New_York"]:
+        partitions_def = HourlyPartitionsDefinition(start_date=start_date, timezone=timezone)
+        end_offset_partitions_def = HourlyPartitionsDefinition(
+            start_date=start_date, timezone=timezone, end_offset=1
+        )
+        operations = build_operations(partitions_def, end_offset_partitions_def, current_time)
+        with session.logged_execution_time(f"Hourly partitions ({timezone})"):
+            for name, operation in operations:
+                results.append((timezone, name, _best_time(operation, num_iterations)))
+
+    session.log_result_summary()
+    print()
+    print(f"{'timezone':<20}{'operation':<50}{'time (ms)':>12}")
+    for timezone, name, duration in results:
+        print(f"{timezone:<20}{name:<50}{duration * 1000:>12.2f}")
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_years, args.num_iterations)
@@ -223,6 +223,8 @@ def dagster_webserver(
             read_only=read_only,
             kwargs=kwargs,
             code_server_log_level=code_server_log_level,
+            # serve the UI right away, showing code locations as loading until they have loaded
+            load_in_background=True,
         ) as workspace_process_context:
             host_dagster_ui_with_workspace_process_context(
                 workspace_process_context,
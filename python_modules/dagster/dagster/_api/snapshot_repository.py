@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Mapping
+from typing import TYPE_CHECKING, Mapping, Optional
 
 import dagster._check as check
 from dagster._core.errors import DagsterUserCodeProcessError
@@ -6,28 +6,51 @@
     ExternalRepositoryData,
     ExternalRepositoryErrorData,
 )
+from dagster._core.remote_representation.external_data_delta import (
+    ExternalRepositoryDataDelta,
+    RepositorySnapshotCache,
+)
 from dagster._serdes import deserialize_value
 
 if TYPE_CHECKING:
-    from dagster._core.remote_representation import CodeLocation
+    from dagster._core.remote_representation import CodeLocation, RemoteRepositoryOrigin
     from dagster._grpc.client import DagsterGrpcClient
 
 
 def sync_get_streaming_external_repositories_data_grpc(
-    api_client: "DagsterGrpcClient", code_location: "CodeLocation"
+    api_client: "DagsterGrpcClient",
+    code_location: "CodeLocation",
+    snapshot_cache: Optional[RepositorySnapshotCache] = None,
 ) -> Mapping[str, ExternalRepositoryData]:
     from dagster._core.remote_representation import CodeLocation, RemoteRepositoryOrigin
 
     check.inst_param(code_location, "code_location", CodeLocation)
+    check.opt_inst_param(snapshot_cache, "snapshot_cache", RepositorySnapshotCache)
+
+    # Repository snapshots are always requested as deltas, so that the server only needs to keep
+    # their content-addressed form. Without a cache from a previous load, every entry is requested.
+    delta_snapshot_cache = (
+        snapshot_cache if snapshot_cache is not None else RepositorySnapshotCache()
+    )
 
     repo_datas = {}
     for repository_name in code_location.repository_names:  # type: ignore
+        external_repository_origin = RemoteRepositoryOrigin(
+            code_location.origin,
+            repository_name,
+        )
+
+        repository_data = _get_external_repository_data_from_delta(
+            api_client, external_repository_origin, delta_snapshot_cache
+        )
+        if repository_data is not None:
+            repo_datas[repository_name] = repository_data
+            continue
+
+        # Older servers do not implement the delta API, fall back to the full snapshot
         external_repository_chunks = list(
             api_client.streaming_external_repository(
-                external_repository_origin=RemoteRepositoryOrigin(
-                    code_location.origin,
-                    repository_name,
-                )
+                external_repository_origin=external_repository_origin
             )
         )
 
@@ -45,4 +68,31 @@ def sync_get_streaming_external_repositories_data_grpc(
             raise DagsterUserCodeProcessError.from_error_info(result.error)
 
         repo_datas[repository_name] = result
+
+    if snapshot_cache is not None:
+        snapshot_cache.retain_repositories(set(repo_datas.keys()))
+
     return repo_datas
+
+
+def _get_external_repository_data_from_delta(
+    api_client: "DagsterGrpcClient",
+    external_repository_origin: "RemoteRepositoryOrigin",
+    snapshot_cache: RepositorySnapshotCache,
+) -> Optional[ExternalRepositoryData]:
+    serialized_delta = api_client.streaming_external_repository_delta(
+        external_repository_origin=external_repository_origin,
+        known_entry_hashes=snapshot_cache.known_entry_hashes,
+    )
+    if serialized_delta is None:
+        return None
+
+    result = deserialize_value(
+        serialized_delta,
+        (ExternalRepositoryDataDelta, ExternalRepositoryErrorData),
+    )
+
+    if isinstance(result, ExternalRepositoryErrorData):
+        raise DagsterUserCodeProcessError.from_error_info(result.error)
+
+    return snapshot_cache.apply_delta(result)
@@ -270,6 +270,7 @@ def get_workspace_process_context_from_kwargs(
     read_only: bool,
     kwargs: ClickArgMapping,
     code_server_log_level: str = "INFO",
+    load_in_background: bool = False,
 ) -> "WorkspaceProcessContext":
     from dagster._core.workspace.context import WorkspaceProcessContext
 
@@ -279,6 +280,7 @@ def get_workspace_process_context_from_kwargs(
         version=version,
         read_only=read_only,
         code_server_log_level=code_server_log_level,
+        load_in_background=load_in_background,
     )
 
 
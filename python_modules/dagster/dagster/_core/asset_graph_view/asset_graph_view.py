@@ -15,6 +15,7 @@
 from dagster._core.definitions.multi_dimensional_partitions import (
     MultiPartitionKey,
     MultiPartitionsDefinition,
+    MultiPartitionsSubset,
     PartitionDimensionDefinition,
 )
 from dagster._core.definitions.partition import (
@@ -199,6 +200,15 @@ def time_windows(self) -> Sequence[TimeWindow]:
                 self._asset_graph_view.effective_dt
             )
             return [TimeWindow(datetime.min, last_tw.end)] if last_tw else []
+        elif isinstance(self._compatible_subset.subset_value, MultiPartitionsSubset):
+            # the time window dimension is the primary dimension, so each row of the subset is a
+            # time window subset
+            subset_from_tw = tw_partitions_def.empty_subset()
+            for subset in self._compatible_subset.subset_value.subsets_by_secondary_key.values():
+                subset_from_tw = subset_from_tw | subset
+            return check.inst(
+                subset_from_tw, BaseTimeWindowPartitionsSubset, "Must be time window subset."
+            ).included_time_windows
         elif isinstance(self._compatible_subset.subset_value, DefaultPartitionsSubset):
             check.inst(
                 self._partitions_def,
@@ -92,6 +92,7 @@ def __init__(
         respect_materialization_data_versions: bool,
         logger: logging.Logger,
         evaluation_time: Optional[datetime.datetime] = None,
+        reuse_unchanged_evaluations: bool = False,
     ):
         from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
 
@@ -119,6 +120,7 @@ def __init__(
         self._observe_run_tags = observe_run_tags
         self._auto_observe_asset_keys = auto_observe_asset_keys or set()
         self._respect_materialization_data_versions = respect_materialization_data_versions
+        self._reuse_unchanged_evaluations = reuse_unchanged_evaluations
         self._logger = logger
 
         # cache data before the tick starts
@@ -206,6 +208,8 @@ def get_asset_condition_evaluations(
             data_time_resolver=self.data_time_resolver,
             respect_materialization_data_versions=self.respect_materialization_data_versions,
             auto_materialize_run_tags=self.auto_materialize_run_tags,
+            max_workers=self.instance_queryer.instance.auto_materialize_num_evaluation_workers,
+            reuse_unchanged_evaluations=self._reuse_unchanged_evaluations,
         )
         return evaluator.evaluate()
 
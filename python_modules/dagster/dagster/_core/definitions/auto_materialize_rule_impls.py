@@ -34,7 +34,7 @@
 )
 from dagster._core.errors import DagsterInvariantViolationError
 from dagster._core.event_api import AssetRecordsFilter
-from dagster._core.storage.dagster_run import IN_PROGRESS_RUN_STATUSES, RunsFilter
+from dagster._core.storage.dagster_run import RunsFilter
 from dagster._core.storage.tags import AUTO_MATERIALIZE_TAG
 from dagster._serdes.serdes import (
     whitelist_for_serdes,
@@ -1116,21 +1116,16 @@ def evaluate_for_asset(self, context: "SchedulingContext") -> "SchedulingResult"
             raise DagsterInvariantViolationError(
                 "SkipOnRunInProgressRule is currently only support for non-partitioned assets."
             )
-        instance = context.legacy_context.instance_queryer.instance
-        planned_materialization_info = (
-            instance.event_log_storage.get_latest_planned_materialization_info(
-                context.legacy_context.asset_key
+        # shares the lookup of the latest planned run with the rest of the evaluation
+        if not context.legacy_context.instance_queryer.get_in_progress_asset_subset(
+            asset_key=context.legacy_context.asset_key
+        ).is_empty:
+            return SchedulingResult.create(
+                context,
+                context.asset_graph_view.get_asset_slice_from_valid_subset(
+                    context.legacy_context.candidate_subset
+                ),
             )
-        )
-        if planned_materialization_info:
-            dagster_run = instance.get_run_by_id(planned_materialization_info.run_id)
-            if dagster_run and dagster_run.status in IN_PROGRESS_RUN_STATUSES:
-                return SchedulingResult.create(
-                    context,
-                    context.asset_graph_view.get_asset_slice_from_valid_subset(
-                        context.legacy_context.candidate_subset
-                    ),
-                )
         return SchedulingResult.create(
             context,
             context.asset_graph_view.get_asset_slice_from_valid_subset(
@@ -3,6 +3,7 @@
 import logging
 import time
 from collections import defaultdict
+from contextlib import nullcontext
 from typing import (
     TYPE_CHECKING,
     AbstractSet,
@@ -26,6 +27,9 @@
     SchedulingEvaluationInfo,
 )
 from dagster._core.definitions.events import AssetKey, AssetKeyPartitionKey
+from dagster._core.definitions.time_window_partitions import TimeWindowPartitionsDefinition
+from dagster._core.utils import InheritContextThreadPoolExecutor
+from dagster._utils.schedules import cron_string_iterator
 
 from ..asset_daemon_cursor import AssetDaemonCursor
 from ..base_asset_graph import BaseAssetGraph
@@ -33,15 +37,21 @@
 from .legacy.legacy_context import (
     LegacyRuleEvaluationContext,
 )
+from .scheduling_condition import SchedulingCondition
 from .serialized_objects import (
+    AssetConditionEvaluation,
     AssetConditionEvaluationState,
 )
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
+
     from dagster._utils.caching_instance_queryer import (
         CachingInstanceQueryer,
     )
 
+    from ..auto_materialize_rule import AutoMaterializeRule
+
 from dataclasses import dataclass
 
 
@@ -62,6 +72,12 @@ def __init__(
         # as https://docs.dagster.io/deployment/dagster-instance#auto-materialize
         # Should this be a supported feature in DS?
         auto_materialize_run_tags: Mapping[str, str],
+        # If set to more than one, the assets at each topological level of the asset graph are
+        # evaluated concurrently on a pool of this many threads
+        max_workers: Optional[int] = None,
+        # If set, assets whose inputs provably have not changed since the previous tick reuse their
+        # previous evaluation state instead of being evaluated again
+        reuse_unchanged_evaluations: bool = False,
     ):
         self.asset_graph = asset_graph
         self.asset_keys = asset_keys
@@ -71,11 +87,15 @@ def __init__(
         self.data_time_resolver = data_time_resolver
         self.respect_materialization_data_versions = respect_materialization_data_versions
         self.auto_materialize_run_tags = auto_materialize_run_tags
+        self.max_workers = max_workers
+        self.reuse_unchanged_evaluations = reuse_unchanged_evaluations
 
         self.evaluation_state_by_key = {}
         self.current_evaluation_info_by_key = {}
         self.expected_data_time_mapping = defaultdict()
         self.to_request = set()
+        self.reused_asset_keys = set()
+        self.query_counts_by_asset_key = {}
         self.num_checked_assets = 0
         self.num_asset_keys = len(asset_keys)
 
@@ -86,6 +106,10 @@ def __init__(
     current_evaluation_info_by_key: Dict[AssetKey, SchedulingEvaluationInfo]
     expected_data_time_mapping: Dict[AssetKey, Optional[datetime.datetime]]
     to_request: Set[AssetKeyPartitionKey]
+    reused_asset_keys: Set[AssetKey]
+    # the queries issued while evaluating each asset, keyed by query type, excluding the queries
+    # which prefetch data for a whole topological level
+    query_counts_by_asset_key: Dict[AssetKey, Mapping[str, int]]
     num_checked_assets: int
     num_asset_keys: int
     logger: logging.Logger
@@ -93,89 +117,229 @@ def __init__(
     data_time_resolver: CachingDataTimeResolver
     respect_materialization_data_versions: bool
     auto_materialize_run_tags: Mapping[str, str]
+    max_workers: Optional[int]
+    reuse_unchanged_evaluations: bool
 
     @property
     def instance_queryer(self) -> "CachingInstanceQueryer":
         return self.asset_graph_view.get_inner_queryer_for_back_compat()
 
+    @property
+    def query_counts(self) -> Mapping[str, int]:
+        """The queries issued to the instance during the evaluation, keyed by query type."""
+        return self.instance_queryer.query_counts
+
     def evaluate(
         self,
     ) -> Tuple[Sequence[AssetConditionEvaluationState], AbstractSet[AssetKeyPartitionKey]]:
-        for asset_key in self.asset_graph.toposorted_asset_keys:
-            # an asset may have already been visited if it was part of a non-subsettable multi-asset
-            if asset_key not in self.asset_keys:
+        with InheritContextThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="scheduling_condition_evaluator_worker",
+        ) if self.max_workers and self.max_workers > 1 else nullcontext() as executor:
+            return self._evaluate(executor)
+
+    def _evaluate(
+        self, executor: Optional[InheritContextThreadPoolExecutor]
+    ) -> Tuple[Sequence[AssetConditionEvaluationState], AbstractSet[AssetKeyPartitionKey]]:
+        for level, level_asset_keys in enumerate(self.asset_graph.toposorted_asset_keys_by_level):
+            asset_keys = sorted(level_asset_keys & self.asset_keys)
+            if not asset_keys:
                 continue
 
-            self.num_checked_assets = self.num_checked_assets + 1
-            start_time = time.time()
+            num_queries_before_level = self.instance_queryer.total_query_count
+            self.prefetch_for_asset_keys(asset_keys)
+            if executor is None:
+                for asset_key in asset_keys:
+                    self.evaluate_asset_and_update_results(asset_key)
+            else:
+                self.evaluate_level_concurrently(executor, asset_keys)
             self.logger.debug(
-                "Evaluating asset"
-                f" {asset_key.to_user_string()} ({self.num_checked_assets}/{self.num_asset_keys})"
+                f"Evaluated {len(asset_keys)} assets at topological level {level} with"
+                f" {self.instance_queryer.total_query_count - num_queries_before_level} queries"
+            )
+
+        self.logger.debug(
+            f"Reused the previous evaluation state of {len(self.reused_asset_keys)} of"
+            f" {self.num_checked_assets} assets, as their inputs were unchanged"
+        )
+        query_counts = self.query_counts
+        self.logger.debug(
+            f"Issued {sum(query_counts.values())} queries while evaluating"
+            f" {self.num_checked_assets} assets: "
+            + ", ".join(
+                f"{query_type}={count}" for query_type, count in sorted(query_counts.items())
+            )
+        )
+        return (list(self.evaluation_state_by_key.values()), self.to_request)
+
+    def prefetch_for_asset_keys(self, asset_keys: Sequence[AssetKey]) -> None:
+        """Fetches the instance data needed to evaluate a level of the asset graph, for the assets
+        in that level and their parents, in a small number of bulk queries.
+        """
+        asset_keys_to_prefetch = set(asset_keys)
+        for asset_key in asset_keys:
+            asset_keys_to_prefetch |= self.asset_graph.get(asset_key).parent_keys
+        self.instance_queryer.prefetch_for_asset_keys(
+            asset_keys_to_prefetch,
+            run_record_asset_keys=[
+                asset_key for asset_key in asset_keys if self.reads_run_records(asset_key)
+            ],
+        )
+
+    def reads_run_records(self, asset_key: AssetKey) -> bool:
+        """Returns True if evaluating the given asset may read the latest run that targeted it."""
+        from ..auto_materialize_rule_impls import SkipOnRunInProgressRule
+
+        asset = self.asset_graph.get(asset_key)
+        if self.asset_graph.get_downstream_freshness_policies(asset_key=asset_key):
+            # the data time of the asset accounts for its latest run if that run failed
+            return True
+        elif asset.is_partitioned:
+            # the in progress and failed partitions are read from the asset status cache
+            return False
+
+        auto_materialize_policy = check.not_none(asset.auto_materialize_policy)
+        return auto_materialize_policy.asset_condition is not None or any(
+            isinstance(rule, SkipOnRunInProgressRule) for rule in auto_materialize_policy.rules
+        )
+
+    def evaluate_level_concurrently(
+        self, executor: InheritContextThreadPoolExecutor, asset_keys: Sequence[AssetKey]
+    ) -> None:
+        """Evaluates the assets of a single topological level on the given executor. Assets in the
+        same level do not depend on each other, so each one only reads the results of previous
+        levels, which are copied so that they are not mutated while being read.
+
+        The members of non-subsettable multi-assets are evaluated serially instead, after the
+        results of the assets sorted before them have been recorded, as their results may depend
+        on each other. Results are recorded in sorted order, so the outcome of a level is the same
+        as when evaluating it serially.
+        """
+        evaluation_state_by_key = dict(self.evaluation_state_by_key)
+        expected_data_time_mapping = dict(self.expected_data_time_mapping)
+        current_evaluation_info_by_key = dict(self.current_evaluation_info_by_key)
+
+        futures: Dict[AssetKey, "Future"] = {}
+        for asset_key in asset_keys:
+            if len(self.asset_graph.get(asset_key).execution_set_asset_keys) > 1:
+                continue
+            self.num_checked_assets = self.num_checked_assets + 1
+            futures[asset_key] = executor.submit(
+                self._evaluate_asset_with_logging,
+                asset_key,
+                self.num_checked_assets,
+                evaluation_state_by_key,
+                expected_data_time_mapping,
+                current_evaluation_info_by_key,
             )
 
-            try:
+        for asset_key in asset_keys:
+            if asset_key in futures:
+                evaluation_state, expected_data_time, query_counts = futures[asset_key].result()
+                self._update_results(asset_key, evaluation_state, expected_data_time, query_counts)
+            else:
+                self.evaluate_asset_and_update_results(asset_key)
+
+    def evaluate_asset_and_update_results(self, asset_key: AssetKey) -> None:
+        self.num_checked_assets = self.num_checked_assets + 1
+        evaluation_state, expected_data_time, query_counts = self._evaluate_asset_with_logging(
+            asset_key,
+            self.num_checked_assets,
+            self.evaluation_state_by_key,
+            self.expected_data_time_mapping,
+            self.current_evaluation_info_by_key,
+        )
+        self._update_results(asset_key, evaluation_state, expected_data_time, query_counts)
+
+    def _evaluate_asset_with_logging(
+        self,
+        asset_key: AssetKey,
+        num_checked_assets: int,
+        evaluation_state_by_key: Mapping[AssetKey, AssetConditionEvaluationState],
+        expected_data_time_mapping: Mapping[AssetKey, Optional[datetime.datetime]],
+        current_evaluation_info_by_key: Mapping[AssetKey, SchedulingEvaluationInfo],
+    ) -> Tuple[AssetConditionEvaluationState, Optional[datetime.datetime], Mapping[str, int]]:
+        start_time = time.time()
+        self.logger.debug(
+            "Evaluating asset"
+            f" {asset_key.to_user_string()} ({num_checked_assets}/{self.num_asset_keys})"
+        )
+
+        try:
+            with self.instance_queryer.count_queries() as query_counts:
                 (evaluation_state, expected_data_time) = self.evaluate_asset(
                     asset_key,
-                    self.evaluation_state_by_key,
-                    self.expected_data_time_mapping,
-                    self.current_evaluation_info_by_key,
+                    evaluation_state_by_key,
+                    expected_data_time_mapping,
+                    current_evaluation_info_by_key,
                 )
-            except Exception as e:
-                raise Exception(
-                    f"Error while evaluating conditions for asset {asset_key.to_user_string()}"
-                ) from e
+        except Exception as e:
+            raise Exception(
+                f"Error while evaluating conditions for asset {asset_key.to_user_string()}"
+            ) from e
 
-            num_requested = evaluation_state.true_subset.size
-            log_fn = self.logger.info if num_requested > 0 else self.logger.debug
+        num_requested = evaluation_state.true_subset.size
+        log_fn = self.logger.info if num_requested > 0 else self.logger.debug
 
-            to_request_asset_partitions = evaluation_state.true_subset.asset_partitions
-            to_request_str = ",".join(
-                [(ap.partition_key or "No partition") for ap in to_request_asset_partitions]
-            )
-            self.to_request |= to_request_asset_partitions
+        to_request_str = ",".join(
+            [
+                (ap.partition_key or "No partition")
+                for ap in evaluation_state.true_subset.asset_partitions
+            ]
+        )
+        log_fn(
+            f"Asset {asset_key.to_user_string()} evaluation result: {num_requested}"
+            f" requested ({to_request_str}) ({format(time.time()-start_time, '.3f')} seconds,"
+            f" {sum(query_counts.values())} queries)"
+        )
+        return evaluation_state, expected_data_time, dict(query_counts)
 
-            log_fn(
-                f"Asset {asset_key.to_user_string()} evaluation result: {num_requested}"
-                f" requested ({to_request_str}) ({format(time.time()-start_time, '.3f')} seconds)"
-            )
+    def _update_results(
+        self,
+        asset_key: AssetKey,
+        evaluation_state: AssetConditionEvaluationState,
+        expected_data_time: Optional[datetime.datetime],
+        query_counts: Mapping[str, int],
+    ) -> None:
+        num_requested = evaluation_state.true_subset.size
+        self.to_request |= evaluation_state.true_subset.asset_partitions
+        self.query_counts_by_asset_key[asset_key] = query_counts
 
-            self.evaluation_state_by_key[asset_key] = evaluation_state
-            self.current_evaluation_info_by_key[asset_key] = (
-                SchedulingEvaluationInfo.from_asset_condition_evaluation_state(
-                    self.asset_graph_view, evaluation_state
-                )
+        self.evaluation_state_by_key[asset_key] = evaluation_state
+        self.current_evaluation_info_by_key[asset_key] = (
+            SchedulingEvaluationInfo.from_asset_condition_evaluation_state(
+                self.asset_graph_view, evaluation_state
             )
-            self.expected_data_time_mapping[asset_key] = expected_data_time
-
-            # if we need to materialize any partitions of a non-subsettable multi-asset, we need to
-            # materialize all of them
-            execution_set_keys = self.asset_graph.get(asset_key).execution_set_asset_keys
-            if len(execution_set_keys) > 1 and num_requested > 0:
-                for neighbor_key in execution_set_keys:
-                    self.expected_data_time_mapping[neighbor_key] = expected_data_time
-
-                    # make sure that the true_subset of the neighbor is accurate -- when it was
-                    # evaluated it may have had a different requested AssetSubset. however, because
-                    # all these neighbors must be executed as a unit, we need to union together
-                    # the subset of all required neighbors
-                    if neighbor_key in self.evaluation_state_by_key:
-                        neighbor_evaluation_state = self.evaluation_state_by_key[neighbor_key]
-                        self.evaluation_state_by_key[neighbor_key] = dataclasses.replace(
-                            neighbor_evaluation_state,
-                            previous_evaluation=neighbor_evaluation_state.previous_evaluation.copy(
-                                update={
-                                    "true_subset": neighbor_evaluation_state.true_subset.copy(
-                                        update={"asset_key": neighbor_key}
-                                    )
-                                }
-                            ),
-                        )
-                    self.to_request |= {
-                        ap._replace(asset_key=neighbor_key)
-                        for ap in evaluation_state.true_subset.asset_partitions
-                    }
+        )
+        self.expected_data_time_mapping[asset_key] = expected_data_time
 
-        return (list(self.evaluation_state_by_key.values()), self.to_request)
+        # if we need to materialize any partitions of a non-subsettable multi-asset, we need to
+        # materialize all of them
+        execution_set_keys = self.asset_graph.get(asset_key).execution_set_asset_keys
+        if len(execution_set_keys) > 1 and num_requested > 0:
+            for neighbor_key in execution_set_keys:
+                self.expected_data_time_mapping[neighbor_key] = expected_data_time
+
+                # make sure that the true_subset of the neighbor is accurate -- when it was
+                # evaluated it may have had a different requested AssetSubset. however, because
+                # all these neighbors must be executed as a unit, we need to union together
+                # the subset of all required neighbors
+                if neighbor_key in self.evaluation_state_by_key:
+                    neighbor_evaluation_state = self.evaluation_state_by_key[neighbor_key]
+                    self.evaluation_state_by_key[neighbor_key] = dataclasses.replace(
+                        neighbor_evaluation_state,
+                        previous_evaluation=neighbor_evaluation_state.previous_evaluation.copy(
+                            update={
+                                "true_subset": neighbor_evaluation_state.true_subset.copy(
+                                    update={"asset_key": neighbor_key}
+                                )
+                            }
+                        ),
+                    )
+                self.to_request |= {
+                    ap._replace(asset_key=neighbor_key)
+                    for ap in evaluation_state.true_subset.asset_partitions
+                }
 
     def evaluate_asset(
         self,
@@ -202,6 +366,23 @@ def evaluate_asset(
         ).to_scheduling_condition()
 
         previous_evaluation_state = self.cursor.get_previous_evaluation_state(asset_key)
+        if (
+            self.reuse_unchanged_evaluations
+            and previous_evaluation_state is not None
+            and self.can_reuse_previous_evaluation_state(
+                asset_key, asset_condition, previous_evaluation_state, evaluation_state_by_key
+            )
+        ):
+            self.reused_asset_keys.add(asset_key)
+            # nothing was requested on the previous tick, and no downstream asset has a freshness
+            # policy, so there is no expected data time to compute
+            return (
+                dataclasses.replace(
+                    previous_evaluation_state,
+                    previous_tick_evaluation_timestamp=self.asset_graph_view.effective_dt.timestamp(),
+                ),
+                None,
+            )
 
         legacy_context = LegacyRuleEvaluationContext.create(
             asset_key=asset_key,
@@ -235,3 +416,192 @@ def evaluate_asset(
             legacy_context, will_materialize=result.true_subset.size > 0
         )
         return AssetConditionEvaluationState.create(context, result), expected_data_time
+
+    def can_reuse_previous_evaluation_state(
+        self,
+        asset_key: AssetKey,
+        asset_condition: SchedulingCondition,
+        previous_evaluation_state: AssetConditionEvaluationState,
+        evaluation_state_by_key: Mapping[AssetKey, AssetConditionEvaluationState],
+    ) -> bool:
+        """Returns True if evaluating the condition of the given asset on this tick is guaranteed to
+        produce the same result as on the previous tick, in which case the previous evaluation
+        state can be reused wholesale.
+
+        This is only attempted for legacy AutoMaterializePolicies which requested nothing on the
+        previous tick and whose rules are all known to depend solely on the events of the asset and
+        its parents, the current time, and in-progress runs and backfills. The evaluation can then
+        be reused if none of these have changed since the previous tick.
+        """
+        previous_evaluation = previous_evaluation_state.previous_evaluation
+        previous_timestamp = previous_evaluation_state.previous_tick_evaluation_timestamp
+        asset = self.asset_graph.get(asset_key)
+        auto_materialize_policy = check.not_none(asset.auto_materialize_policy)
+        if (
+            previous_timestamp is None
+            or not previous_evaluation.true_subset.is_empty
+            or auto_materialize_policy.asset_condition is not None
+            or len(asset.execution_set_asset_keys) > 1
+            # expected data times must be computed for these assets
+            or self.asset_graph.get_downstream_freshness_policies(asset_key=asset_key)
+        ):
+            return False
+
+        # the condition tree must be identical to the one which was previously evaluated
+        evaluations_by_unique_id = _get_evaluations_by_unique_id(
+            previous_evaluation, asset_condition, parent_unique_id=None, index=None
+        )
+        if evaluations_by_unique_id is None:
+            return False
+
+        previous_dt = datetime.datetime.fromtimestamp(previous_timestamp, tz=datetime.timezone.utc)
+        for rule in auto_materialize_policy.rules:
+            if not self._rule_result_is_unchanged(
+                asset_key,
+                rule,
+                evaluations_by_unique_id.get(
+                    rule.to_asset_condition().get_unique_id(parent_unique_id=None, index=None)
+                ),
+                previous_dt,
+            ):
+                return False
+
+        neighbor_keys = [
+            asset_key,
+            *(parent_key for parent_key in asset.parent_keys if self.asset_graph.has(parent_key)),
+        ]
+        for neighbor_key in neighbor_keys:
+            # partitions may have been added since the previous tick
+            partitions_def = self.asset_graph.get(neighbor_key).partitions_def
+            if partitions_def is None:
+                pass
+            elif isinstance(partitions_def, TimeWindowPartitionsDefinition):
+                if partitions_def.get_last_partition_window(
+                    current_time=previous_dt
+                ) != partitions_def.get_last_partition_window(
+                    current_time=self.asset_graph_view.effective_dt
+                ):
+                    return False
+            else:
+                # the keys of dynamic partitions may change at any time, and we do not keep track
+                # of the keys of static or multi-dimensional partitions in the evaluation state
+                return False
+
+            # the parent will be requested on this tick
+            if neighbor_key != asset_key and (
+                neighbor_key in evaluation_state_by_key
+                and not evaluation_state_by_key[neighbor_key].true_subset.is_empty
+            ):
+                return False
+
+            # the asset or one of its parents has been updated since the previous tick
+            latest_storage_id = (
+                self.instance_queryer.get_latest_materialization_or_observation_storage_id(
+                    AssetKeyPartitionKey(neighbor_key)
+                )
+            )
+            if latest_storage_id is not None and (
+                previous_evaluation_state.max_storage_id is None
+                or latest_storage_id > previous_evaluation_state.max_storage_id
+            ):
+                return False
+
+        return previous_evaluation.true_subset.is_compatible_with_partitions_def(
+            asset.partitions_def
+        )
+
+    def _rule_result_is_unchanged(
+        self,
+        asset_key: AssetKey,
+        rule: "AutoMaterializeRule",
+        previous_rule_evaluation: Optional[AssetConditionEvaluation],
+        previous_dt: datetime.datetime,
+    ) -> bool:
+        """Returns True if the given rule is guaranteed to produce the same result as on the
+        previous tick, provided that the asset and its parents have not been updated since.
+        """
+        from ..auto_materialize_rule_impls import (
+            MaterializeOnCronRule,
+            MaterializeOnMissingRule,
+            MaterializeOnParentUpdatedRule,
+            MaterializeOnRequiredForFreshnessRule,
+            SkipOnBackfillInProgressRule,
+            SkipOnNotAllParentsUpdatedRule,
+            SkipOnNotAllParentsUpdatedSinceCronRule,
+            SkipOnParentMissingRule,
+            SkipOnParentOutdatedRule,
+            SkipOnRequiredButNonexistentParentsRule,
+            SkipOnRunInProgressRule,
+        )
+
+        if previous_rule_evaluation is None:
+            return False
+        elif isinstance(
+            rule,
+            (
+                MaterializeOnMissingRule,
+                MaterializeOnParentUpdatedRule,
+                # returns an empty result when there are no downstream freshness policies
+                MaterializeOnRequiredForFreshnessRule,
+                SkipOnNotAllParentsUpdatedRule,
+                SkipOnParentMissingRule,
+                SkipOnParentOutdatedRule,
+                SkipOnRequiredButNonexistentParentsRule,
+            ),
+        ):
+            return True
+        elif isinstance(rule, (MaterializeOnCronRule, SkipOnNotAllParentsUpdatedSinceCronRule)):
+            # no cron tick has passed since the previous tick
+            next_cron_tick = next(
+                cron_string_iterator(
+                    start_timestamp=previous_dt.timestamp(),
+                    cron_string=rule.cron_schedule,
+                    execution_timezone=rule.timezone,
+                )
+            )
+            return next_cron_tick > self.asset_graph_view.effective_dt
+        elif isinstance(rule, SkipOnBackfillInProgressRule):
+            # the asset was not backfilling on the previous tick, and still is not
+            return (
+                previous_rule_evaluation.true_subset.is_empty
+                and self.instance_queryer.get_active_backfill_target_asset_graph_subset()
+                .get_asset_subset(asset_key, self.asset_graph)
+                .is_empty
+            )
+        elif isinstance(rule, SkipOnRunInProgressRule):
+            # the asset was not being materialized on the previous tick, and still is not
+            return (
+                previous_rule_evaluation.true_subset.is_empty
+                and self.instance_queryer.get_in_progress_asset_subset(asset_key=asset_key).is_empty
+            )
+        else:
+            # the result of any other rule may depend on information that is not tracked here
+            return False
+
+
+def _get_evaluations_by_unique_id(
+    evaluation: AssetConditionEvaluation,
+    condition: SchedulingCondition,
+    parent_unique_id: Optional[str],
+    index: Optional[int],
+) -> Optional[Mapping[str, AssetConditionEvaluation]]:
+    """Returns a mapping from the unique id of each node of the given evaluation tree to its
+    evaluation, or None if the evaluation tree does not match the tree of the given condition.
+    """
+    unique_id = condition.get_unique_id(parent_unique_id=parent_unique_id, index=index)
+    if evaluation.condition_snapshot.unique_id != unique_id or len(
+        evaluation.child_evaluations
+    ) != len(condition.children):
+        return None
+
+    evaluations_by_unique_id = {unique_id: evaluation}
+    for child_index, (child_evaluation, child_condition) in enumerate(
+        zip(evaluation.child_evaluations, condition.children)
+    ):
+        child_evaluations_by_unique_id = _get_evaluations_by_unique_id(
+            child_evaluation, child_condition, parent_unique_id=unique_id, index=child_index
+        )
+        if child_evaluations_by_unique_id is None:
+            return None
+        evaluations_by_unique_id.update(child_evaluations_by_unique_id)
+    return evaluations_by_unique_id
@@ -332,12 +332,27 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
     if start_selector:
         start_method, start_cfg = next(iter(start_selector.items()))
 
+    # the worker pool is enabled by including its config, which fills in defaults for both fields
+    worker_pool_cfg = check.opt_nullable_dict_elem(config, "worker_pool")
+    worker_pool_kwargs = (
+        {
+            "use_worker_pool": True,
+            "max_steps_per_worker": check.int_elem(worker_pool_cfg, "max_steps_per_worker"),
+            "max_worker_memory_growth_mb": check.opt_int_elem(
+                worker_pool_cfg, "max_worker_memory_growth_mb"
+            ),
+        }
+        if worker_pool_cfg is not None
+        else {}
+    )
+
     return MultiprocessExecutor(
         max_concurrent=check.opt_int_elem(config, "max_concurrent"),
         tag_concurrency_limits=check.opt_list_elem(config, "tag_concurrency_limits"),
         retries=RetryMode.from_config(check.dict_elem(config, "retries")),  # type: ignore
         start_method=start_method,
         explicit_forkserver_preload=check.opt_list_elem(start_cfg, "preload_modules", of_type=str),
+        **worker_pool_kwargs,
     )
 
 
@@ -391,6 +406,31 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
             ),
         ),
         "retries": get_retries_config(),
+        "worker_pool": Field(
+            {
+                "max_steps_per_worker": Field(
+                    Int,
+                    default_value=100,
+                    description="The number of steps a worker process executes before it is replaced.",
+                ),
+                "max_worker_memory_growth_mb": Field(
+                    Noneable(Int),
+                    default_value=None,
+                    description=(
+                        "Replace a worker process once its peak memory usage has grown by more than"
+                        " this many megabytes since it started. By default, workers are only"
+                        " replaced after `max_steps_per_worker` steps."
+                    ),
+                ),
+            },
+            is_required=False,
+            description=(
+                "Execute steps in a pool of long-lived worker processes instead of starting a new"
+                " process for every step, so that the instance and job code are only loaded once"
+                " per worker. Each worker executes one step at a time. A worker that crashes fails"
+                " the step it was executing, and is replaced by a new worker."
+            ),
+        ),
     },
     description="Execute each step in an individual process.",
 )
@@ -1,9 +1,16 @@
 import hashlib
 import itertools
+import json
+from collections import defaultdict
 from datetime import datetime
 from functools import lru_cache, reduce
 from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Any,
     Dict,
+    FrozenSet,
+    Iterable,
     List,
     Mapping,
     NamedTuple,
@@ -23,6 +30,7 @@
 from dagster._core.definitions.partition_key_range import PartitionKeyRange
 from dagster._core.errors import (
     DagsterInvalidDefinitionError,
+    DagsterInvalidDeserializationVersionError,
     DagsterInvalidInvocationError,
     DagsterUnknownPartitionError,
 )
@@ -31,15 +39,30 @@
     MULTIDIMENSIONAL_PARTITION_PREFIX,
     get_multidimensional_partition_tag,
 )
+from dagster._serdes import whitelist_for_serdes
+from dagster._serdes.serdes import NamedTupleSerializer, UnpackContext, WhitelistMap
 
 from .partition import (
+    AllPartitionsSubset,
     DefaultPartitionsSubset,
     DynamicPartitionsDefinition,
     PartitionsDefinition,
     PartitionsSubset,
     StaticPartitionsDefinition,
+    _get_partition_key_ranges_in_subset,
+    _should_serialize_partitions_subset_bitmaps,
 )
-from .time_window_partitions import TimeWindow, TimeWindowPartitionsDefinition
+from .time_window_partitions import (
+    BaseTimeWindowPartitionsSubset,
+    TimeWindow,
+    TimeWindowPartitionsDefinition,
+    TimeWindowPartitionsSubset,
+)
+
+if TYPE_CHECKING:
+    from dagster._core.remote_representation.external_data import (
+        ExternalMultiPartitionsDefinitionData,
+    )
 
 INVALID_STATIC_PARTITIONS_KEY_CHARACTERS = set(["|", ",", "[", "]"])
 
@@ -218,7 +241,7 @@ def __init__(self, partitions_defs: Mapping[str, PartitionsDefinition]):
 
     @property
     def partitions_subset_class(self) -> Type["PartitionsSubset"]:
-        return DefaultPartitionsSubset
+        return MultiPartitionsSubset
 
     def get_partition_keys_in_range(
         self,
@@ -348,8 +371,10 @@ def filter_valid_partition_keys(
         self, partition_keys: Set[str], dynamic_partitions_store: DynamicPartitionsStore
     ) -> Set[MultiPartitionKey]:
         partition_keys_by_dimension = {
-            dim.name: dim.partitions_def.get_partition_keys(
-                dynamic_partitions_store=dynamic_partitions_store
+            dim.name: set(
+                dim.partitions_def.get_partition_keys(
+                    dynamic_partitions_store=dynamic_partitions_store
+                )
             )
             for dim in self.partitions_defs
         }
@@ -364,7 +389,7 @@ def filter_valid_partition_keys(
             )
 
             if all(
-                key in partition_keys_by_dimension.get(dim, [])
+                key in partition_keys_by_dimension.get(dim, set())
                 for dim, key in multipartition_key.keys_by_dimension.items()
             ):
                 validated_partitions.add(partition_key)
@@ -548,6 +573,463 @@ def get_num_partitions(
         return reduce(lambda x, y: x * y, dimension_counts, 1)
 
 
+class MultiPartitionsSubset(PartitionsSubset):
+    """A subset of the partitions of a MultiPartitionsDefinition, stored by column: for each key
+    of the secondary dimension, the subset of keys of the primary dimension that it is paired
+    with. Rows of a time window primary dimension are stored as time window ranges and rows of a
+    static or dynamic primary dimension as bitmaps, so set operations, length and membership
+    checks never enumerate the composite partition keys. Keys that are not valid for the partitions
+    definition, e.g. keys of time partitions that have not started yet, are kept as they are.
+
+    Subsets are serialized as a sorted list of keys, like DefaultPartitionsSubset. They can instead
+    be serialized by dimension by setting the DAGSTER_SERIALIZE_PARTITIONS_SUBSET_BITMAPS
+    environment variable to 1, once every process that reads them can deserialize both formats.
+    """
+
+    # Every time we change the serialization format, we should increment the version number.
+    # This will ensure that we can gracefully degrade when deserializing old data.
+    SERIALIZATION_VERSION = 2
+
+    def __init__(
+        self,
+        partitions_def: MultiPartitionsDefinition,
+        subsets_by_secondary_key: Optional[Mapping[str, PartitionsSubset]] = None,
+        other_partition_keys: Optional[AbstractSet[str]] = None,
+    ):
+        self._partitions_def = check.inst_param(
+            partitions_def, "partitions_def", MultiPartitionsDefinition
+        )
+        check.opt_mapping_param(
+            subsets_by_secondary_key,
+            "subsets_by_secondary_key",
+            key_type=str,
+            value_type=PartitionsSubset,
+        )
+        # drop empty rows, so that equal subsets have equal rows
+        self._subsets_by_secondary_key: Mapping[str, PartitionsSubset] = {
+            secondary_key: subset
+            for secondary_key, subset in (subsets_by_secondary_key or {}).items()
+            if not (
+                subset.is_empty
+                if isinstance(subset, BaseTimeWindowPartitionsSubset)
+                else len(subset) == 0
+            )
+        }
+        self._other_partition_keys = frozenset(
+            check.opt_set_param(other_partition_keys, "other_partition_keys", of_type=str)
+        )
+
+        primary_dimension, secondary_dimension = (
+            partitions_def._get_primary_and_secondary_dimension()  # noqa: SLF001
+        )
+        self._primary_dimension = primary_dimension
+        self._secondary_dimension = secondary_dimension
+        dimension_names = partitions_def.partition_dimension_names
+        self._primary_key_idx = dimension_names.index(primary_dimension.name)
+        self._secondary_key_idx = dimension_names.index(secondary_dimension.name)
+
+    @property
+    def partitions_def(self) -> MultiPartitionsDefinition:
+        return self._partitions_def
+
+    @property
+    def subsets_by_secondary_key(self) -> Mapping[str, PartitionsSubset]:
+        """For each key of the secondary dimension, the subset of the primary dimension's
+        partitions that it is paired with.
+        """
+        return self._subsets_by_secondary_key
+
+    @property
+    def other_partition_keys(self) -> AbstractSet[str]:
+        """The keys in the subset that are not valid for the partitions definition, and so can't
+        be stored by dimension.
+        """
+        return self._other_partition_keys
+
+    def _split_partition_key(self, partition_key: str) -> Optional[Tuple[str, str]]:
+        partition_key_strs = partition_key.split(MULTIPARTITION_KEY_DELIMITER)
+        if len(partition_key_strs) != len(self._partitions_def.partitions_defs):
+            return None
+        return (
+            partition_key_strs[self._primary_key_idx],
+            partition_key_strs[self._secondary_key_idx],
+        )
+
+    def _multi_partition_key(self, primary_key: str, secondary_key: str) -> MultiPartitionKey:
+        return MultiPartitionKey(
+            {
+                self._primary_dimension.name: primary_key,
+                self._secondary_dimension.name: secondary_key,
+            }
+        )
+
+    def _empty_row(self) -> PartitionsSubset:
+        primary_partitions_def = self._primary_dimension.partitions_def
+        if isinstance(primary_partitions_def, TimeWindowPartitionsDefinition):
+            # store time window ranges rather than the partition keys
+            return TimeWindowPartitionsSubset.empty_subset(primary_partitions_def)
+        return primary_partitions_def.empty_subset()
+
+    def _to_multi_partitions_subset(self, other: PartitionsSubset) -> "MultiPartitionsSubset":
+        if (
+            isinstance(other, MultiPartitionsSubset)
+            and other.partitions_def == self._partitions_def
+        ):
+            return other
+        return self.empty_subset(self._partitions_def).with_partition_keys(
+            other.get_partition_keys()
+        )
+
+    def get_partition_keys_not_in_subset(
+        self,
+        partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Iterable[str]:
+        primary_partitions_def = self._primary_dimension.partitions_def
+        all_primary_keys: Optional[Sequence[str]] = None
+        partition_keys = set()
+        for secondary_key in self._secondary_dimension.partitions_def.get_partition_keys(
+            current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+        ):
+            subset = self._subsets_by_secondary_key.get(secondary_key)
+            if subset is not None:
+                primary_keys = subset.get_partition_keys_not_in_subset(
+                    primary_partitions_def,
+                    current_time=current_time,
+                    dynamic_partitions_store=dynamic_partitions_store,
+                )
+            else:
+                if all_primary_keys is None:
+                    all_primary_keys = primary_partitions_def.get_partition_keys(
+                        current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+                    )
+                primary_keys = all_primary_keys
+
+            partition_keys.update(
+                self._multi_partition_key(primary_key, secondary_key)
+                for primary_key in primary_keys
+            )
+        return partition_keys
+
+    def get_partition_keys(self) -> AbstractSet[str]:
+        return {
+            self._multi_partition_key(primary_key, secondary_key)
+            for secondary_key, subset in self._subsets_by_secondary_key.items()
+            for primary_key in subset.get_partition_keys()
+        } | self._other_partition_keys
+
+    def get_partition_key_ranges(
+        self,
+        partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Sequence[PartitionKeyRange]:
+        return _get_partition_key_ranges_in_subset(
+            self,
+            partitions_def.get_partition_keys(
+                current_time, dynamic_partitions_store=dynamic_partitions_store
+            ),
+        )
+
+    def with_partition_keys(self, partition_keys: Iterable[str]) -> "MultiPartitionsSubset":
+        # time window rows only hold the partitions of their partitions definition, so keys for any
+        # other time are kept as they are
+        primary_partitions_def = self._primary_dimension.partitions_def
+        check_primary_keys = isinstance(primary_partitions_def, TimeWindowPartitionsDefinition)
+        is_valid_by_primary_key: Dict[str, bool] = {}
+
+        primary_keys_by_secondary_key: Dict[str, Set[str]] = defaultdict(set)
+        other_partition_keys: Set[str] = set()
+        for partition_key in partition_keys:
+            split_key = self._split_partition_key(partition_key)
+            if split_key is not None and check_primary_keys:
+                if split_key[0] not in is_valid_by_primary_key:
+                    is_valid_by_primary_key[split_key[0]] = (
+                        primary_partitions_def.has_partition_key(split_key[0])
+                    )
+                if not is_valid_by_primary_key[split_key[0]]:
+                    split_key = None
+
+            if split_key is None:
+                other_partition_keys.add(partition_key)
+            else:
+                primary_keys_by_secondary_key[split_key[1]].add(split_key[0])
+
+        if not primary_keys_by_secondary_key and other_partition_keys <= self._other_partition_keys:
+            return self
+
+        # secondary keys are commonly paired with the same primary keys, e.g. when a whole range
+        # of dates was materialized for each static partition, so build each distinct row once
+        added_subsets_by_primary_keys: Dict[FrozenSet[str], PartitionsSubset] = {}
+        subsets_by_secondary_key = dict(self._subsets_by_secondary_key)
+        for secondary_key, primary_keys in primary_keys_by_secondary_key.items():
+            frozen_primary_keys = frozenset(primary_keys)
+            added_subset = added_subsets_by_primary_keys.get(frozen_primary_keys)
+            if added_subset is None:
+                added_subset = self._empty_row().with_partition_keys(frozen_primary_keys)
+                added_subsets_by_primary_keys[frozen_primary_keys] = added_subset
+
+            subset = subsets_by_secondary_key.get(secondary_key)
+            subsets_by_secondary_key[secondary_key] = (
+                subset | added_subset if subset is not None else added_subset
+            )
+        return MultiPartitionsSubset(
+            self._partitions_def,
+            subsets_by_secondary_key,
+            self._other_partition_keys | other_partition_keys,
+        )
+
+    def __or__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self is other:
+            return self
+        if isinstance(other, AllPartitionsSubset):
+            return other
+        other = self._to_multi_partitions_subset(other)
+
+        subsets_by_secondary_key = dict(self._subsets_by_secondary_key)
+        for secondary_key, other_subset in other.subsets_by_secondary_key.items():
+            subset = subsets_by_secondary_key.get(secondary_key)
+            subsets_by_secondary_key[secondary_key] = (
+                subset | other_subset if subset is not None else other_subset
+            )
+        return MultiPartitionsSubset(
+            self._partitions_def,
+            subsets_by_secondary_key,
+            self._other_partition_keys | other.other_partition_keys,
+        )
+
+    def __and__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self is other or isinstance(other, AllPartitionsSubset):
+            return self
+        if not (
+            isinstance(other, MultiPartitionsSubset)
+            and other.partitions_def == self._partitions_def
+        ):
+            # other may contain keys that are not valid for this partitions definition, so only
+            # convert the keys that are in this subset
+            return self.empty_subset(self._partitions_def).with_partition_keys(
+                partition_key
+                for partition_key in other.get_partition_keys()
+                if partition_key in self
+            )
+
+        return MultiPartitionsSubset(
+            self._partitions_def,
+            {
+                secondary_key: subset & other.subsets_by_secondary_key[secondary_key]
+                for secondary_key, subset in self._subsets_by_secondary_key.items()
+                if secondary_key in other.subsets_by_secondary_key
+            },
+            self._other_partition_keys & other.other_partition_keys,
+        )
+
+    def __sub__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self is other or isinstance(other, AllPartitionsSubset):
+            return self.empty_subset(self._partitions_def)
+        if not (
+            isinstance(other, MultiPartitionsSubset)
+            and other.partitions_def == self._partitions_def
+        ):
+            return self - (self & other)
+
+        return MultiPartitionsSubset(
+            self._partitions_def,
+            {
+                secondary_key: (
+                    subset - other.subsets_by_secondary_key[secondary_key]
+                    if secondary_key in other.subsets_by_secondary_key
+                    else subset
+                )
+                for secondary_key, subset in self._subsets_by_secondary_key.items()
+            },
+            self._other_partition_keys - other.other_partition_keys,
+        )
+
+    def serialize(self) -> str:
+        if not _should_serialize_partitions_subset_bitmaps():
+            return DefaultPartitionsSubset(self.get_partition_keys()).serialize()
+
+        data: Dict[str, Any] = {
+            "version": self.SERIALIZATION_VERSION,
+            "primary_dimension": self._primary_dimension.name,
+            # sort to ensure that equivalent partition subsets have identical serialized forms
+            "subsets_by_secondary_key": {
+                secondary_key: self._subsets_by_secondary_key[secondary_key].serialize()
+                for secondary_key in sorted(self._subsets_by_secondary_key.keys())
+            },
+        }
+        if self._other_partition_keys:
+            data["other_partition_keys"] = sorted(self._other_partition_keys)
+        return json.dumps(data)
+
+    @classmethod
+    def from_serialized(
+        cls, partitions_def: PartitionsDefinition, serialized: str
+    ) -> "MultiPartitionsSubset":
+        data = json.loads(serialized)
+        empty_subset = cls.empty_subset(partitions_def)
+
+        if isinstance(data, list):
+            # backwards compatibility
+            return empty_subset.with_partition_keys(data)
+        elif data.get("version") == DefaultPartitionsSubset.SERIALIZATION_VERSION:
+            return empty_subset.with_partition_keys(data.get("subset"))
+        elif data.get("version") != cls.SERIALIZATION_VERSION:
+            raise DagsterInvalidDeserializationVersionError(
+                f"Attempted to deserialize partition subset with version {data.get('version')},"
+                f" but only versions {DefaultPartitionsSubset.SERIALIZATION_VERSION} and"
+                f" {cls.SERIALIZATION_VERSION} are supported."
+            )
+
+        primary_partitions_def = empty_subset._primary_dimension.partitions_def  # noqa: SLF001
+        return MultiPartitionsSubset(
+            empty_subset.partitions_def,
+            {
+                secondary_key: primary_partitions_def.deserialize_subset(serialized_subset)
+                for secondary_key, serialized_subset in data["subsets_by_secondary_key"].items()
+            },
+            set(data.get("other_partition_keys", [])),
+        )
+
+    @classmethod
+    def can_deserialize(
+        cls,
+        partitions_def: PartitionsDefinition,
+        serialized: str,
+        serialized_partitions_def_unique_id: Optional[str],
+        serialized_partitions_def_class_name: Optional[str],
+    ) -> bool:
+        if (
+            serialized_partitions_def_class_name is not None
+            and serialized_partitions_def_class_name != partitions_def.__class__.__name__
+        ):
+            return False
+
+        data = json.loads(serialized)
+        if isinstance(data, list):
+            return True
+        elif data.get("version") == DefaultPartitionsSubset.SERIALIZATION_VERSION:
+            return data.get("subset") is not None
+        elif (
+            data.get("version") != cls.SERIALIZATION_VERSION
+            or not isinstance(partitions_def, MultiPartitionsDefinition)
+            or data.get("primary_dimension") != partitions_def.primary_dimension.name
+        ):
+            return False
+
+        primary_partitions_def = partitions_def.primary_dimension.partitions_def
+        return all(
+            primary_partitions_def.can_deserialize_subset(
+                serialized_subset,
+                serialized_partitions_def_unique_id=None,
+                serialized_partitions_def_class_name=None,
+            )
+            for serialized_subset in data["subsets_by_secondary_key"].values()
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, MultiPartitionsSubset):
+            return (
+                self._partitions_def == other.partitions_def
+                and self._subsets_by_secondary_key == other.subsets_by_secondary_key
+                and self._other_partition_keys == other.other_partition_keys
+            )
+        return isinstance(other, DefaultPartitionsSubset) and self.get_partition_keys() == set(
+            other.get_partition_keys()
+        )
+
+    def __len__(self) -> int:
+        return sum(len(subset) for subset in self._subsets_by_secondary_key.values()) + len(
+            self._other_partition_keys
+        )
+
+    def __contains__(self, value) -> bool:
+        if not isinstance(value, str):
+            return False
+        if value in self._other_partition_keys:
+            return True
+        split_key = self._split_partition_key(value)
+        if split_key is None:
+            return False
+        primary_key, secondary_key = split_key
+        subset = self._subsets_by_secondary_key.get(secondary_key)
+        return subset is not None and primary_key in subset
+
+    def __repr__(self) -> str:
+        return (
+            f"MultiPartitionsSubset(subsets_by_secondary_key={self._subsets_by_secondary_key},"
+            f" other_partition_keys={set(self._other_partition_keys)})"
+        )
+
+    @classmethod
+    def empty_subset(
+        cls, partitions_def: Optional[PartitionsDefinition] = None
+    ) -> "MultiPartitionsSubset":
+        if not isinstance(partitions_def, MultiPartitionsDefinition):
+            check.failed("Partitions definition must be a MultiPartitionsDefinition")
+        return cls(cast(MultiPartitionsDefinition, partitions_def))
+
+    def to_serializable_subset(self) -> PartitionsSubset:
+        from dagster._core.remote_representation.external_data import (
+            external_multi_partitions_definition_from_def,
+        )
+
+        if not _should_serialize_partitions_subset_bitmaps():
+            return DefaultPartitionsSubset(self.get_partition_keys())
+
+        try:
+            partitions_def_data = external_multi_partitions_definition_from_def(
+                self._partitions_def
+            )
+        except DagsterInvalidDefinitionError:
+            # e.g. dynamic partitions definitions without a name
+            return DefaultPartitionsSubset(self.get_partition_keys())
+
+        # unpacked as a MultiPartitionsSubset, see SerializableMultiPartitionsSubsetSerializer
+        return cast(
+            PartitionsSubset,
+            SerializableMultiPartitionsSubset(
+                partitions_def_data=partitions_def_data, serialized_subset=self.serialize()
+            ),
+        )
+
+
+class SerializableMultiPartitionsSubsetSerializer(
+    NamedTupleSerializer["SerializableMultiPartitionsSubset"]
+):
+    def unpack(
+        self,
+        unpacked_dict: Dict[str, Any],
+        whitelist_map: WhitelistMap,
+        context: UnpackContext,
+    ) -> Any:
+        value = super().unpack(unpacked_dict, whitelist_map, context)
+        if isinstance(value, SerializableMultiPartitionsSubset):
+            return value.to_multi_partitions_subset()
+        return value
+
+
+@whitelist_for_serdes(serializer=SerializableMultiPartitionsSubsetSerializer)
+class SerializableMultiPartitionsSubset(
+    NamedTuple(
+        "_SerializableMultiPartitionsSubset",
+        [
+            ("partitions_def_data", "ExternalMultiPartitionsDefinitionData"),
+            ("serialized_subset", str),
+        ],
+    )
+):
+    """The serdes form of a MultiPartitionsSubset that is serialized by dimension, along with its
+    partitions definition. It is deserialized as a MultiPartitionsSubset.
+    """
+
+    def to_multi_partitions_subset(self) -> MultiPartitionsSubset:
+        return MultiPartitionsSubset.from_serialized(
+            self.partitions_def_data.get_partitions_definition(), self.serialized_subset
+        )
+
+
 def get_tags_from_multi_partition_key(multi_partition_key: MultiPartitionKey) -> Mapping[str, str]:
     check.inst_param(multi_partition_key, "multi_partition_key", MultiPartitionKey)
 
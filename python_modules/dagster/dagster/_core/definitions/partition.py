@@ -1,6 +1,10 @@
+import base64
 import copy
 import hashlib
 import json
+import os
+import threading
+import zlib
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from datetime import (
@@ -14,6 +18,7 @@
     Dict,
     Generic,
     Iterable,
+    List,
     Mapping,
     NamedTuple,
     Optional,
@@ -35,6 +40,7 @@
 from dagster._core.instance import DagsterInstance, DynamicPartitionsStore
 from dagster._core.storage.tags import PARTITION_NAME_TAG, PARTITION_SET_TAG
 from dagster._serdes import whitelist_for_serdes
+from dagster._serdes.serdes import NamedTupleSerializer
 from dagster._utils import xor
 from dagster._utils.cached_method import cached_method
 from dagster._utils.warnings import (
@@ -334,6 +340,14 @@ def __init__(self, partition_keys: Sequence[str]):
 
         self._partition_keys = partition_keys
 
+    @property
+    def partitions_subset_class(self) -> Type["PartitionsSubset"]:
+        return KeyBitmapPartitionsSubset
+
+    @cached_method
+    def get_partition_key_ordinals(self) -> "PartitionKeyOrdinals":
+        return PartitionKeyOrdinals(self._partition_keys, extendable=False)
+
     @public
     def get_partition_keys(
         self,
@@ -478,6 +492,16 @@ def _validated_name(self) -> str:
             )
         return self.name
 
+    @property
+    def partitions_subset_class(self) -> Type["PartitionsSubset"]:
+        return KeyBitmapPartitionsSubset
+
+    @cached_method
+    def get_partition_key_ordinals(self) -> "PartitionKeyOrdinals":
+        # dynamic partition keys are assigned ordinals as they are seen, for as long as this
+        # definition is in use
+        return PartitionKeyOrdinals(extendable=True)
+
     def __eq__(self, other):
         return (
             isinstance(other, DynamicPartitionsDefinition)
@@ -1113,26 +1137,12 @@ def get_partition_key_ranges(
         current_time: Optional[datetime] = None,
         dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
     ) -> Sequence[PartitionKeyRange]:
-        partition_keys = partitions_def.get_partition_keys(
-            current_time, dynamic_partitions_store=dynamic_partitions_store
+        return _get_partition_key_ranges_in_subset(
+            self,
+            partitions_def.get_partition_keys(
+                current_time, dynamic_partitions_store=dynamic_partitions_store
+            ),
         )
-        cur_range_start = None
-        cur_range_end = None
-        result = []
-        for partition_key in partition_keys:
-            if partition_key in self.subset:
-                if cur_range_start is None:
-                    cur_range_start = partition_key
-                cur_range_end = partition_key
-            else:
-                if cur_range_start is not None and cur_range_end is not None:
-                    result.append(PartitionKeyRange(cur_range_start, cur_range_end))
-                cur_range_start = cur_range_end = None
-
-        if cur_range_start is not None and cur_range_end is not None:
-            result.append(PartitionKeyRange(cur_range_start, cur_range_end))
-
-        return result
 
     def with_partition_keys(self, partition_keys: Iterable[str]) -> "DefaultPartitionsSubset":
         return DefaultPartitionsSubset(
@@ -1185,6 +1195,10 @@ def can_deserialize(
         )
 
     def __eq__(self, other: object) -> bool:
+        from dagster._core.definitions.multi_dimensional_partitions import MultiPartitionsSubset
+
+        if isinstance(other, (KeyBitmapPartitionsSubset, MultiPartitionsSubset)):
+            return self.subset == other.get_partition_keys()
         return isinstance(other, DefaultPartitionsSubset) and self.subset == other.subset
 
     def __len__(self) -> int:
@@ -1203,6 +1217,355 @@ def empty_subset(
         return cls()
 
 
+def _get_partition_key_ranges_in_subset(
+    subset: PartitionsSubset, partition_keys: Sequence[str]
+) -> Sequence[PartitionKeyRange]:
+    cur_range_start = None
+    cur_range_end = None
+    result = []
+    for partition_key in partition_keys:
+        if partition_key in subset:
+            if cur_range_start is None:
+                cur_range_start = partition_key
+            cur_range_end = partition_key
+        else:
+            if cur_range_start is not None and cur_range_end is not None:
+                result.append(PartitionKeyRange(cur_range_start, cur_range_end))
+            cur_range_start = cur_range_end = None
+
+    if cur_range_start is not None and cur_range_end is not None:
+        result.append(PartitionKeyRange(cur_range_start, cur_range_end))
+
+    return result
+
+
+class PartitionKeyOrdinals:
+    """Assigns each partition key an ordinal, so that sets of partition keys can be represented as
+    bitmaps. Keys passed in up front, such as those of a static partitions definition, are assigned
+    ordinals in order. If `extendable` is set, keys that were not known up front, such as dynamic
+    partitions, are assigned the next ordinal the first time they are seen.
+    """
+
+    def __init__(self, partition_keys: Sequence[str] = (), extendable: bool = True):
+        self._keys: List[str] = list(partition_keys)
+        self._ordinals: Dict[str, int] = {key: i for i, key in enumerate(self._keys)}
+        self._num_defined_keys = len(self._keys)
+        self._extendable = extendable
+        self._defined_keys_id: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> Mapping[str, Any]:
+        return {key: value for key, value in self.__dict__.items() if key != "_lock"}
+
+    def __setstate__(self, state: Mapping[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def num_defined_keys(self) -> int:
+        return self._num_defined_keys
+
+    @property
+    def extendable(self) -> bool:
+        return self._extendable
+
+    @property
+    def defined_keys_id(self) -> str:
+        """Matches the serializable unique identifier of a static partitions definition with the
+        defined keys.
+        """
+        if self._defined_keys_id is None:
+            self._defined_keys_id = hashlib.sha1(
+                json.dumps(self._keys[: self._num_defined_keys]).encode("utf-8")
+            ).hexdigest()
+        return self._defined_keys_id
+
+    def get_ordinal(self, partition_key: str) -> Optional[int]:
+        return self._ordinals.get(partition_key)
+
+    def _add_ordinal(self, partition_key: str) -> int:
+        with self._lock:
+            ordinal = self._ordinals.get(partition_key)
+            if ordinal is None:
+                ordinal = len(self._keys)
+                self._keys.append(partition_key)
+                self._ordinals[partition_key] = ordinal
+        return ordinal
+
+    def get_bitmap(self, partition_keys: Iterable[str], add_missing: bool) -> Optional[int]:
+        """Returns the bitmap of the given keys. If `add_missing` is set, keys that have not been
+        assigned an ordinal are assigned one, or None is returned if the ordinals are not
+        extendable. Otherwise those keys are left out.
+        """
+        ordinals = []
+        for key in partition_keys:
+            ordinal = self._ordinals.get(key)
+            if ordinal is None and add_missing:
+                if not self._extendable:
+                    return None
+                ordinal = self._add_ordinal(key)
+            if ordinal is not None:
+                ordinals.append(ordinal)
+        if not ordinals:
+            return 0
+
+        # setting bits in a buffer avoids reallocating the integer for every key
+        buffer = bytearray(max(ordinals) // 8 + 1)
+        for ordinal in ordinals:
+            buffer[ordinal >> 3] |= 1 << (ordinal & 7)
+        return int.from_bytes(buffer, "little")
+
+    def get_partition_keys(self, bitmap: int) -> List[str]:
+        """Returns the keys in the given bitmap, in ordinal order."""
+        keys = self._keys
+        partition_keys = []
+        for byte_index, byte in enumerate(_bitmap_to_bytes(bitmap)):
+            if byte:
+                offset = byte_index * 8
+                for bit in range(8):
+                    if byte & (1 << bit):
+                        partition_keys.append(keys[offset + bit])
+        return partition_keys
+
+
+def _bitmap_to_bytes(bitmap: int) -> bytes:
+    return bitmap.to_bytes((bitmap.bit_length() + 7) // 8, "little")
+
+
+def _should_serialize_partitions_subset_bitmaps() -> bool:
+    # Processes running older versions of dagster can only read subsets serialized as a list of
+    # keys, so the compact bitmap format must be opted into once every reader has been upgraded.
+    return os.getenv("DAGSTER_SERIALIZE_PARTITIONS_SUBSET_BITMAPS") == "1"
+
+
+class KeyBitmapPartitionsSubsetSerializer(NamedTupleSerializer["KeyBitmapPartitionsSubset"]):
+    """Serializes bitmap subsets as DefaultPartitionsSubsets, since ordinals are not meaningful
+    outside of the process.
+    """
+
+    def get_storage_name(self) -> str:
+        return "DefaultPartitionsSubset"
+
+    def object_as_mapping(self, value: "KeyBitmapPartitionsSubset") -> Mapping[str, Any]:
+        return {"subset": value.get_partition_keys()}
+
+
+@whitelist_for_serdes(serializer=KeyBitmapPartitionsSubsetSerializer)
+class KeyBitmapPartitionsSubset(
+    PartitionsSubset,
+    NamedTuple("_KeyBitmapPartitionsSubset", [("ordinals", PartitionKeyOrdinals), ("bitmap", int)]),
+):
+    """A subset of the partitions of a static or dynamic partitions definition, stored as a bitmap
+    over the ordinals of its partition keys. Set operations between subsets of the same
+    partitions definition are bitwise operations on the bitmaps. Adding keys that a static
+    partitions definition does not contain returns a DefaultPartitionsSubset instead.
+
+    Subsets are serialized as a sorted list of keys, like DefaultPartitionsSubset. Subsets of static
+    partitions definitions can instead be serialized to a compressed bitmap by setting the
+    DAGSTER_SERIALIZE_PARTITIONS_SUBSET_BITMAPS environment variable to 1, once every process that
+    reads them can deserialize both formats.
+    """
+
+    # Every time we change the serialization format, we should increment the version number.
+    # This will ensure that we can gracefully degrade when deserializing old data.
+    SERIALIZATION_VERSION = 2
+
+    def __new__(cls, ordinals: PartitionKeyOrdinals, bitmap: int = 0):
+        return super(KeyBitmapPartitionsSubset, cls).__new__(
+            cls,
+            check.inst_param(ordinals, "ordinals", PartitionKeyOrdinals),
+            check.int_param(bitmap, "bitmap"),
+        )
+
+    def _get_other_bitmap(self, other: PartitionsSubset, add_missing: bool) -> Optional[int]:
+        if isinstance(other, KeyBitmapPartitionsSubset) and other.ordinals is self.ordinals:
+            return other.bitmap
+        return self.ordinals.get_bitmap(other.get_partition_keys(), add_missing=add_missing)
+
+    def get_partition_keys_not_in_subset(
+        self,
+        partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Iterable[str]:
+        return {
+            partition_key
+            for partition_key in partitions_def.get_partition_keys(
+                current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+            )
+            if partition_key not in self
+        }
+
+    def get_partition_keys(self) -> AbstractSet[str]:
+        return set(self.ordinals.get_partition_keys(self.bitmap))
+
+    def get_partition_key_ranges(
+        self,
+        partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Sequence[PartitionKeyRange]:
+        return _get_partition_key_ranges_in_subset(
+            self,
+            partitions_def.get_partition_keys(
+                current_time, dynamic_partitions_store=dynamic_partitions_store
+            ),
+        )
+
+    def with_partition_keys(self, partition_keys: Iterable[str]) -> PartitionsSubset:
+        partition_keys = list(partition_keys)
+        bitmap = self.ordinals.get_bitmap(partition_keys, add_missing=True)
+        if bitmap is None:
+            # the keys are not all in the static partitions definition
+            return DefaultPartitionsSubset(self.get_partition_keys() | set(partition_keys))
+        return KeyBitmapPartitionsSubset(self.ordinals, self.bitmap | bitmap)
+
+    def __or__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self is other:
+            return self
+        if isinstance(other, AllPartitionsSubset):
+            return other
+        bitmap = self._get_other_bitmap(other, add_missing=True)
+        if bitmap is None:
+            return DefaultPartitionsSubset(
+                self.get_partition_keys() | set(other.get_partition_keys())
+            )
+        return KeyBitmapPartitionsSubset(self.ordinals, self.bitmap | bitmap)
+
+    def __and__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self is other:
+            return self
+        if isinstance(other, AllPartitionsSubset):
+            return self
+        return KeyBitmapPartitionsSubset(
+            self.ordinals,
+            self.bitmap & check.not_none(self._get_other_bitmap(other, add_missing=False)),
+        )
+
+    def __sub__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self is other or isinstance(other, AllPartitionsSubset):
+            return KeyBitmapPartitionsSubset(self.ordinals)
+        return KeyBitmapPartitionsSubset(
+            self.ordinals,
+            self.bitmap & ~check.not_none(self._get_other_bitmap(other, add_missing=False)),
+        )
+
+    def serialize(self) -> str:
+        # Only bitmaps over the keys of a static partitions definition can be deserialized in
+        # another process. Anything else is serialized as a list of keys.
+        if (
+            not self.ordinals.extendable
+            and self.ordinals.num_defined_keys
+            and _should_serialize_partitions_subset_bitmaps()
+        ):
+            return json.dumps(
+                {
+                    "version": self.SERIALIZATION_VERSION,
+                    "partitions_def_id": self.ordinals.defined_keys_id,
+                    "bitmap": base64.b64encode(zlib.compress(_bitmap_to_bytes(self.bitmap))).decode(
+                        "ascii"
+                    ),
+                }
+            )
+
+        return json.dumps(
+            {
+                "version": DefaultPartitionsSubset.SERIALIZATION_VERSION,
+                # sort to ensure that equivalent partition subsets have identical serialized forms
+                "subset": sorted(self.get_partition_keys()),
+            }
+        )
+
+    @classmethod
+    def from_serialized(
+        cls, partitions_def: PartitionsDefinition, serialized: str
+    ) -> PartitionsSubset:
+        data = json.loads(serialized)
+        empty_subset = cls.empty_subset(partitions_def)
+
+        if isinstance(data, list):
+            # backwards compatibility
+            return empty_subset.with_partition_keys(data)
+        elif data.get("version") == DefaultPartitionsSubset.SERIALIZATION_VERSION:
+            return empty_subset.with_partition_keys(data.get("subset"))
+        elif data.get("version") != cls.SERIALIZATION_VERSION:
+            raise DagsterInvalidDeserializationVersionError(
+                f"Attempted to deserialize partition subset with version {data.get('version')},"
+                f" but only versions {DefaultPartitionsSubset.SERIALIZATION_VERSION} and"
+                f" {cls.SERIALIZATION_VERSION} are supported."
+            )
+
+        if (
+            empty_subset.ordinals.extendable
+            or data.get("partitions_def_id") != empty_subset.ordinals.defined_keys_id
+        ):
+            raise DagsterInvalidDeserializationVersionError(
+                "Attempted to deserialize a partition subset bitmap for a different set of"
+                " partition keys."
+            )
+        return KeyBitmapPartitionsSubset(
+            empty_subset.ordinals,
+            int.from_bytes(zlib.decompress(base64.b64decode(data["bitmap"])), "little"),
+        )
+
+    @classmethod
+    def can_deserialize(
+        cls,
+        partitions_def: PartitionsDefinition,
+        serialized: str,
+        serialized_partitions_def_unique_id: Optional[str],
+        serialized_partitions_def_class_name: Optional[str],
+    ) -> bool:
+        if (
+            serialized_partitions_def_class_name is not None
+            and serialized_partitions_def_class_name != partitions_def.__class__.__name__
+        ):
+            return False
+
+        data = json.loads(serialized)
+        if isinstance(data, list):
+            return True
+        elif data.get("version") == DefaultPartitionsSubset.SERIALIZATION_VERSION:
+            return data.get("subset") is not None
+        return (
+            data.get("version") == cls.SERIALIZATION_VERSION
+            and isinstance(partitions_def, StaticPartitionsDefinition)
+            and data.get("partitions_def_id")
+            == partitions_def.get_partition_key_ordinals().defined_keys_id
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, KeyBitmapPartitionsSubset) and other.ordinals is self.ordinals:
+            return self.bitmap == other.bitmap
+        return isinstance(
+            other, (KeyBitmapPartitionsSubset, DefaultPartitionsSubset)
+        ) and self.get_partition_keys() == set(other.get_partition_keys())
+
+    def __len__(self) -> int:
+        return bin(self.bitmap).count("1")
+
+    def __contains__(self, value) -> bool:
+        ordinal = self.ordinals.get_ordinal(value)
+        return ordinal is not None and bool(self.bitmap >> ordinal & 1)
+
+    def __repr__(self) -> str:
+        return f"KeyBitmapPartitionsSubset(subset={self.get_partition_keys()})"
+
+    @classmethod
+    def empty_subset(
+        cls, partitions_def: Optional[PartitionsDefinition] = None
+    ) -> "KeyBitmapPartitionsSubset":
+        if partitions_def is None:
+            return cls(PartitionKeyOrdinals())
+
+        check.inst_param(
+            partitions_def,
+            "partitions_def",
+            (StaticPartitionsDefinition, DynamicPartitionsDefinition),
+        )
+        return cls(partitions_def.get_partition_key_ordinals())
+
+
 class AllPartitionsSubset(
     NamedTuple(
         "_AllPartitionsSubset",
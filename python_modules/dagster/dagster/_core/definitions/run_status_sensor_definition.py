@@ -740,7 +740,7 @@ def _wrapped_fn(
                 # record id (which is reindexed relative to some run sharded query).  When we update
                 # the cursor, we should omit the timestamp, since this API only queries the global
                 # index shard instead of the run shard.
-                event_records = context.instance.fetch_run_status_changes(
+                event_records = context.instance.fetch_lazy_run_status_changes(
                     records_filter=RunStatusChangeRecordsFilter(
                         event_type=cast(RunStatusChangeEventType, event_type),
                         after_timestamp=cast(
@@ -749,24 +749,24 @@ def _wrapped_fn(
                     ),
                     ascending=True,
                     limit=fetch_limit,
-                ).records
+                )
             else:
                 # the cursor storage id is globally unique, either because the event log storage is
                 # not run sharded or because the cursor was set from an event returned from the
                 # index shard. When we update the cursor, we should omit the timestamp, since this
                 # API only queries the global index shard instead of the run shard.
-                event_records = context.instance.fetch_run_status_changes(
+                event_records = context.instance.fetch_lazy_run_status_changes(
                     records_filter=RunStatusChangeRecordsFilter(
                         event_type=cast(RunStatusChangeEventType, event_type),
                         after_storage_id=sensor_cursor.record_id,
                     ),
                     ascending=True,
                     limit=fetch_limit,
-                ).records
+                )
 
-            run_ids_to_fetch = list(
-                set(event_record.event_log_entry.run_id for event_record in event_records)
-            )
+            # the records are deserialized lazily, so that the event payloads are only read for
+            # runs that the sensor ends up processing
+            run_ids_to_fetch = list(set(event_record.run_id for event_record in event_records))
 
             run_records = (
                 {
@@ -781,12 +781,11 @@ def _wrapped_fn(
 
             num_processed_runs = 0
             for event_record in event_records:
-                event_log_entry = event_record.event_log_entry
                 storage_id = event_record.storage_id
                 record_timestamp = utc_datetime_from_timestamp(event_record.timestamp).isoformat()
 
                 # skip if we couldn't find the right run
-                if event_log_entry.run_id not in run_records:
+                if event_record.run_id not in run_records:
                     context.update_cursor(
                         RunStatusSensorCursor(
                             record_id=storage_id, record_timestamp=record_timestamp
@@ -794,7 +793,7 @@ def _wrapped_fn(
                     )
                     continue
 
-                dagster_run = run_records[event_log_entry.run_id].dagster_run
+                dagster_run = run_records[event_record.run_id].dagster_run
                 job_match = False
 
                 # if monitor_all_code_locations is provided, then we want to run the sensor for all jobs in all code locations
@@ -876,7 +875,7 @@ def _wrapped_fn(
                     with RunStatusSensorContext(
                         sensor_name=name,
                         dagster_run=dagster_run,
-                        dagster_event=event_log_entry.dagster_event,
+                        dagster_event=event_record.event_log_entry.dagster_event,
                         instance=context.instance,
                         resource_defs=context.resource_defs,
                         logger=context.log,
@@ -1,5 +1,7 @@
 from datetime import datetime, timedelta
-from typing import List, NamedTuple, Optional, Sequence, cast
+from typing import List, NamedTuple, Optional, Sequence, Tuple, cast
+
+import pendulum
 
 import dagster._check as check
 from dagster._annotations import PublicAttr, experimental_param
@@ -232,6 +234,20 @@ def _map_partitions(
         if result is not None:
             return result
 
+        if (
+            from_partitions_def._has_fixed_period  # noqa: SLF001
+            and to_partitions_def._has_fixed_period  # noqa: SLF001
+        ):
+            return self._map_partitions_by_index(
+                from_partitions_def=from_partitions_def,
+                to_partitions_def=to_partitions_def,
+                from_partitions_subset=from_partitions_subset,
+                start_offset=start_offset,
+                end_offset=end_offset,
+                current_time=current_time,
+                mapping_downstream_to_upstream=mapping_downstream_to_upstream,
+            )
+
         first_window = to_partitions_def.get_first_partition_window(current_time=current_time)
         last_window = to_partitions_def.get_last_partition_window(current_time=current_time)
         full_window = (
@@ -349,6 +365,142 @@ def _map_partitions(
             sorted(list(required_but_nonexistent_partition_keys)),
         )
 
+    def _map_partitions_by_index(
+        self,
+        from_partitions_def: TimeWindowPartitionsDefinition,
+        to_partitions_def: TimeWindowPartitionsDefinition,
+        from_partitions_subset: BaseTimeWindowPartitionsSubset,
+        start_offset: int,
+        end_offset: int,
+        current_time: Optional[datetime],
+        mapping_downstream_to_upstream: bool,
+    ) -> UpstreamPartitionsResult:
+        """Equivalent to the general path of _map_partitions, for when both PartitionsDefinitions
+        have a fixed period. Each time window is converted to a range of partition indexes, and the
+        offsets, alignment to the target partitions and bounds checks are done with integer
+        arithmetic on those ranges instead of by iterating over and formatting partition keys.
+        """
+        from_start_timestamp_for_index = from_partitions_def._get_start_timestamp_for_index  # noqa: SLF001
+        from_index_for_timestamp = from_partitions_def._get_index_for_timestamp  # noqa: SLF001
+        to_start_timestamp_for_index = to_partitions_def._get_start_timestamp_for_index  # noqa: SLF001
+        to_index_for_timestamp = to_partitions_def._get_index_for_timestamp  # noqa: SLF001
+
+        num_to_partitions = to_partitions_def.get_num_partitions(current_time)
+        # Don't allow offsetting to push the windows out of the bounds of the target
+        # PartitionsDefinition
+        has_bounds = num_to_partitions > 0
+        bounds_start_timestamp = to_start_timestamp_for_index(0) if has_bounds else None
+        bounds_end_timestamp = (
+            to_start_timestamp_for_index(num_to_partitions) if has_bounds else None
+        )
+
+        # half-open ranges of partition indexes in to_partitions_def
+        index_ranges: List[Tuple[int, int]] = []
+        for from_time_window in from_partitions_subset.included_time_windows:
+            if mapping_downstream_to_upstream:
+                # offsets are in units of the downstream partitions, which are the ones we're
+                # mapping from
+                from_start_timestamp = from_start_timestamp_for_index(
+                    from_index_for_timestamp(from_time_window.start.timestamp()) + start_offset
+                )
+                from_end_timestamp = from_start_timestamp_for_index(
+                    from_index_for_timestamp(from_time_window.end.timestamp()) + end_offset
+                )
+                if has_bounds:
+                    if start_offset < 0:
+                        from_start_timestamp = max(from_start_timestamp, bounds_start_timestamp)
+                    elif start_offset > 0:
+                        from_start_timestamp = min(from_start_timestamp, bounds_end_timestamp)
+                    if end_offset < 0:
+                        from_end_timestamp = max(from_end_timestamp, bounds_start_timestamp)
+                    elif end_offset > 0:
+                        from_end_timestamp = min(from_end_timestamp, bounds_end_timestamp)
+
+                to_start_index = to_index_for_timestamp(from_start_timestamp)
+                to_end_index = to_index_for_timestamp(from_end_timestamp, round_up=True)
+            else:
+                # offsets are in units of the downstream partitions, which are the ones we're
+                # mapping to, so they're applied after aligning to them
+                to_start_index = (
+                    to_index_for_timestamp(from_time_window.start.timestamp()) + start_offset
+                )
+                to_end_index = (
+                    to_index_for_timestamp(from_time_window.end.timestamp(), round_up=True)
+                    + end_offset
+                )
+                if has_bounds:
+                    if start_offset < 0:
+                        to_start_index = max(to_start_index, 0)
+                    elif start_offset > 0:
+                        to_start_index = min(to_start_index, num_to_partitions)
+                    if end_offset < 0:
+                        to_end_index = max(to_end_index, 0)
+                    elif end_offset > 0:
+                        to_end_index = min(to_end_index, num_to_partitions)
+
+            if to_start_index < to_end_index:
+                index_ranges.append((to_start_index, to_end_index))
+
+        def _time_window_for_index_range(start_index: int, end_index: int) -> TimeWindow:
+            return TimeWindow(
+                pendulum.from_timestamp(
+                    to_start_timestamp_for_index(start_index), tz=to_partitions_def.timezone
+                ),
+                pendulum.from_timestamp(
+                    to_start_timestamp_for_index(end_index), tz=to_partitions_def.timezone
+                ),
+            )
+
+        filtered_index_ranges: List[Tuple[int, int]] = []
+        required_but_nonexistent_partition_keys = set()
+        for start_index, end_index in index_ranges:
+            if start_index < num_to_partitions and end_index > 0:
+                filtered_index_ranges.append(
+                    (max(start_index, 0), min(end_index, num_to_partitions))
+                )
+
+            if self.allow_nonexistent_upstream_partitions:
+                # If allowed to have nonexistent upstream partitions, do not consider
+                # out of range partitions to be invalid
+                continue
+
+            if not has_bounds or (start_index < 0 and end_index > num_to_partitions):
+                invalid_index_range = (start_index, end_index)
+            elif start_index < 0:
+                invalid_index_range = (start_index, min(end_index, 0))
+            elif end_index > num_to_partitions:
+                invalid_index_range = (max(start_index, num_to_partitions), end_index)
+            else:
+                continue
+
+            required_but_nonexistent_partition_keys.update(
+                to_partitions_def.get_partition_keys_in_time_window(
+                    time_window=_time_window_for_index_range(*invalid_index_range)
+                )
+            )
+
+        merged_index_ranges: List[Tuple[int, int]] = []
+        for start_index, end_index in sorted(filtered_index_ranges):
+            if merged_index_ranges and start_index <= merged_index_ranges[-1][1]:
+                merged_index_ranges[-1] = (
+                    merged_index_ranges[-1][0],
+                    max(merged_index_ranges[-1][1], end_index),
+                )
+            else:
+                merged_index_ranges.append((start_index, end_index))
+
+        return UpstreamPartitionsResult(
+            TimeWindowPartitionsSubset(
+                to_partitions_def,
+                num_partitions=None,
+                included_time_windows=[
+                    _time_window_for_index_range(start_index, end_index)
+                    for start_index, end_index in merged_index_ranges
+                ],
+            ),
+            sorted(list(required_but_nonexistent_partition_keys)),
+        )
+
     def _do_cheap_partition_mapping_if_possible(
         self,
         from_partitions_def: TimeWindowPartitionsDefinition,
@@ -1,9 +1,10 @@
+import bisect
 import functools
 import hashlib
 import json
 import re
 from abc import abstractmethod, abstractproperty
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, timedelta, tzinfo
 from enum import Enum
 from functools import cached_property
 from typing import (
@@ -25,6 +26,7 @@
 
 import pendulum
 import pytz
+from pytz.tzinfo import StaticTzInfo
 
 import dagster._check as check
 from dagster._annotations import PublicAttr, public
@@ -41,6 +43,7 @@
     pack_value,
     unpack_value,
 )
+from dagster._seven.compat.datetime import timezone_from_string
 from dagster._seven.compat.pendulum import (
     _IS_PENDULUM_1,
     PRE_TRANSITION,
@@ -51,6 +54,7 @@
 from dagster._utils.cronstring import get_fixed_minute_interval, is_basic_daily, is_basic_hourly
 from dagster._utils.partitions import DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE
 from dagster._utils.schedules import (
+    MAX_DAY_OF_MONTH_WITH_GUARANTEED_MONTHLY_INTERVAL,
     cron_string_iterator,
     cron_string_repeats_every_hour,
     is_valid_cron_schedule,
@@ -247,6 +251,25 @@ def empty() -> "TimeWindow":
         return TimeWindow(start=datetime.max, end=datetime.max)
 
 
+def _get_utc_offsets_since(tz: tzinfo, start: datetime) -> Optional[Sequence[timedelta]]:
+    """Returns the UTC offsets that a pytz timezone uses from the given time onwards, or None if
+    they cannot be determined. pytz does not expose its transition tables publicly, so any
+    timezone that does not have them in the expected shape returns None.
+    """
+    utc_transition_times = getattr(tz, "_utc_transition_times", None)
+    transition_info = getattr(tz, "_transition_info", None)
+    if not utc_transition_times or not transition_info:
+        return None
+
+    try:
+        first_index = max(
+            0, bisect.bisect_right(utc_transition_times, start.replace(tzinfo=None)) - 1
+        )
+        return [transition[0] for transition in transition_info[first_index:]]
+    except (TypeError, IndexError):
+        return None
+
+
 @whitelist_for_serdes(
     field_serializers={"start": DatetimeFieldSerializer, "end": DatetimeFieldSerializer},
     is_pickleable=False,
@@ -376,34 +399,15 @@ def _get_fast_num_partitions(self, current_time: Optional[datetime] = None) -> O
         None if the count cannot be computed quickly and must enumerate all partitions before
         counting them.
         """
-        last_partition_window = self.get_last_partition_window(current_time)
-        first_partition_window = self.get_first_partition_window(current_time)
-
-        if not last_partition_window or not first_partition_window:
+        if not self._has_fixed_period:
             return None
 
-        if self.is_basic_daily:
-            return (
-                date(
-                    last_partition_window.start.year,
-                    last_partition_window.start.month,
-                    last_partition_window.start.day,
-                )
-                - date(
-                    first_partition_window.start.year,
-                    first_partition_window.start.month,
-                    first_partition_window.start.day,
-                )
-            ).days + 1
-
-        fixed_minute_interval = get_fixed_minute_interval(self.cron_schedule)
-        if fixed_minute_interval:
-            minutes_in_window = (
-                last_partition_window.start.timestamp() - first_partition_window.start.timestamp()
-            ) / 60
-            return int(minutes_in_window // fixed_minute_interval) + 1
+        last_partition_window = self.get_last_partition_window(current_time)
+        if last_partition_window is None:
+            return None
 
-        return None
+        # the first partition window is always the window at index 0
+        return self._get_index_for_timestamp(last_partition_window.start.timestamp()) + 1
 
     def get_num_partitions(
         self,
@@ -449,6 +453,20 @@ def get_partition_keys_between_indexes(
         # Start index is inclusive, end index is exclusive.
         # Method added for performance reasons, to only string format
         # partition keys included within the indices.
+        if self._has_fixed_period:
+            end_idx = min(end_idx, self.get_num_partitions(current_time))
+            if start_idx >= end_idx:
+                return []
+            partition_keys = []
+            for time_window in self._iterate_time_windows_from_index(start_idx):
+                # datetimes from _iterate_time_windows have the correct tz so use None as a optimization
+                partition_keys.append(
+                    dst_safe_strftime(time_window.start, None, self.fmt, self.cron_schedule)
+                )
+                if len(partition_keys) >= end_idx - start_idx:
+                    break
+            return partition_keys
+
         current_timestamp = self.get_current_timestamp(current_time=current_time)
 
         partitions_past_current_time = 0
@@ -548,6 +566,10 @@ def __getstate__(self):
     @functools.lru_cache(maxsize=100)
     def time_window_for_partition_key(self, partition_key: str) -> TimeWindow:
         partition_key_dt = dst_safe_strptime(partition_key, self.timezone, self.fmt)
+        if self._fixed_minute_interval:
+            return self._get_time_window_for_index(
+                self._get_index_for_timestamp(partition_key_dt.timestamp(), round_up=True)
+            )
         return next(iter(self._iterate_time_windows(partition_key_dt)))
 
     @functools.lru_cache(maxsize=5)
@@ -559,6 +581,23 @@ def time_windows_for_partition_keys(
         if len(partition_keys) == 0:
             return []
 
+        if self._fixed_minute_interval:
+            # key by timestamp, since datetimes with the same tzinfo compare equal on either side of
+            # a DST transition
+            time_windows_by_start_timestamp = {
+                time_window.start.timestamp(): time_window
+                for time_window in (self.time_window_for_partition_key(pk) for pk in partition_keys)
+            }
+            partition_key_time_windows = [
+                time_windows_by_start_timestamp[start_timestamp]
+                for start_timestamp in sorted(time_windows_by_start_timestamp)
+            ]
+            return (
+                self._filter_valid_time_windows(partition_key_time_windows)
+                if validate
+                else partition_key_time_windows
+            )
+
         sorted_pks = sorted(
             partition_keys,
             key=lambda pk: dst_safe_strptime(pk, self.timezone, self.fmt).timestamp(),
@@ -583,21 +622,24 @@ def time_windows_for_partition_keys(
                 partition_key_time_windows.append(next(cur_windows_iterator))
 
         if validate:
-            start_time_window = self.get_first_partition_window()
-            end_time_window = self.get_last_partition_window()
+            partition_key_time_windows = self._filter_valid_time_windows(partition_key_time_windows)
+        return partition_key_time_windows
 
-            if start_time_window is None or end_time_window is None:
-                check.failed("No partitions in the PartitionsDefinition")
+    def _filter_valid_time_windows(self, time_windows: Sequence[TimeWindow]) -> List[TimeWindow]:
+        start_time_window = self.get_first_partition_window()
+        end_time_window = self.get_last_partition_window()
 
-            start_timestamp = start_time_window.start.timestamp()
-            end_timestamp = end_time_window.end.timestamp()
+        if start_time_window is None or end_time_window is None:
+            check.failed("No partitions in the PartitionsDefinition")
 
-            partition_key_time_windows = [
-                tw
-                for tw in partition_key_time_windows
-                if tw.start.timestamp() >= start_timestamp and tw.end.timestamp() <= end_timestamp
-            ]
-        return partition_key_time_windows
+        start_timestamp = start_time_window.start.timestamp()
+        end_timestamp = end_time_window.end.timestamp()
+
+        return [
+            tw
+            for tw in time_windows
+            if tw.start.timestamp() >= start_timestamp and tw.end.timestamp() <= end_timestamp
+        ]
 
     def start_time_for_partition_key(self, partition_key: str) -> datetime:
         partition_key_dt = pendulum.instance(
@@ -605,6 +647,8 @@ def start_time_for_partition_key(self, partition_key: str) -> datetime:
         )
         if self.is_basic_hourly or self.is_basic_daily:
             return partition_key_dt
+        if self._fixed_minute_interval:
+            return self.time_window_for_partition_key(partition_key).start
         # the datetime format might not include granular components, so we need to recover them,
         # e.g. if cron_schedule="0 7 * * *" and fmt="%Y-%m-%d".
         # we make the assumption that the parsed partition key is <= the start datetime.
@@ -721,6 +765,19 @@ def _get_last_partition_window(self, *, current_time: datetime) -> Optional[Time
 
         if self.end_offset == 0:
             return next(iter(self._reverse_iterate_time_windows(current_time)))
+        elif self._has_fixed_period:
+            # the window containing the bound is the first window that is not yet complete
+            last_index = (
+                self._get_index_for_timestamp(current_time.timestamp()) - 1 + self.end_offset
+            )
+            if self.end:
+                last_index = min(
+                    last_index,
+                    self._get_index_for_timestamp(self.end.timestamp())
+                    - 1
+                    + min(self.end_offset, 0),
+                )
+            return self._get_time_window_for_index(last_index) if last_index >= 0 else None
         else:
             # TODO: make this efficient
             last_partition_key = super().get_last_partition_key(current_time)
@@ -988,11 +1045,210 @@ def _reverse_iterate_time_windows(self, end: datetime) -> Iterable[TimeWindow]:
             yield TimeWindow(next_time, prev_time)
             prev_time = next_time
 
+    @cached_property
+    def _fixed_minute_interval(self) -> Optional[int]:
+        """The number of minutes between partitions, if every partition has the same length in
+        absolute time. This holds for hourly and minutely cron schedules unless the timezone
+        shifts its UTC offset by something other than a multiple of the interval, e.g. the 30
+        minute DST shift in Australia/Lord_Howe.
+        """
+        fixed_minute_interval = get_fixed_minute_interval(self.cron_schedule)
+        if fixed_minute_interval is None:
+            return None
+
+        tz = pytz.timezone(self.timezone)
+        if isinstance(tz, (StaticTzInfo, type(pytz.utc))):
+            # fixed offset timezones never shift
+            return fixed_minute_interval
+
+        # only the offsets in effect from the start of the partitions definition onwards matter,
+        # so that local mean time offsets from before standard time was adopted are ignored
+        utc_offsets = _get_utc_offsets_since(tz, self.start.astimezone(pytz.utc))
+        if not utc_offsets:
+            return None
+
+        offset_minutes = {
+            int(utc_offset.total_seconds()) // 60 % fixed_minute_interval
+            for utc_offset in utc_offsets
+        }
+        return fixed_minute_interval if len(offset_minutes) == 1 else None
+
+    @cached_property
+    def _fixed_period_schedule_type(self) -> Optional[ScheduleType]:
+        """The schedule type, if partitions have a fixed calendar length in the partitions timezone,
+        i.e. one partition per day, week or month. Monthly schedules that start after the 28th
+        skip months, so do not have a fixed period.
+        """
+        schedule_type = self.schedule_type
+        if schedule_type in (ScheduleType.DAILY, ScheduleType.WEEKLY):
+            return schedule_type
+        if (
+            schedule_type == ScheduleType.MONTHLY
+            and 1 <= self.day_offset <= MAX_DAY_OF_MONTH_WITH_GUARANTEED_MONTHLY_INTERVAL
+        ):
+            return schedule_type
+        return None
+
+    @property
+    def _has_fixed_period(self) -> bool:
+        return (
+            self._fixed_minute_interval is not None or self._fixed_period_schedule_type is not None
+        )
+
+    @cached_property
+    def _first_time_window(self) -> TimeWindow:
+        """The window at index 0, i.e. the first window that starts at or after the start time,
+        regardless of the current time.
+        """
+        return next(iter(self._iterate_time_windows(self.start)))
+
+    def _get_time_window_for_index(self, index: int) -> TimeWindow:
+        """Returns the time window at the given index, counting from the first time window, without
+        iterating over the windows in between. Only supported for schedules with a fixed period.
+        """
+        first_window_start = self._first_time_window.start
+        if self._fixed_minute_interval:
+            period_seconds = self._fixed_minute_interval * 60
+            start_timestamp = first_window_start.timestamp() + index * period_seconds
+            return TimeWindow(
+                pendulum.from_timestamp(start_timestamp, tz=self.timezone),
+                pendulum.from_timestamp(start_timestamp + period_seconds, tz=self.timezone),
+            )
+
+        period_start_date = self._get_period_start_date_for_index(index)
+
+        # the first window that starts on or after the start of the period's first day is the
+        # window at the index. Seeking to it with the cron iterator resolves DST transitions the
+        # same way as iterating from the start.
+        return next(
+            iter(
+                self._iterate_time_windows(
+                    create_pendulum_time(
+                        period_start_date.year,
+                        period_start_date.month,
+                        period_start_date.day,
+                        tz=self.timezone,
+                    )
+                )
+            )
+        )
+
+    @cached_property
+    def _tzinfo(self) -> tzinfo:
+        return check.not_none(timezone_from_string(self.timezone))
+
+    @cached_property
+    def _first_time_window_start_date(self) -> date:
+        first_window_start = self._first_time_window.start
+        return date(first_window_start.year, first_window_start.month, first_window_start.day)
+
+    def _get_period_start_date_for_index(self, index: int) -> date:
+        """Returns the first local calendar date of the day, week or month of the time window at the
+        given index. Only supported for schedules with a fixed calendar period.
+        """
+        first_window_start_date = self._first_time_window_start_date
+        schedule_type = check.not_none(self._fixed_period_schedule_type)
+        if schedule_type == ScheduleType.MONTHLY:
+            month_index = (
+                first_window_start_date.year * 12 + first_window_start_date.month - 1 + index
+            )
+            return date(month_index // 12, month_index % 12 + 1, 1)
+
+        days_per_period = 7 if schedule_type == ScheduleType.WEEKLY else 1
+        return first_window_start_date + timedelta(days=index * days_per_period)
+
+    @cached_property
+    def _fixed_period_start_offsets(self) -> Tuple[int, int, int]:
+        """The day of the month, hour and minute that each fixed calendar period starts at."""
+        day = self.day_offset if self._fixed_period_schedule_type == ScheduleType.MONTHLY else 0
+        return day, self.hour_offset, self.minute_offset
+
+    def _get_start_timestamp_for_index(self, index: int) -> float:
+        """Returns the start timestamp of the time window at the given index. Equivalent to
+        `_get_time_window_for_index(index).start.timestamp()`, but only seeks with the cron iterator
+        when the window starts at a local time that is skipped or repeated by a DST transition. Only
+        supported for schedules with a fixed period.
+        """
+        if self._fixed_minute_interval:
+            return (
+                self._first_time_window.start.timestamp() + index * self._fixed_minute_interval * 60
+            )
+
+        period_start_date = self._get_period_start_date_for_index(index)
+        day, hour, minute = self._fixed_period_start_offsets
+        window_start = datetime(
+            period_start_date.year,
+            period_start_date.month,
+            day or period_start_date.day,
+            hour,
+            minute,
+            tzinfo=self._tzinfo,
+        )
+        if window_start.utcoffset() != window_start.replace(fold=1).utcoffset():
+            # resolve DST transitions the same way as the cron iterator
+            return self._get_time_window_for_index(index).start.timestamp()
+        return window_start.timestamp()
+
+    def _get_index_for_timestamp(self, timestamp: float, round_up: bool = False) -> int:
+        """Returns the index of the time window that contains the given timestamp, or with
+        `round_up`, the index of the first time window that starts at or after it. Indexes count
+        from the first time window, so are negative for timestamps before it. Only supported for
+        schedules with a fixed period.
+        """
+        first_window_start = self._first_time_window.start
+        if self._fixed_minute_interval:
+            period_seconds = self._fixed_minute_interval * 60
+            offset = timestamp - first_window_start.timestamp()
+            if round_up:
+                return -int((-offset) // period_seconds)
+            return int(offset // period_seconds)
+
+        schedule_type = check.not_none(self._fixed_period_schedule_type)
+        local_dt = datetime.fromtimestamp(timestamp, self._tzinfo)
+        first_window_start_date = self._first_time_window_start_date
+        if schedule_type == ScheduleType.MONTHLY:
+            index = (local_dt.year - first_window_start_date.year) * 12 + (
+                local_dt.month - first_window_start_date.month
+            )
+        else:
+            days_per_period = 7 if schedule_type == ScheduleType.WEEKLY else 1
+            index = (local_dt.date() - first_window_start_date).days // days_per_period
+
+        # the calendar arithmetic finds the period that the timestamp falls in, but the window for
+        # that period may start later in the period (e.g. daily partitions that start at 7am)
+        while timestamp < self._get_start_timestamp_for_index(index):
+            index -= 1
+        while timestamp >= self._get_start_timestamp_for_index(index + 1):
+            index += 1
+
+        if round_up and timestamp > self._get_start_timestamp_for_index(index):
+            index += 1
+        return index
+
+    def _iterate_time_windows_from_index(self, index: int) -> Iterable[TimeWindow]:
+        """Returns an infinite generator of time windows, starting with the window at the given
+        index. Only supported for schedules with a fixed period.
+        """
+        if self._fixed_minute_interval:
+            while True:
+                yield self._get_time_window_for_index(index)
+                index += 1
+        else:
+            yield from self._iterate_time_windows(self._get_time_window_for_index(index).start)
+
     def get_partition_key_for_timestamp(self, timestamp: float, end_closed: bool = False) -> str:
         """Args:
         timestamp (float): Timestamp from the unix epoch, UTC.
         end_closed (bool): Whether the interval is closed at the end or at the beginning.
         """
+        if self._fixed_minute_interval:
+            time_window = self._get_time_window_for_index(self._get_index_for_timestamp(timestamp))
+            if end_closed and time_window.start.timestamp() == timestamp:
+                time_window = self._get_time_window_for_index(
+                    self._get_index_for_timestamp(timestamp) - 1
+                )
+            return dst_safe_strftime(time_window.start, self.timezone, self.fmt, self.cron_schedule)
+
         iterator = cron_string_iterator(
             timestamp, self.cron_schedule, self.timezone, start_offset=-1
         )
@@ -1945,14 +2201,41 @@ def __eq__(self, other):
             and self.included_time_windows == other.included_time_windows
         )
 
+    def _has_same_partitions_def(self, other: "PartitionsSubset") -> bool:
+        return (
+            isinstance(other, BaseTimeWindowPartitionsSubset)
+            and other.partitions_def == self.partitions_def
+        )
+
+    def _with_combined_time_windows(
+        self,
+        other: "BaseTimeWindowPartitionsSubset",
+        include: Callable[[bool, bool], bool],
+    ) -> "TimeWindowPartitionsSubset":
+        return TimeWindowPartitionsSubset(
+            self.partitions_def,
+            num_partitions=None,
+            included_time_windows=_combine_time_windows(
+                self.included_time_windows, other.included_time_windows, include
+            ),
+        )
+
     def __or__(self, other: "PartitionsSubset") -> "PartitionsSubset":
         if self is other:
             return self
+        if self._has_same_partitions_def(other):
+            return self._with_combined_time_windows(
+                cast(BaseTimeWindowPartitionsSubset, other), lambda a, b: a or b
+            )
         return self.with_partition_keys(other.get_partition_keys())
 
     def __sub__(self, other: "PartitionsSubset") -> "PartitionsSubset":
         if self is other:
             return self.empty_subset(self.partitions_def)
+        if self._has_same_partitions_def(other):
+            return self._with_combined_time_windows(
+                cast(BaseTimeWindowPartitionsSubset, other), lambda a, b: a and not b
+            )
         return self.empty_subset(self.partitions_def).with_partition_keys(
             set(self.get_partition_keys()).difference(set(other.get_partition_keys()))
         )
@@ -1960,11 +2243,59 @@ def __sub__(self, other: "PartitionsSubset") -> "PartitionsSubset":
     def __and__(self, other: "PartitionsSubset") -> "PartitionsSubset":
         if self is other:
             return self
+        if self._has_same_partitions_def(other):
+            return self._with_combined_time_windows(
+                cast(BaseTimeWindowPartitionsSubset, other), lambda a, b: a and b
+            )
         return self.empty_subset(self.partitions_def).with_partition_keys(
             set(self.get_partition_keys()) & set(other.get_partition_keys())
         )
 
 
+def _combine_time_windows(
+    time_windows: Sequence[TimeWindow],
+    other_time_windows: Sequence[TimeWindow],
+    include: Callable[[bool, bool], bool],
+) -> Sequence[TimeWindow]:
+    """Combines two sorted sequences of non-overlapping time windows, returning the minimized set of
+    time windows that cover the times where `include(in_time_windows, in_other_time_windows)`.
+    Because time windows in a subset always start and end on partition boundaries, so do the
+    resulting time windows.
+    """
+    boundaries = {}
+    for time_window in [*other_time_windows, *time_windows]:
+        boundaries[time_window.start.timestamp()] = time_window.start
+        boundaries[time_window.end.timestamp()] = time_window.end
+    sorted_timestamps = sorted(boundaries.keys())
+
+    def _next_idx_containing(windows: Sequence[TimeWindow], idx: int, timestamp: float) -> int:
+        while idx < len(windows) and windows[idx].end.timestamp() <= timestamp:
+            idx += 1
+        return idx
+
+    result: List[TimeWindow] = []
+    idx = other_idx = 0
+    for start_timestamp, end_timestamp in zip(sorted_timestamps, sorted_timestamps[1:]):
+        idx = _next_idx_containing(time_windows, idx, start_timestamp)
+        other_idx = _next_idx_containing(other_time_windows, other_idx, start_timestamp)
+        in_time_windows = (
+            idx < len(time_windows) and time_windows[idx].start.timestamp() <= start_timestamp
+        )
+        in_other_time_windows = (
+            other_idx < len(other_time_windows)
+            and other_time_windows[other_idx].start.timestamp() <= start_timestamp
+        )
+        if not include(in_time_windows, in_other_time_windows):
+            continue
+
+        if result and result[-1].end.timestamp() == start_timestamp:
+            result[-1] = TimeWindow(result[-1].start, boundaries[end_timestamp])
+        else:
+            result.append(TimeWindow(boundaries[start_timestamp], boundaries[end_timestamp]))
+
+    return result
+
+
 class PartitionKeysTimeWindowPartitionsSubset(BaseTimeWindowPartitionsSubset):
     """A PartitionsSubset for a TimeWindowPartitionsDefinition, which internally represents the
     included partitions using strings.
@@ -2196,9 +2527,8 @@ def cheap_ends_before(self, dt: datetime, dt_cron_schedule: str) -> bool:
     def num_partitions(self) -> int:
         num_partitions_ = self._asdict()["num_partitions"]
         if num_partitions_ is None:
-            return sum(
-                len(self.partitions_def.get_partition_keys_in_time_window(time_window))
-                for time_window in self.included_time_windows
+            return self._num_partitions_from_time_windows(
+                self.partitions_def, self.included_time_windows
             )
         return num_partitions_
 
@@ -2206,6 +2536,16 @@ def num_partitions(self) -> int:
     def _num_partitions_from_time_windows(
         cls, partitions_def: TimeWindowPartitionsDefinition, time_windows: Sequence[TimeWindow]
     ) -> int:
+        if partitions_def._has_fixed_period:  # noqa: SLF001
+            return sum(
+                partitions_def._get_index_for_timestamp(  # noqa: SLF001
+                    time_window.end.timestamp(), round_up=True
+                )
+                - partitions_def._get_index_for_timestamp(  # noqa: SLF001
+                    time_window.start.timestamp(), round_up=True
+                )
+                for time_window in time_windows
+            )
         return sum(
             len(partitions_def.get_partition_keys_in_time_window(time_window))
             for time_window in time_windows
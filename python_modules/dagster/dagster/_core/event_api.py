@@ -10,7 +10,14 @@
 from dagster._core.definitions.events import AssetKey, AssetMaterialization, AssetObservation
 from dagster._core.events import EVENT_TYPE_TO_PIPELINE_RUN_STATUS, DagsterEventType
 from dagster._core.events.log import EventLogEntry
-from dagster._serdes import whitelist_for_serdes
+from dagster._serdes import (
+    deserialize_value,
+    get_packed_field,
+    unpack_value,
+    whitelist_for_serdes,
+)
+from dagster._serdes.errors import DeserializationError
+from dagster._serdes.serdes import _WHITELIST_MAP
 from dagster._seven import json
 
 EventHandlerFn: TypeAlias = Callable[[EventLogEntry, str], None]
@@ -141,6 +148,216 @@ def event_type(self) -> DagsterEventType:
         ).event_type
 
 
+# for asset events, the path through the serialized `event_specific_data` to the object which holds
+# the asset key and partition
+_ASSET_EVENT_DATA_PATHS: Mapping[DagsterEventType, Sequence[str]] = {
+    DagsterEventType.ASSET_MATERIALIZATION: ["materialization"],
+    DagsterEventType.ASSET_OBSERVATION: ["asset_observation"],
+    DagsterEventType.ASSET_MATERIALIZATION_PLANNED: [],
+}
+
+
+class LazyEventLogRecord:
+    """An event record whose stored event is only parsed when it is accessed.
+
+    Constructing a record does no parsing. The envelope of the event (run id, timestamp, step key,
+    job name, event type, and the asset key and partition of asset events) is read from the parsed
+    JSON the first time one of those properties is accessed, without constructing the nested
+    DagsterEvent payload, which may contain arbitrarily large metadata. The run id and asset key can
+    also be passed in by storages that read them from indexed columns, so that they are available
+    without parsing the event at all. Accessing `event_log_entry` (or any property derived from it)
+    deserializes the full entry once and caches it. Exposes the same read-only properties as
+    EventLogRecord.
+
+    Users should not instantiate this class directly.
+    """
+
+    __slots__ = (
+        "storage_id",
+        "_run_id",
+        "_timestamp",
+        "_step_key",
+        "_job_name",
+        "_dagster_event_type",
+        "_asset_key",
+        "_partition_key",
+        "_is_envelope_parsed",
+        "_serialized_event",
+        "_event_log_entry",
+    )
+
+    def __init__(
+        self,
+        storage_id: int,
+        serialized_event: str,
+        run_id: Optional[str] = None,
+        asset_key: Optional[AssetKey] = None,
+    ):
+        self.storage_id = check.int_param(storage_id, "storage_id")
+        self._serialized_event: Optional[str] = check.str_param(
+            serialized_event, "serialized_event"
+        )
+        self._event_log_entry: Optional[EventLogEntry] = None
+        self._run_id = check.opt_str_param(run_id, "run_id")
+        self._asset_key = check.opt_inst_param(asset_key, "asset_key", AssetKey)
+        self._timestamp: float = 0.0
+        self._step_key: Optional[str] = None
+        self._job_name: Optional[str] = None
+        self._dagster_event_type: Optional[DagsterEventType] = None
+        self._partition_key: Optional[str] = None
+        self._is_envelope_parsed = False
+
+    def _parse_envelope(self) -> None:
+        if self._is_envelope_parsed:
+            return
+
+        envelope = json.loads(check.not_none(self._serialized_event))
+        serializer = _WHITELIST_MAP.object_deserializers.get(envelope.get("__class__", ""))
+        if not serializer or serializer.klass is not EventLogEntry:
+            raise DeserializationError(
+                f"Expected a serialized EventLogEntry, got {envelope.get('__class__')}"
+            )
+
+        self._run_id = get_packed_field(envelope, "run_id")
+        self._timestamp = get_packed_field(envelope, "timestamp")
+        self._step_key = get_packed_field(envelope, "step_key")
+        self._job_name = get_packed_field(envelope, "job_name")
+        self._is_envelope_parsed = True
+
+        dagster_event = get_packed_field(envelope, "dagster_event")
+        if dagster_event is None:
+            if get_packed_field(envelope, "error_info") is None:
+                # plain log messages have no nested payload to defer, so the entry is unpacked from
+                # the already parsed envelope instead of retaining the serialized event
+                self._event_log_entry = unpack_value(envelope, as_type=EventLogEntry)
+                self._serialized_event = None
+            return
+
+        try:
+            self._dagster_event_type = DagsterEventType(
+                get_packed_field(dagster_event, "event_type_value")
+            )
+        except ValueError:
+            # renamed and unknown event types are resolved by the DagsterEvent deserializer, which
+            # maps old event types to their new ones and unknown event types to engine events
+            entry = self.event_log_entry
+            self._dagster_event_type = entry.dagster_event_type
+            self._asset_key = self._asset_key or (
+                entry.dagster_event.asset_key if entry.dagster_event else None
+            )
+            self._partition_key = entry.dagster_event.partition if entry.dagster_event else None
+            return
+
+        asset_event_data_path = _ASSET_EVENT_DATA_PATHS.get(self._dagster_event_type)
+        if asset_event_data_path is None:
+            return
+
+        try:
+            asset_event_data = get_packed_field(dagster_event, "event_specific_data")
+            for field_name in asset_event_data_path:
+                asset_event_data = get_packed_field(asset_event_data, field_name)
+            if self._asset_key is None:
+                self._asset_key = unpack_value(
+                    get_packed_field(asset_event_data, "asset_key"), as_type=AssetKey
+                )
+            self._partition_key = get_packed_field(asset_event_data, "partition")
+        except (AttributeError, DeserializationError):
+            # fall back to reading the asset key and partition from the deserialized entry
+            entry = self.event_log_entry
+            self._asset_key = entry.dagster_event.asset_key if entry.dagster_event else None
+            self._partition_key = entry.dagster_event.partition if entry.dagster_event else None
+
+    @staticmethod
+    def from_event_log_record(event_log_record: EventLogRecord) -> "LazyEventLogRecord":
+        """Wrap an already deserialized EventLogRecord."""
+        entry = event_log_record.event_log_entry
+        record = LazyEventLogRecord.__new__(LazyEventLogRecord)
+        record.storage_id = event_log_record.storage_id
+        record._run_id = entry.run_id  # noqa: SLF001
+        record._timestamp = entry.timestamp  # noqa: SLF001
+        record._step_key = entry.step_key  # noqa: SLF001
+        record._job_name = entry.job_name  # noqa: SLF001
+        record._dagster_event_type = entry.dagster_event_type  # noqa: SLF001
+        dagster_event = entry.dagster_event
+        record._asset_key = dagster_event.asset_key if dagster_event else None  # noqa: SLF001
+        record._partition_key = dagster_event.partition if dagster_event else None  # noqa: SLF001
+        record._is_envelope_parsed = True  # noqa: SLF001
+        record._serialized_event = None  # noqa: SLF001
+        record._event_log_entry = entry  # noqa: SLF001
+        return record
+
+    @property
+    def run_id(self) -> str:
+        if self._run_id is None:
+            self._parse_envelope()
+        return check.not_none(self._run_id)
+
+    @property
+    def timestamp(self) -> float:
+        self._parse_envelope()
+        return self._timestamp
+
+    @property
+    def step_key(self) -> Optional[str]:
+        self._parse_envelope()
+        return self._step_key
+
+    @property
+    def job_name(self) -> Optional[str]:
+        self._parse_envelope()
+        return self._job_name
+
+    @property
+    def dagster_event_type(self) -> Optional[DagsterEventType]:
+        self._parse_envelope()
+        return self._dagster_event_type
+
+    @property
+    def event_log_entry(self) -> EventLogEntry:
+        if self._event_log_entry is None:
+            self._event_log_entry = deserialize_value(
+                check.not_none(self._serialized_event), EventLogEntry
+            )
+        return self._event_log_entry
+
+    @property
+    def is_deserialized(self) -> bool:
+        return self._event_log_entry is not None
+
+    @property
+    def asset_key(self) -> Optional[AssetKey]:
+        if self._asset_key is None:
+            self._parse_envelope()
+        return self._asset_key
+
+    @property
+    def partition_key(self) -> Optional[str]:
+        self._parse_envelope()
+        return self._partition_key
+
+    @property
+    def asset_materialization(self) -> Optional[AssetMaterialization]:
+        if self.dagster_event_type != DagsterEventType.ASSET_MATERIALIZATION:
+            return None
+        return self.event_log_entry.asset_materialization
+
+    @property
+    def asset_observation(self) -> Optional[AssetObservation]:
+        if self.dagster_event_type != DagsterEventType.ASSET_OBSERVATION:
+            return None
+        return self.event_log_entry.asset_observation
+
+    @property
+    def event_type(self) -> DagsterEventType:
+        return check.not_none(
+            self.dagster_event_type,
+            "Expected dagster_event property to be present if calling the event_type property",
+        )
+
+    def to_event_log_record(self) -> EventLogRecord:
+        return EventLogRecord(storage_id=self.storage_id, event_log_entry=self.event_log_entry)
+
+
 class EventRecordsResult(NamedTuple):
     """Return value for a query fetching event records from the instance.  Contains a list of event
     records, a cursor string, and a boolean indicating whether there are more records to fetch.
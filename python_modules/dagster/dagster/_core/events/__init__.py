@@ -210,6 +210,23 @@ class DagsterEventType(str, Enum):
     DagsterEventType.RUN_CANCELED,
 }
 
+# When run event buffering is enabled (see `DagsterInstance.handle_new_event`), these events are
+# written immediately along with any buffered events for the same run. Step and run boundaries are
+# acted on by other processes as soon as they are stored, and asset events may be read back by the
+# step that reported them.
+EVENT_BUFFER_FLUSH_EVENTS = PIPELINE_EVENTS | {
+    DagsterEventType.ASSET_MATERIALIZATION,
+    DagsterEventType.ASSET_MATERIALIZATION_PLANNED,
+    DagsterEventType.ASSET_OBSERVATION,
+    DagsterEventType.ASSET_CHECK_EVALUATION,
+    DagsterEventType.STEP_START,
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.STEP_SKIPPED,
+    DagsterEventType.STEP_UP_FOR_RETRY,
+    DagsterEventType.STEP_RESTARTED,
+}
+
 HOOK_EVENTS = {
     DagsterEventType.HOOK_COMPLETED,
     DagsterEventType.HOOK_ERRORED,
@@ -244,7 +261,8 @@ class DagsterEventType(str, Enum):
 
 PIPELINE_RUN_STATUS_TO_EVENT_TYPE = {v: k for k, v in EVENT_TYPE_TO_PIPELINE_RUN_STATUS.items()}
 
-# These are the only events currently supported in `EventLogStorage.store_event_batch`
+# The events that `EventLogStorage.store_event_batch` originally supported. Batches of any event type
+# can now be stored, this is kept for backwards compatibility.
 BATCH_WRITABLE_EVENTS = {
     DagsterEventType.ASSET_MATERIALIZATION,
     DagsterEventType.ASSET_OBSERVATION,
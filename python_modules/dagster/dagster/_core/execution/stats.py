@@ -1,6 +1,6 @@
 from collections import defaultdict
 from enum import Enum
-from typing import Any, Dict, Iterable, NamedTuple, Optional, Sequence, cast
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Tuple, cast
 
 import dagster._check as check
 from dagster._core.definitions import ExpectationResult
@@ -81,9 +81,8 @@ def build_run_step_stats_from_events(
     run_id: str, records: Iterable[EventLogEntry]
 ) -> Sequence["RunStepKeyStatsSnapshot"]:
     by_step_key: Dict[str, Dict[str, Any]] = defaultdict(dict)
-    attempts = defaultdict(list)
-    attempt_events = defaultdict(list)
-    markers: Dict[str, Dict[str, Any]] = defaultdict(dict)
+    attempt_events: Dict[str, List[Tuple[DagsterEventType, float]]] = defaultdict(list)
+    markers: Dict[str, Dict[str, Dict[str, Any]]] = defaultdict(dict)
     for event in records:
         if not event.is_dagster_event:
             continue
@@ -107,50 +106,177 @@ def build_run_step_stats_from_events(
         if dagster_event.event_type == DagsterEventType.STEP_SKIPPED:
             by_step_key[step_key]["end_time"] = event.timestamp
             by_step_key[step_key]["status"] = StepEventStatus.SKIPPED
-        if dagster_event.event_type == DagsterEventType.ASSET_MATERIALIZATION:
-            materialization_events = by_step_key[step_key].get("materialization_events", [])
-            materialization_events.append(event)
-            by_step_key[step_key]["materialization_events"] = materialization_events
-        if dagster_event.event_type == DagsterEventType.STEP_EXPECTATION_RESULT:
-            expectation_data = cast(StepExpectationResultData, dagster_event.event_specific_data)
-            expectation_result = expectation_data.expectation_result
-            step_expectation_results = by_step_key[step_key].get("expectation_results", [])
-            step_expectation_results.append(expectation_result)
-            by_step_key[step_key]["expectation_results"] = step_expectation_results
         if dagster_event.event_type in (
             DagsterEventType.STEP_UP_FOR_RETRY,
             DagsterEventType.STEP_RESTARTED,
         ):
-            attempt_events[step_key].append(event)
+            attempt_events[step_key].append((dagster_event.event_type, event.timestamp))
         if dagster_event.event_type in MARKER_EVENTS:
-            if dagster_event.engine_event_data.marker_start:
-                key = dagster_event.engine_event_data.marker_start
-                if key not in markers[step_key]:
-                    markers[step_key][key] = {"key": key, "start": event.timestamp}
-                else:
-                    markers[step_key][key]["start"] = event.timestamp
-
-            if dagster_event.engine_event_data.marker_end:
-                key = dagster_event.engine_event_data.marker_end
-                if key not in markers[step_key]:
-                    markers[step_key][key] = {"key": key, "end": event.timestamp}
-                else:
-                    markers[step_key][key]["end"] = event.timestamp
+            _add_step_marker(
+                markers[step_key],
+                event.timestamp,
+                dagster_event.engine_event_data.marker_start,
+                dagster_event.engine_event_data.marker_end,
+            )
+        _add_step_payload(by_step_key, event)
+
+    return _build_run_step_stats_snapshots(run_id, by_step_key, attempt_events, markers)
+
+
+class StepEventAggregate(NamedTuple):
+    """The number of events of a single type for a step, along with the storage id and timestamp of
+    the last of those events.
+    """
+
+    step_key: str
+    event_type: DagsterEventType
+    count: int
+    last_storage_id: int
+    last_timestamp: Optional[float]
+
+
+class StepMarkerEvent(NamedTuple):
+    """The marker fields of a single engine event for a step."""
+
+    step_key: str
+    timestamp: float
+    marker_start: Optional[str]
+    marker_end: Optional[str]
+
+
+# the step lifecycle events that determine the status, timing and attempt count of a step
+STEP_STATS_AGGREGATE_EVENT_TYPES = (
+    DagsterEventType.STEP_START,
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_SKIPPED,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.STEP_RESTARTED,
+)
+
+# the events that delimit the attempts of a step that is retried
+STEP_ATTEMPT_EVENT_TYPES = (
+    DagsterEventType.STEP_UP_FOR_RETRY,
+    DagsterEventType.STEP_RESTARTED,
+)
+
+# the events whose payload is included in the step stats
+STEP_PAYLOAD_EVENT_TYPES = (
+    DagsterEventType.ASSET_MATERIALIZATION,
+    DagsterEventType.STEP_EXPECTATION_RESULT,
+)
+
+_STEP_END_STATUSES = {
+    DagsterEventType.STEP_SUCCESS: StepEventStatus.SUCCESS,
+    DagsterEventType.STEP_SKIPPED: StepEventStatus.SKIPPED,
+    DagsterEventType.STEP_FAILURE: StepEventStatus.FAILURE,
+}
+
+
+def build_run_step_stats_from_aggregates(
+    run_id: str,
+    aggregates: Iterable[StepEventAggregate],
+    attempt_events: Iterable[Tuple[str, DagsterEventType, float]],
+    payload_records: Iterable[EventLogEntry],
+    marker_events: Iterable[StepMarkerEvent],
+) -> Sequence["RunStepKeyStatsSnapshot"]:
+    """Build step stats from pre-aggregated step lifecycle events, so that storages can compute the
+    status, timing and attempt count of each step without reading every event of the run.
 
+    Args:
+        aggregates: The aggregates of the STEP_STATS_AGGREGATE_EVENT_TYPES events of each step.
+        attempt_events: The (step key, event type, timestamp) of each STEP_ATTEMPT_EVENT_TYPES
+            event, in storage order.
+        payload_records: The STEP_PAYLOAD_EVENT_TYPES events, in storage order.
+        marker_events: The marker fields of the MARKER_EVENTS events, in storage order.
+
+    Produces the same stats as `build_run_step_stats_from_events` for event logs where a step has
+    at most one STEP_START event, which precedes any of its STEP_RESTARTED events.
+    """
+    by_step_key: Dict[str, Dict[str, Any]] = defaultdict(dict)
+    last_end_event_ids: Dict[str, int] = {}
+    for aggregate in aggregates:
+        step_stats = by_step_key[aggregate.step_key]
+        if aggregate.event_type == DagsterEventType.STEP_START:
+            step_stats["start_time"] = aggregate.last_timestamp
+            step_stats["attempts"] = int(step_stats.get("attempts") or 0) + 1
+        elif aggregate.event_type == DagsterEventType.STEP_RESTARTED:
+            step_stats["attempts"] = int(step_stats.get("attempts") or 0) + aggregate.count
+        elif aggregate.event_type in _STEP_END_STATUSES:
+            # the last end event for a step determines its status
+            if aggregate.last_storage_id > last_end_event_ids.get(aggregate.step_key, -1):
+                last_end_event_ids[aggregate.step_key] = aggregate.last_storage_id
+                step_stats["end_time"] = aggregate.last_timestamp
+                step_stats["status"] = _STEP_END_STATUSES[aggregate.event_type]
+
+    attempt_events_by_step_key: Dict[str, List[Tuple[DagsterEventType, float]]] = defaultdict(list)
+    for step_key, event_type, timestamp in attempt_events:
+        attempt_events_by_step_key[step_key].append((event_type, timestamp))
+
+    for record in payload_records:
+        _add_step_payload(by_step_key, record)
+
+    markers: Dict[str, Dict[str, Dict[str, Any]]] = defaultdict(dict)
+    for marker_event in marker_events:
+        _add_step_marker(
+            markers[marker_event.step_key],
+            marker_event.timestamp,
+            marker_event.marker_start,
+            marker_event.marker_end,
+        )
+
+    return _build_run_step_stats_snapshots(run_id, by_step_key, attempt_events_by_step_key, markers)
+
+
+def _add_step_payload(by_step_key: Dict[str, Dict[str, Any]], event: EventLogEntry) -> None:
+    dagster_event = event.get_dagster_event()
+    step_key = check.not_none(dagster_event.step_key)
+    if dagster_event.event_type == DagsterEventType.ASSET_MATERIALIZATION:
+        materialization_events = by_step_key[step_key].get("materialization_events", [])
+        materialization_events.append(event)
+        by_step_key[step_key]["materialization_events"] = materialization_events
+    if dagster_event.event_type == DagsterEventType.STEP_EXPECTATION_RESULT:
+        expectation_data = cast(StepExpectationResultData, dagster_event.event_specific_data)
+        expectation_result = expectation_data.expectation_result
+        step_expectation_results = by_step_key[step_key].get("expectation_results", [])
+        step_expectation_results.append(expectation_result)
+        by_step_key[step_key]["expectation_results"] = step_expectation_results
+
+
+def _add_step_marker(
+    step_markers: Dict[str, Dict[str, Any]],
+    timestamp: float,
+    marker_start: Optional[str],
+    marker_end: Optional[str],
+) -> None:
+    if marker_start:
+        if marker_start not in step_markers:
+            step_markers[marker_start] = {"key": marker_start, "start": timestamp}
+        else:
+            step_markers[marker_start]["start"] = timestamp
+
+    if marker_end:
+        if marker_end not in step_markers:
+            step_markers[marker_end] = {"key": marker_end, "end": timestamp}
+        else:
+            step_markers[marker_end]["end"] = timestamp
+
+
+def _build_run_step_stats_snapshots(
+    run_id: str,
+    by_step_key: Dict[str, Dict[str, Any]],
+    attempt_events: Mapping[str, Sequence[Tuple[DagsterEventType, float]]],
+    markers: Mapping[str, Mapping[str, Mapping[str, Any]]],
+) -> Sequence["RunStepKeyStatsSnapshot"]:
+    attempts = {}
     for step_key, step_stats in by_step_key.items():
-        events = attempt_events[step_key]
         step_attempts = []
         attempt_start = step_stats.get("start_time")
 
-        for event in events:
-            if not event.dagster_event:
-                continue
-            if event.dagster_event.event_type == DagsterEventType.STEP_UP_FOR_RETRY:
-                step_attempts.append(
-                    RunStepMarker(start_time=attempt_start, end_time=event.timestamp)
-                )
-            elif event.dagster_event.event_type == DagsterEventType.STEP_RESTARTED:
-                attempt_start = event.timestamp
+        for event_type, timestamp in attempt_events.get(step_key, []):
+            if event_type == DagsterEventType.STEP_UP_FOR_RETRY:
+                step_attempts.append(RunStepMarker(start_time=attempt_start, end_time=timestamp))
+            elif event_type == DagsterEventType.STEP_RESTARTED:
+                attempt_start = timestamp
         if step_stats.get("end_time"):
             step_attempts.append(
                 RunStepMarker(start_time=attempt_start, end_time=step_stats["end_time"])
@@ -166,7 +292,7 @@ def build_run_step_stats_from_events(
             attempts_list=attempts[step_key],
             markers=[
                 RunStepMarker(start_time=marker.get("start"), end_time=marker.get("end"))
-                for marker in markers[step_key].values()
+                for marker in markers.get(step_key, {}).values()
             ],
             **value,
         )
@@ -3,10 +3,12 @@
 import os
 import queue
 import sys
+import time
 from abc import ABC, abstractmethod
 from multiprocessing import Queue
+from multiprocessing.connection import wait
 from multiprocessing.context import BaseContext as MultiprocessingBaseContext
-from typing import TYPE_CHECKING, Iterator, NamedTuple, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterator, NamedTuple, Optional, Tuple, Union
 
 from typing_extensions import Literal
 
@@ -98,11 +100,43 @@ def _execute_command_in_child_process(event_queue: Queue, command: ChildProcessC
 """Sentinel value."""
 
 
+class ChildProcessEventSelector:
+    """Waits for events from any of a set of child processes at once.
+
+    Without a selector, each child process iterator blocks on its own queue for up to a `TICK`
+    before yielding None, so an idle iteration over N quiet children takes N ticks and delays
+    events from every other child. Iterators that are passed a selector register their process
+    and event queue with it and poll without blocking, so the caller can instead block in a single
+    `wait` call that returns as soon as any child emits an event or exits.
+    """
+
+    def __init__(self):
+        self._handles: Dict[int, Tuple[Any, Any]] = {}
+
+    def register(self, process, event_queue) -> None:
+        # the read end of the queue's pipe becomes readable once the child has put an event on it
+        self._handles[id(process)] = (event_queue._reader, process.sentinel)  # noqa: SLF001
+
+    def unregister(self, process) -> None:
+        self._handles.pop(id(process), None)
+
+    def wait(self, timeout: float) -> bool:
+        """Blocks until any registered child process has an event available or has exited, or
+        until the timeout elapses. Returns whether any child process is ready.
+        """
+        if not self._handles:
+            if timeout > 0:
+                time.sleep(timeout)
+            return False
+        handles = [handle for pair in self._handles.values() for handle in pair]
+        return bool(wait(handles, timeout=max(timeout, 0)))
+
+
 def _poll_for_event(
-    process, event_queue
+    process, event_queue, timeout: float = TICK
 ) -> Optional[Union["DagsterEvent", Literal["PROCESS_DEAD_AND_QUEUE_EMPTY"]]]:
     try:
-        return event_queue.get(block=True, timeout=TICK)
+        return event_queue.get(block=timeout > 0, timeout=timeout if timeout > 0 else None)
     except queue.Empty:
         if not process.is_alive():
             # There is a possibility that after the last queue.get the
@@ -118,7 +152,9 @@ def _poll_for_event(
 
 
 def execute_child_process_command(
-    multiprocessing_ctx: MultiprocessingBaseContext, command: ChildProcessCommand
+    multiprocessing_ctx: MultiprocessingBaseContext,
+    command: ChildProcessCommand,
+    event_selector: Optional[ChildProcessEventSelector] = None,
 ) -> Iterator[Optional["DagsterEvent"]]:
     """Execute a ChildProcessCommand in a new process.
 
@@ -142,6 +178,9 @@ def execute_child_process_command(
     Args:
         multiprocessing_ctx: The multiprocessing context to execute in (spawn, forkserver, fork)
         command (ChildProcessCommand): The command to execute in the child process.
+        event_selector (Optional[ChildProcessEventSelector]): If set, the child process is
+            registered with the selector and polled without blocking, and the caller is
+            responsible for waiting on the selector when no iterator has produced an event.
 
     Warning: if the child process is in an infinite loop, this will
     also infinitely loop.
@@ -149,16 +188,20 @@ def execute_child_process_command(
     check.inst_param(command, "command", ChildProcessCommand)
 
     event_queue = multiprocessing_ctx.Queue()
+    process = None
     try:
         process = multiprocessing_ctx.Process(  # type: ignore
             target=_execute_command_in_child_process, args=(event_queue, command)
         )
         process.start()
+        if event_selector:
+            event_selector.register(process, event_queue)
 
         completed_properly = False
+        poll_timeout = 0 if event_selector else TICK
 
         while not completed_properly:
-            event = _poll_for_event(process, event_queue)
+            event = _poll_for_event(process, event_queue, poll_timeout)
 
             if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
                 break
@@ -174,4 +217,6 @@ def execute_child_process_command(
 
         process.join()
     finally:
+        if event_selector and process:
+            event_selector.unregister(process)
         event_queue.close()
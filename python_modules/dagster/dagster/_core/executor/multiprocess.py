@@ -37,9 +37,11 @@
     ChildProcessCommand,
     ChildProcessCrashException,
     ChildProcessEvent,
+    ChildProcessEventSelector,
     ChildProcessSystemErrorEvent,
     execute_child_process_command,
 )
+from .step_worker_pool import StepWorker, StepWorkerCommand, StepWorkerPool
 
 if TYPE_CHECKING:
     from dagster._core.instance.ref import InstanceRef
@@ -47,15 +49,19 @@
 
 DELEGATE_MARKER = "multiprocess_subprocess_init"
 
+# Upper bound on how long the executor waits for events from child processes when none are ready,
+# so that interrupts are still noticed promptly.
+MAX_IDLE_WAIT_SECONDS = 0.1
 
-class MultiprocessExecutorChildProcessCommand(ChildProcessCommand):
+
+class MultiprocessExecutorChildProcessCommand(ChildProcessCommand, StepWorkerCommand):
     def __init__(
         self,
         run_config: Mapping[str, object],
         dagster_run: "DagsterRun",
         step_key: str,
         instance_ref: "InstanceRef",
-        term_event: Any,
+        term_event: Optional[Any],
         recon_pipeline: ReconstructableJob,
         retry_mode: RetryMode,
         known_state: Optional[KnownExecutionState],
@@ -72,36 +78,40 @@ def __init__(
         self.repository_load_data = repository_load_data
 
     def execute(self) -> Iterator[DagsterEvent]:
-        recon_job = self.recon_pipeline
         with DagsterInstance.from_ref(self.instance_ref) as instance:
             start_termination_thread(self.term_event)
+            yield from self.execute_in_worker(instance)
 
-            log_manager = create_context_free_log_manager(instance, self.dagster_run)
-
-            yield DagsterEvent.step_worker_started(
-                log_manager,
-                self.dagster_run.job_name,
-                message=f'Executing step "{self.step_key}" in subprocess.',
-                metadata={
-                    "pid": MetadataValue.text(str(os.getpid())),
-                },
-                step_key=self.step_key,
-            )
-            execution_plan = create_execution_plan(
-                job=recon_job,
-                run_config=self.run_config,
-                step_keys_to_execute=[self.step_key],
-                known_state=self.known_state,
-                repository_load_data=self.repository_load_data,
-            )
-            yield from execute_plan_iterator(
-                execution_plan,
-                recon_job,
-                self.dagster_run,
-                run_config=self.run_config,
-                retry_mode=self.retry_mode.for_inner_plan(),
-                instance=instance,
-            )
+    def execute_in_worker(self, instance: DagsterInstance) -> Iterator[DagsterEvent]:
+        recon_job = self.recon_pipeline
+        log_manager = create_context_free_log_manager(instance, self.dagster_run)
+
+        yield DagsterEvent.step_worker_started(
+            log_manager,
+            self.dagster_run.job_name,
+            message=f'Executing step "{self.step_key}" in subprocess.',
+            metadata={
+                "pid": MetadataValue.text(str(os.getpid())),
+            },
+            step_key=self.step_key,
+        )
+        # the job definition is cached on the reconstructable job, so long-lived workers only load
+        # the job code once
+        execution_plan = create_execution_plan(
+            job=recon_job,
+            run_config=self.run_config,
+            step_keys_to_execute=[self.step_key],
+            known_state=self.known_state,
+            repository_load_data=self.repository_load_data,
+        )
+        yield from execute_plan_iterator(
+            execution_plan,
+            recon_job,
+            self.dagster_run,
+            run_config=self.run_config,
+            retry_mode=self.retry_mode.for_inner_plan(),
+            instance=instance,
+        )
 
 
 class MultiprocessExecutor(Executor):
@@ -112,6 +122,9 @@ def __init__(
         tag_concurrency_limits: Optional[List[Dict[str, Any]]] = None,
         start_method: Optional[str] = None,
         explicit_forkserver_preload: Optional[Sequence[str]] = None,
+        use_worker_pool: bool = False,
+        max_steps_per_worker: int = 100,
+        max_worker_memory_growth_mb: Optional[int] = None,
     ):
         self._retries = check.inst_param(retries, "retries", RetryMode)
         if not max_concurrent:
@@ -137,6 +150,11 @@ def __init__(
             )
         self._start_method = start_method
         self._explicit_forkserver_preload = explicit_forkserver_preload
+        self._use_worker_pool = check.bool_param(use_worker_pool, "use_worker_pool")
+        self._max_steps_per_worker = check.int_param(max_steps_per_worker, "max_steps_per_worker")
+        self._max_worker_memory_growth_mb = check.opt_int_param(
+            max_worker_memory_growth_mb, "max_worker_memory_growth_mb"
+        )
 
     @property
     def retries(self) -> RetryMode:
@@ -199,13 +217,28 @@ def execute(
                     instance_concurrency_context=instance_concurrency_context,
                 )
             )
+            worker_pool = None
+            if self._use_worker_pool:
+                worker_pool = StepWorkerPool(
+                    multiproc_ctx,
+                    plan_context.instance.get_ref(),
+                    max_steps_per_worker=self._max_steps_per_worker,
+                    max_worker_memory_growth_mb=self._max_worker_memory_growth_mb,
+                )
+                stack.callback(worker_pool.shutdown)
+
             active_iters: Dict[str, Iterator[Optional[DagsterEvent]]] = {}
             errors: Dict[int, SerializableErrorInfo] = {}
             term_events: Dict[str, Any] = {}
             stopping: bool = False
+            # child processes are polled without blocking, and the loop instead blocks on all of
+            # them at once when none of them had anything to report
+            event_selector = ChildProcessEventSelector()
 
             while (not stopping and not active_execution.is_complete) or active_iters:
+                made_progress = False
                 if active_execution.check_for_interrupts():
+                    made_progress = True
                     yield DagsterEvent.engine_event(
                         plan_context,
                         "Multiprocess executor: received termination signal - "
@@ -227,20 +260,38 @@ def execute(
                     if not steps:
                         break
 
+                    made_progress = True
                     for step in steps:
                         step_context = plan_context.for_step(step)
-                        term_events[step.key] = multiproc_ctx.Event()
-                        active_iters[step.key] = execute_step_out_of_process(
-                            multiproc_ctx,
-                            job,
-                            step_context,
-                            step,
-                            errors,
-                            term_events,
-                            self.retries,
-                            active_execution.get_known_state(),
-                            execution_plan.repository_load_data,
-                        )
+                        if worker_pool:
+                            worker = worker_pool.acquire_worker()
+                            term_events[step.key] = worker.term_event
+                            active_iters[step.key] = execute_step_in_worker(
+                                worker_pool,
+                                worker,
+                                job,
+                                step_context,
+                                step,
+                                errors,
+                                self.retries,
+                                active_execution.get_known_state(),
+                                execution_plan.repository_load_data,
+                                event_selector,
+                            )
+                        else:
+                            term_events[step.key] = multiproc_ctx.Event()
+                            active_iters[step.key] = execute_step_out_of_process(
+                                multiproc_ctx,
+                                job,
+                                step_context,
+                                step,
+                                errors,
+                                term_events,
+                                self.retries,
+                                active_execution.get_known_state(),
+                                execution_plan.repository_load_data,
+                                event_selector,
+                            )
 
                 # process active iterators
                 empty_iters = []
@@ -250,6 +301,7 @@ def execute(
                         if event_or_none is None:
                             continue
                         else:
+                            made_progress = True
                             yield event_or_none
                             active_execution.handle_event(event_or_none)
 
@@ -279,13 +331,20 @@ def execute(
                         empty_iters.append(key)
 
                 # clear and mark complete finished iterators
+                if empty_iters:
+                    made_progress = True
                 for key in empty_iters:
                     del active_iters[key]
                     del term_events[key]
                     active_execution.verify_complete(plan_context, key)
 
                 # process skipped and abandoned steps
-                yield from active_execution.plan_events_iterator(plan_context)
+                for plan_event in active_execution.plan_events_iterator(plan_context):
+                    made_progress = True
+                    yield plan_event
+
+                if not made_progress:
+                    event_selector.wait(_get_idle_wait_timeout(active_execution))
 
             errs = {pid: err for pid, err in errors.items() if err}
 
@@ -326,6 +385,14 @@ def execute(
             )
 
 
+def _get_idle_wait_timeout(active_execution: ActiveExecution) -> float:
+    # wake up in time to launch steps that are waiting to be retried or for concurrency slots
+    sleep_interval = active_execution.sleep_interval()
+    if sleep_interval > 0:
+        return min(sleep_interval, MAX_IDLE_WAIT_SECONDS)
+    return MAX_IDLE_WAIT_SECONDS
+
+
 def execute_step_out_of_process(
     multiproc_ctx: MultiprocessingBaseContext,
     recon_job: ReconstructableJob,
@@ -336,6 +403,7 @@ def execute_step_out_of_process(
     retries: RetryMode,
     known_state: KnownExecutionState,
     repository_load_data: Optional[RepositoryLoadData],
+    event_selector: Optional[ChildProcessEventSelector] = None,
 ) -> Iterator[Optional[DagsterEvent]]:
     command = MultiprocessExecutorChildProcessCommand(
         run_config=step_context.run_config,
@@ -355,7 +423,51 @@ def execute_step_out_of_process(
         metadata={},
     )
 
-    for ret in execute_child_process_command(multiproc_ctx, command):
+    yield from _handle_child_process_events(
+        execute_child_process_command(multiproc_ctx, command, event_selector), errors
+    )
+
+
+def execute_step_in_worker(
+    worker_pool: StepWorkerPool,
+    worker: StepWorker,
+    recon_job: ReconstructableJob,
+    step_context: IStepContext,
+    step: ExecutionStep,
+    errors: Dict[int, SerializableErrorInfo],
+    retries: RetryMode,
+    known_state: KnownExecutionState,
+    repository_load_data: Optional[RepositoryLoadData],
+    event_selector: Optional[ChildProcessEventSelector] = None,
+) -> Iterator[Optional[DagsterEvent]]:
+    command = MultiprocessExecutorChildProcessCommand(
+        run_config=step_context.run_config,
+        dagster_run=step_context.dagster_run,
+        step_key=step.key,
+        instance_ref=step_context.instance.get_ref(),
+        # the worker listens for its own termination event
+        term_event=None,
+        recon_pipeline=recon_job,
+        retry_mode=retries,
+        known_state=known_state,
+        repository_load_data=repository_load_data,
+    )
+
+    yield DagsterEvent.step_worker_starting(
+        step_context,
+        f'Sending step "{step.key}" to worker process (pid: {worker.process.pid}).',
+        metadata={},
+    )
+
+    yield from _handle_child_process_events(
+        worker_pool.execute(worker, command, event_selector), errors
+    )
+
+
+def _handle_child_process_events(
+    child_process_events: Iterator[Any], errors: Dict[int, SerializableErrorInfo]
+) -> Iterator[Optional[DagsterEvent]]:
+    for ret in child_process_events:
         if ret is None or isinstance(ret, DagsterEvent):
             yield ret
         elif isinstance(ret, ChildProcessEvent):
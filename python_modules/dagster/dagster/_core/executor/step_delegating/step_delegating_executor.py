@@ -28,6 +28,25 @@
 DEFAULT_SLEEP_SECONDS = float(
     os.environ.get("DAGSTER_STEP_DELEGATING_EXECUTOR_SLEEP_SECONDS", "1.0")
 )
+DEFAULT_MAX_SLEEP_SECONDS = float(
+    os.environ.get("DAGSTER_STEP_DELEGATING_EXECUTOR_MAX_SLEEP_SECONDS", "5.0")
+)
+
+# The event types that the executor needs to tail from the event log in order to orchestrate the
+# steps that it launches: step lifecycle events, and step outputs (which determine which
+# downstream steps and dynamic mapping keys can execute).
+ORCHESTRATION_EVENT_TYPES = frozenset(
+    {
+        DagsterEventType.STEP_START,
+        DagsterEventType.STEP_RESTARTED,
+        DagsterEventType.STEP_OUTPUT,
+        DagsterEventType.STEP_SUCCESS,
+        DagsterEventType.STEP_FAILURE,
+        DagsterEventType.STEP_SKIPPED,
+        DagsterEventType.STEP_UP_FOR_RETRY,
+        DagsterEventType.RESOURCE_INIT_FAILURE,
+    }
+)
 
 
 class StepDelegatingExecutor(Executor):
@@ -46,6 +65,8 @@ def __init__(
         max_concurrent: Optional[int] = None,
         tag_concurrency_limits: Optional[List[Dict[str, Any]]] = None,
         should_verify_step: bool = False,
+        orchestration_events_only: Optional[bool] = None,
+        max_sleep_seconds: Optional[float] = None,
     ):
         self._step_handler = step_handler
         self._retries = retries
@@ -70,6 +91,26 @@ def __init__(
         )
         self._should_verify_step = should_verify_step
 
+        # When set, only the events needed to orchestrate the steps are tailed from the event log
+        # and yielded, rather than every event that the steps write. Those other events are still
+        # stored in the event log, but are not included in the in-process execution result.
+        self._orchestration_events_only = check.opt_bool_param(
+            orchestration_events_only,
+            "orchestration_events_only",
+            default=os.getenv("DAGSTER_STEP_DELEGATING_EXECUTOR_ORCHESTRATION_EVENTS_ONLY") == "1",
+        )
+        # When tailing orchestration events only, the poll interval backs off while no events
+        # arrive, up to this value, and returns to sleep_seconds as soon as there is activity.
+        self._max_sleep_seconds = max(
+            self._sleep_seconds,
+            cast(
+                float,
+                check.opt_float_param(
+                    max_sleep_seconds, "max_sleep_seconds", default=DEFAULT_MAX_SLEEP_SECONDS
+                ),
+            ),
+        )
+
         self._event_cursor: Optional[str] = None
         self._pop_events_offset = int(os.getenv("DAGSTER_EXECUTOR_POP_EVENTS_OFFSET", "0"))
 
@@ -92,6 +133,11 @@ def _pop_events(
                 cursor_obj.storage_id() - self._pop_events_offset
             ).to_string()
 
+        if self._orchestration_events_only:
+            return self._pop_orchestration_events(
+                instance, run_id, adjusted_cursor, seen_storage_ids
+            )
+
         conn = instance.get_records_for_run(
             run_id,
             adjusted_cursor,
@@ -109,6 +155,33 @@ def _pop_events(
 
         return dagster_events
 
+    def _pop_orchestration_events(
+        self,
+        instance: DagsterInstance,
+        run_id: str,
+        cursor: Optional[str],
+        seen_storage_ids: Set[int],
+    ) -> Sequence[DagsterEvent]:
+        # filter on the indexed event type column, and only deserialize the records that have not
+        # already been yielded
+        records = instance.get_lazy_records_for_run(
+            run_id,
+            cursor,
+            of_type=ORCHESTRATION_EVENT_TYPES,
+        )
+        if records:
+            self._event_cursor = EventLogCursor.from_storage_id(records[-1].storage_id).to_string()
+
+        dagster_events = []
+        for record in records:
+            if record.storage_id in seen_storage_ids:
+                continue
+            seen_storage_ids.add(record.storage_id)
+            if record.event_log_entry.dagster_event:
+                dagster_events.append(record.event_log_entry.dagster_event)
+
+        return dagster_events
+
     def _get_step_handler_context(
         self, plan_context, steps, active_execution
     ) -> StepHandlerContext:
@@ -150,6 +223,7 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                 instance_concurrency_context=instance_concurrency_context,
             ) as active_execution:
                 running_steps: Dict[str, ExecutionStep] = {}
+                sleep_seconds = self._sleep_seconds
 
                 if plan_context.resume_from_failure:
                     DagsterEvent.engine_event(
@@ -256,12 +330,14 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
 
                         return
 
+                    has_activity = False
                     if active_execution.has_in_flight_steps:
                         for dagster_event in self._pop_events(
                             plan_context.instance,
                             plan_context.run_id,
                             seen_storage_ids,
                         ):
+                            has_activity = True
                             yield dagster_event
                             # STEP_SKIPPED events are only emitted by ActiveExecution, which already handles
                             # and yields them.
@@ -342,6 +418,7 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                     list(active_execution.concurrency_event_iterator(plan_context))
 
                     for step in active_execution.get_steps_to_execute(max_steps_to_run):
+                        has_activity = True
                         running_steps[step.key] = step
                         list(
                             self._step_handler.launch_step(
@@ -351,4 +428,10 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                             )
                         )
 
-                    time.sleep(self._sleep_seconds)
+                    if self._orchestration_events_only:
+                        sleep_seconds = (
+                            self._sleep_seconds
+                            if has_activity
+                            else min(sleep_seconds * 2, self._max_sleep_seconds)
+                        )
+                    time.sleep(sleep_seconds)
@@ -0,0 +1,273 @@
+"""A pool of long-lived worker processes for executing steps out of process.
+
+Starting a new process for every step means paying for interpreter startup, imports and code
+loading once per step. Workers in a `StepWorkerPool` instead execute a sequence of step commands,
+one at a time, loading the instance and job code once. A worker that crashes only fails the step it
+was executing, and is replaced by a new worker for the next step.
+"""
+
+import os
+import sys
+from abc import ABC, abstractmethod
+from multiprocessing.context import BaseContext as MultiprocessingBaseContext
+from typing import TYPE_CHECKING, Any, Iterator, List, NamedTuple, Optional, Union
+
+import dagster._check as check
+from dagster._core.errors import DagsterExecutionInterruptedError
+from dagster._utils import start_termination_thread
+from dagster._utils.error import serializable_error_info_from_exc_info
+from dagster._utils.interrupts import capture_interrupts
+
+from .child_process_executor import (
+    PROCESS_DEAD_AND_QUEUE_EMPTY,
+    TICK,
+    ChildProcessCrashException,
+    ChildProcessDoneEvent,
+    ChildProcessEvent,
+    ChildProcessEventSelector,
+    ChildProcessStartEvent,
+    ChildProcessSystemErrorEvent,
+    _poll_for_event,
+)
+
+if TYPE_CHECKING:
+    from dagster._core.events import DagsterEvent
+    from dagster._core.instance import DagsterInstance, InstanceRef
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+class WorkerRetiringEvent(NamedTuple("_WorkerRetiringEvent", [("pid", int)]), ChildProcessEvent):
+    """Sent by a worker before the done event of its last step, once it will not accept more."""
+
+
+class StepWorkerCommand(ABC):
+    """Inherit from this class to execute a command in a `StepWorkerPool`.
+
+    The object must be picklable. Unlike a `ChildProcessCommand`, it is executed in a process that
+    may already have executed other commands, and will be passed the instance that the worker
+    process opened on startup.
+    """
+
+    @abstractmethod
+    def execute_in_worker(
+        self, instance: "DagsterInstance"
+    ) -> Iterator[Union[ChildProcessEvent, "DagsterEvent"]]:
+        """This method is invoked in the worker process."""
+
+
+def _get_max_rss_bytes() -> Optional[int]:
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # reported in bytes on macOS and kilobytes on linux
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def _run_step_worker(
+    command_queue: Any,
+    event_queue: Any,
+    term_event: Any,
+    instance_ref: "InstanceRef",
+    max_steps: int,
+    max_memory_growth_bytes: Optional[int],
+) -> None:
+    from dagster._core.instance import DagsterInstance
+
+    with capture_interrupts(), DagsterInstance.from_ref(instance_ref) as instance:
+        pid = os.getpid()
+        start_termination_thread(term_event)
+        baseline_rss = _get_max_rss_bytes()
+        num_steps = 0
+        while True:
+            command = command_queue.get()
+            if command is None:
+                return
+
+            event_queue.put(ChildProcessStartEvent(pid=pid))
+            num_steps += 1
+            try:
+                for step_event in command.execute_in_worker(instance):
+                    event_queue.put(step_event)
+                done_event: Union[ChildProcessDoneEvent, ChildProcessSystemErrorEvent] = (
+                    ChildProcessDoneEvent(pid=pid)
+                )
+            except (
+                Exception,
+                KeyboardInterrupt,
+                DagsterExecutionInterruptedError,
+            ):
+                done_event = ChildProcessSystemErrorEvent(
+                    pid=pid, error_info=serializable_error_info_from_exc_info(sys.exc_info())
+                )
+
+            rss = _get_max_rss_bytes()
+            retiring = (
+                num_steps >= max_steps
+                # a worker that was interrupted does not run any further steps
+                or term_event.is_set()
+                or (
+                    max_memory_growth_bytes is not None
+                    and rss is not None
+                    and baseline_rss is not None
+                    and rss - baseline_rss > max_memory_growth_bytes
+                )
+            )
+            if retiring:
+                event_queue.put(WorkerRetiringEvent(pid=pid))
+            event_queue.put(done_event)
+            if retiring:
+                return
+
+
+class StepWorker:
+    def __init__(
+        self,
+        multiprocessing_ctx: MultiprocessingBaseContext,
+        instance_ref: "InstanceRef",
+        max_steps: int,
+        max_memory_growth_bytes: Optional[int],
+    ):
+        self.command_queue = multiprocessing_ctx.Queue()
+        self.event_queue = multiprocessing_ctx.Queue()
+        # must be created before the process is started, since events can only be shared with
+        # a process through inheritance
+        self.term_event = multiprocessing_ctx.Event()
+        self.process = multiprocessing_ctx.Process(  # type: ignore
+            target=_run_step_worker,
+            args=(
+                self.command_queue,
+                self.event_queue,
+                self.term_event,
+                instance_ref,
+                max_steps,
+                max_memory_growth_bytes,
+            ),
+        )
+        self.process.start()
+        self.retired = False
+
+    def execute(
+        self,
+        command: StepWorkerCommand,
+        event_selector: Optional[ChildProcessEventSelector] = None,
+    ) -> Iterator[Optional[Any]]:
+        """Sends a command to the worker, and yields the events it produces until it is done, using
+        the same protocol as `execute_child_process_command`.
+        """
+        self.command_queue.put(command)
+        if event_selector:
+            event_selector.register(self.process, self.event_queue)
+
+        completed_properly = False
+        poll_timeout = 0 if event_selector else TICK
+        try:
+            while not completed_properly:
+                event = _poll_for_event(self.process, self.event_queue, poll_timeout)
+
+                if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
+                    break
+
+                if isinstance(event, WorkerRetiringEvent):
+                    self.retired = True
+                    continue
+
+                yield event
+
+                if isinstance(event, (ChildProcessDoneEvent, ChildProcessSystemErrorEvent)):
+                    completed_properly = True
+        finally:
+            if event_selector:
+                event_selector.unregister(self.process)
+
+        if not completed_properly:
+            self.retired = True
+            self.close()
+            raise ChildProcessCrashException(exit_code=self.process.exitcode)
+
+        if self.retired:
+            self.close()
+
+    def shutdown(self, terminate: bool = False) -> None:
+        if terminate:
+            self.process.terminate()
+        elif not self.retired and self.process.is_alive():
+            self.command_queue.put(None)
+        self.retired = True
+        self.close()
+
+    def close(self) -> None:
+        self.process.join()
+        self.command_queue.close()
+        self.event_queue.close()
+
+
+class StepWorkerPool:
+    """Bounded pool of `StepWorker` processes. Each worker executes at most one step at a time, so
+    the number of workers never exceeds the number of steps executing concurrently.
+    """
+
+    def __init__(
+        self,
+        multiprocessing_ctx: MultiprocessingBaseContext,
+        instance_ref: "InstanceRef",
+        max_steps_per_worker: int,
+        max_worker_memory_growth_mb: Optional[int] = None,
+    ):
+        self._multiprocessing_ctx = multiprocessing_ctx
+        self._instance_ref = instance_ref
+        self._max_steps_per_worker = check.int_param(max_steps_per_worker, "max_steps_per_worker")
+        check.opt_int_param(max_worker_memory_growth_mb, "max_worker_memory_growth_mb")
+        self._max_memory_growth_bytes = (
+            max_worker_memory_growth_mb * 1024 * 1024
+            if max_worker_memory_growth_mb is not None
+            else None
+        )
+        self._idle_workers: List[StepWorker] = []
+        self._busy_workers: List[StepWorker] = []
+
+    def acquire_worker(self) -> StepWorker:
+        while self._idle_workers:
+            worker = self._idle_workers.pop()
+            if worker.process.is_alive():
+                self._busy_workers.append(worker)
+                return worker
+            worker.retired = True
+            worker.close()
+
+        worker = StepWorker(
+            self._multiprocessing_ctx,
+            self._instance_ref,
+            self._max_steps_per_worker,
+            self._max_memory_growth_bytes,
+        )
+        self._busy_workers.append(worker)
+        return worker
+
+    def execute(
+        self,
+        worker: StepWorker,
+        command: StepWorkerCommand,
+        event_selector: Optional[ChildProcessEventSelector] = None,
+    ) -> Iterator[Optional[Any]]:
+        """Executes a command on a worker from `acquire_worker`, returning the worker to the pool
+        once the command completes.
+        """
+        try:
+            yield from worker.execute(command, event_selector)
+        finally:
+            self._busy_workers.remove(worker)
+            if not worker.retired:
+                self._idle_workers.append(worker)
+
+    def shutdown(self) -> None:
+        for worker in self._idle_workers:
+            worker.shutdown()
+        # workers are only still busy if the executor exited without waiting for their steps
+        for worker in self._busy_workers:
+            worker.shutdown(terminate=True)
+        self._idle_workers = []
+        self._busy_workers = []
@@ -1,7 +1,9 @@
+import atexit
 import logging
 import logging.config
 import os
 import sys
+import threading
 import time
 import warnings
 import weakref
@@ -82,7 +84,9 @@
 
 from .config import (
     DAGSTER_CONFIG_YAML_FILENAME,
+    DEFAULT_CODE_LOCATION_LOAD_TIMEOUT,
     DEFAULT_LOCAL_CODE_SERVER_STARTUP_TIMEOUT,
+    DEFAULT_MAX_CONCURRENT_CODE_LOCATION_LOADS,
     get_default_tick_retention_settings,
     get_tick_retention_settings,
 )
@@ -169,6 +173,7 @@
         EventLogRecord,
         EventRecordsFilter,
         EventRecordsResult,
+        LazyEventLogRecord,
         PlannedMaterializationInfo,
     )
     from dagster._core.storage.partition_status_cache import (
@@ -201,6 +206,30 @@ def _is_batch_writing_enabled() -> bool:
     return _get_event_batch_size() > 0
 
 
+# Sets the number of events of any type that will be buffered per run before being written to the
+# event log in a single batch. Buffered events are also written whenever a step or run boundary
+# event is handled (see `EVENT_BUFFER_FLUSH_EVENTS`), once the oldest buffered event has waited for
+# the max latency, and when the instance is disposed. If the process dies, at most
+# `DAGSTER_RUN_EVENT_BUFFER_SIZE - 1` events per run that were reported within the max latency are
+# lost. Defaults to 0, which turns off run event buffering.
+def _get_run_event_buffer_size() -> int:
+    return int(os.getenv("DAGSTER_RUN_EVENT_BUFFER_SIZE", "0"))
+
+
+def _get_run_event_buffer_max_latency_seconds() -> float:
+    return float(os.getenv("DAGSTER_RUN_EVENT_BUFFER_MAX_LATENCY_SECONDS", "1.0"))
+
+
+# Instances that have buffered events, which are flushed if the process exits without disposing them
+_INSTANCES_WITH_BUFFERED_EVENTS: "weakref.WeakSet[DagsterInstance]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_buffered_events_at_exit() -> None:
+    for instance in list(_INSTANCES_WITH_BUFFERED_EVENTS):
+        instance.flush_run_event_buffers()
+
+
 def _check_run_equality(
     pipeline_run: DagsterRun, candidate_run: DagsterRun
 ) -> Mapping[str, Tuple[Any, Any]]:
@@ -504,6 +533,13 @@ def __init__(
         # Used for batched event handling
         self._event_buffer: Dict[str, List[EventLogEntry]] = defaultdict(list)
 
+        # Used for buffering all events for a run, see `handle_new_event`
+        self._run_event_buffers: Dict[str, List[EventLogEntry]] = defaultdict(list)
+        self._run_event_buffer_start_times: Dict[str, float] = {}
+        self._run_event_buffer_lock = threading.RLock()
+        self._run_event_buffer_condition = threading.Condition(self._run_event_buffer_lock)
+        self._run_event_buffer_flusher: Optional[threading.Thread] = None
+
     # ctors
 
     @public
@@ -910,6 +946,18 @@ def code_server_reload_timeout(self) -> int:
             "reload_timeout", DEFAULT_LOCAL_CODE_SERVER_STARTUP_TIMEOUT
         )
 
+    @property
+    def code_server_max_concurrent_loads(self) -> int:
+        return self.code_server_settings.get(
+            "max_concurrent_loads", DEFAULT_MAX_CONCURRENT_CODE_LOCATION_LOADS
+        )
+
+    @property
+    def code_location_load_timeout(self) -> int:
+        return self.code_server_settings.get(
+            "location_load_timeout", DEFAULT_CODE_LOCATION_LOAD_TIMEOUT
+        )
+
     @property
     def wait_for_local_code_server_processes_on_shutdown(self) -> bool:
         return self.code_server_settings.get("wait_for_local_processes_on_shutdown", False)
@@ -936,6 +984,10 @@ def run_retries_enabled(self) -> bool:
     def run_retries_max_retries(self) -> int:
         return self.get_settings("run_retries").get("max_retries", 0)
 
+    @property
+    def asset_status_cache_write_through_enabled(self) -> bool:
+        return self.get_settings("asset_status_cache").get("write_through", False)
+
     @property
     def auto_materialize_enabled(self) -> bool:
         return self.get_settings("auto_materialize").get("enabled", True)
@@ -962,6 +1014,10 @@ def auto_materialize_max_tick_retries(self) -> int:
     def auto_materialize_use_sensors(self) -> int:
         return self.get_settings("auto_materialize").get("use_sensors", False)
 
+    @property
+    def auto_materialize_num_evaluation_workers(self) -> Optional[int]:
+        return self.get_settings("auto_materialize").get("num_evaluation_workers")
+
     @property
     def global_op_concurrency_default_limit(self) -> Optional[int]:
         return self.get_settings("concurrency").get("default_op_concurrency_limit")
@@ -1023,6 +1079,7 @@ def reindex(self, print_fn: PrintFn = lambda _: None) -> None:
         print_fn("Done.")
 
     def dispose(self) -> None:
+        self.flush_run_event_buffers()
         self._local_artifact_storage.dispose()
         self._run_storage.dispose()
         if self._run_coordinator:
@@ -1919,6 +1976,19 @@ def get_records_for_run(
     ) -> "EventLogConnection":
         return self._event_storage.get_records_for_run(run_id, cursor, of_type, limit, ascending)
 
+    @traced
+    def get_lazy_records_for_run(
+        self,
+        run_id: str,
+        cursor: Optional[str] = None,
+        of_type: Optional[Union["DagsterEventType", Set["DagsterEventType"]]] = None,
+        limit: Optional[int] = None,
+        ascending: bool = True,
+    ) -> Sequence["LazyEventLogRecord"]:
+        return self._event_storage.get_lazy_records_for_run(
+            run_id, cursor, of_type, limit, ascending
+        )
+
     def watch_event_logs(self, run_id: str, cursor: Optional[str], cb: "EventHandlerFn") -> None:
         return self._event_storage.watch(run_id, cursor, cb)
 
@@ -2160,6 +2230,21 @@ def fetch_run_status_changes(
             records_filter, limit, cursor, ascending
         )
 
+    @traced
+    def fetch_lazy_run_status_changes(
+        self,
+        records_filter: Union["DagsterEventType", "RunStatusChangeRecordsFilter"],
+        limit: int,
+        cursor: Optional[str] = None,
+        ascending: bool = False,
+    ) -> Sequence["LazyEventLogRecord"]:
+        """Like `fetch_run_status_changes`, but defers parsing each stored event until it is
+        accessed.
+        """
+        return self._event_storage.fetch_lazy_run_status_changes(
+            records_filter, limit, cursor, ascending
+        )
+
     @public
     @traced
     def get_status_by_partition(
@@ -2280,6 +2365,16 @@ def get_latest_storage_id_by_partition(
         """
         return self._event_storage.get_latest_storage_id_by_partition(asset_key, event_type)
 
+    @traced
+    def get_latest_storage_ids_by_partition(
+        self, asset_keys: Sequence[AssetKey], event_type: "DagsterEventType"
+    ) -> Mapping[AssetKey, Mapping[str, int]]:
+        """Fetch the latest storage id for each partition of each of the given asset keys.
+
+        Returns a mapping of asset key to a mapping of partition to storage id.
+        """
+        return self._event_storage.get_latest_storage_ids_by_partition(asset_keys, event_type)
+
     @traced
     def get_latest_planned_materialization_info(
         self,
@@ -2408,10 +2503,24 @@ def handle_new_event(
         to the storage layer in a single batch. If an error occurrs during batch writing, then we
         fall back to iterative individual event writes.
 
+        If run event buffering is enabled (by setting `DAGSTER_RUN_EVENT_BUFFER_SIZE`), events of
+        every type are instead kept in a per-run buffer. The buffer is written as a single batch
+        when it reaches the buffer size, when the end of a batch is reached, when a step boundary,
+        run boundary or asset event without `batch_metadata` is handled, or, on a background thread,
+        once its oldest event has waited for `DAGSTER_RUN_EVENT_BUFFER_MAX_LATENCY_SECONDS`. Events
+        for a run are always stored and sent to subscribers in the order they were handled. Errors
+        while writing a run's buffer are raised rather than retried with individual event writes,
+        since the storage may already have written part of the batch.
+
         Args:
             event (EventLogEntry): The event to handle.
             batch_metadata (Optional[DagsterEventBatchMetadata]): Metadata for batch writing.
         """
+        run_event_buffer_size = _get_run_event_buffer_size()
+        if run_event_buffer_size > 0:
+            self._buffer_run_event(event, run_event_buffer_size, batch_metadata)
+            return
+
         if batch_metadata is None or not _is_batch_writing_enabled():
             events = [event]
         else:
@@ -2423,8 +2532,17 @@ def handle_new_event(
             else:
                 return
 
+        self._store_and_notify_events(events, store_individually_on_error=True)
+
+    def _store_and_notify_events(
+        self, events: Sequence["EventLogEntry"], store_individually_on_error: bool = False
+    ) -> None:
         if len(events) == 1:
             self._event_storage.store_event(events[0])
+        elif not store_individually_on_error:
+            # Storages may commit part of a batch before failing (e.g. per run shard, or before
+            # updating the asset index), so storing the events again one by one could duplicate them
+            self._event_storage.store_event_batch(events)
         else:
             try:
                 self._event_storage.store_event_batch(events)
@@ -2449,6 +2567,71 @@ def handle_new_event(
             for sub in self._subscribers[run_id]:
                 sub(event)
 
+    def _buffer_run_event(
+        self,
+        event: "EventLogEntry",
+        buffer_size: int,
+        batch_metadata: Optional["DagsterEventBatchMetadata"],
+    ) -> None:
+        from dagster._core.events import EVENT_BUFFER_FLUSH_EVENTS
+
+        run_id = event.run_id
+        with self._run_event_buffer_lock:
+            buffer = self._run_event_buffers[run_id]
+            buffer.append(event)
+            start_time = self._run_event_buffer_start_times.setdefault(run_id, time.time())
+            if (
+                len(buffer) >= buffer_size
+                or (batch_metadata is not None and batch_metadata.is_end)
+                or (
+                    batch_metadata is None and event.dagster_event_type in EVENT_BUFFER_FLUSH_EVENTS
+                )
+                or time.time() - start_time >= _get_run_event_buffer_max_latency_seconds()
+            ):
+                self._flush_run_event_buffer(run_id)
+            else:
+                _INSTANCES_WITH_BUFFERED_EVENTS.add(self)
+                if self._run_event_buffer_flusher is None:
+                    self._run_event_buffer_flusher = threading.Thread(
+                        target=self._flush_run_event_buffers_after_max_latency,
+                        name="run_event_buffer_flusher",
+                        daemon=True,
+                    )
+                    self._run_event_buffer_flusher.start()
+
+    def _flush_run_event_buffers_after_max_latency(self) -> None:
+        # Runs on a background thread while any events are buffered, writing each run's buffer once
+        # its oldest event has waited for the max latency. The thread holds the buffer lock except
+        # while waiting, so buffers are never written concurrently with events being added to them.
+        with self._run_event_buffer_condition:
+            while self._run_event_buffer_start_times:
+                max_latency = _get_run_event_buffer_max_latency_seconds()
+                for run_id, start_time in list(self._run_event_buffer_start_times.items()):
+                    if time.time() - start_time >= max_latency:
+                        try:
+                            self._flush_run_event_buffer(run_id)
+                        except Exception as e:
+                            sys.stderr.write(f"Exception while storing buffered run events: {e}\n")
+
+                if self._run_event_buffer_start_times:
+                    next_deadline = min(self._run_event_buffer_start_times.values()) + max_latency
+                    self._run_event_buffer_condition.wait(max(next_deadline - time.time(), 0))
+
+            self._run_event_buffer_flusher = None
+
+    def _flush_run_event_buffer(self, run_id: str) -> None:
+        with self._run_event_buffer_lock:
+            self._run_event_buffer_start_times.pop(run_id, None)
+            events = self._run_event_buffers.pop(run_id, None)
+            if events:
+                self._store_and_notify_events(events)
+
+    def flush_run_event_buffers(self) -> None:
+        """Writes any events that are buffered for runs to the event log."""
+        with self._run_event_buffer_lock:
+            for run_id in list(self._run_event_buffers.keys()):
+                self._flush_run_event_buffer(run_id)
+
     def add_event_listener(self, run_id: str, cb) -> None:
         self._subscribers[run_id].append(cb)
 
@@ -18,7 +18,7 @@
 )
 from dagster._config.source import BoolSource
 from dagster._core.errors import DagsterInvalidConfigError
-from dagster._core.storage.config import mysql_config, pg_config
+from dagster._core.storage.config import mysql_config, pg_event_log_config
 from dagster._serdes import class_from_code_pointer
 from dagster._utils.concurrency import get_max_concurrency_limit_value
 from dagster._utils.merger import merge_dicts
@@ -160,7 +160,7 @@ def storage_config_schema() -> Field:
     return Field(
         Selector(
             {
-                "postgres": Field(pg_config()),
+                "postgres": Field(pg_event_log_config()),
                 "mysql": Field(mysql_config()),
                 "sqlite": Field({"base_dir": StringSource}),
                 "custom": Field(configurable_class_schema()),
@@ -193,6 +193,8 @@ def python_logs_config_schema() -> Field:
 
 
 DEFAULT_LOCAL_CODE_SERVER_STARTUP_TIMEOUT = 180
+DEFAULT_MAX_CONCURRENT_CODE_LOCATION_LOADS = 8
+DEFAULT_CODE_LOCATION_LOAD_TIMEOUT = 600
 
 
 def get_default_tick_retention_settings(
@@ -287,6 +289,16 @@ def sensors_daemon_config() -> Field:
                     " tick."
                 ),
             ),
+            "use_due_queue": Field(
+                Bool,
+                is_required=False,
+                default_value=False,
+                description=(
+                    "Whether to track when each sensor is next due to be evaluated, so that only"
+                    " due sensors are loaded on each iteration instead of every sensor in the"
+                    " workspace."
+                ),
+            ),
         },
         is_required=False,
     )
@@ -383,6 +395,20 @@ def dagster_instance_config_schema() -> Mapping[str, Field]:
                 "local_startup_timeout": Field(int, is_required=False),
                 "reload_timeout": Field(int, is_required=False),
                 "wait_for_local_processes_on_shutdown": Field(bool, is_required=False),
+                "max_concurrent_loads": Field(
+                    int,
+                    is_required=False,
+                    description=(
+                        "How many code locations to load at the same time when loading or reloading the workspace"
+                    ),
+                ),
+                "location_load_timeout": Field(
+                    int,
+                    is_required=False,
+                    description=(
+                        "How many seconds to wait for a single code location to load before reporting an error for it"
+                    ),
+                ),
             },
             is_required=False,
         ),
@@ -413,6 +439,36 @@ def dagster_instance_config_schema() -> Mapping[str, Field]:
                         "How many threads to use to process ticks from multiple automation policy sensors in parallel"
                     ),
                 ),
+                "num_evaluation_workers": Field(
+                    int,
+                    is_required=False,
+                    description=(
+                        "How many threads to use to evaluate the assets at each level of the asset graph concurrently within a single tick"
+                    ),
+                ),
+                "reuse_unchanged_evaluations": Field(
+                    Bool,
+                    is_required=False,
+                    default_value=False,
+                    description=(
+                        "Whether assets whose inputs provably have not changed since the previous tick reuse their previous evaluation instead of being evaluated again"
+                    ),
+                ),
+                "use_leases": Field(
+                    Bool,
+                    is_required=False,
+                    default_value=False,
+                    description=(
+                        "Whether to coordinate with other asset daemon processes running against the same instance, so that each automation policy sensor is evaluated by a single process at a time. Only needed when running multiple asset daemon processes at once."
+                    ),
+                ),
+                "lease_duration_seconds": Field(
+                    int,
+                    is_required=False,
+                    description=(
+                        "When use_leases is set, how long a daemon process keeps its automation policy sensors after it stops renewing them, before another process takes them over"
+                    ),
+                ),
             }
         ),
         "concurrency": Field(
@@ -424,4 +480,18 @@ def dagster_instance_config_schema() -> Mapping[str, Field]:
                 ),
             }
         ),
+        "asset_status_cache": Field(
+            {
+                "write_through": Field(
+                    bool,
+                    is_required=False,
+                    default_value=False,
+                    description=(
+                        "Whether the cached partition status of each asset should be updated as"
+                        " materialization and planned materialization events are stored, rather"
+                        " than when the status is next read."
+                    ),
+                ),
+            }
+        ),
     }
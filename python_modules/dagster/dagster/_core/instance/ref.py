@@ -457,6 +457,7 @@ def from_dir(
             "nux",
             "auto_materialize",
             "concurrency",
+            "asset_status_cache",
         }
         settings = {key: config_value.get(key) for key in settings_keys if config_value.get(key)}
 
@@ -48,6 +48,7 @@
     external_partition_set_name_for_job_name,
     external_repository_data_from_def,
 )
+from dagster._core.remote_representation.external_data_delta import RepositorySnapshotCache
 from dagster._core.remote_representation.grpc_server_registry import GrpcServerRegistry
 from dagster._core.remote_representation.handle import JobHandle, RepositoryHandle
 from dagster._core.remote_representation.origin import (
@@ -594,6 +595,7 @@ def __init__(
         watch_server: Optional[bool] = True,
         grpc_server_registry: Optional[GrpcServerRegistry] = None,
         grpc_metadata: Optional[Sequence[Tuple[str, str]]] = None,
+        snapshot_cache: Optional[RepositorySnapshotCache] = None,
     ):
         from dagster._grpc.client import DagsterGrpcClient, client_heartbeat_thread
 
@@ -675,6 +677,9 @@ def __init__(
             self._external_repositories_data = sync_get_streaming_external_repositories_data_grpc(
                 self.client,
                 self,
+                snapshot_cache=check.opt_inst_param(
+                    snapshot_cache, "snapshot_cache", RepositorySnapshotCache
+                ),
             )
 
             self.external_repositories = {
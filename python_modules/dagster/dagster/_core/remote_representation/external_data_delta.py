@@ -0,0 +1,248 @@
+"""Content-addressed transfer of ExternalRepositoryData between code servers and host processes.
+
+The server splits an ExternalRepositoryData into a manifest that lists a content hash for every
+entry (job, asset node, sensor, schedule, ...) and the serialized entries themselves, keyed by
+hash. A host process keeps the entries it has already received in a RepositorySnapshotCache and
+sends their hashes along with each request, so that reloading a code location only transfers and
+deserializes the entries that changed since the previous load.
+"""
+
+import hashlib
+import threading
+from typing import AbstractSet, Any, Dict, List, Mapping, NamedTuple, Optional, Sequence, Set, Tuple
+
+import dagster._check as check
+from dagster._core.definitions.metadata import MetadataMapping
+from dagster._core.remote_representation.external_data import (
+    EnvVarConsumer,
+    ExternalAssetCheck,
+    ExternalAssetNode,
+    ExternalJobData,
+    ExternalJobRef,
+    ExternalRepositoryData,
+    ExternalResourceData,
+    PartitionSetSnap,
+    ScheduleSnap,
+    SensorSnap,
+)
+from dagster._serdes import whitelist_for_serdes
+from dagster._serdes.serdes import deserialize_value, serialize_value
+
+# The sequence fields of ExternalRepositoryData that are transferred entry by entry, along with the
+# type of each entry.
+CONTENT_ADDRESSED_FIELDS: Mapping[str, type] = {
+    "external_schedule_datas": ScheduleSnap,
+    "external_partition_set_datas": PartitionSetSnap,
+    "external_sensor_datas": SensorSnap,
+    "external_asset_graph_data": ExternalAssetNode,
+    "external_job_datas": ExternalJobData,
+    "external_job_refs": ExternalJobRef,
+    "external_resource_data": ExternalResourceData,
+    "external_asset_checks": ExternalAssetCheck,
+}
+
+
+def hash_serialized_entry(serialized_entry: str) -> str:
+    return hashlib.sha1(serialized_entry.encode("utf-8")).hexdigest()
+
+
+@whitelist_for_serdes
+class ExternalRepositoryManifest(
+    NamedTuple(
+        "_ExternalRepositoryManifest",
+        [
+            ("name", str),
+            ("entry_hashes_by_field", Mapping[str, Optional[Sequence[str]]]),
+            ("metadata", Optional[MetadataMapping]),
+            ("utilized_env_vars", Optional[Mapping[str, Sequence[EnvVarConsumer]]]),
+        ],
+    )
+):
+    """The ordered content hashes of every entry of an ExternalRepositoryData, along with the
+    fields of the ExternalRepositoryData that are not transferred entry by entry.
+    """
+
+    def __new__(
+        cls,
+        name: str,
+        entry_hashes_by_field: Mapping[str, Optional[Sequence[str]]],
+        metadata: Optional[MetadataMapping] = None,
+        utilized_env_vars: Optional[Mapping[str, Sequence[EnvVarConsumer]]] = None,
+    ):
+        return super(ExternalRepositoryManifest, cls).__new__(
+            cls,
+            name=check.str_param(name, "name"),
+            entry_hashes_by_field=check.mapping_param(
+                entry_hashes_by_field, "entry_hashes_by_field", key_type=str
+            ),
+            metadata=check.opt_mapping_param(metadata, "metadata", key_type=str),
+            utilized_env_vars=check.opt_nullable_mapping_param(
+                utilized_env_vars, "utilized_env_vars", key_type=str
+            ),
+        )
+
+    @property
+    def entry_hashes(self) -> AbstractSet[str]:
+        return {
+            entry_hash
+            for entry_hashes in self.entry_hashes_by_field.values()
+            if entry_hashes is not None
+            for entry_hash in entry_hashes
+        }
+
+
+# The fields of ExternalRepositoryData that are transferred in the manifest rather than entry by
+# entry
+MANIFEST_FIELDS = frozenset(ExternalRepositoryManifest._fields) - {"entry_hashes_by_field"}
+
+# A field of ExternalRepositoryData that is in neither set would be silently dropped whenever a
+# repository is reassembled from a delta
+check.invariant(
+    set(CONTENT_ADDRESSED_FIELDS) | MANIFEST_FIELDS == set(ExternalRepositoryData._fields),
+    "Every field of ExternalRepositoryData must be listed in CONTENT_ADDRESSED_FIELDS or be a field"
+    " of ExternalRepositoryManifest",
+)
+
+
+@whitelist_for_serdes
+class ExternalRepositoryDataDelta(
+    NamedTuple(
+        "_ExternalRepositoryDataDelta",
+        [
+            ("manifest", ExternalRepositoryManifest),
+            ("serialized_entries", Mapping[str, str]),
+        ],
+    )
+):
+    """The manifest of an ExternalRepositoryData, along with the serialized entries, keyed by
+    content hash, that the requesting process does not already have.
+    """
+
+    def __new__(cls, manifest: ExternalRepositoryManifest, serialized_entries: Mapping[str, str]):
+        return super(ExternalRepositoryDataDelta, cls).__new__(
+            cls,
+            manifest=check.inst_param(manifest, "manifest", ExternalRepositoryManifest),
+            serialized_entries=check.mapping_param(
+                serialized_entries, "serialized_entries", key_type=str, value_type=str
+            ),
+        )
+
+
+def external_repository_manifest_from_data(
+    external_repository_data: ExternalRepositoryData,
+) -> Tuple[ExternalRepositoryManifest, Mapping[str, str]]:
+    """Split an ExternalRepositoryData into its manifest and its serialized entries by hash."""
+    check.inst_param(external_repository_data, "external_repository_data", ExternalRepositoryData)
+
+    serialized_entries: Dict[str, str] = {}
+    entry_hashes_by_field: Dict[str, Optional[Sequence[str]]] = {}
+    for field_name in CONTENT_ADDRESSED_FIELDS:
+        entries = getattr(external_repository_data, field_name)
+        if entries is None:
+            entry_hashes_by_field[field_name] = None
+            continue
+
+        entry_hashes = []
+        for entry in entries:
+            serialized_entry = serialize_value(entry)
+            entry_hash = hash_serialized_entry(serialized_entry)
+            serialized_entries[entry_hash] = serialized_entry
+            entry_hashes.append(entry_hash)
+        entry_hashes_by_field[field_name] = entry_hashes
+
+    return (
+        ExternalRepositoryManifest(
+            entry_hashes_by_field=entry_hashes_by_field,
+            **{
+                field_name: getattr(external_repository_data, field_name)
+                for field_name in MANIFEST_FIELDS
+            },
+        ),
+        serialized_entries,
+    )
+
+
+def external_repository_data_delta(
+    manifest: ExternalRepositoryManifest,
+    serialized_entries: Mapping[str, str],
+    known_entry_hashes: AbstractSet[str],
+) -> ExternalRepositoryDataDelta:
+    return ExternalRepositoryDataDelta(
+        manifest=manifest,
+        serialized_entries={
+            entry_hash: serialized_entries[entry_hash]
+            for entry_hash in manifest.entry_hashes
+            if entry_hash not in known_entry_hashes
+        },
+    )
+
+
+class RepositorySnapshotCache:
+    """Deserialized ExternalRepositoryData entries, keyed by content hash, for the repositories
+    of a single code location. Entries that are no longer referenced by any repository after a
+    load are evicted.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Any] = {}
+        self._entry_hashes_by_repository: Dict[str, AbstractSet[str]] = {}
+
+    @property
+    def known_entry_hashes(self) -> AbstractSet[str]:
+        with self._lock:
+            return set(self._entries.keys())
+
+    def apply_delta(self, delta: ExternalRepositoryDataDelta) -> ExternalRepositoryData:
+        """Reassemble the ExternalRepositoryData described by a delta, using cached entries for
+        any hashes that the delta does not include.
+        """
+        check.inst_param(delta, "delta", ExternalRepositoryDataDelta)
+        manifest = delta.manifest
+
+        with self._lock:
+            for entry_hash, serialized_entry in delta.serialized_entries.items():
+                if entry_hash not in self._entries:
+                    self._entries[entry_hash] = deserialize_value(serialized_entry)
+
+            fields: Dict[str, Optional[List[Any]]] = {}
+            for field_name, entry_type in CONTENT_ADDRESSED_FIELDS.items():
+                entry_hashes = manifest.entry_hashes_by_field.get(field_name)
+                if entry_hashes is None:
+                    fields[field_name] = None
+                    continue
+
+                entries = []
+                for entry_hash in entry_hashes:
+                    check.invariant(
+                        entry_hash in self._entries,
+                        f"Entry {entry_hash} for {field_name} in repository {manifest.name} was"
+                        " neither cached nor included in the delta",
+                    )
+                    entries.append(check.inst(self._entries[entry_hash], entry_type))
+                fields[field_name] = entries
+
+            self._entry_hashes_by_repository[manifest.name] = manifest.entry_hashes
+            self._evict_unreferenced_entries()
+
+        return ExternalRepositoryData(
+            **{field_name: getattr(manifest, field_name) for field_name in MANIFEST_FIELDS},
+            **fields,  # type: ignore
+        )
+
+    def retain_repositories(self, repository_names: AbstractSet[str]) -> None:
+        """Evict the entries of any repository that is no longer in the code location."""
+        with self._lock:
+            for repository_name in list(self._entry_hashes_by_repository.keys()):
+                if repository_name not in repository_names:
+                    del self._entry_hashes_by_repository[repository_name]
+            self._evict_unreferenced_entries()
+
+    def _evict_unreferenced_entries(self) -> None:
+        referenced: Set[str] = set()
+        for entry_hashes in self._entry_hashes_by_repository.values():
+            referenced.update(entry_hashes)
+
+        for entry_hash in list(self._entries.keys()):
+            if entry_hash not in referenced:
+                del self._entries[entry_hash]
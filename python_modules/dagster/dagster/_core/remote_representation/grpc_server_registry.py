@@ -111,8 +111,13 @@ def __init__(
         self._heartbeat_ttl = check.int_param(heartbeat_ttl, "heartbeat_ttl")
         self._startup_timeout = check.int_param(startup_timeout, "startup_timeout")
 
+        # Guards _active_entries, _origin_locks and _all_processes
         self._lock = threading.Lock()
 
+        # Held while a server is being created or reloaded for a given origin ID, so that servers
+        # for different origins can start up at the same time
+        self._origin_locks: Dict[str, threading.Lock] = {}
+
         self._all_processes: List[GrpcServerProcess] = []
 
         self._cleanup_thread_shutdown_event: Optional[threading.Event] = None
@@ -150,16 +155,23 @@ def clear_all_grpc_endpoints(self):
         with self._lock:
             self._active_entries.clear()
 
+    def _get_origin_lock(self, origin_id: str) -> threading.Lock:
+        with self._lock:
+            if origin_id not in self._origin_locks:
+                self._origin_locks[origin_id] = threading.Lock()
+            return self._origin_locks[origin_id]
+
     def reload_grpc_endpoint(
         self, code_location_origin: ManagedGrpcPythonEnvCodeLocationOrigin
     ) -> GrpcServerEndpoint:
         check.inst_param(code_location_origin, "code_location_origin", CodeLocationOrigin)
-        with self._lock:
-            origin_id = code_location_origin.get_id()
-            if origin_id in self._active_entries:
-                # Free the map entry for this origin so that _get_grpc_endpoint will create
-                # a new process
-                del self._active_entries[origin_id]
+        origin_id = code_location_origin.get_id()
+        with self._get_origin_lock(origin_id):
+            with self._lock:
+                if origin_id in self._active_entries:
+                    # Free the map entry for this origin so that _get_grpc_endpoint will create
+                    # a new process
+                    del self._active_entries[origin_id]
 
             return self._get_grpc_endpoint(code_location_origin)
 
@@ -168,7 +180,7 @@ def get_grpc_endpoint(
     ) -> GrpcServerEndpoint:
         check.inst_param(code_location_origin, "code_location_origin", CodeLocationOrigin)
 
-        with self._lock:
+        with self._get_origin_lock(code_location_origin.get_id()):
             return self._get_grpc_endpoint(code_location_origin)
 
     def _get_loadable_target_origin(
@@ -192,11 +204,13 @@ def _get_grpc_endpoint(
                 f" {code_location_origin.location_name}"
             )
 
-        if origin_id not in self._active_entries:
-            refresh_server = True
-        else:
-            active_entry = self._active_entries[origin_id]
-            refresh_server = loadable_target_origin != active_entry.loadable_target_origin
+        # Only the map lookups and updates hold the registry-wide lock - the server process is
+        # started while holding just the lock for this origin
+        with self._lock:
+            active_entry = self._active_entries.get(origin_id)
+        refresh_server = (
+            active_entry is None or loadable_target_origin != active_entry.loadable_target_origin
+        )
 
         new_server_id: Optional[str]
         if refresh_server:
@@ -215,21 +229,25 @@ def _get_grpc_endpoint(
                     container_image=self._container_image,
                     container_context=self._container_context,
                 )
-                self._all_processes.append(server_process)
-                self._active_entries[origin_id] = ServerRegistryEntry(
+                active_entry = ServerRegistryEntry(
                     process=server_process,
                     loadable_target_origin=loadable_target_origin,
                     creation_timestamp=pendulum.now("UTC").timestamp(),
                     server_id=new_server_id,
                 )
+                with self._lock:
+                    self._all_processes.append(server_process)
+                    self._active_entries[origin_id] = active_entry
             except Exception:
-                self._active_entries[origin_id] = ErrorRegistryEntry(
+                active_entry = ErrorRegistryEntry(
                     error=serializable_error_info_from_exc_info(sys.exc_info()),
                     loadable_target_origin=loadable_target_origin,
                     creation_timestamp=pendulum.now("UTC").timestamp(),
                 )
+                with self._lock:
+                    self._active_entries[origin_id] = active_entry
 
-        active_entry = self._active_entries[origin_id]
+        active_entry = check.not_none(active_entry)
 
         if isinstance(active_entry, ErrorRegistryEntry):
             raise DagsterUserCodeProcessError(
@@ -37,6 +37,7 @@
         GrpcServerCodeLocation,
         InProcessCodeLocation,
     )
+    from dagster._core.remote_representation.external_data_delta import RepositorySnapshotCache
     from dagster._grpc.client import DagsterGrpcClient
 
 # This is a hard-coded name for the special "in-process" location.
@@ -346,7 +347,11 @@ def get_display_metadata(self) -> Mapping[str, str]:
         }
         return {key: value for key, value in metadata.items() if value is not None}
 
-    def reload_location(self, instance: "DagsterInstance") -> "GrpcServerCodeLocation":
+    def reload_location(
+        self,
+        instance: "DagsterInstance",
+        snapshot_cache: Optional["RepositorySnapshotCache"] = None,
+    ) -> "GrpcServerCodeLocation":
         from dagster._core.remote_representation.code_location import (
             GrpcServerCodeLocation,
         )
@@ -363,14 +368,18 @@ def reload_location(self, instance: "DagsterInstance") -> "GrpcServerCodeLocatio
             else:
                 raise
 
-        return GrpcServerCodeLocation(self, instance=instance)
+        return GrpcServerCodeLocation(self, instance=instance, snapshot_cache=snapshot_cache)
 
-    def create_location(self, instance: "DagsterInstance") -> "GrpcServerCodeLocation":
+    def create_location(
+        self,
+        instance: "DagsterInstance",
+        snapshot_cache: Optional["RepositorySnapshotCache"] = None,
+    ) -> "GrpcServerCodeLocation":
         from dagster._core.remote_representation.code_location import (
             GrpcServerCodeLocation,
         )
 
-        return GrpcServerCodeLocation(self, instance=instance)
+        return GrpcServerCodeLocation(self, instance=instance, snapshot_cache=snapshot_cache)
 
     def create_client(self) -> "DagsterGrpcClient":
         from dagster._grpc.client import DagsterGrpcClient
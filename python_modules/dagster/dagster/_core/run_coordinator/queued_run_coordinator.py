@@ -70,6 +70,7 @@ def __init__(
         max_user_code_failure_retries: Optional[int] = None,
         user_code_failure_retry_delay: Optional[int] = None,
         block_op_concurrency_limited_runs: Optional[Mapping[str, Any]] = None,
+        dequeue_use_run_queue_index: Optional[bool] = None,
         inst_data: Optional[ConfigurableClassData] = None,
     ):
         self._inst_data: Optional[ConfigurableClassData] = check.opt_inst_param(
@@ -96,6 +97,9 @@ def __init__(
         self._dequeue_num_workers: Optional[int] = check.opt_int_param(
             dequeue_num_workers, "dequeue_num_workers"
         )
+        self._dequeue_use_run_queue_index: bool = check.opt_bool_param(
+            dequeue_use_run_queue_index, "dequeue_use_run_queue_index", False
+        )
         self._max_user_code_failure_retries: int = check.opt_int_param(
             max_user_code_failure_retries, "max_user_code_failure_retries", 0
         )
@@ -146,6 +150,10 @@ def dequeue_use_threads(self) -> bool:
     def dequeue_num_workers(self) -> Optional[int]:
         return self._dequeue_num_workers
 
+    @property
+    def dequeue_use_run_queue_index(self) -> bool:
+        return self._dequeue_use_run_queue_index
+
     @property
     def should_block_op_concurrency_limited_runs(self) -> bool:
         return self._should_block_op_concurrency_limited_runs
@@ -215,6 +223,16 @@ def config_type(cls) -> UserConfigSchema:
                     "If dequeue_use_threads is true, limit the number of concurrent worker threads."
                 ),
             ),
+            "dequeue_use_run_queue_index": Field(
+                config=bool,
+                is_required=False,
+                description=(
+                    "Whether to keep queued runs in an in-memory index in the daemon that is"
+                    " updated incrementally, rather than reading every queued run from the run"
+                    " storage on each dequeue iteration. Speeds up dequeuing when many runs are"
+                    " queued at once."
+                ),
+            ),
             "max_user_code_failure_retries": Field(
                 config=IntSource,
                 is_required=False,
@@ -265,6 +283,7 @@ def from_config_value(
             dequeue_interval_seconds=config_value.get("dequeue_interval_seconds"),
             dequeue_use_threads=config_value.get("dequeue_use_threads"),
             dequeue_num_workers=config_value.get("dequeue_num_workers"),
+            dequeue_use_run_queue_index=config_value.get("dequeue_use_run_queue_index"),
             max_user_code_failure_retries=config_value.get("max_user_code_failure_retries"),
             user_code_failure_retry_delay=config_value.get("user_code_failure_retry_delay"),
             block_op_concurrency_limited_runs=config_value.get("block_op_concurrency_limited_runs"),
@@ -760,3 +760,21 @@ def get_evaluation_with_run_ids(
             return deserialize_auto_materialize_asset_evaluation_to_asset_condition_evaluation_with_run_ids(
                 self.serialized_evaluation_body, partitions_def
             )
+
+
+class InstigatorLease(NamedTuple):
+    """A lease on some unit of work, such as the ticks of an instigator, that is held by one of
+    several cooperating daemon processes until it expires or is released.
+    """
+
+    lease_key: str
+    owner_id: str
+    expiration_timestamp: float
+
+    @classmethod
+    def from_db_row(cls, row) -> "InstigatorLease":
+        return cls(
+            lease_key=row["lease_key"],
+            owner_id=row["owner_id"],
+            expiration_timestamp=row["expiration_timestamp"],
+        )
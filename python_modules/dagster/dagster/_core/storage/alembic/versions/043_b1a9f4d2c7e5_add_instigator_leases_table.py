@@ -0,0 +1,42 @@
+"""add instigator leases table
+
+Revision ID: b1a9f4d2c7e5
+Revises: 46b412388816
+Create Date: 2024-05-20 10:12:41.408231
+
+"""
+
+import sqlalchemy as db
+from alembic import op
+from dagster._core.storage.migration.utils import has_table
+from dagster._core.storage.sql import MySQLCompatabilityTypes, get_current_timestamp
+from sqlalchemy.dialects import sqlite
+
+# revision identifiers, used by Alembic.
+revision = "b1a9f4d2c7e5"
+down_revision = "46b412388816"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if not has_table("instigator_leases"):
+        op.create_table(
+            "instigator_leases",
+            db.Column(
+                "id",
+                db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+                primary_key=True,
+                autoincrement=True,
+            ),
+            db.Column("lease_key", MySQLCompatabilityTypes.UniqueText, nullable=False, unique=True),
+            db.Column("owner_id", db.String(255), nullable=False),
+            db.Column("expiration_timestamp", db.Float, nullable=False),
+            db.Column("create_timestamp", db.DateTime, server_default=get_current_timestamp()),
+            db.Column("update_timestamp", db.DateTime, server_default=get_current_timestamp()),
+        )
+
+
+def downgrade():
+    if has_table("instigator_leases"):
+        op.drop_table("instigator_leases")
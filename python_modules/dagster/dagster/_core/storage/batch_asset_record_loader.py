@@ -1,4 +1,5 @@
-from typing import TYPE_CHECKING, Iterable, Mapping, Optional, Sequence, Set
+import threading
+from typing import TYPE_CHECKING, Callable, Iterable, Mapping, Optional, Sequence, Set
 
 import dagster._check as check
 from dagster._core.definitions.events import AssetKey
@@ -11,34 +12,47 @@
 
 class BatchAssetRecordLoader:
     """A batch loader that fetches asset records.  This loader is expected to be
-    instantiated with a set of asset keys.
+    instantiated with a set of asset keys. It is safe to share between threads.
     """
 
-    def __init__(self, instance: DagsterInstance, asset_keys: Iterable[AssetKey]):
+    def __init__(
+        self,
+        instance: DagsterInstance,
+        asset_keys: Iterable[AssetKey],
+        on_fetch: Optional[Callable[[], None]] = None,
+    ):
         self._instance = instance
         self._unfetched_asset_keys: Set[AssetKey] = set(asset_keys)
         self._asset_records: Mapping[AssetKey, Optional["AssetRecord"]] = {}
+        # called on the fetching thread whenever the loader queries the instance
+        self._on_fetch = on_fetch
+        self._lock = threading.RLock()
 
     def add_asset_keys(self, asset_keys: Iterable[AssetKey]):
-        unfetched_asset_keys = set(asset_keys).difference(self._asset_records)
-        self._unfetched_asset_keys = self._unfetched_asset_keys.union(unfetched_asset_keys)
+        with self._lock:
+            unfetched_asset_keys = set(asset_keys).difference(self._asset_records)
+            self._unfetched_asset_keys = self._unfetched_asset_keys.union(unfetched_asset_keys)
 
     def get_asset_record(self, asset_key: AssetKey) -> Optional["AssetRecord"]:
-        if asset_key not in self._asset_records and asset_key not in self._unfetched_asset_keys:
-            check.failed(
-                f"Asset key {asset_key} not recognized for this loader. Expected one of:"
-                f" {self._unfetched_asset_keys.union(self._asset_records.keys())}"
-            )
+        with self._lock:
+            if asset_key not in self._asset_records and asset_key not in self._unfetched_asset_keys:
+                check.failed(
+                    f"Asset key {asset_key} not recognized for this loader. Expected one of:"
+                    f" {self._unfetched_asset_keys.union(self._asset_records.keys())}"
+                )
 
-        if asset_key in self._unfetched_asset_keys:
-            self.fetch()
+            if asset_key in self._unfetched_asset_keys:
+                self.fetch()
 
-        return self._asset_records.get(asset_key)
+            return self._asset_records.get(asset_key)
 
     def clear_cache(self):
         """For use in tests."""
-        self._unfetched_asset_keys = self._unfetched_asset_keys.union(self._asset_records.keys())
-        self._asset_records = {}
+        with self._lock:
+            self._unfetched_asset_keys = self._unfetched_asset_keys.union(
+                self._asset_records.keys()
+            )
+            self._asset_records = {}
 
     def has_cached_asset_record(self, asset_key: AssetKey):
         return asset_key in self._asset_records
@@ -69,16 +83,22 @@ def get_latest_observation_for_asset_key(self, asset_key: AssetKey) -> Optional[
         return asset_record.asset_entry.last_observation
 
     def fetch(self) -> None:
-        if not self._unfetched_asset_keys:
-            return
-
-        new_records = {
-            record.asset_entry.asset_key: record
-            for record in self._instance.get_asset_records(list(self._unfetched_asset_keys))
-        }
-
-        self._asset_records = {
-            **self._asset_records,
-            **{asset_key: new_records.get(asset_key) for asset_key in self._unfetched_asset_keys},
-        }
-        self._unfetched_asset_keys = set()
+        with self._lock:
+            if not self._unfetched_asset_keys:
+                return
+
+            if self._on_fetch:
+                self._on_fetch()
+            new_records = {
+                record.asset_entry.asset_key: record
+                for record in self._instance.get_asset_records(list(self._unfetched_asset_keys))
+            }
+
+            self._asset_records = {
+                **self._asset_records,
+                **{
+                    asset_key: new_records.get(asset_key)
+                    for asset_key in self._unfetched_asset_keys
+                },
+            }
+            self._unfetched_asset_keys = set()
@@ -66,3 +66,18 @@ def pg_config() -> UserConfigSchema:
         ),
         "should_autocreate_tables": Field(bool, is_required=False, default_value=True),
     }
+
+
+def pg_event_log_config() -> UserConfigSchema:
+    return {
+        **pg_config(),
+        "use_listen_notify_event_watcher": Field(
+            bool,
+            is_required=False,
+            default_value=False,
+            description=(
+                "Watch runs for new events using Postgres LISTEN/NOTIFY on a single dedicated"
+                " connection, falling back to polling if that connection is lost."
+            ),
+        ),
+    }
@@ -23,6 +23,7 @@
     EventLogRecord,
     EventRecordsFilter,
     EventRecordsResult,
+    LazyEventLogRecord,
     RunStatusChangeRecordsFilter,
 )
 from dagster._core.events import DagsterEventType
@@ -209,6 +210,34 @@ def get_records_for_run(
             limit (Optional[int]): Max number of records to return.
         """
 
+    def get_lazy_records_for_run(
+        self,
+        run_id: str,
+        cursor: Optional[str] = None,
+        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]] = None,
+        limit: Optional[int] = None,
+        ascending: bool = True,
+    ) -> Sequence[LazyEventLogRecord]:
+        """Get the event log records corresponding to a run, deferring the deserialization of each
+        record's EventLogEntry until it is accessed. Useful for callers that only need the event
+        type, step key, timestamp or asset key of each record.
+
+        Storages that do not override this fall back to fetching deserialized records with
+        `get_records_for_run`.
+
+        Args:
+            run_id (str): The id of the run for which to fetch logs.
+            cursor (Optional[str]): Cursor value to track paginated queries.
+            of_type (Optional[DagsterEventType]): the dagster event type to filter the logs.
+            limit (Optional[int]): Max number of records to return.
+        """
+        return [
+            LazyEventLogRecord.from_event_log_record(record)
+            for record in self.get_records_for_run(
+                run_id, cursor, of_type, limit, ascending=ascending
+            ).records
+        ]
+
     def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
         """Get a summary of events that have ocurred in a run."""
         return build_run_stats_from_events(run_id, self.get_logs_for_run(run_id))
@@ -419,6 +448,17 @@ def get_latest_storage_id_by_partition(
     ) -> Mapping[str, int]:
         pass
 
+    def get_latest_storage_ids_by_partition(
+        self, asset_keys: Sequence[AssetKey], event_type: DagsterEventType
+    ) -> Mapping[AssetKey, Mapping[str, int]]:
+        """Fetch the latest storage id for each partition of each of the given asset keys. Storages
+        that can answer this in a single query should override this method.
+        """
+        return {
+            asset_key: self.get_latest_storage_id_by_partition(asset_key, event_type)
+            for asset_key in asset_keys
+        }
+
     @abstractmethod
     def get_latest_tags_by_partition(
         self,
@@ -583,6 +623,23 @@ def fetch_run_status_changes(
     ) -> EventRecordsResult:
         raise NotImplementedError()
 
+    def fetch_lazy_run_status_changes(
+        self,
+        records_filter: Union[DagsterEventType, RunStatusChangeRecordsFilter],
+        limit: int,
+        cursor: Optional[str] = None,
+        ascending: bool = False,
+    ) -> Sequence[LazyEventLogRecord]:
+        """Like `fetch_run_status_changes`, but defers the deserialization of each record's
+        EventLogEntry until it is accessed.
+        """
+        return [
+            LazyEventLogRecord.from_event_log_record(record)
+            for record in self.fetch_run_status_changes(
+                records_filter, limit, cursor, ascending
+            ).records
+        ]
+
     @abstractmethod
     def get_latest_planned_materialization_info(
         self,
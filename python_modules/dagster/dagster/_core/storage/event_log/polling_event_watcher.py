@@ -1,13 +1,30 @@
+import logging
 import threading
-from typing import Callable, List, MutableMapping, NamedTuple, Optional
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Callable,
+    Dict,
+    List,
+    MutableMapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+)
 
 import dagster._check as check
 from dagster._core.events.log import EventLogEntry
-from dagster._core.storage.event_log.base import EventLogCursor, EventLogStorage
+from dagster._core.storage.event_log.base import EventLogCursor, EventLogRecord, EventLogStorage
+
+if TYPE_CHECKING:
+    from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
 
 INIT_POLL_PERIOD = 0.250  # 250ms
 MAX_POLL_PERIOD = 16.0  # 16s
 
+# maximum number of records fetched by a single shared query across all watched runs
+POLL_BATCH_LIMIT = 1000
+
 
 class CallbackAfterCursor(NamedTuple):
     """Callback passed from Observer class in event polling.
@@ -21,30 +38,47 @@ class CallbackAfterCursor(NamedTuple):
     callback: Callable[[EventLogEntry, str], None]
 
 
+def _storage_id_from_cursor(cursor: Optional[str]) -> Optional[int]:
+    return EventLogCursor.parse(cursor).storage_id() if cursor else None
+
+
+class _WatchedRun:
+    """The callbacks registered for a single watched run, along with the storage id of the last
+    event that has been dispatched for that run.
+    """
+
+    def __init__(self, cursor: Optional[int]):
+        self.callbacks: List[CallbackAfterCursor] = []
+        self.cursor = cursor
+        self.caught_up = False
+
+
 class SqlPollingEventWatcher:
-    """Event Log Watcher that uses a multithreaded polling approach to retrieving new events for run_ids
-    This class' job is to manage a collection of threads that each poll the event log for a given run_id
-    Uses one thread (SqlPollingRunIdEventWatcherThread) per watched run_id.
+    """Event Log Watcher that uses a polling approach to retrieving new events for run_ids.
+
+    A single SqlPollingEventWatcherThread tails the event log on behalf of every watched run_id,
+    so the number of threads (and, for storages that are not run-sharded, the number of queries per
+    poll cycle) stays constant regardless of how many runs are being watched.
 
     LOCKING INFO:
-        ORDER: _dict_lock -> run_id_thread.callback_fn_list_lock
-        INVARIANTS: _dict_lock protects _run_id_to_watcher_dict
+        INVARIANTS: _lock protects _watched_runs
     """
 
-    def __init__(self, event_log_storage: EventLogStorage):
+    def __init__(self, event_log_storage: "SqlEventLogStorage"):
         self._event_log_storage = check.inst_param(
             event_log_storage, "event_log_storage", EventLogStorage
         )
 
-        # INVARIANT: dict_lock protects _run_id_to_watcher_dict
-        self._dict_lock: threading.Lock = threading.Lock()
-        self._run_id_to_watcher_dict: MutableMapping[str, SqlPollingRunIdEventWatcherThread] = {}
+        # INVARIANT: _lock protects _watched_runs
+        self._lock: threading.Lock = threading.Lock()
+        self._watched_runs: MutableMapping[str, _WatchedRun] = {}
+        self._thread: Optional[SqlPollingEventWatcherThread] = None
         self._disposed = False
 
     def has_run_id(self, run_id: str) -> bool:
         run_id = check.str_param(run_id, "run_id")
-        with self._dict_lock:
-            _has_run_id = run_id in self._run_id_to_watcher_dict
+        with self._lock:
+            _has_run_id = run_id in self._watched_runs
         return _has_run_id
 
     def watch_run(
@@ -58,14 +92,17 @@ def watch_run(
         callback = check.callable_param(callback, "callback")
         check.invariant(not self._disposed, "Attempted to watch_run after close")
 
-        with self._dict_lock:
-            if run_id not in self._run_id_to_watcher_dict:
-                self._run_id_to_watcher_dict[run_id] = SqlPollingRunIdEventWatcherThread(
-                    self._event_log_storage, run_id
-                )
-                self._run_id_to_watcher_dict[run_id].daemon = True
-                self._run_id_to_watcher_dict[run_id].start()
-            self._run_id_to_watcher_dict[run_id].add_callback(cursor, callback)
+        with self._lock:
+            if run_id not in self._watched_runs:
+                self._watched_runs[run_id] = _WatchedRun(_storage_id_from_cursor(cursor))
+            self._watched_runs[run_id].callbacks.append(CallbackAfterCursor(cursor, callback))
+
+            if self._thread is None:
+                self._thread = SqlPollingEventWatcherThread(self)
+                self._thread.daemon = True
+                self._thread.start()
+            else:
+                self._thread.wake()
 
     def unwatch_run(
         self,
@@ -74,106 +111,226 @@ def unwatch_run(
     ) -> None:
         run_id = check.str_param(run_id, "run_id")
         handler = check.callable_param(handler, "handler")
-        with self._dict_lock:
-            if run_id in self._run_id_to_watcher_dict:
-                self._run_id_to_watcher_dict[run_id].remove_callback(handler)
-                if self._run_id_to_watcher_dict[run_id].should_thread_exit.is_set():
-                    del self._run_id_to_watcher_dict[run_id]
+        with self._lock:
+            if run_id in self._watched_runs:
+                watched_run = self._watched_runs[run_id]
+                watched_run.callbacks = [
+                    callback_with_cursor
+                    for callback_with_cursor in watched_run.callbacks
+                    if callback_with_cursor.callback != handler
+                ]
+                if not watched_run.callbacks:
+                    del self._watched_runs[run_id]
+                    if not self._watched_runs and self._thread:
+                        # let the polling thread exit now that nothing is being watched
+                        self._thread.wake()
+
+    def release_thread_if_idle(self, thread: "SqlPollingEventWatcherThread") -> bool:
+        """Called by the polling thread to check whether it should exit because no runs are being
+        watched. A subsequent call to `watch_run` starts a new polling thread.
+        """
+        with self._lock:
+            if self._watched_runs:
+                return False
+            if self._thread is thread:
+                self._thread = None
+            return True
 
     def close(self) -> None:
         if not self._disposed:
             self._disposed = True
-            with self._dict_lock:
-                for watcher_thread in self._run_id_to_watcher_dict.values():
-                    if not watcher_thread.should_thread_exit.is_set():
-                        watcher_thread.should_thread_exit.set()
-                for run_id in self._run_id_to_watcher_dict:
-                    self._run_id_to_watcher_dict[run_id].join()
-                self._run_id_to_watcher_dict = {}
+            with self._lock:
+                thread = self._thread
+                self._thread = None
+                self._watched_runs = {}
+            if thread:
+                thread.should_thread_exit.set()
+                thread.wake()
+                thread.join()
+
+    def get_poll_period(self, previous_poll_period: float, is_active: bool) -> float:
+        """Returns how long the polling thread should wait before the next poll, backing off while
+        no new events are found.
+        """
+        return INIT_POLL_PERIOD if is_active else min(previous_poll_period * 2, MAX_POLL_PERIOD)
 
+    def poll(self, run_ids: Optional[AbstractSet[str]] = None) -> bool:
+        """Fetch new events for watched runs and dispatch them to the registered callbacks.
 
-class SqlPollingRunIdEventWatcherThread(threading.Thread):
-    """subclass of Thread that watches a given run_id for new Events by polling every POLLING_CADENCE.
+        Runs that were just added are first caught up individually from their starting cursor.
+        After that, storages that are not run-sharded fetch the new events for all of the watched
+        runs with a single query per cycle, filtering each run by its own cursor.
 
-    Holds a list of callbacks (_callback_fn_list) each passed in by an `Observer`. Note that
-        the callbacks have a cursor associated; this means that the callbacks should be
-        only executed on EventLogEntrys with an associated id >= callback.cursor
-    Exits when `self.should_thread_exit` is set.
+        Exceptions raised by a callback stop the watch for its run, and are re-raised once the
+        other runs have been polled.
 
-    LOCKING INFO:
-        INVARIANTS: _callback_fn_list_lock protects _callback_fn_list
+        Args:
+            run_ids (Optional[AbstractSet[str]]): If provided, only runs in this set are polled
+                (in addition to any newly added runs that still need to be caught up).
+
+        Returns whether any new events were dispatched.
+        """
+        with self._lock:
+            run_ids_to_catch_up = [
+                run_id
+                for run_id, watched_run in self._watched_runs.items()
+                if not watched_run.caught_up
+            ]
+            watched_run_ids = [
+                run_id
+                for run_id in self._watched_runs.keys()
+                if run_ids is None or run_id in run_ids
+            ]
+
+        callback_errors: List[Exception] = []
+        found_events = False
+        for run_id in run_ids_to_catch_up:
+            found_events = self._poll_run(run_id, callback_errors) or found_events
+
+        caught_up_run_ids = [
+            run_id for run_id in watched_run_ids if run_id not in run_ids_to_catch_up
+        ]
+        if caught_up_run_ids:
+            if self._event_log_storage.is_run_sharded:
+                for run_id in caught_up_run_ids:
+                    found_events = self._poll_run(run_id, callback_errors) or found_events
+            else:
+                found_events = self._poll_runs(caught_up_run_ids, callback_errors) or found_events
+
+        if callback_errors:
+            raise callback_errors[0]
+        return found_events
+
+    def _poll_run(self, run_id: str, callback_errors: List[Exception]) -> bool:
+        with self._lock:
+            watched_run = self._watched_runs.get(run_id)
+            cursor = watched_run.cursor if watched_run else None
+        if not watched_run:
+            return False
+
+        conn = self._event_log_storage.get_records_for_run(
+            run_id,
+            cursor=EventLogCursor.from_storage_id(cursor).to_string()
+            if cursor is not None
+            else None,
+        )
+        with self._lock:
+            watched_run.caught_up = True
+            if watched_run.cursor is None:
+                # rely on the fact that all storage ids will be positive integers
+                watched_run.cursor = -1
+        self._dispatch(run_id, conn.records, callback_errors)
+        return bool(conn.records)
 
+    def _poll_runs(self, run_ids: Sequence[str], callback_errors: List[Exception]) -> bool:
+        with self._lock:
+            cursors_by_run_id = {
+                run_id: self._watched_runs[run_id].cursor
+                for run_id in run_ids
+                if run_id in self._watched_runs
+            }
+
+        found_events = False
+        while cursors_by_run_id:
+            records = self._event_log_storage.get_records_for_runs(
+                cursors_by_run_id, limit=POLL_BATCH_LIMIT
+            )
+            records_by_run_id: Dict[str, List[EventLogRecord]] = {}
+            for record in records:
+                records_by_run_id.setdefault(record.run_id, []).append(record)
+            for run_id, run_records in records_by_run_id.items():
+                self._dispatch(run_id, run_records, callback_errors)
+                # only advance past records that were dispatched, so that an event for this run
+                # that is committed later with a lower storage id than other runs' is not skipped
+                cursors_by_run_id[run_id] = run_records[-1].storage_id
+
+            found_events = found_events or bool(records)
+            if len(records) < POLL_BATCH_LIMIT:
+                break
+        return found_events
+
+    def _dispatch(
+        self,
+        run_id: str,
+        records: Sequence[EventLogRecord],
+        callback_errors: List[Exception],
+    ) -> None:
+        with self._lock:
+            watched_run = self._watched_runs.get(run_id)
+            if not watched_run or watched_run.cursor is None:
+                return
+            run_cursor = watched_run.cursor
+            records = [record for record in records if record.storage_id > run_cursor]
+            if not records:
+                return
+            watched_run.cursor = records[-1].storage_id
+            callbacks = list(watched_run.callbacks)
+
+        # callbacks are invoked outside of the lock so that they may unwatch the run
+        for event_record in records:
+            for callback_with_cursor in callbacks:
+                callback_cursor = _storage_id_from_cursor(callback_with_cursor.cursor)
+                if callback_cursor is not None and callback_cursor >= event_record.storage_id:
+                    continue
+                try:
+                    callback_with_cursor.callback(
+                        event_record.event_log_entry,
+                        str(EventLogCursor.from_storage_id(event_record.storage_id)),
+                    )
+                except Exception as e:
+                    # stop watching the run, as a dedicated polling thread for it would have exited
+                    with self._lock:
+                        if self._watched_runs.get(run_id) is watched_run:
+                            del self._watched_runs[run_id]
+                    callback_errors.append(e)
+                    return
+
+
+class SqlPollingEventWatcherThread(threading.Thread):
+    """subclass of Thread that polls the event log on behalf of a SqlPollingEventWatcher.
+
+    Wakes every poll period, backing off up to MAX_POLL_PERIOD while no new events are found, and
+    immediately whenever a new run is watched.
+    Exits when `self.should_thread_exit` is set, or when no runs are being watched.
     """
 
-    def __init__(self, event_log_storage: EventLogStorage, run_id: str):
-        super(SqlPollingRunIdEventWatcherThread, self).__init__()
-        self._event_log_storage = check.inst_param(
-            event_log_storage, "event_log_storage", EventLogStorage
+    def __init__(self, event_watcher: SqlPollingEventWatcher):
+        super(SqlPollingEventWatcherThread, self).__init__()
+        self._event_watcher = check.inst_param(
+            event_watcher, "event_watcher", SqlPollingEventWatcher
         )
-        self._run_id = check.str_param(run_id, "run_id")
-        self._callback_fn_list_lock: threading.Lock = threading.Lock()
-        self._callback_fn_list: List[CallbackAfterCursor] = []
         self._should_thread_exit = threading.Event()
-        self.name = f"sql-event-watch-run-id-{self._run_id}"
+        self._wake = threading.Event()
+        self.name = "sql-event-watch"
 
     @property
     def should_thread_exit(self) -> threading.Event:
         return self._should_thread_exit
 
-    def add_callback(self, cursor: Optional[str], callback: Callable[[EventLogEntry, str], None]):
-        """Observer has started watching this run.
-            Add a callback to execute on new EventLogEntrys after the given cursor.
-
-        Args:
-            cursor (Optional[str]): event log cursor for the callback to execute
-            callback (Callable[[EventLogEntry, str], None]): callback to update the Dagster UI
-        """
-        cursor = check.opt_str_param(cursor, "cursor")
-        callback = check.callable_param(callback, "callback")
-        with self._callback_fn_list_lock:
-            self._callback_fn_list.append(CallbackAfterCursor(cursor, callback))
-
-    def remove_callback(self, callback: Callable[[EventLogEntry, str], None]):
-        """Observer has stopped watching this run;
-            Remove a callback from the list of callbacks to execute on new EventLogEntrys.
-
-            Also kill thread if no callbacks remaining (i.e. no Observers are watching this run_id)
-
-        Args:
-            callback (Callable[[EventLogEntry, str], None]): callback to remove from list of callbacks
-        """
-        callback = check.callable_param(callback, "callback")
-        with self._callback_fn_list_lock:
-            self._callback_fn_list = [
-                callback_with_cursor
-                for callback_with_cursor in self._callback_fn_list
-                if callback_with_cursor.callback != callback
-            ]
-            if not self._callback_fn_list:
-                self._should_thread_exit.set()
+    def wake(self) -> None:
+        self._wake.set()
 
     def run(self) -> None:
         """Polling function to update Observers with EventLogEntrys from Event Log DB.
         Wakes every POLLING_CADENCE &
-            1. executes a SELECT query to get new EventLogEntrys
+            1. executes SELECT queries to get new EventLogEntrys for all watched runs
             2. fires each callback (taking into account the callback.cursor) on the new EventLogEntrys
-        Uses max_index_so_far as a cursor in the DB to make sure that only new records are retrieved.
+        Uses the last dispatched storage id of each run as a cursor in the DB to make sure that only
+        new records are retrieved.
         """
-        cursor = None
         wait_time = INIT_POLL_PERIOD
-        while not self._should_thread_exit.wait(wait_time):
-            conn = self._event_log_storage.get_records_for_run(self._run_id, cursor=cursor)
-            cursor = conn.cursor
-            for event_record in conn.records:
-                with self._callback_fn_list_lock:
-                    for callback_with_cursor in self._callback_fn_list:
-                        if (
-                            callback_with_cursor.cursor is None
-                            or EventLogCursor.parse(callback_with_cursor.cursor).storage_id()
-                            < event_record.storage_id
-                        ):
-                            callback_with_cursor.callback(
-                                event_record.event_log_entry,
-                                str(EventLogCursor.from_storage_id(event_record.storage_id)),
-                            )
-            wait_time = INIT_POLL_PERIOD if conn.records else min(wait_time * 2, MAX_POLL_PERIOD)
+        while True:
+            woken = self._wake.wait(wait_time)
+            self._wake.clear()
+            if self._should_thread_exit.is_set() or self._event_watcher.release_thread_if_idle(
+                self
+            ):
+                return
+
+            try:
+                found_events = self._event_watcher.poll()
+            except Exception:
+                logging.exception("Exception while polling for new events for watched runs.")
+                found_events = False
+
+            wait_time = self._event_watcher.get_poll_period(wait_time, found_events or woken)
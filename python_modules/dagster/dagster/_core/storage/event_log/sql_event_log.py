@@ -45,6 +45,7 @@
 )
 from dagster._core.event_api import (
     EventRecordsResult,
+    LazyEventLogRecord,
     RunShardedEventsCursor,
     RunStatusChangeRecordsFilter,
 )
@@ -56,7 +57,15 @@
     DagsterEventType,
 )
 from dagster._core.events.log import EventLogEntry
-from dagster._core.execution.stats import RunStepKeyStatsSnapshot, build_run_step_stats_from_events
+from dagster._core.execution.stats import (
+    STEP_ATTEMPT_EVENT_TYPES,
+    STEP_PAYLOAD_EVENT_TYPES,
+    STEP_STATS_AGGREGATE_EVENT_TYPES,
+    RunStepKeyStatsSnapshot,
+    StepEventAggregate,
+    StepMarkerEvent,
+    build_run_step_stats_from_aggregates,
+)
 from dagster._core.storage.asset_check_execution_record import (
     AssetCheckExecutionRecord,
     AssetCheckExecutionRecordStatus,
@@ -70,6 +79,7 @@
 )
 from dagster._serdes import (
     deserialize_value,
+    get_packed_field,
     serialize_value,
 )
 from dagster._serdes.errors import DeserializationError
@@ -119,6 +129,15 @@
     from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
 
 MIN_ASSET_ROWS = 25
+
+# columns read for LazyEventLogRecords, so that the run id and asset key are available without
+# parsing the stored event
+_LAZY_RECORD_COLUMNS = [
+    SqlEventLogStorageTable.c.id,
+    SqlEventLogStorageTable.c.event,
+    SqlEventLogStorageTable.c.run_id,
+    SqlEventLogStorageTable.c.asset_key,
+]
 DEFAULT_MAX_LIMIT_EVENT_RECORDS = 10000
 
 
@@ -271,6 +290,69 @@ def store_asset_event(self, event: EventLogEntry, event_id: int):
             except db_exc.IntegrityError:
                 conn.execute(update_statement)
 
+        self._update_asset_cached_status_data_for_event(event, event_id)
+
+    def _store_asset_event_batch(
+        self,
+        conn: Connection,
+        events: Sequence[EventLogEntry],
+        event_ids: Sequence[int],
+        has_asset_key_index_cols: bool,
+        update_cached_status: bool = False,
+    ) -> None:
+        """Batched equivalent of `store_asset_event`, executed against an open index connection.
+
+        The asset key index is written once per distinct asset key rather than once per event, with
+        values from later events in the batch taking precedence over earlier ones. Callers are
+        expected to hold the write lock on the index shard (e.g. by having already written to it in
+        the same transaction), since existing rows are determined up front. If
+        `update_cached_status` is set, the events are also applied to the cached asset statuses.
+        """
+        values_by_asset_key: Dict[str, Dict[str, Any]] = {}
+        for event, event_id in zip(events, event_ids):
+            if not (event.dagster_event and event.dagster_event.asset_key):
+                continue
+            values_by_asset_key.setdefault(event.dagster_event.asset_key.to_string(), {}).update(
+                self._get_asset_entry_values(event, event_id, has_asset_key_index_cols)
+            )
+
+        if not values_by_asset_key:
+            return
+
+        existing_rows = conn.execute(
+            db_select(
+                [AssetKeyTable.c.asset_key, AssetKeyTable.c.cached_status_data]
+                if update_cached_status
+                else [AssetKeyTable.c.asset_key]
+            ).where(AssetKeyTable.c.asset_key.in_(list(values_by_asset_key.keys())))
+        ).fetchall()
+        existing_asset_keys = {row[0] for row in existing_rows}
+
+        # multi-row inserts require every row to bind the same set of columns
+        insert_rows_by_columns: Dict[Tuple[str, ...], List[Dict[str, Any]]] = defaultdict(list)
+        for asset_key_str, values in values_by_asset_key.items():
+            if asset_key_str not in existing_asset_keys:
+                insert_rows_by_columns[tuple(sorted(values.keys()))].append(
+                    {"asset_key": asset_key_str, **values}
+                )
+            elif values:
+                conn.execute(
+                    AssetKeyTable.update()
+                    .values(**values)
+                    .where(AssetKeyTable.c.asset_key == asset_key_str)
+                )
+
+        for rows in insert_rows_by_columns.values():
+            conn.execute(AssetKeyTable.insert().values(rows))
+
+        if update_cached_status:
+            self._update_asset_cached_status_data_for_events(
+                conn,
+                events,
+                event_ids,
+                cached_status_data_by_asset_key={row[0]: row[1] for row in existing_rows},
+            )
+
     def _get_asset_entry_values(
         self, event: EventLogEntry, event_id: int, has_asset_key_index_cols: bool
     ) -> Dict[str, Any]:
@@ -410,7 +492,19 @@ def store_asset_event_tags(
         check.sequence_param(events, "events", EventLogEntry)
         check.sequence_param(event_ids, "event_ids", int)
 
-        all_values = [
+        all_values = self._get_asset_event_tag_rows(events, event_ids)
+
+        # Only execute if tags table exists. This is to support OSS users who have not yet run the
+        # migration to create the table. On read, we will throw an error if the table does not
+        # exist.
+        if len(all_values) > 0 and self.has_table(AssetEventTagsTable.name):
+            with self.index_connection() as conn:
+                conn.execute(AssetEventTagsTable.insert(), all_values)
+
+    def _get_asset_event_tag_rows(
+        self, events: Sequence[EventLogEntry], event_ids: Sequence[int]
+    ) -> Sequence[Mapping[str, Any]]:
+        return [
             dict(
                 event_id=event_id,
                 asset_key=check.not_none(event.get_dagster_event().asset_key).to_string(),
@@ -422,13 +516,6 @@ def store_asset_event_tags(
             for key, value in self._tags_for_asset_event(event).items()
         ]
 
-        # Only execute if tags table exists. This is to support OSS users who have not yet run the
-        # migration to create the table. On read, we will throw an error if the table does not
-        # exist.
-        if len(all_values) > 0 and self.has_table(AssetEventTagsTable.name):
-            with self.index_connection() as conn:
-                conn.execute(AssetEventTagsTable.insert(), all_values)
-
     def _tags_for_asset_event(self, event: EventLogEntry) -> Mapping[str, str]:
         tags = {}
         if event.dagster_event and event.dagster_event.asset_key:
@@ -491,6 +578,51 @@ def get_records_for_run(
             of_type (Optional[DagsterEventType]): the dagster event type to filter the logs.
             limit (Optional[int]): the maximum number of events to fetch
         """
+        query = self._get_records_for_run_query(run_id, cursor, of_type, limit, ascending)
+        with self.run_connection(run_id) as conn:
+            results = conn.execute(query).fetchall()
+
+        last_record_id = None
+        try:
+            records = []
+            for (
+                record_id,
+                json_str,
+            ) in results:
+                records.append(
+                    EventLogRecord(
+                        storage_id=record_id,
+                        event_log_entry=deserialize_value(json_str, EventLogEntry),
+                    )
+                )
+                last_record_id = record_id
+        except (seven.JSONDecodeError, DeserializationError) as err:
+            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+
+        if last_record_id is not None:
+            next_cursor = EventLogCursor.from_storage_id(last_record_id).to_string()
+        elif cursor:
+            # record fetch returned no new logs, return the same cursor
+            next_cursor = cursor
+        else:
+            # rely on the fact that all storage ids will be positive integers
+            next_cursor = EventLogCursor.from_storage_id(-1).to_string()
+
+        return EventLogConnection(
+            records=records,
+            cursor=next_cursor,
+            has_more=bool(limit and len(results) == limit),
+        )
+
+    def _get_records_for_run_query(
+        self,
+        run_id: str,
+        cursor: Optional[str],
+        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]],
+        limit: Optional[int],
+        ascending: bool,
+        columns: Optional[Sequence[db.Column]] = None,
+    ) -> SqlAlchemyQuery:
         check.str_param(run_id, "run_id")
         check.opt_str_param(cursor, "cursor")
 
@@ -503,7 +635,7 @@ def get_records_for_run(
         )
 
         query = (
-            db_select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
+            db_select(columns or [SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
             .where(SqlEventLogStorageTable.c.run_id == run_id)
             .order_by(
                 SqlEventLogStorageTable.c.id.asc()
@@ -532,40 +664,94 @@ def get_records_for_run(
         if limit:
             query = query.limit(limit)
 
+        return query
+
+    def get_lazy_records_for_run(
+        self,
+        run_id: str,
+        cursor: Optional[str] = None,
+        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]] = None,
+        limit: Optional[int] = None,
+        ascending: bool = True,
+    ) -> Sequence[LazyEventLogRecord]:
+        query = self._get_records_for_run_query(
+            run_id, cursor, of_type, limit, ascending, columns=_LAZY_RECORD_COLUMNS
+        )
         with self.run_connection(run_id) as conn:
             results = conn.execute(query).fetchall()
 
-        last_record_id = None
-        try:
-            records = []
-            for (
-                record_id,
-                json_str,
-            ) in results:
+        return [_lazy_record_from_row(row) for row in results]
+
+    def get_records_for_runs(
+        self,
+        after_storage_ids_by_run_id: Mapping[str, Optional[int]],
+        limit: Optional[int] = None,
+    ) -> Sequence[EventLogRecord]:
+        """Get the event records for a set of runs in a single query, in ascending storage id order.
+
+        Storage ids are only comparable across runs for storages that are not run-sharded, so this
+        is only supported when `is_run_sharded` is False.
+
+        Args:
+            after_storage_ids_by_run_id (Mapping[str, Optional[int]]): The ids of the runs for which
+                to fetch records, mapped to the storage id after which records should be returned
+                for that run (or None to return all of the run's records).
+            limit (Optional[int]): the maximum number of records to fetch
+        """
+        check.mapping_param(
+            after_storage_ids_by_run_id, "after_storage_ids_by_run_id", key_type=str
+        )
+        check.opt_int_param(limit, "limit")
+        check.invariant(
+            not self.is_run_sharded,
+            "Cannot fetch records across runs for a run-sharded event log storage.",
+        )
+
+        if not after_storage_ids_by_run_id:
+            return []
+
+        query = (
+            db_select(
+                [
+                    SqlEventLogStorageTable.c.id,
+                    SqlEventLogStorageTable.c.run_id,
+                    SqlEventLogStorageTable.c.event,
+                ]
+            )
+            .where(
+                db.or_(
+                    *(
+                        SqlEventLogStorageTable.c.run_id == run_id
+                        if after_storage_id is None
+                        else db.and_(
+                            SqlEventLogStorageTable.c.run_id == run_id,
+                            SqlEventLogStorageTable.c.id > after_storage_id,
+                        )
+                        for run_id, after_storage_id in after_storage_ids_by_run_id.items()
+                    )
+                )
+            )
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+        if limit:
+            query = query.limit(limit)
+
+        with self.index_connection() as conn:
+            results = conn.execute(query).fetchall()
+
+        records = []
+        for record_id, run_id, json_str in results:
+            try:
                 records.append(
                     EventLogRecord(
                         storage_id=record_id,
                         event_log_entry=deserialize_value(json_str, EventLogEntry),
                     )
                 )
-                last_record_id = record_id
-        except (seven.JSONDecodeError, DeserializationError) as err:
-            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
-
-        if last_record_id is not None:
-            next_cursor = EventLogCursor.from_storage_id(last_record_id).to_string()
-        elif cursor:
-            # record fetch returned no new logs, return the same cursor
-            next_cursor = cursor
-        else:
-            # rely on the fact that all storage ids will be positive integers
-            next_cursor = EventLogCursor.from_storage_id(-1).to_string()
+            except (seven.JSONDecodeError, DeserializationError) as err:
+                raise DagsterEventLogInvalidForRun(run_id=run_id) from err
 
-        return EventLogConnection(
-            records=records,
-            cursor=next_cursor,
-            has_more=bool(limit and len(results) == limit),
-        )
+        return records
 
     def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
         check.str_param(run_id, "run_id")
@@ -630,51 +816,120 @@ def get_step_stats_for_run(
         check.str_param(run_id, "run_id")
         check.opt_list_param(step_keys, "step_keys", of_type=str)
 
-        # Originally, this was two different queries:
-        # 1) one query which aggregated top-level step stats by grouping by event type / step_key in
-        #    a single query, using pure SQL (e.g. start_time, end_time, status, attempt counts).
-        # 2) one query which fetched all the raw events for a specific event type and then inspected
-        #    the deserialized event object to aggregate stats derived from sequences of events.
-        #    (e.g. marker events, materializations, expectations resuls, attempts timing, etc.)
-        #
-        # For simplicity, we now just do the second type of query and derive the stats in Python
-        # from the raw events.  This has the benefit of being easier to read and also the benefit of
-        # being able to share code with the in-memory event log storage implementation.  We may
-        # choose to revisit this in the future, especially if we are able to do JSON-column queries
-        # in SQL as a way of bypassing the serdes layer in all cases.
-        raw_event_query = (
-            db_select([SqlEventLogStorageTable.c.event])
-            .where(SqlEventLogStorageTable.c.run_id == run_id)
-            .where(SqlEventLogStorageTable.c.step_key != None)  # noqa: E711
+        # The status and attempt count of each step are aggregated in the database from the indexed
+        # event type column, so that the number of rows read for the step lifecycle scales with the
+        # number of steps rather than the number of events.  Event bodies are only read for:
+        # - the last event of each aggregate and the retry events, whose timestamps are parsed from
+        #   the event body like the rest of the step stats (the timestamp column is rounded)
+        # - materializations and expectation results, whose payload is part of the stats
+        # - engine events whose body contains a marker, which are filtered in the database
+        def _step_events_query(columns, event_types: Iterable[DagsterEventType]):
+            query = (
+                db_select(columns)
+                .where(SqlEventLogStorageTable.c.run_id == run_id)
+                .where(SqlEventLogStorageTable.c.step_key != None)  # noqa: E711
+                .where(
+                    SqlEventLogStorageTable.c.dagster_event_type.in_(
+                        [event_type.value for event_type in event_types]
+                    )
+                )
+            )
+            if step_keys:
+                query = query.where(SqlEventLogStorageTable.c.step_key.in_(step_keys))
+            return query
+
+        aggregate_query = _step_events_query(
+            [
+                SqlEventLogStorageTable.c.step_key,
+                SqlEventLogStorageTable.c.dagster_event_type,
+                db.func.count().label("n_events_of_type"),
+                db.func.max(SqlEventLogStorageTable.c.id).label("last_event_id"),
+            ],
+            STEP_STATS_AGGREGATE_EVENT_TYPES,
+        ).group_by(SqlEventLogStorageTable.c.step_key, SqlEventLogStorageTable.c.dagster_event_type)
+        last_event_query = db_select(
+            [SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event]
+        ).where(
+            SqlEventLogStorageTable.c.id.in_(
+                _step_events_query(
+                    [db.func.max(SqlEventLogStorageTable.c.id)], STEP_STATS_AGGREGATE_EVENT_TYPES
+                ).group_by(
+                    SqlEventLogStorageTable.c.step_key,
+                    SqlEventLogStorageTable.c.dagster_event_type,
+                )
+            )
+        )
+        attempt_query = _step_events_query(
+            [
+                SqlEventLogStorageTable.c.step_key,
+                SqlEventLogStorageTable.c.dagster_event_type,
+                SqlEventLogStorageTable.c.event,
+            ],
+            STEP_ATTEMPT_EVENT_TYPES,
+        ).order_by(SqlEventLogStorageTable.c.id.asc())
+        payload_query = _step_events_query(
+            [SqlEventLogStorageTable.c.event], STEP_PAYLOAD_EVENT_TYPES
+        ).order_by(SqlEventLogStorageTable.c.id.asc())
+        marker_query = (
+            _step_events_query(
+                [SqlEventLogStorageTable.c.step_key, SqlEventLogStorageTable.c.event],
+                MARKER_EVENTS,
+            )
             .where(
-                SqlEventLogStorageTable.c.dagster_event_type.in_(
-                    [
-                        DagsterEventType.STEP_START.value,
-                        DagsterEventType.STEP_SUCCESS.value,
-                        DagsterEventType.STEP_SKIPPED.value,
-                        DagsterEventType.STEP_FAILURE.value,
-                        DagsterEventType.STEP_RESTARTED.value,
-                        DagsterEventType.ASSET_MATERIALIZATION.value,
-                        DagsterEventType.STEP_EXPECTATION_RESULT.value,
-                        DagsterEventType.STEP_RESTARTED.value,
-                        DagsterEventType.STEP_UP_FOR_RETRY.value,
-                    ]
-                    + [marker_event.value for marker_event in MARKER_EVENTS]
+                db.or_(
+                    *(
+                        SqlEventLogStorageTable.c.event.like(f'%"{field_name}":{separator}"%')
+                        for field_name in ("marker_start", "marker_end")
+                        for separator in ("", " ")
+                    )
                 )
             )
             .order_by(SqlEventLogStorageTable.c.id.asc())
         )
-        if step_keys:
-            raw_event_query = raw_event_query.where(
-                SqlEventLogStorageTable.c.step_key.in_(step_keys)
-            )
 
         with self.run_connection(run_id) as conn:
-            results = conn.execute(raw_event_query).fetchall()
+            aggregate_rows = conn.execute(aggregate_query).fetchall()
+            last_event_rows = conn.execute(last_event_query).fetchall()
+            attempt_rows = conn.execute(attempt_query).fetchall()
+            payload_rows = conn.execute(payload_query).fetchall()
+            marker_rows = conn.execute(marker_query).fetchall()
 
         try:
-            records = [deserialize_value(json_str, EventLogEntry) for (json_str,) in results]
-            return build_run_step_stats_from_events(run_id, records)
+            last_event_timestamps = {
+                event_id: _get_event_timestamp(json_str) for event_id, json_str in last_event_rows
+            }
+            marker_events = []
+            for step_key, json_str in marker_rows:
+                marker_event = _get_step_marker_event(step_key, json_str)
+                if marker_event:
+                    marker_events.append(marker_event)
+
+            return build_run_step_stats_from_aggregates(
+                run_id,
+                aggregates=[
+                    StepEventAggregate(
+                        step_key=step_key,
+                        event_type=DagsterEventType(dagster_event_type),
+                        count=n_events_of_type,
+                        last_storage_id=last_event_id,
+                        last_timestamp=last_event_timestamps.get(last_event_id),
+                    )
+                    for (
+                        step_key,
+                        dagster_event_type,
+                        n_events_of_type,
+                        last_event_id,
+                    ) in aggregate_rows
+                ],
+                attempt_events=[
+                    (step_key, DagsterEventType(dagster_event_type), _get_event_timestamp(json_str))
+                    for step_key, dagster_event_type, json_str in attempt_rows
+                ],
+                payload_records=[
+                    deserialize_value(json_str, EventLogEntry) for (json_str,) in payload_rows
+                ],
+                marker_events=marker_events,
+            )
         except (seven.JSONDecodeError, DeserializationError) as err:
             raise DagsterEventLogInvalidForRun(run_id=run_id) from err
 
@@ -976,6 +1231,35 @@ def _get_event_records(
         ascending: bool = False,
     ) -> Sequence[EventLogRecord]:
         """Returns a list of (record_id, record)."""
+        query = self._get_event_records_query(event_records_filter, limit, ascending)
+        with self.index_connection() as conn:
+            results = conn.execute(query).fetchall()
+
+        event_records = []
+        for row_id, json_str in results:
+            try:
+                event_record = deserialize_value(json_str, NamedTuple)
+                if not isinstance(event_record, EventLogEntry):
+                    logging.warning(
+                        "Could not resolve event record as EventLogEntry for id `%s`.", row_id
+                    )
+                    continue
+
+                event_records.append(
+                    EventLogRecord(storage_id=row_id, event_log_entry=event_record)
+                )
+            except seven.JSONDecodeError:
+                logging.warning("Could not parse event record id `%s`.", row_id)
+
+        return event_records
+
+    def _get_event_records_query(
+        self,
+        event_records_filter: EventRecordsFilter,
+        limit: Optional[int],
+        ascending: bool,
+        columns: Optional[Sequence[db.Column]] = None,
+    ) -> SqlAlchemyQuery:
         check.inst_param(event_records_filter, "event_records_filter", EventRecordsFilter)
         check.opt_int_param(limit, "limit")
         check.bool_param(ascending, "ascending")
@@ -986,7 +1270,7 @@ def _get_event_records(
             asset_details = None
 
         query = db_select(
-            [SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event]
+            columns or [SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event]
         ).select_from(SqlEventLogStorageTable)
 
         query = self._apply_filter_to_query(
@@ -1002,26 +1286,21 @@ def _get_event_records(
         else:
             query = query.order_by(SqlEventLogStorageTable.c.id.desc())
 
+        return query
+
+    def _get_lazy_event_records(
+        self,
+        event_records_filter: EventRecordsFilter,
+        limit: Optional[int] = None,
+        ascending: bool = False,
+    ) -> Sequence[LazyEventLogRecord]:
+        query = self._get_event_records_query(
+            event_records_filter, limit, ascending, columns=_LAZY_RECORD_COLUMNS
+        )
         with self.index_connection() as conn:
             results = conn.execute(query).fetchall()
 
-        event_records = []
-        for row_id, json_str in results:
-            try:
-                event_record = deserialize_value(json_str, NamedTuple)
-                if not isinstance(event_record, EventLogEntry):
-                    logging.warning(
-                        "Could not resolve event record as EventLogEntry for id `%s`.", row_id
-                    )
-                    continue
-
-                event_records.append(
-                    EventLogRecord(storage_id=row_id, event_log_entry=event_record)
-                )
-            except seven.JSONDecodeError:
-                logging.warning("Could not parse event record id `%s`.", row_id)
-
-        return event_records
+        return [_lazy_record_from_row(row) for row in results]
 
     def supports_event_consumer_queries(self) -> bool:
         return True
@@ -1099,13 +1378,13 @@ def fetch_observations(
 
         return self._get_event_records_result(event_records_filter, limit, cursor, ascending)
 
-    def fetch_run_status_changes(
+    def _get_run_status_changes_filter(
         self,
         records_filter: Union[DagsterEventType, RunStatusChangeRecordsFilter],
         limit: int,
-        cursor: Optional[str] = None,
-        ascending: bool = False,
-    ) -> EventRecordsResult:
+        cursor: Optional[str],
+        ascending: bool,
+    ) -> EventRecordsFilter:
         enforce_max_records_limit(limit)
         event_type = (
             records_filter
@@ -1124,8 +1403,32 @@ def fetch_run_status_changes(
                 event_type, before_cursor=before_cursor, after_cursor=after_cursor
             )
         )
+        return event_records_filter
+
+    def fetch_run_status_changes(
+        self,
+        records_filter: Union[DagsterEventType, RunStatusChangeRecordsFilter],
+        limit: int,
+        cursor: Optional[str] = None,
+        ascending: bool = False,
+    ) -> EventRecordsResult:
+        event_records_filter = self._get_run_status_changes_filter(
+            records_filter, limit, cursor, ascending
+        )
         return self._get_event_records_result(event_records_filter, limit, cursor, ascending)
 
+    def fetch_lazy_run_status_changes(
+        self,
+        records_filter: Union[DagsterEventType, RunStatusChangeRecordsFilter],
+        limit: int,
+        cursor: Optional[str] = None,
+        ascending: bool = False,
+    ) -> Sequence[LazyEventLogRecord]:
+        event_records_filter = self._get_run_status_changes_filter(
+            records_filter, limit, cursor, ascending
+        )
+        return self._get_lazy_event_records(event_records_filter, limit, ascending)
+
     def get_logs_for_all_runs_by_log_id(
         self,
         after_cursor: int = -1,
@@ -1524,6 +1827,175 @@ def update_asset_cached_status_data(
                     .values(cached_status_data=serialize_value(cache_values))
                 )
 
+    def _is_asset_status_cache_write_through_enabled(self) -> bool:
+        return (
+            self.has_instance
+            and self._instance.asset_status_cache_write_through_enabled
+            and self.can_cache_asset_status_data()
+        )
+
+    def _update_asset_cached_status_data_for_event(
+        self, event: EventLogEntry, event_id: int
+    ) -> None:
+        dagster_event = check.not_none(event.dagster_event)
+        if (
+            dagster_event.partition is not None
+            and (
+                dagster_event.is_step_materialization
+                or dagster_event.is_asset_materialization_planned
+            )
+            and self._is_asset_status_cache_write_through_enabled()
+        ):
+            with self.index_connection() as conn:
+                self._update_asset_cached_status_data_for_events(conn, [event], [event_id])
+
+    def _update_asset_cached_status_data_for_events(
+        self,
+        conn: Connection,
+        events: Sequence[EventLogEntry],
+        event_ids: Sequence[int],
+        cached_status_data_by_asset_key: Optional[Mapping[str, Optional[str]]] = None,
+    ) -> None:
+        """Applies newly stored asset events to the cached statuses of their assets. Called with an
+        open index connection after the asset key rows have been updated for the events, when
+        write-through caching of asset statuses is enabled on the instance.
+
+        The stored cache values may be passed in as `cached_status_data_by_asset_key` if they were
+        already read as part of writing the asset key rows.
+        """
+        from dagster._core.storage.partition_status_cache import (
+            AssetStatusCacheValue,
+            apply_asset_event_to_status_cache_value,
+            get_status_cache_partitions_defs,
+        )
+
+        events_and_ids_by_asset_key: Dict[str, List[Tuple[EventLogEntry, int]]] = defaultdict(list)
+        for event, event_id in zip(events, event_ids):
+            dagster_event = event.dagster_event
+            if (
+                dagster_event
+                and dagster_event.asset_key
+                and dagster_event.partition is not None
+                and (
+                    dagster_event.is_step_materialization
+                    or dagster_event.is_asset_materialization_planned
+                )
+            ):
+                events_and_ids_by_asset_key[dagster_event.asset_key.to_string()].append(
+                    (event, event_id)
+                )
+
+        if not events_and_ids_by_asset_key:
+            return
+
+        for events_and_ids in events_and_ids_by_asset_key.values():
+            events_and_ids.sort(key=lambda event_and_id: event_and_id[1])
+
+        if cached_status_data_by_asset_key is None:
+            cached_status_data_by_asset_key = {
+                row[0]: row[1]
+                for row in conn.execute(
+                    db_select(
+                        [AssetKeyTable.c.asset_key, AssetKeyTable.c.cached_status_data]
+                    ).where(AssetKeyTable.c.asset_key.in_(list(events_and_ids_by_asset_key.keys())))
+                ).fetchall()
+            }
+
+        cache_values_by_asset_key: Dict[str, AssetStatusCacheValue] = {}
+        for asset_key_str, events_and_ids in events_and_ids_by_asset_key.items():
+            stored_cached_status_data = cached_status_data_by_asset_key.get(asset_key_str)
+            cache_value = (
+                AssetStatusCacheValue.from_db_string(stored_cached_status_data)
+                if stored_cached_status_data
+                else None
+            )
+            if (
+                cache_value
+                and cache_value.partitions_def_id
+                and events_and_ids[-1][1] > cache_value.latest_storage_id
+            ):
+                cache_values_by_asset_key[asset_key_str] = cache_value
+
+        if not cache_values_by_asset_key:
+            return
+
+        # a cached value can only be advanced past these events if it already reflects every
+        # earlier event for the asset, otherwise it is brought up to date when it is next read
+        assets_with_unapplied_events = {
+            row[0]
+            for row in conn.execute(
+                db_select([SqlEventLogStorageTable.c.asset_key])
+                .distinct()
+                .where(
+                    db.and_(
+                        SqlEventLogStorageTable.c.dagster_event_type.in_(
+                            [
+                                DagsterEventType.ASSET_MATERIALIZATION.value,
+                                DagsterEventType.ASSET_MATERIALIZATION_PLANNED.value,
+                            ]
+                        ),
+                        SqlEventLogStorageTable.c.id.notin_(list(event_ids)),
+                        db.or_(
+                            *[
+                                db.and_(
+                                    SqlEventLogStorageTable.c.asset_key == asset_key_str,
+                                    SqlEventLogStorageTable.c.id > cache_value.latest_storage_id,
+                                    SqlEventLogStorageTable.c.id
+                                    < events_and_ids_by_asset_key[asset_key_str][-1][1],
+                                )
+                                for asset_key_str, cache_value in cache_values_by_asset_key.items()
+                            ]
+                        ),
+                    )
+                )
+            ).fetchall()
+        }
+
+        partitions_defs_by_id = get_status_cache_partitions_defs(
+            self._instance,
+            {
+                check.not_none(cache_value.partitions_def_id)
+                for cache_value in cache_values_by_asset_key.values()
+            },
+        )
+
+        for asset_key_str, cache_value in cache_values_by_asset_key.items():
+            partitions_def = partitions_defs_by_id.get(
+                check.not_none(cache_value.partitions_def_id)
+            )
+            if asset_key_str in assets_with_unapplied_events or partitions_def is None:
+                continue
+
+            updated_cache_value: Optional[AssetStatusCacheValue] = cache_value
+            for event, event_id in events_and_ids_by_asset_key[asset_key_str]:
+                if updated_cache_value is None:
+                    break
+                if event_id <= updated_cache_value.latest_storage_id:
+                    continue
+                updated_cache_value = apply_asset_event_to_status_cache_value(
+                    updated_cache_value,
+                    partitions_def,
+                    event,
+                    event_id,
+                    dynamic_partitions_store=self._instance,
+                )
+
+            if updated_cache_value is None:
+                continue
+
+            # only replace the cached value if it has not been concurrently updated
+            conn.execute(
+                AssetKeyTable.update()
+                .where(
+                    db.and_(
+                        AssetKeyTable.c.asset_key == asset_key_str,
+                        AssetKeyTable.c.cached_status_data
+                        == cached_status_data_by_asset_key[asset_key_str],
+                    )
+                )
+                .values(cached_status_data=serialize_value(updated_cache_value))
+            )
+
     def _fetch_backcompat_materialization_times(
         self, asset_keys: Sequence[AssetKey]
     ) -> Mapping[AssetKey, datetime]:
@@ -1897,6 +2369,55 @@ def get_latest_storage_id_by_partition(
             latest_materialization_storage_id_by_partition[cast(str, row[0])] = cast(int, row[1])
         return latest_materialization_storage_id_by_partition
 
+    def get_latest_storage_ids_by_partition(
+        self, asset_keys: Sequence[AssetKey], event_type: DagsterEventType
+    ) -> Mapping[AssetKey, Mapping[str, int]]:
+        """Fetch the latest storage id for each partition of each of the given asset keys in a
+        single query.
+
+        Returns a mapping of asset key to a mapping of partition to storage id.
+        """
+        check.sequence_param(asset_keys, "asset_keys", of_type=AssetKey)
+        check.inst_param(event_type, "event_type", DagsterEventType)
+
+        asset_keys = list(dict.fromkeys(asset_keys))
+        if not asset_keys:
+            return {}
+
+        query = (
+            db_select(
+                [
+                    SqlEventLogStorageTable.c.asset_key,
+                    SqlEventLogStorageTable.c.partition,
+                    db.func.max(SqlEventLogStorageTable.c.id).label("id"),
+                ]
+            )
+            .where(
+                db.and_(
+                    SqlEventLogStorageTable.c.asset_key.in_(
+                        [asset_key.to_string() for asset_key in asset_keys]
+                    ),
+                    SqlEventLogStorageTable.c.partition != None,  # noqa: E711
+                    SqlEventLogStorageTable.c.dagster_event_type == event_type.value,
+                )
+            )
+            .group_by(SqlEventLogStorageTable.c.asset_key, SqlEventLogStorageTable.c.partition)
+        )
+        query = self._add_assets_wipe_filter_to_query(
+            query, self._get_assets_details(asset_keys), asset_keys
+        )
+
+        with self.index_connection() as conn:
+            rows = conn.execute(query).fetchall()
+
+        latest_storage_ids_by_partition: Dict[AssetKey, Dict[str, int]] = {
+            asset_key: {} for asset_key in asset_keys
+        }
+        for row in rows:
+            asset_key = check.not_none(AssetKey.from_db_string(cast(str, row[0])))
+            latest_storage_ids_by_partition[asset_key][cast(str, row[1])] = cast(int, row[2])
+        return latest_storage_ids_by_partition
+
     def get_latest_tags_by_partition(
         self,
         asset_key: AssetKey,
@@ -2994,6 +3515,16 @@ def get_latest_planned_materialization_info(
         )
 
 
+def _lazy_record_from_row(row: SqlAlchemyRow) -> LazyEventLogRecord:
+    record_id, json_str, run_id, asset_key_str = row
+    return LazyEventLogRecord(
+        record_id,
+        json_str,
+        run_id=run_id,
+        asset_key=AssetKey.from_db_string(asset_key_str) if asset_key_str else None,
+    )
+
+
 def _get_from_row(row: SqlAlchemyRow, column: str) -> object:
     """Utility function for extracting a column from a sqlalchemy row proxy, since '_asdict' is not
     supported in sqlalchemy 1.3.
@@ -3001,3 +3532,30 @@ def _get_from_row(row: SqlAlchemyRow, column: str) -> object:
     if column not in row.keys():
         return None
     return row[column]
+
+
+def _get_event_timestamp(json_str: str) -> float:
+    """Read the timestamp of a serialized event from the parsed JSON, without deserializing it."""
+    return get_packed_field(seven.json.loads(json_str), "timestamp")
+
+
+def _get_step_marker_event(step_key: str, json_str: str) -> Optional[StepMarkerEvent]:
+    """Read the marker fields of a serialized engine event from the parsed JSON, without
+    deserializing the event and its metadata.
+    """
+    packed_entry = seven.json.loads(json_str)
+    packed_event_data = get_packed_field(
+        get_packed_field(packed_entry, "dagster_event"), "event_specific_data"
+    )
+    if not packed_event_data:
+        return None
+    marker_start = get_packed_field(packed_event_data, "marker_start")
+    marker_end = get_packed_field(packed_event_data, "marker_end")
+    if not marker_start and not marker_end:
+        return None
+    return StepMarkerEvent(
+        step_key=step_key,
+        timestamp=get_packed_field(packed_entry, "timestamp"),
+        marker_start=marker_start,
+        marker_end=marker_end,
+    )
@@ -2,7 +2,7 @@
 import os
 from collections import defaultdict
 from contextlib import contextmanager
-from typing import Any, Mapping, Optional
+from typing import Any, Mapping, Optional, Sequence
 
 import sqlalchemy as db
 from sqlalchemy.pool import NullPool
@@ -12,6 +12,8 @@
 
 import dagster._check as check
 from dagster._config import StringSource
+from dagster._core.events import ASSET_CHECK_EVENTS, ASSET_EVENTS
+from dagster._core.events.log import EventLogEntry
 from dagster._core.storage.dagster_run import DagsterRunStatus
 from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.storage.sql import (
@@ -25,8 +27,9 @@
 from dagster._serdes import ConfigurableClass, ConfigurableClassData
 from dagster._utils import mkdir_p
 
-from ..schema import SqlEventLogStorageMetadata
+from ..schema import AssetEventTagsTable, SqlEventLogStorageMetadata
 from ..sql_event_log import SqlDbConnection, SqlEventLogStorage
+from .sqlite_event_log import insert_event_rows
 
 SQLITE_EVENT_LOG_FILENAME = "event_log"
 
@@ -135,6 +138,45 @@ def enable_secondary_index(self, name):
         if name in self._secondary_index_cache:
             del self._secondary_index_cache[name]
 
+    def store_event_batch(self, events: Sequence[EventLogEntry]) -> None:
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+        if not events:
+            return
+
+        asset_event_indexes = [
+            i
+            for i, event in enumerate(events)
+            if event.is_dagster_event
+            and event.dagster_event_type in ASSET_EVENTS
+            and event.get_dagster_event().asset_key
+        ]
+        asset_events = [events[i] for i in asset_event_indexes]
+        # these both open their own connections, so must be resolved before the batch transaction
+        has_asset_key_index_cols = bool(asset_events) and self.has_asset_key_index_cols()
+        has_tags_table = bool(asset_events) and self.has_table(AssetEventTagsTable.name)
+        update_cached_status = (
+            bool(asset_events) and self._is_asset_status_cache_write_through_enabled()
+        )
+
+        with self._connect() as conn:
+            event_ids = insert_event_rows(conn, [self._event_to_row(event) for event in events])
+            if asset_events:
+                asset_event_ids = [event_ids[i] for i in asset_event_indexes]
+                self._store_asset_event_batch(
+                    conn,
+                    asset_events,
+                    asset_event_ids,
+                    has_asset_key_index_cols,
+                    update_cached_status=update_cached_status,
+                )
+                tag_rows = self._get_asset_event_tag_rows(asset_events, asset_event_ids)
+                if tag_rows and has_tags_table:
+                    conn.execute(AssetEventTagsTable.insert(), tag_rows)
+
+        for event, event_id in zip(events, event_ids):
+            if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
+                self.store_asset_check_event(event, event_id)
+
     def watch(self, run_id, cursor, callback):
         if not self._obs:
             self._obs = Observer()
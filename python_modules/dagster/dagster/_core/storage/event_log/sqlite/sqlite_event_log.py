@@ -8,7 +8,18 @@
 import time
 from collections import defaultdict
 from contextlib import contextmanager
-from typing import TYPE_CHECKING, Any, ContextManager, Iterator, Optional, Sequence, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Union,
+)
 
 import sqlalchemy as db
 import sqlalchemy.exc as db_exc
@@ -52,13 +63,33 @@
 from dagster._serdes.serdes import deserialize_value
 from dagster._utils import mkdir_p
 
-from ..schema import SqlEventLogStorageMetadata, SqlEventLogStorageTable
+from ..schema import AssetEventTagsTable, SqlEventLogStorageMetadata, SqlEventLogStorageTable
 from ..sql_event_log import RunShardedEventsCursor, SqlEventLogStorage
 
 if TYPE_CHECKING:
     from dagster._core.storage.sqlite_storage import SqliteStorageConfig
 INDEX_SHARD_NAME = "index"
 
+# SQLite caps the number of bound parameters per statement (999 prior to 3.32), so multi-row event
+# inserts are split into chunks that stay under that limit
+SQLITE_EVENT_INSERT_CHUNK_SIZE = 100
+
+
+def insert_event_rows(conn: Connection, rows: Sequence[Mapping[str, Any]]) -> Sequence[int]:
+    """Insert event log rows using multi-row inserts, returning the storage ids in order.
+
+    Once the first chunk has been written, the connection holds the SQLite write lock until the
+    enclosing transaction commits, so each chunk is assigned a contiguous block of row ids ending
+    at the last inserted row id.
+    """
+    event_ids: List[int] = []
+    for i in range(0, len(rows), SQLITE_EVENT_INSERT_CHUNK_SIZE):
+        chunk = rows[i : i + SQLITE_EVENT_INSERT_CHUNK_SIZE]
+        result = conn.execute(SqlEventLogStorageTable.insert().values(list(chunk)))
+        last_id = check.not_none(result.lastrowid)
+        event_ids.extend(range(last_id - len(chunk) + 1, last_id + 1))
+    return event_ids
+
 
 class SqliteEventLogStorage(SqlEventLogStorage, ConfigurableClass):
     """SQLite-backed event log storage.
@@ -273,6 +304,76 @@ def store_event(self, event: EventLogEntry) -> None:
             with self.index_connection() as conn:
                 conn.execute(insert_event_statement)
 
+    def store_event_batch(self, events: Sequence[EventLogEntry]) -> None:
+        """Overridden method to write a batch of events with a single transaction per run shard,
+        plus a single transaction against the index shard for mirrored asset and run status events.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+        if not events:
+            return
+
+        rows = [self._event_to_row(event) for event in events]
+
+        rows_by_run_id: Dict[str, List[Mapping[str, Any]]] = defaultdict(list)
+        for event, row in zip(events, rows):
+            rows_by_run_id[event.run_id].append(row)
+
+        for run_id, run_rows in rows_by_run_id.items():
+            with self.run_connection(run_id) as conn:
+                insert_event_rows(conn, run_rows)
+
+        asset_events = []
+        index_rows = []
+        for event, row in zip(events, rows):
+            if not event.is_dagster_event:
+                continue
+            if event.get_dagster_event().asset_key:
+                check.invariant(
+                    event.dagster_event_type in ASSET_EVENTS,
+                    "Can only store asset materializations, materialization_planned, and"
+                    " observations in index database",
+                )
+                asset_events.append(event)
+                index_rows.append(row)
+            elif event.dagster_event_type in EVENT_TYPE_TO_PIPELINE_RUN_STATUS:
+                # should mirror run status change events in the index shard
+                index_rows.append(row)
+
+        if index_rows:
+            # these both open their own connections to the index shard, so must be resolved before
+            # taking the shard lock below
+            has_asset_key_index_cols = bool(asset_events) and self.has_asset_key_index_cols()
+            has_tags_table = bool(asset_events) and self.has_table(AssetEventTagsTable.name)
+            update_cached_status = (
+                bool(asset_events) and self._is_asset_status_cache_write_through_enabled()
+            )
+
+            with self.index_connection() as conn:
+                index_event_ids = insert_event_rows(conn, index_rows)
+                asset_event_ids = [
+                    event_id
+                    for event_id, row in zip(index_event_ids, index_rows)
+                    if row["asset_key"] is not None
+                ]
+                if asset_events:
+                    self._store_asset_event_batch(
+                        conn,
+                        asset_events,
+                        asset_event_ids,
+                        has_asset_key_index_cols,
+                        update_cached_status=update_cached_status,
+                    )
+                    tag_rows = self._get_asset_event_tag_rows(asset_events, asset_event_ids)
+                    if tag_rows and has_tags_table:
+                        conn.execute(AssetEventTagsTable.insert(), tag_rows)
+
+        for event in events:
+            if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
+                self.store_asset_check_event(event, None)
+
     def get_event_records(
         self,
         event_records_filter: EventRecordsFilter,
@@ -43,7 +43,11 @@
 if TYPE_CHECKING:
     from dagster._core.definitions.asset_check_spec import AssetCheckKey
     from dagster._core.definitions.run_request import InstigatorType
-    from dagster._core.event_api import AssetRecordsFilter, RunStatusChangeRecordsFilter
+    from dagster._core.event_api import (
+        AssetRecordsFilter,
+        LazyEventLogRecord,
+        RunStatusChangeRecordsFilter,
+    )
     from dagster._core.events import DagsterEvent, DagsterEventType
     from dagster._core.events.log import EventLogEntry
     from dagster._core.execution.backfill import BulkActionStatus, PartitionBackfill
@@ -52,6 +56,7 @@
     from dagster._core.remote_representation.origin import RemoteJobOrigin
     from dagster._core.scheduler.instigation import (
         AutoMaterializeAssetEvaluationRecord,
+        InstigatorLease,
         InstigatorState,
         InstigatorStatus,
         InstigatorTick,
@@ -415,6 +420,9 @@ def get_step_stats_for_run(
     def store_event(self, event: "EventLogEntry") -> None:
         return self._storage.event_log_storage.store_event(event)
 
+    def store_event_batch(self, events: Sequence["EventLogEntry"]) -> None:
+        return self._storage.event_log_storage.store_event_batch(events)
+
     def delete_events(self, run_id: str) -> None:
         return self._storage.event_log_storage.delete_events(run_id)
 
@@ -493,6 +501,17 @@ def fetch_run_status_changes(
             filters, limit, cursor, ascending
         )
 
+    def fetch_lazy_run_status_changes(
+        self,
+        filters: Union["DagsterEventType", "RunStatusChangeRecordsFilter"],
+        limit: int,
+        cursor: Optional[str] = None,
+        ascending: bool = False,
+    ) -> Sequence["LazyEventLogRecord"]:
+        return self._storage.event_log_storage.fetch_lazy_run_status_changes(
+            filters, limit, cursor, ascending
+        )
+
     def get_latest_planned_materialization_info(
         self,
         asset_key: AssetKey,
@@ -551,6 +570,13 @@ def get_latest_storage_id_by_partition(
             asset_key, event_type
         )
 
+    def get_latest_storage_ids_by_partition(
+        self, asset_keys: Sequence["AssetKey"], event_type: "DagsterEventType"
+    ) -> Mapping["AssetKey", Mapping[str, int]]:
+        return self._storage.event_log_storage.get_latest_storage_ids_by_partition(
+            asset_keys, event_type
+        )
+
     def get_latest_tags_by_partition(
         self,
         asset_key: "AssetKey",
@@ -626,6 +652,18 @@ def get_records_for_run(
             run_id, cursor, of_type, limit, ascending
         )
 
+    def get_lazy_records_for_run(
+        self,
+        run_id: str,
+        cursor: Optional[str] = None,
+        of_type: Optional[Union["DagsterEventType", Set["DagsterEventType"]]] = None,
+        limit: Optional[int] = None,
+        ascending: bool = True,
+    ) -> Sequence["LazyEventLogRecord"]:
+        return self._storage.event_log_storage.get_lazy_records_for_run(
+            run_id, cursor, of_type, limit, ascending
+        )
+
     def initialize_concurrency_limit_to_default(self, concurrency_key: str) -> bool:
         return self._storage.event_log_storage.initialize_concurrency_limit_to_default(
             concurrency_key
@@ -817,6 +855,27 @@ def get_auto_materialize_evaluations_for_evaluation_id(
     def purge_asset_evaluations(self, before: float):
         return self._storage.schedule_storage.purge_asset_evaluations(before)
 
+    @property
+    def supports_instigator_leases(self) -> bool:
+        return self._storage.schedule_storage.supports_instigator_leases
+
+    def acquire_instigator_lease(
+        self, lease_key: str, owner_id: str, duration_seconds: float
+    ) -> bool:
+        return self._storage.schedule_storage.acquire_instigator_lease(
+            lease_key, owner_id, duration_seconds
+        )
+
+    def release_instigator_lease(self, lease_key: str, owner_id: str) -> None:
+        return self._storage.schedule_storage.release_instigator_lease(lease_key, owner_id)
+
+    def get_instigator_leases(
+        self, lease_key_prefix: Optional[str] = None, include_expired: bool = True
+    ) -> Sequence["InstigatorLease"]:
+        return self._storage.schedule_storage.get_instigator_leases(
+            lease_key_prefix, include_expired
+        )
+
     def upgrade(self) -> None:
         return self._storage.schedule_storage.upgrade()
 
@@ -1,5 +1,15 @@
 from enum import Enum
-from typing import TYPE_CHECKING, List, NamedTuple, Optional, Sequence, Set, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 import pendulum
 
@@ -28,9 +38,10 @@
 )
 from dagster._serdes import whitelist_for_serdes
 from dagster._serdes.errors import DeserializationError
-from dagster._serdes.serdes import deserialize_value
+from dagster._serdes.serdes import deserialize_value, serialize_value
 
 if TYPE_CHECKING:
+    from dagster._core.events.log import EventLogEntry
     from dagster._core.storage.batch_asset_record_loader import BatchAssetRecordLoader
     from dagster._core.storage.event_log.base import AssetRecord
 
@@ -43,6 +54,10 @@
 )
 RUN_FETCH_BATCH_SIZE = 100
 
+STATUS_CACHE_PARTITIONS_DEF_KEY_PREFIX = "asset_status_cache_partitions_def:"
+MAX_CACHED_STATUS_CACHE_PARTITIONS_DEFS = 128
+_status_cache_partitions_defs_by_id: Dict[str, PartitionsDefinition] = {}
+
 
 class AssetPartitionStatus(Enum):
     """The status of asset partition."""
@@ -353,6 +368,139 @@ def _build_status_cache(
     )
 
 
+def _get_status_cache_partitions_def_cursor_key(partitions_def_id: str) -> str:
+    return f"{STATUS_CACHE_PARTITIONS_DEF_KEY_PREFIX}{partitions_def_id}"
+
+
+def store_status_cache_partitions_def(
+    instance: DagsterInstance, partitions_def_id: str, partitions_def: PartitionsDefinition
+) -> None:
+    """Stores the partitions definition of a cache value, keyed by its serializable unique
+    identifier, so that the event log storage can apply new events to cache values that were built
+    for this definition.
+    """
+    from dagster._core.remote_representation.external_data import (
+        external_partitions_definition_from_def,
+    )
+
+    instance.daemon_cursor_storage.set_cursor_values(
+        {
+            _get_status_cache_partitions_def_cursor_key(partitions_def_id): serialize_value(
+                external_partitions_definition_from_def(partitions_def)
+            )
+        }
+    )
+
+
+def get_status_cache_partitions_defs(
+    instance: DagsterInstance, partitions_def_ids: Set[str]
+) -> Mapping[str, PartitionsDefinition]:
+    """Returns the stored partitions definitions for the given serializable unique identifiers.
+    Identifiers without a stored definition are omitted.
+    """
+    from dagster._core.remote_representation.external_data import (
+        ExternalPartitionsDefinitionData,
+    )
+
+    partitions_defs_by_id = {
+        partitions_def_id: _status_cache_partitions_defs_by_id[partitions_def_id]
+        for partitions_def_id in partitions_def_ids
+        if partitions_def_id in _status_cache_partitions_defs_by_id
+    }
+    missing_ids = partitions_def_ids - partitions_defs_by_id.keys()
+    if not missing_ids:
+        return partitions_defs_by_id
+
+    stored_values = instance.daemon_cursor_storage.get_cursor_values(
+        {
+            _get_status_cache_partitions_def_cursor_key(partitions_def_id)
+            for partitions_def_id in missing_ids
+        }
+    )
+    for partitions_def_id in missing_ids:
+        stored_value = stored_values.get(
+            _get_status_cache_partitions_def_cursor_key(partitions_def_id)
+        )
+        if not stored_value:
+            continue
+
+        partitions_def = deserialize_value(
+            stored_value, ExternalPartitionsDefinitionData
+        ).get_partitions_definition()
+        # the identifier is derived from the definition itself, so loaded definitions can be kept
+        # for the life of the process, up to a fixed number of them
+        if len(_status_cache_partitions_defs_by_id) >= MAX_CACHED_STATUS_CACHE_PARTITIONS_DEFS:
+            _status_cache_partitions_defs_by_id.pop(
+                next(iter(_status_cache_partitions_defs_by_id)), None
+            )
+        _status_cache_partitions_defs_by_id[partitions_def_id] = partitions_def
+        partitions_defs_by_id[partitions_def_id] = partitions_def
+
+    return partitions_defs_by_id
+
+
+def apply_asset_event_to_status_cache_value(
+    cache_value: AssetStatusCacheValue,
+    partitions_def: PartitionsDefinition,
+    event: "EventLogEntry",
+    event_id: int,
+    dynamic_partitions_store: DynamicPartitionsStore,
+) -> Optional[AssetStatusCacheValue]:
+    """Returns the cache value updated to reflect a single newly stored materialization or planned
+    materialization event, or None if the event cannot be applied incrementally and the cache value
+    should instead be refreshed when it is next read.
+
+    The cache value must already reflect every earlier event for the asset. Failed partitions are
+    still resolved from run statuses when the cache value is read, using the tracked in-progress
+    event ids.
+    """
+    dagster_event = event.dagster_event
+    if dagster_event is None or event_id <= cache_value.latest_storage_id:
+        return None
+
+    partition = dagster_event.partition
+    if partition is None or not (
+        dagster_event.is_step_materialization or dagster_event.is_asset_materialization_planned
+    ):
+        return None
+
+    validated_keys = get_validated_partition_keys(
+        dynamic_partitions_store, partitions_def, {partition}
+    )
+    if not validated_keys:
+        return cache_value._replace(latest_storage_id=event_id)
+
+    new_subset = partitions_def.empty_subset().with_partition_keys(validated_keys)
+    in_progress_subset = cache_value.deserialize_in_progress_partition_subsets(partitions_def)
+
+    if dagster_event.is_step_materialization:
+        in_progress_subset = in_progress_subset - new_subset
+        return cache_value._replace(
+            latest_storage_id=event_id,
+            serialized_materialized_partition_subset=(
+                cache_value.deserialize_materialized_partition_subsets(partitions_def) | new_subset
+            ).serialize(),
+            serialized_failed_partition_subset=(
+                cache_value.deserialize_failed_partition_subsets(partitions_def) - new_subset
+            ).serialize(),
+            serialized_in_progress_partition_subset=in_progress_subset.serialize(),
+            # once no partitions are in progress, there are no runs left to check on
+            earliest_in_progress_materialization_event_id=(
+                cache_value.earliest_in_progress_materialization_event_id
+                if len(in_progress_subset) > 0
+                else None
+            ),
+        )
+
+    return cache_value._replace(
+        latest_storage_id=event_id,
+        serialized_in_progress_partition_subset=(in_progress_subset | new_subset).serialize(),
+        earliest_in_progress_materialization_event_id=(
+            cache_value.earliest_in_progress_materialization_event_id or event_id
+        ),
+    )
+
+
 def build_failed_and_in_progress_partition_subset(
     instance: DagsterInstance,
     asset_key: AssetKey,
@@ -455,6 +603,22 @@ def get_and_update_asset_status_cache_value(
             dynamic_partitions_store=dynamic_partitions_store
         )
     )
+    if (
+        use_cached_value
+        and stored_cache_value
+        and not stored_cache_value.earliest_in_progress_materialization_event_id
+    ):
+        # a write-through cache value that has been kept up to date with every stored event, and
+        # has no in-progress runs to check on, can be returned without any further queries
+        last_materialization_storage_id = (
+            asset_record.asset_entry.last_materialization_storage_id if asset_record else None
+        )
+        if stored_cache_value.latest_storage_id >= max(
+            last_materialization_storage_id or 0,
+            get_last_planned_storage_id(instance, asset_key, asset_record),
+        ):
+            return stored_cache_value
+
     updated_cache_value = _build_status_cache(
         instance=instance,
         asset_key=asset_key,
@@ -465,5 +629,13 @@ def get_and_update_asset_status_cache_value(
     )
     if updated_cache_value is not None and updated_cache_value != stored_cache_value:
         instance.update_asset_cached_status_data(asset_key, updated_cache_value)
+        if (
+            instance.asset_status_cache_write_through_enabled
+            and partitions_def
+            and updated_cache_value.partitions_def_id
+        ):
+            store_status_cache_partitions_def(
+                instance, updated_cache_value.partitions_def_id, partitions_def
+            )
 
     return updated_cache_value
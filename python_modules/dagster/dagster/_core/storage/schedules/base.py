@@ -9,6 +9,7 @@
 from dagster._core.instance import MayHaveInstanceWeakref, T_DagsterInstance
 from dagster._core.scheduler.instigation import (
     AutoMaterializeAssetEvaluationRecord,
+    InstigatorLease,
     InstigatorState,
     InstigatorStatus,
     InstigatorTick,
@@ -190,6 +191,48 @@ def purge_asset_evaluations(self, before: float) -> None:
             before (datetime): All evaluations before this datetime will get purged
         """
 
+    @property
+    def supports_instigator_leases(self) -> bool:
+        return False
+
+    def acquire_instigator_lease(
+        self, lease_key: str, owner_id: str, duration_seconds: float
+    ) -> bool:
+        """Acquire the lease with the given key for the given owner, if it is not held by another
+        owner or has expired. If the lease is already held by the given owner, it is renewed.
+
+        Args:
+            lease_key (str): The key of the lease to acquire.
+            owner_id (str): A unique identifier for the process acquiring the lease.
+            duration_seconds (float): How long the lease should be held for, unless it is renewed.
+
+        Returns:
+            bool: Whether the lease is now held by the given owner.
+        """
+        raise NotImplementedError()
+
+    def release_instigator_lease(self, lease_key: str, owner_id: str) -> None:
+        """Release the lease with the given key, if it is held by the given owner.
+
+        Args:
+            lease_key (str): The key of the lease to release.
+            owner_id (str): The identifier of the process releasing the lease.
+        """
+        raise NotImplementedError()
+
+    def get_instigator_leases(
+        self, lease_key_prefix: Optional[str] = None, include_expired: bool = True
+    ) -> Sequence[InstigatorLease]:
+        """Get the leases that are currently held, including those that have expired but have not
+        been acquired by another owner since.
+
+        Args:
+            lease_key_prefix (Optional[str]): Only return leases whose key starts with this prefix.
+            include_expired (bool): Whether to return leases that have expired, according to the
+                clock of the storage.
+        """
+        raise NotImplementedError()
+
     @abc.abstractmethod
     def upgrade(self) -> None:
         """Perform any needed migrations."""
@@ -81,6 +81,21 @@
     db.Column("create_timestamp", db.DateTime, server_default=get_current_timestamp()),
 )
 
+InstigatorLeasesTable = db.Table(
+    "instigator_leases",
+    ScheduleStorageSqlMetadata,
+    db.Column(
+        "id",
+        db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    ),
+    db.Column("lease_key", MySQLCompatabilityTypes.UniqueText, nullable=False, unique=True),
+    db.Column("owner_id", db.String(255), nullable=False),
+    db.Column("expiration_timestamp", db.Float, nullable=False),
+    db.Column("create_timestamp", db.DateTime, server_default=get_current_timestamp()),
+    db.Column("update_timestamp", db.DateTime, server_default=get_current_timestamp()),
+)
 
 # Secondary Index migration table, used to track data migrations, event_logs and runs.
 # This schema should match the schema in the event_log storage, run schema
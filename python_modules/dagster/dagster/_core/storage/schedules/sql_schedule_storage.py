@@ -28,13 +28,18 @@
 from dagster._core.errors import DagsterInvariantViolationError
 from dagster._core.scheduler.instigation import (
     AutoMaterializeAssetEvaluationRecord,
+    InstigatorLease,
     InstigatorState,
     InstigatorStatus,
     InstigatorTick,
     TickData,
     TickStatus,
 )
-from dagster._core.storage.sql import SqlAlchemyQuery, SqlAlchemyRow
+from dagster._core.storage.sql import (
+    SqlAlchemyQuery,
+    SqlAlchemyRow,
+    get_current_epoch_timestamp,
+)
 from dagster._core.storage.sqlalchemy_compat import db_fetch_mappings, db_select, db_subquery
 from dagster._serdes import serialize_value
 from dagster._serdes.serdes import deserialize_value
@@ -49,6 +54,7 @@
 )
 from .schema import (
     AssetDaemonAssetEvaluationsTable,
+    InstigatorLeasesTable,
     InstigatorsTable,
     JobTable,
     JobTickTable,
@@ -290,6 +296,10 @@ def _has_asset_daemon_asset_evaluations_table(self, conn: Connection) -> bool:
         table_names = db.inspect(conn).get_table_names()
         return "asset_daemon_asset_evaluations" in table_names
 
+    def _has_instigator_leases_table(self, conn: Connection) -> bool:
+        table_names = db.inspect(conn).get_table_names()
+        return "instigator_leases" in table_names
+
     def get_batch_ticks(
         self,
         selector_ids: Sequence[str],
@@ -572,6 +582,99 @@ def purge_asset_evaluations(self, before: float):
         with self.connect() as conn:
             conn.execute(query)
 
+    @property
+    def supports_instigator_leases(self) -> bool:
+        # only cached once the table exists, so that a running process picks up the migration that
+        # adds it
+        if not getattr(self, "_supports_instigator_leases", False):
+            with self.connect() as conn:
+                self._supports_instigator_leases = self._has_instigator_leases_table(conn)
+        return self._supports_instigator_leases
+
+    def acquire_instigator_lease(
+        self, lease_key: str, owner_id: str, duration_seconds: float
+    ) -> bool:
+        check.str_param(lease_key, "lease_key")
+        check.str_param(owner_id, "owner_id")
+        check.numeric_param(duration_seconds, "duration_seconds")
+
+        # expiration times are computed from the clock of the database rather than that of the
+        # calling process, so that they can be compared between processes
+        with self.connect() as conn:
+            # take over the lease if it is already held by this owner or has expired. the condition
+            # is evaluated atomically with the update, so at most one owner can take over a lease
+            result = conn.execute(
+                InstigatorLeasesTable.update()
+                .where(
+                    db.and_(
+                        InstigatorLeasesTable.c.lease_key == lease_key,
+                        db.or_(
+                            InstigatorLeasesTable.c.owner_id == owner_id,
+                            InstigatorLeasesTable.c.expiration_timestamp
+                            < get_current_epoch_timestamp(),
+                        ),
+                    )
+                )
+                .values(
+                    owner_id=owner_id,
+                    expiration_timestamp=get_current_epoch_timestamp() + duration_seconds,
+                    update_timestamp=pendulum.now("UTC"),
+                )
+            )
+            if result.rowcount > 0:
+                return True
+
+            try:
+                conn.execute(
+                    InstigatorLeasesTable.insert().values(
+                        lease_key=lease_key,
+                        owner_id=owner_id,
+                        expiration_timestamp=get_current_epoch_timestamp() + duration_seconds,
+                    )
+                )
+            except db_exc.IntegrityError:
+                # the lease is held by another owner
+                return False
+            return True
+
+    def release_instigator_lease(self, lease_key: str, owner_id: str) -> None:
+        check.str_param(lease_key, "lease_key")
+        check.str_param(owner_id, "owner_id")
+
+        with self.connect() as conn:
+            conn.execute(
+                InstigatorLeasesTable.delete().where(
+                    db.and_(
+                        InstigatorLeasesTable.c.lease_key == lease_key,
+                        InstigatorLeasesTable.c.owner_id == owner_id,
+                    )
+                )
+            )
+
+    def get_instigator_leases(
+        self, lease_key_prefix: Optional[str] = None, include_expired: bool = True
+    ) -> Sequence[InstigatorLease]:
+        check.opt_str_param(lease_key_prefix, "lease_key_prefix")
+        check.bool_param(include_expired, "include_expired")
+
+        query = db_select(
+            [
+                InstigatorLeasesTable.c.lease_key,
+                InstigatorLeasesTable.c.owner_id,
+                InstigatorLeasesTable.c.expiration_timestamp,
+            ]
+        ).order_by(InstigatorLeasesTable.c.lease_key.asc())
+        if lease_key_prefix:
+            query = query.where(InstigatorLeasesTable.c.lease_key.startswith(lease_key_prefix))
+        if not include_expired:
+            query = query.where(
+                InstigatorLeasesTable.c.expiration_timestamp >= get_current_epoch_timestamp()
+            )
+
+        with self.connect() as conn:
+            rows = db_fetch_mappings(conn, query)
+            return [InstigatorLease.from_db_row(row) for row in rows]
+
     def wipe(self) -> None:
         """Clears the schedule storage."""
         with self.connect() as conn:
@@ -582,6 +685,8 @@ def wipe(self) -> None:
                 conn.execute(InstigatorsTable.delete())
             if self._has_asset_daemon_asset_evaluations_table(conn):
                 conn.execute(AssetDaemonAssetEvaluationsTable.delete())
+            if self._has_instigator_leases_table(conn):
+                conn.execute(InstigatorLeasesTable.delete())
 
     # MIGRATIONS
 
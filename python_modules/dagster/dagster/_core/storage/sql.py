@@ -182,6 +182,30 @@ def compiles_get_current_timestamp_default(_element, _compiler, **_kw) -> str:
     return "CURRENT_TIMESTAMP"
 
 
+class get_current_epoch_timestamp(db.sql.expression.FunctionElement):
+    """The current time of the database as seconds since the epoch, as a float, on MySQL, Postgres,
+    and Sqlite. Used to compare timestamps written by processes whose clocks may differ.
+    """
+
+    type = db.types.Float()  # type: ignore
+    inherit_cache = True
+
+
+@compiles(get_current_epoch_timestamp, "mysql")
+def compiles_get_current_epoch_timestamp_mysql(_element, _compiler, **_kw) -> str:
+    return f"UNIX_TIMESTAMP(CURRENT_TIMESTAMP({MYSQL_DATE_PRECISION}))"
+
+
+@compiles(get_current_epoch_timestamp, "postgresql")
+def compiles_get_current_epoch_timestamp_postgres(_element, _compiler, **_kw) -> str:
+    return "EXTRACT(EPOCH FROM NOW())"
+
+
+@compiles(get_current_epoch_timestamp)
+def compiles_get_current_epoch_timestamp_default(_element, _compiler, **_kw) -> str:
+    return "((JULIANDAY('now') - 2440587.5) * 86400.0)"
+
+
 @compiles(db.types.TIMESTAMP, "mysql")
 def add_precision_to_mysql_timestamps(_element, _compiler, **_kw) -> str:
     return f"TIMESTAMP({MYSQL_DATE_PRECISION})"
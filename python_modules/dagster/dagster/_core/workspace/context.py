@@ -4,9 +4,22 @@
 import time
 import warnings
 from abc import ABC, abstractmethod
+from concurrent.futures import FIRST_COMPLETED, Future, wait
 from contextlib import ExitStack
 from itertools import count
-from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Sequence, Set, Type, TypeVar, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from typing_extensions import Self
 
@@ -27,6 +40,7 @@
     GrpcServerCodeLocation,
     RepositoryHandle,
 )
+from dagster._core.remote_representation.external_data_delta import RepositorySnapshotCache
 from dagster._core.remote_representation.grpc_server_registry import (
     GrpcServerRegistry,
 )
@@ -40,6 +54,7 @@
     ManagedGrpcPythonEnvCodeLocationOrigin,
 )
 from dagster._core.storage.batch_asset_record_loader import BatchAssetRecordLoader
+from dagster._core.utils import InheritContextThreadPoolExecutor
 from dagster._utils.aiodataloader import DataLoader
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 
@@ -71,6 +86,10 @@
 
 WEBSERVER_GRPC_SERVER_HEARTBEAT_TTL = 45
 
+# How often to check whether any code location has exceeded its load timeout, while no location
+# has started loading yet
+_LOCATION_LOAD_POLL_INTERVAL_SECONDS = 1
+
 
 class BaseWorkspaceRequestContext(IWorkspace, LoadingContext):
     """This class is a request-scoped object that stores (1) a reference to all repository locations
@@ -481,11 +500,15 @@ def __init__(
         read_only: bool = False,
         grpc_server_registry: Optional[GrpcServerRegistry] = None,
         code_server_log_level: str = "INFO",
+        # If set, returns once every code location has been added with a LOADING status, and loads
+        # the locations on a background thread, rather than returning once they have all loaded
+        load_in_background: bool = False,
     ):
         self._stack = ExitStack()
 
         check.opt_str_param(version, "version")
         check.bool_param(read_only, "read_only")
+        check.bool_param(load_in_background, "load_in_background")
 
         self._instance = check.inst_param(instance, "instance", DagsterInstance)
         self._workspace_load_target = check.opt_inst_param(
@@ -522,13 +545,27 @@ def __init__(
                 )
             )
 
+        self._snapshot_caches: Dict[str, RepositorySnapshotCache] = {}
         self._location_entry_dict: Dict[str, CodeLocationEntry] = {}
-        self._update_workspace(
-            {
-                origin.location_name: self._load_location(origin, reload=False)
-                for origin in self._origins
-            }
-        )
+
+        # Serializes loads of the whole workspace, so that an older load cannot overwrite the
+        # entries of a newer one
+        self._load_workspace_lock = threading.Lock()
+        # Completed when the workspace is closed, so that loads can stop waiting on locations that
+        # are still loading
+        self._shutdown_future: Future = Future()
+        self._background_load_thread: Optional[threading.Thread] = None
+        if load_in_background:
+            origins = self._add_loading_entries()
+            self._background_load_thread = threading.Thread(
+                target=self._load_locations_into_workspace,
+                args=(origins, False),
+                name="workspace_load",
+                daemon=True,
+            )
+            self._background_load_thread.start()
+        else:
+            self._load_workspace(reload=False)
 
     @property
     def workspace_load_target(self) -> Optional[WorkspaceLoadTarget]:
@@ -606,6 +643,14 @@ def _start_watch_thread(self, origin: GrpcServerCodeLocationOrigin) -> None:
         self._watch_threads[location_name] = watch_thread
         watch_thread.start()
 
+    def _get_snapshot_cache(self, location_name: str) -> RepositorySnapshotCache:
+        # Kept across reloads so that reloading a location only fetches the snapshot entries that
+        # changed since it was last loaded
+        with self._lock:
+            if location_name not in self._snapshot_caches:
+                self._snapshot_caches[location_name] = RepositorySnapshotCache()
+            return self._snapshot_caches[location_name]
+
     def _load_location(self, origin: CodeLocationOrigin, reload: bool) -> CodeLocationEntry:
         location_name = origin.location_name
         location = None
@@ -627,6 +672,17 @@ def _load_location(self, origin: CodeLocationOrigin, reload: bool) -> CodeLocati
                     watch_server=False,
                     grpc_server_registry=self._grpc_server_registry,
                     instance=self._instance,
+                    snapshot_cache=self._get_snapshot_cache(location_name),
+                )
+            elif isinstance(origin, GrpcServerCodeLocationOrigin):
+                location = (
+                    origin.reload_location(
+                        self.instance, snapshot_cache=self._get_snapshot_cache(location_name)
+                    )
+                    if reload
+                    else origin.create_location(
+                        self.instance, snapshot_cache=self._get_snapshot_cache(location_name)
+                    )
                 )
             else:
                 location = (
@@ -650,6 +706,147 @@ def _load_location(self, origin: CodeLocationOrigin, reload: bool) -> CodeLocati
             update_timestamp=time.time(),
         )
 
+    def _load_locations(
+        self, origins: Sequence[CodeLocationOrigin], reload: bool
+    ) -> Iterator[CodeLocationEntry]:
+        """Loads the given code locations on a bounded thread pool, yielding each entry as soon as
+        it has finished loading. A location that takes longer than the instance's
+        location_load_timeout to load is yielded as an error, without waiting for it to finish. If
+        the workspace is closed, returns without waiting for the locations that are still loading.
+        """
+        if not origins:
+            return
+
+        load_timeout = self._instance.code_location_load_timeout
+        load_start_times: Dict[str, float] = {}
+
+        def _load(origin: CodeLocationOrigin) -> CodeLocationEntry:
+            load_start_times[origin.location_name] = time.time()
+            return self._load_location(origin, reload=reload)
+
+        executor = InheritContextThreadPoolExecutor(
+            max_workers=min(len(origins), self._instance.code_server_max_concurrent_loads),
+            thread_name_prefix="code_location_load_worker",
+        )
+        try:
+            origins_by_future: Dict[Future, CodeLocationOrigin] = {
+                executor.submit(_load, origin): origin for origin in origins
+            }
+            pending = set(origins_by_future)
+            while pending:
+                deadlines = [
+                    load_start_times[origins_by_future[future].location_name] + load_timeout
+                    for future in pending
+                    if origins_by_future[future].location_name in load_start_times
+                ]
+                done, _ = wait(
+                    pending | {self._shutdown_future},
+                    timeout=(
+                        max(min(deadlines) - time.time(), 0)
+                        if deadlines
+                        else _LOCATION_LOAD_POLL_INTERVAL_SECONDS
+                    ),
+                    return_when=FIRST_COMPLETED,
+                )
+                if self._shutdown_future.done():
+                    for future in pending:
+                        # locations that have not started loading are never loaded, and the rest
+                        # are cleaned up once they finish loading
+                        future.cancel()
+                        future.add_done_callback(_cleanup_abandoned_location_load)
+                    return
+
+                pending -= done
+                for future in done:
+                    yield future.result()
+
+                now = time.time()
+                for future in list(pending):
+                    origin = origins_by_future[future]
+                    load_start_time = load_start_times.get(origin.location_name)
+                    if load_start_time is None or now - load_start_time <= load_timeout:
+                        continue
+
+                    pending.remove(future)
+                    # the location is cleaned up if it ever finishes loading
+                    future.add_done_callback(_cleanup_abandoned_location_load)
+                    warnings.warn(
+                        f"Timed out after {load_timeout} seconds loading code location"
+                        f" {origin.location_name}"
+                    )
+                    yield CodeLocationEntry(
+                        origin=origin,
+                        code_location=None,
+                        load_error=SerializableErrorInfo(
+                            message=(
+                                f"Timed out after {load_timeout} seconds waiting for code location"
+                                f" {origin.location_name} to load."
+                            ),
+                            stack=[],
+                            cls_name=None,
+                        ),
+                        load_status=CodeLocationLoadStatus.LOADED,
+                        display_metadata=origin.get_display_metadata(),
+                        update_timestamp=time.time(),
+                    )
+        finally:
+            # don't block on any loads that have timed out or were abandoned
+            executor.shutdown(wait=False)
+
+    def _load_workspace(self, reload: bool) -> None:
+        """Loads each code location in the workspace, swapping it into the workspace as soon as it
+        has loaded so that locations that are quick to load can be used while slower locations
+        are still loading. Until its replacement has loaded, a location that is being reloaded
+        continues to be served, and a location that is loading for the first time is shown as
+        loading.
+        """
+        self._load_locations_into_workspace(self._add_loading_entries(), reload)
+
+    def _add_loading_entries(self) -> Sequence[CodeLocationOrigin]:
+        """Adds an entry with a LOADING status for each code location that is not yet in the
+        workspace, and removes the locations that are no longer part of it. Returns the origins of
+        the locations in the workspace.
+        """
+        origins = self._origins
+        with self._lock:
+            previous_location_names = set(self._location_entry_dict)
+
+        location_names = {origin.location_name for origin in origins}
+        self._update_location_entries(
+            {
+                **{
+                    location_name: None
+                    for location_name in previous_location_names
+                    if location_name not in location_names
+                },
+                **{
+                    origin.location_name: CodeLocationEntry(
+                        origin=origin,
+                        code_location=None,
+                        load_error=None,
+                        load_status=CodeLocationLoadStatus.LOADING,
+                        display_metadata=origin.get_display_metadata(),
+                        update_timestamp=time.time(),
+                    )
+                    for origin in origins
+                    if origin.location_name not in previous_location_names
+                },
+            }
+        )
+        return origins
+
+    def _load_locations_into_workspace(
+        self, origins: Sequence[CodeLocationOrigin], reload: bool
+    ) -> None:
+        with self._load_workspace_lock:
+            for entry in self._load_locations(origins, reload=reload):
+                if self._shutdown_future.done():
+                    # the workspace was closed while the location was loading
+                    if entry.code_location:
+                        entry.code_location.cleanup()
+                    continue
+                self._update_location_entries({entry.origin.location_name: entry})
+
     def create_snapshot(self) -> Mapping[str, CodeLocationEntry]:
         with self._lock:
             return self._location_entry_dict.copy()
@@ -693,46 +890,54 @@ def shutdown_code_location(self, name: str) -> None:
             self._location_entry_dict[name].origin.shutdown_server()
 
     def refresh_workspace(self) -> None:
-        updated_locations = {
-            origin.location_name: self._load_location(origin, reload=False)
-            for origin in self._origins
-        }
-        self._update_workspace(updated_locations)
+        self._load_workspace(reload=False)
 
     def reload_workspace(self) -> None:
-        updated_locations = {
-            origin.location_name: self._load_location(origin, reload=True)
-            for origin in self._origins
-        }
-        self._update_workspace(updated_locations)
+        self._load_workspace(reload=True)
+
+    def _update_location_entries(
+        self, new_entries: Mapping[str, Optional[CodeLocationEntry]]
+    ) -> None:
+        """Swaps in the given entries for their locations, removing the locations whose entry is
+        None, and cleans up the entries that they replaced.
+        """
+        previous_events = []
+        previous_threads = []
+        previous_entries = []
 
-    def _update_workspace(self, new_locations: Dict[str, CodeLocationEntry]):
         # minimize lock time by only holding while swapping data old to new
         with self._lock:
-            previous_events = self._watch_thread_shutdown_events
-            self._watch_thread_shutdown_events = {}
+            for location_name, entry in new_entries.items():
+                if location_name in self._watch_thread_shutdown_events:
+                    previous_events.append(self._watch_thread_shutdown_events.pop(location_name))
+                    previous_threads.append(self._watch_threads.pop(location_name))
+
+                if location_name in self._location_entry_dict:
+                    previous_entries.append(self._location_entry_dict[location_name])
 
-            previous_threads = self._watch_threads
-            self._watch_threads = {}
+                if entry is None:
+                    self._location_entry_dict.pop(location_name, None)
+                    self._snapshot_caches.pop(location_name, None)
+                    continue
 
-            previous_locations = self._location_entry_dict
-            self._location_entry_dict = new_locations
+                self._location_entry_dict[location_name] = entry
 
-            # start monitoring for new locations
-            for entry in self._location_entry_dict.values():
-                if isinstance(entry.origin, GrpcServerCodeLocationOrigin):
+                # start monitoring the location once it has loaded
+                if entry.load_status == CodeLocationLoadStatus.LOADED and isinstance(
+                    entry.origin, GrpcServerCodeLocationOrigin
+                ):
                     self._start_watch_thread(entry.origin)
 
-        # clean up previous locations
-        for event in previous_events.values():
+        # clean up previous entries
+        for event in previous_events:
             event.set()
 
-        for watch_thread in previous_threads.values():
+        for watch_thread in previous_threads:
             watch_thread.join()
 
-        for entry in previous_locations.values():
-            if entry.code_location:
-                entry.code_location.cleanup()
+        for previous_entry in previous_entries:
+            if previous_entry.code_location:
+                previous_entry.code_location.cleanup()
 
     def create_request_context(self, source: Optional[object] = None) -> WorkspaceRequestContext:
         return WorkspaceRequestContext(
@@ -773,7 +978,16 @@ def __enter__(self):
         return self
 
     def __exit__(self, exception_type, exception_value, traceback):
-        self._update_workspace({})  # update to empty to close all current locations
+        # stop waiting on and swapping in locations that are still loading
+        if not self._shutdown_future.done():
+            self._shutdown_future.set_result(None)
+        if self._background_load_thread:
+            self._background_load_thread.join()
+
+        # close all current locations
+        self._update_location_entries(
+            {location_name: None for location_name in self.code_location_names}
+        )
         self._stack.close()
 
     def copy_for_test_instance(self, instance: DagsterInstance) -> "WorkspaceProcessContext":
@@ -785,3 +999,12 @@ def copy_for_test_instance(self, instance: DagsterInstance) -> "WorkspaceProcess
             read_only=self.read_only,
             grpc_server_registry=self._grpc_server_registry,
         )
+
+
+def _cleanup_abandoned_location_load(future: Future) -> None:
+    if future.cancelled() or future.exception():
+        return
+
+    entry = future.result()
+    if entry.code_location:
+        entry.code_location.cleanup()
@@ -1,13 +1,28 @@
 import base64
 import logging
+import random
 import sys
 import threading
+import time
+import uuid
 import zlib
 from collections import defaultdict
 from concurrent.futures import Future, ThreadPoolExecutor
-from contextlib import ExitStack
+from contextlib import ExitStack, contextmanager
 from types import TracebackType
-from typing import Any, Dict, Mapping, Optional, Sequence, Set, Tuple, Type, cast
+from typing import (
+    AbstractSet,
+    Any,
+    Dict,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    cast,
+)
 
 import pendulum
 
@@ -69,11 +84,13 @@
     SingleInstigatorDebugCrashFlags,
     check_for_debug_crash,
 )
+from dagster._utils.security import non_secure_md5_hash_str
 
 _LEGACY_PRE_SENSOR_AUTO_MATERIALIZE_CURSOR_KEY = "ASSET_DAEMON_CURSOR"
 _PRE_SENSOR_AUTO_MATERIALIZE_CURSOR_KEY = "ASSET_DAEMON_CURSOR_NEW"
 _PRE_SENSOR_ASSET_DAEMON_PAUSED_KEY = "ASSET_DAEMON_PAUSED"
 _MIGRATED_CURSOR_TO_SENSORS_KEY = "MIGRATED_CURSOR_TO_SENSORS"
+_LAST_EVALUATION_ID_CURSOR_KEY = "ASSET_DAEMON_LAST_EVALUATION_ID"
 
 
 EVALUATIONS_TTL_DAYS = 30
@@ -89,6 +106,22 @@
 
 MIN_INTERVAL_LOOP_SECONDS = 5
 
+# When running multiple asset daemon processes, how long a process holds on to its leases unless
+# it renews them. The leases of a process that dies are handed off once they expire.
+DEFAULT_LEASE_DURATION_SECONDS = 60
+# How many times a process renews its leases per lease duration, from a background thread so that
+# they do not expire while a long tick is being evaluated
+_LEASE_RENEWALS_PER_DURATION = 3
+
+_WORKER_LEASE_KEY_PREFIX = "asset_daemon/workers/"
+_SENSOR_LEASE_KEY_PREFIX = "asset_daemon/sensors/"
+_EVALUATION_ID_LEASE_KEY = "asset_daemon/evaluation_id"
+_EVALUATION_ID_LEASE_DURATION_SECONDS = 10
+# How long to wait before trying to acquire a lease held by another process again, doubling after
+# each attempt up to the maximum
+_LEASE_RETRY_INITIAL_DELAY_SECONDS = 0.05
+_LEASE_RETRY_MAX_DELAY_SECONDS = 2
+
 
 def get_has_migrated_to_sensors(instance: DagsterInstance) -> bool:
     return bool(
@@ -316,8 +349,11 @@ def write(self) -> None:
 class AssetDaemon(DagsterDaemon):
     def __init__(self, settings: Mapping[str, Any], pre_sensor_interval_seconds: int):
         self._initialized_evaluation_id = False
-        self._evaluation_id_lock = threading.Lock()
+        self._evaluation_id_lock = threading.RLock()
         self._next_evaluation_id = None
+        # when running multiple asset daemon processes, the evaluation IDs up to this one have been
+        # reserved for this process
+        self._max_reserved_evaluation_id = None
 
         self._pre_sensor_interval_seconds = pre_sensor_interval_seconds
         self._last_pre_sensor_submit_time = None
@@ -326,12 +362,34 @@ def __init__(self, settings: Mapping[str, Any], pre_sensor_interval_seconds: int
 
         self._settings = settings
 
+        # when running multiple asset daemon processes, each one evaluates the sensors that it holds
+        # a lease on
+        self._use_leases = bool(settings.get("use_leases"))
+        self._lease_duration_seconds = (
+            settings.get("lease_duration_seconds") or DEFAULT_LEASE_DURATION_SECONDS
+        )
+        self._worker_id = str(uuid.uuid4())
+        # Guards _held_sensor_leases, and is held while leases are renewed so that a lease is never
+        # renewed after it has been released
+        self._held_leases_lock = threading.Lock()
+        self._held_sensor_leases: Dict[str, Optional[str]] = {}
+
+        self._reuse_unchanged_evaluations = bool(settings.get("reuse_unchanged_evaluations"))
+
         super().__init__()
 
     @classmethod
     def daemon_type(cls) -> str:
         return "ASSET"
 
+    @property
+    def supports_multiple_processes(self) -> bool:
+        return self._use_leases
+
+    @property
+    def worker_id(self) -> str:
+        return self._worker_id
+
     def _get_print_sensor_name(self, sensor: Optional[ExternalSensor]) -> str:
         if not sensor:
             return ""
@@ -375,14 +433,177 @@ def _initialize_evaluation_id(
 
             self._initialized_evaluation_id = True
 
-    def _get_next_evaluation_id(self):
+    def _get_next_evaluation_id(self, instance: DagsterInstance):
         # Thread-safe way to generate a new evaluation ID across multiple
         # workers running asset policy sensors at once
         with self._evaluation_id_lock:
             check.invariant(self._initialized_evaluation_id)
+            if self._use_leases and (
+                self._max_reserved_evaluation_id is None
+                or self._next_evaluation_id >= self._max_reserved_evaluation_id
+            ):
+                self._reserve_evaluation_ids(instance, 1)
+
             self._next_evaluation_id = self._next_evaluation_id + 1
             return self._next_evaluation_id
 
+    def _reserve_evaluation_ids(self, instance: DagsterInstance, num_evaluation_ids: int) -> None:
+        """Reserves the next block of evaluation IDs for this process, discarding any IDs left over
+        from its previous block. Other daemon processes generate evaluation IDs as well, so the
+        latest reserved one is shared between them in the cursor storage. Reserving a block at once
+        means that the lease which guards it is only acquired once per iteration, rather than once
+        per evaluation.
+        """
+        with self._evaluation_id_lock:
+            check.invariant(self._initialized_evaluation_id)
+            with self._hold_lease(instance, _EVALUATION_ID_LEASE_KEY):
+                last_evaluation_id = instance.daemon_cursor_storage.get_cursor_values(
+                    {_LAST_EVALUATION_ID_CURSOR_KEY}
+                ).get(_LAST_EVALUATION_ID_CURSOR_KEY)
+                self._next_evaluation_id = max(
+                    self._next_evaluation_id, int(last_evaluation_id or 0)
+                )
+                self._max_reserved_evaluation_id = self._next_evaluation_id + num_evaluation_ids
+                instance.daemon_cursor_storage.set_cursor_values(
+                    {_LAST_EVALUATION_ID_CURSOR_KEY: str(self._max_reserved_evaluation_id)}
+                )
+
+    @contextmanager
+    def _hold_lease(self, instance: DagsterInstance, lease_key: str) -> Iterator[None]:
+        """Waits until the given lease can be acquired, and holds it until the context exits."""
+        schedule_storage = check.not_none(instance.schedule_storage)
+        start_time = time.time()
+        retry_delay = _LEASE_RETRY_INITIAL_DELAY_SECONDS
+        while not schedule_storage.acquire_instigator_lease(
+            lease_key, self._worker_id, _EVALUATION_ID_LEASE_DURATION_SECONDS
+        ):
+            if time.time() - start_time > 2 * _EVALUATION_ID_LEASE_DURATION_SECONDS:
+                raise Exception(f"Timed out waiting to acquire lease {lease_key}")
+            # back off with jitter, so that waiting processes do not retry in lockstep
+            time.sleep(random.uniform(retry_delay / 2, retry_delay))
+            retry_delay = min(retry_delay * 2, _LEASE_RETRY_MAX_DELAY_SECONDS)
+        try:
+            yield
+        finally:
+            schedule_storage.release_instigator_lease(lease_key, self._worker_id)
+
+    def _get_sensor_lease_key(self, selector_id: Optional[str]) -> str:
+        return (
+            f"{_SENSOR_LEASE_KEY_PREFIX}{selector_id or _PRE_SENSOR_AUTO_MATERIALIZE_SELECTOR_ID}"
+        )
+
+    def _get_leased_sensors_and_repos(
+        self,
+        instance: DagsterInstance,
+        sensors_and_repos: Sequence[Tuple[Optional[ExternalSensor], Optional[ExternalRepository]]],
+        amp_tick_futures: Mapping[Optional[str], Future],
+    ) -> Sequence[Tuple[Optional[ExternalSensor], Optional[ExternalRepository]]]:
+        """Returns the sensors that this daemon process holds a lease on, out of the given sensors.
+
+        Each sensor is assigned to one of the live daemon processes by rendezvous hashing, so that
+        only the sensors of a process that starts or stops move to a different process. A process
+        keeps the leases of its sensors until the sensor is assigned to another process and its
+        in-flight tick is finished, or until the lease expires because the process has stopped
+        renewing it, after which the process that the sensor is assigned to takes it over.
+        """
+        schedule_storage = check.not_none(instance.schedule_storage)
+
+        # advertise that this process is alive, and find the other live processes
+        schedule_storage.acquire_instigator_lease(
+            f"{_WORKER_LEASE_KEY_PREFIX}{self._worker_id}",
+            self._worker_id,
+            self._lease_duration_seconds,
+        )
+        live_worker_ids = {
+            lease.owner_id
+            for lease in schedule_storage.get_instigator_leases(
+                _WORKER_LEASE_KEY_PREFIX, include_expired=False
+            )
+        } | {self._worker_id}
+
+        leased_sensors_and_repos = []
+        with self._held_leases_lock:
+            for sensor, repo in sensors_and_repos:
+                selector_id = sensor.selector_id if sensor else None
+                lease_key = self._get_sensor_lease_key(selector_id)
+                tick_in_flight = (
+                    selector_id in amp_tick_futures and not amp_tick_futures[selector_id].done()
+                )
+                if (
+                    tick_in_flight
+                    or _get_assigned_worker_id(live_worker_ids, lease_key) == self._worker_id
+                ):
+                    if schedule_storage.acquire_instigator_lease(
+                        lease_key, self._worker_id, self._lease_duration_seconds
+                    ):
+                        self._held_sensor_leases[lease_key] = selector_id
+                        leased_sensors_and_repos.append((sensor, repo))
+                    else:
+                        self._held_sensor_leases.pop(lease_key, None)
+
+            # hand off the sensors that are no longer assigned to this process, or no longer running
+            leased_lease_keys = {
+                self._get_sensor_lease_key(sensor.selector_id if sensor else None)
+                for sensor, _ in leased_sensors_and_repos
+            }
+            for lease_key, selector_id in list(self._held_sensor_leases.items()):
+                if lease_key in leased_lease_keys or (
+                    selector_id in amp_tick_futures and not amp_tick_futures[selector_id].done()
+                ):
+                    continue
+                schedule_storage.release_instigator_lease(lease_key, self._worker_id)
+                del self._held_sensor_leases[lease_key]
+
+        return leased_sensors_and_repos
+
+    def _renew_leases(self, instance: DagsterInstance, shutdown_event: threading.Event) -> None:
+        """Renews the leases held by this process until the given event is set. Ticks are
+        evaluated between daemon iterations, so without this a tick that takes longer than the
+        lease duration would lose its sensor to another process before it could finish.
+        """
+        schedule_storage = check.not_none(instance.schedule_storage)
+        while not shutdown_event.wait(self._lease_duration_seconds / _LEASE_RENEWALS_PER_DURATION):
+            try:
+                with self._held_leases_lock:
+                    for lease_key in [
+                        f"{_WORKER_LEASE_KEY_PREFIX}{self._worker_id}",
+                        *self._held_sensor_leases.keys(),
+                    ]:
+                        schedule_storage.acquire_instigator_lease(
+                            lease_key, self._worker_id, self._lease_duration_seconds
+                        )
+            except Exception:
+                DaemonErrorCapture.on_exception(
+                    exc_info=sys.exc_info(),
+                    logger=self._logger,
+                    log_message="AssetDaemon failed to renew its leases",
+                )
+
+    def _release_leases(self, instance: DagsterInstance) -> None:
+        """Releases all leases held by this process, so that other processes can take over its
+        sensors right away rather than once the leases expire.
+        """
+        schedule_storage = check.not_none(instance.schedule_storage)
+        with self._held_leases_lock:
+            for lease_key in [
+                *self._held_sensor_leases.keys(),
+                f"{_WORKER_LEASE_KEY_PREFIX}{self._worker_id}",
+            ]:
+                schedule_storage.release_instigator_lease(lease_key, self._worker_id)
+            self._held_sensor_leases = {}
+
+    def _has_sensor_lease(
+        self, instance: DagsterInstance, sensor: Optional[ExternalSensor]
+    ) -> bool:
+        """Renews the lease of this process on the given sensor, returning False if it has been
+        taken over by another process in the meantime.
+        """
+        return check.not_none(instance.schedule_storage).acquire_instigator_lease(
+            self._get_sensor_lease_key(sensor.selector_id if sensor else None),
+            self._worker_id,
+            self._lease_duration_seconds,
+        )
+
     def core_loop(
         self,
         workspace_process_context: IWorkspaceProcessContext,
@@ -401,9 +622,32 @@ def core_loop(
                 " migrate` to enable."
             )
 
+        if self._use_leases:
+            check.invariant(
+                schedule_storage.supports_instigator_leases,
+                "Running multiple asset daemon processes requires the schedule storage to support"
+                " leases. Run `dagster instance migrate` to enable.",
+            )
+
         amp_tick_futures: Dict[Optional[str], Future] = {}
         threadpool_executor = None
         with ExitStack() as stack:
+            if self._use_leases:
+                # registered first so that it runs after any in-flight ticks have finished and the
+                # leases are no longer being renewed
+                stack.callback(self._release_leases, instance)
+
+                lease_renewal_shutdown_event = threading.Event()
+                lease_renewal_thread = threading.Thread(
+                    target=self._renew_leases,
+                    args=(instance, lease_renewal_shutdown_event),
+                    name="asset_daemon_lease_renewal",
+                    daemon=True,
+                )
+                lease_renewal_thread.start()
+                stack.callback(lease_renewal_thread.join)
+                stack.callback(lease_renewal_shutdown_event.set)
+
             if self._settings.get("use_threads"):
                 threadpool_executor = stack.enter_context(
                     InheritContextThreadPoolExecutor(
@@ -531,6 +775,15 @@ def _run_iteration_impl(
             )
             all_auto_materialize_states = {}
 
+        if self._use_leases:
+            sensors_and_repos = self._get_leased_sensors_and_repos(
+                instance, sensors_and_repos, amp_tick_futures
+            )
+            # reserved once the leases are held, so that the evaluation IDs of a sensor keep
+            # increasing when it is handed off between processes
+            if sensors_and_repos:
+                self._reserve_evaluation_ids(instance, len(sensors_and_repos))
+
         for sensor, repo in sensors_and_repos:
             if sensor:
                 selector_id = sensor.selector.get_id()
@@ -795,7 +1048,7 @@ def _process_auto_materialize_tick_generator(
                 # Evaluation ID will always be monotonically increasing, but will not always
                 # be auto-incrementing by 1 once there are multiple AMP evaluations happening in
                 # parallel
-                next_evaluation_id = self._get_next_evaluation_id()
+                next_evaluation_id = self._get_next_evaluation_id(instance)
                 tick = instance.create_tick(
                     TickData(
                         instigator_origin_id=instigator_origin_id,
@@ -897,12 +1150,27 @@ def _evaluate_auto_materialize_tick(
                 auto_observe_asset_keys=auto_observe_asset_keys,
                 respect_materialization_data_versions=instance.auto_materialize_respect_materialization_data_versions,
                 logger=self._logger,
+                reuse_unchanged_evaluations=self._reuse_unchanged_evaluations,
             ).evaluate()
 
             check.invariant(new_cursor.evaluation_id == evaluation_id)
 
             check_for_debug_crash(debug_crash_flags, "EVALUATIONS_FINISHED")
 
+            if self._use_leases and not self._has_sensor_lease(instance, sensor):
+                # another process has taken over this sensor while it was being evaluated, and
+                # will evaluate it again itself
+                print_group_name = self._get_print_sensor_name(sensor)
+                self._logger.warning(
+                    f"Lost the lease on evaluation {evaluation_id}{print_group_name} to another"
+                    " asset daemon process, skipping"
+                )
+                tick_context.update_state(
+                    TickStatus.SKIPPED,
+                    skip_reason="Another asset daemon process took over this sensor",
+                )
+                return
+
             evaluations_by_asset_key = {
                 evaluation.asset_key: evaluation.with_run_ids(set()) for evaluation in evaluations
             }
@@ -1016,3 +1284,11 @@ def _evaluate_auto_materialize_tick(
             )
 
         self._logger.info(f"Finished auto-materialization tick{print_group_name}")
+
+
+def _get_assigned_worker_id(worker_ids: AbstractSet[str], lease_key: str) -> str:
+    """Assigns the given lease to one of the given daemon processes using rendezvous hashing."""
+    return max(
+        sorted(worker_ids),
+        key=lambda worker_id: non_secure_md5_hash_str(f"{worker_id}{lease_key}".encode()),
+    )
@@ -27,7 +27,7 @@
     execute_concurrency_slots_iteration,
     execute_run_monitoring_iteration,
 )
-from dagster._daemon.sensor import execute_sensor_iteration_loop
+from dagster._daemon.sensor import SensorDueQueue, execute_sensor_iteration_loop
 from dagster._daemon.types import DaemonHeartbeat
 from dagster._daemon.utils import DaemonErrorCapture
 from dagster._scheduler.scheduler import execute_scheduler_iteration_loop
@@ -87,6 +87,13 @@ def __init__(self):
     def daemon_type(cls) -> str:
         """returns: str."""
 
+    @property
+    def supports_multiple_processes(self) -> bool:
+        """Whether multiple processes running this daemon at once against the same instance
+        coordinate with each other.
+        """
+        return False
+
     def __exit__(self, _exception_type, _exception_value, _traceback):
         pass
 
@@ -183,6 +190,7 @@ def _check_add_heartbeat(
             self._last_heartbeat_time
             and last_stored_heartbeat
             and last_stored_heartbeat.daemon_id != daemon_uuid
+            and not self.supports_multiple_processes
         ):
             self._logger.error(
                 "Another %s daemon is still sending heartbeats. You likely have multiple "
@@ -299,6 +307,7 @@ def __init__(self, settings: Mapping[str, Any]) -> None:
         self._exit_stack = ExitStack()
         self._threadpool_executor: Optional[InheritContextThreadPoolExecutor] = None
         self._submit_threadpool_executor: Optional[InheritContextThreadPoolExecutor] = None
+        self._use_due_queue = bool(settings.get("use_due_queue"))
 
         if settings.get("use_threads"):
             self._threadpool_executor = self._exit_stack.enter_context(
@@ -335,6 +344,7 @@ def core_loop(
             shutdown_event,
             threadpool_executor=self._threadpool_executor,
             submit_threadpool_executor=self._submit_threadpool_executor,
+            sensor_due_queue=SensorDueQueue() if self._use_due_queue else None,
         )
 
 
@@ -4,7 +4,7 @@
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import ExitStack
-from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+from typing import AbstractSet, Dict, Iterable, Iterator, List, Optional, Sequence
 
 from dagster import (
     DagsterEvent,
@@ -30,11 +30,11 @@
     RunRecord,
     RunsFilter,
 )
-from dagster._core.storage.tags import PRIORITY_TAG
 from dagster._core.utils import InheritContextThreadPoolExecutor
 from dagster._core.workspace.context import IWorkspaceProcessContext
 from dagster._core.workspace.workspace import IWorkspace
 from dagster._daemon.daemon import DaemonIterator, IntervalDaemon
+from dagster._daemon.run_coordinator.run_queue_index import RunQueueIndex, get_run_priority
 from dagster._daemon.utils import DaemonErrorCapture
 from dagster._utils.tags import TagConcurrencyLimitsCounter
 
@@ -53,6 +53,7 @@ def __init__(self, interval_seconds, page_size=PAGE_SIZE) -> None:
         self._location_timeouts_lock = threading.Lock()
         self._location_timeouts: Dict[str, float] = {}
         self._page_size = page_size
+        self._run_queue_index: Optional[RunQueueIndex] = None
         super().__init__(interval_seconds)
 
     def _get_executor(self, max_workers) -> ThreadPoolExecutor:
@@ -87,9 +88,14 @@ def run_iteration(
         run_queue_config = run_coordinator.get_run_queue_config()
 
         instance = workspace_process_context.instance
-        runs_to_dequeue = self._get_runs_to_dequeue(
-            instance, run_queue_config, fixed_iteration_time=fixed_iteration_time
-        )
+        if run_coordinator.dequeue_use_run_queue_index:
+            runs_to_dequeue = self._get_runs_to_dequeue_from_index(
+                instance, run_queue_config, fixed_iteration_time=fixed_iteration_time
+            )
+        else:
+            runs_to_dequeue = self._get_runs_to_dequeue(
+                instance, run_queue_config, fixed_iteration_time=fixed_iteration_time
+            )
         yield from self._dequeue_runs_iter(
             workspace_process_context,
             run_coordinator,
@@ -265,21 +271,9 @@ def _get_runs_to_dequeue(
             batch += queued_runs
             batch = self._priority_sort(batch)
 
-            if run_queue_config.should_block_op_concurrency_limited_runs:
-                try:
-                    global_concurrency_limits_counter = GlobalOpConcurrencyLimitsCounter(
-                        instance,
-                        batch,
-                        in_progress_run_records,
-                        run_queue_config.op_concurrency_slot_buffer,
-                    )
-                except:
-                    self._logger.exception("Failed to initialize op concurrency counter")
-                    # when we cannot initialize the global concurrency counter, we should fall back
-                    # to not blocking any runs based on op concurrency limits
-                    global_concurrency_limits_counter = None
-            else:
-                global_concurrency_limits_counter = None
+            global_concurrency_limits_counter = self._get_global_concurrency_limits_counter(
+                instance, run_queue_config, batch, in_progress_run_records
+            )
 
             to_remove = []
             for run in batch:
@@ -289,25 +283,9 @@ def _get_runs_to_dequeue(
                 else:
                     tag_concurrency_limits_counter.update_counters_with_launched_item(run)
 
-                if (
-                    global_concurrency_limits_counter
-                    and global_concurrency_limits_counter.is_blocked(run)
+                if self._is_run_blocked(
+                    run, global_concurrency_limits_counter, paused_location_names
                 ):
-                    concurrency_blocked_info = json.dumps(
-                        global_concurrency_limits_counter.get_blocked_run_debug_info(run)
-                    )
-                    self._logger.info(
-                        f"Run {run.run_id} is blocked by global concurrency limits: {concurrency_blocked_info}"
-                    )
-                    to_remove.append(run)
-                    continue
-                elif global_concurrency_limits_counter:
-                    global_concurrency_limits_counter.update_counters_with_launched_item(run)
-
-                location_name = (
-                    run.external_job_origin.location_name if run.external_job_origin else None
-                )
-                if location_name and location_name in paused_location_names:
                     to_remove.append(run)
                     continue
 
@@ -319,19 +297,131 @@ def _get_runs_to_dequeue(
 
         return batch
 
+    def _get_runs_to_dequeue_from_index(
+        self,
+        instance: DagsterInstance,
+        run_queue_config: RunQueueConfig,
+        fixed_iteration_time: Optional[float],
+    ) -> List[DagsterRun]:
+        """Equivalent to `_get_runs_to_dequeue`, but reads queued runs from an in-memory index that
+        is updated incrementally, instead of paging through every queued run on each iteration.
+        """
+        if self._run_queue_index is None:
+            self._run_queue_index = RunQueueIndex(page_size=self._page_size)
+        run_queue_index = self._run_queue_index
+
+        max_concurrent_runs = run_queue_config.max_concurrent_runs
+        tag_concurrency_limits = run_queue_config.tag_concurrency_limits
+
+        # the in-progress runs are still fetched on every iteration, since runs can be launched
+        # and can change status without going through the queue
+        in_progress_run_records = self._get_in_progress_run_records(instance)
+        in_progress_runs = [record.dagster_run for record in in_progress_run_records]
+
+        max_concurrent_runs_enabled = max_concurrent_runs != -1  # setting to -1 disables the limit
+        max_runs_to_launch = max_concurrent_runs - len(in_progress_run_records)
+        if max_concurrent_runs_enabled and max_runs_to_launch <= 0:
+            self._logger.info(
+                f"{len(in_progress_run_records)} runs are currently in progress. Maximum is {max_concurrent_runs}, won't launch more."
+            )
+            return []
+
+        run_queue_index.update(instance, tag_concurrency_limits)
+        if not len(run_queue_index):
+            return []
+
+        now = fixed_iteration_time or time.time()
+        with self._location_timeouts_lock:
+            paused_location_names = {
+                location_name
+                for location_name in self._location_timeouts
+                if self._location_timeouts[location_name] > now
+            }
+
+        self._logger.info(
+            f"Checking tag concurrency limits for {len(run_queue_index)} queued runs."
+            + (
+                " Temporarily skipping runs from the following locations due to a user code"
+                " error: " + ",".join(list(paused_location_names))
+                if paused_location_names
+                else ""
+            )
+        )
+
+        tag_concurrency_limits_counter = TagConcurrencyLimitsCounter(
+            tag_concurrency_limits, in_progress_runs
+        )
+        global_concurrency_limits_counter = self._get_global_concurrency_limits_counter(
+            instance, run_queue_config, run_queue_index.queued_runs, in_progress_run_records
+        )
+
+        batch: List[DagsterRun] = []
+        for run in run_queue_index.iter_unblocked_runs(tag_concurrency_limits_counter):
+            tag_concurrency_limits_counter.update_counters_with_launched_item(run)
+            if self._is_run_blocked(run, global_concurrency_limits_counter, paused_location_names):
+                continue
+
+            batch.append(run)
+            if max_concurrent_runs_enabled and len(batch) >= max_runs_to_launch:
+                break
+
+        # runs that are about to be dequeued are refetched on the next iteration, and are added
+        # back to the index if they are still queued
+        run_queue_index.recheck(run.run_id for run in batch)
+        return batch
+
+    def _get_global_concurrency_limits_counter(
+        self,
+        instance: DagsterInstance,
+        run_queue_config: RunQueueConfig,
+        queued_runs: Sequence[DagsterRun],
+        in_progress_run_records: Sequence[RunRecord],
+    ) -> Optional[GlobalOpConcurrencyLimitsCounter]:
+        if not run_queue_config.should_block_op_concurrency_limited_runs:
+            return None
+
+        try:
+            return GlobalOpConcurrencyLimitsCounter(
+                instance,
+                queued_runs,
+                in_progress_run_records,
+                run_queue_config.op_concurrency_slot_buffer,
+            )
+        except:
+            self._logger.exception("Failed to initialize op concurrency counter")
+            # when we cannot initialize the global concurrency counter, we should fall back
+            # to not blocking any runs based on op concurrency limits
+            return None
+
+    def _is_run_blocked(
+        self,
+        run: DagsterRun,
+        global_concurrency_limits_counter: Optional[GlobalOpConcurrencyLimitsCounter],
+        paused_location_names: AbstractSet[str],
+    ) -> bool:
+        """Checks whether a run that is not blocked by tag concurrency limits should still not be
+        dequeued, updating the global concurrency counter with the run if it is not blocked by it.
+        """
+        if global_concurrency_limits_counter and global_concurrency_limits_counter.is_blocked(run):
+            concurrency_blocked_info = json.dumps(
+                global_concurrency_limits_counter.get_blocked_run_debug_info(run)
+            )
+            self._logger.info(
+                f"Run {run.run_id} is blocked by global concurrency limits: {concurrency_blocked_info}"
+            )
+            return True
+        elif global_concurrency_limits_counter:
+            global_concurrency_limits_counter.update_counters_with_launched_item(run)
+
+        location_name = run.external_job_origin.location_name if run.external_job_origin else None
+        return bool(location_name and location_name in paused_location_names)
+
     def _get_in_progress_run_records(self, instance: DagsterInstance) -> Sequence[RunRecord]:
         return instance.get_run_records(filters=RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES))
 
     def _priority_sort(self, runs: Iterable[DagsterRun]) -> List[DagsterRun]:
-        def get_priority(run: DagsterRun) -> int:
-            priority_tag_value = run.tags.get(PRIORITY_TAG, "0")
-            try:
-                return int(priority_tag_value)
-            except ValueError:
-                return 0
-
         # sorted is stable, so fifo is maintained
-        return sorted(runs, key=get_priority, reverse=True)
+        return sorted(runs, key=get_run_priority, reverse=True)
 
     def _is_location_pausing_dequeues(self, location_name: str, now: float) -> bool:
         with self._location_timeouts_lock:
@@ -0,0 +1,237 @@
+import bisect
+import heapq
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from dagster import _check as check
+from dagster._core.events import DagsterEventType
+from dagster._core.storage.dagster_run import DagsterRun, DagsterRunStatus, RunRecord, RunsFilter
+from dagster._core.storage.tags import PRIORITY_TAG
+
+if TYPE_CHECKING:
+    from dagster._core.instance import DagsterInstance
+    from dagster._utils.tags import TagConcurrencyLimitsCounter
+
+# How often the index is rebuilt from the run storage. Between full refreshes, the index is updated
+# from the enqueue events written since the last refresh, so changes to queued runs that are not
+# made through an enqueue event (e.g. deleting a queued run, or changing its priority tag) are only
+# picked up once the index is rebuilt.
+DEFAULT_FULL_REFRESH_INTERVAL_SECONDS = 300
+
+# (-priority, run storage id) - higher priority first, then first-in-first-out
+RunSortKey = Tuple[int, int]
+# the tags of a run that have tag concurrency limits
+BucketKey = Tuple[Tuple[str, str], ...]
+
+
+def get_run_priority(run: DagsterRun) -> int:
+    priority_tag_value = run.tags.get(PRIORITY_TAG, "0")
+    try:
+        return int(priority_tag_value)
+    except ValueError:
+        return 0
+
+
+def get_tag_concurrency_limit_keys(
+    tag_concurrency_limits: Sequence[Mapping[str, Any]],
+) -> FrozenSet[str]:
+    return frozenset(tag_limit["key"] for tag_limit in tag_concurrency_limits)
+
+
+class RunQueueIndex:
+    """In-memory index of the queued runs in an instance, kept in priority order.
+
+    Rather than paging through every queued run on each iteration, the index is built once and then
+    kept up to date from the enqueue events written to the event log since the last update, along
+    with any runs that the caller asks to recheck (e.g. runs that it attempted to dequeue).
+
+    Queued runs are bucketed by the tags that have tag concurrency limits. Runs in the same bucket
+    are either all blocked or all unblocked by the tag concurrency limits, and since the number of
+    in-progress runs only grows while runs are being dequeued, a bucket whose highest priority run
+    is blocked can be skipped entirely. This means that only runs that can be launched, plus one
+    run per blocked bucket, are visited when choosing runs to dequeue.
+    """
+
+    def __init__(
+        self,
+        page_size: int,
+        full_refresh_interval_seconds: float = DEFAULT_FULL_REFRESH_INTERVAL_SECONDS,
+    ):
+        self._page_size = check.int_param(page_size, "page_size")
+        self._full_refresh_interval_seconds = check.numeric_param(
+            full_refresh_interval_seconds, "full_refresh_interval_seconds"
+        )
+        self._last_full_refresh_time: Optional[float] = None
+        self._enqueued_cursor: Optional[str] = None
+        self._limit_keys: FrozenSet[str] = frozenset()
+
+        self._runs: Dict[str, DagsterRun] = {}
+        self._sort_keys: Dict[str, RunSortKey] = {}
+        self._bucket_keys: Dict[str, BucketKey] = {}
+        # each bucket is a list of (sort key, run id), sorted by priority
+        self._buckets: Dict[BucketKey, List[Tuple[RunSortKey, str]]] = {}
+        self._run_ids_to_recheck: Set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._runs)
+
+    @property
+    def queued_runs(self) -> Sequence[DagsterRun]:
+        return list(self._runs.values())
+
+    def update(
+        self,
+        instance: "DagsterInstance",
+        tag_concurrency_limits: Sequence[Mapping[str, Any]],
+    ) -> None:
+        limit_keys = get_tag_concurrency_limit_keys(tag_concurrency_limits)
+        if limit_keys != self._limit_keys:
+            self._limit_keys = limit_keys
+            self._rebucket()
+
+        now = time.time()
+        if (
+            self._last_full_refresh_time is None
+            or now - self._last_full_refresh_time >= self._full_refresh_interval_seconds
+        ):
+            self._full_refresh(instance)
+            self._last_full_refresh_time = now
+        else:
+            self._incremental_refresh(instance)
+
+    def recheck(self, run_ids: Iterable[str]) -> None:
+        """Removes runs from the index until the next update, when they are added back if they are
+        still queued.
+        """
+        for run_id in run_ids:
+            self._remove(run_id)
+            self._run_ids_to_recheck.add(run_id)
+
+    def iter_unblocked_runs(
+        self, tag_concurrency_limits_counter: "TagConcurrencyLimitsCounter"
+    ) -> Iterator[DagsterRun]:
+        """Yields queued runs in priority order, skipping runs that are blocked by tag concurrency
+        limits. The counter is checked lazily, so the caller should update it with each yielded run
+        that it launches before requesting the next run.
+        """
+        heap = [
+            (bucket[0][0], bucket_key, 0) for bucket_key, bucket in self._buckets.items() if bucket
+        ]
+        heapq.heapify(heap)
+        while heap:
+            _sort_key, bucket_key, index = heapq.heappop(heap)
+            bucket = self._buckets[bucket_key]
+            run = self._runs[bucket[index][1]]
+            if tag_concurrency_limits_counter.is_blocked(run):
+                # every other run in the bucket is blocked by the same limits
+                continue
+
+            yield run
+
+            if index + 1 < len(bucket):
+                heapq.heappush(heap, (bucket[index + 1][0], bucket_key, index + 1))
+
+    def _full_refresh(self, instance: "DagsterInstance") -> None:
+        # fetch the cursor before the runs, so that no runs that are enqueued in between are missed
+        self._enqueued_cursor = instance.fetch_run_status_changes(
+            DagsterEventType.RUN_ENQUEUED, limit=1, ascending=False
+        ).cursor
+
+        self._runs = {}
+        self._sort_keys = {}
+        self._bucket_keys = {}
+        self._buckets = {}
+        self._run_ids_to_recheck = set()
+
+        cursor = None
+        has_more = True
+        while has_more:
+            records = instance.get_run_records(
+                RunsFilter(statuses=[DagsterRunStatus.QUEUED]),
+                cursor=cursor,
+                limit=self._page_size,
+                ascending=True,
+            )
+            has_more = len(records) >= self._page_size
+            for record in records:
+                self._add(record)
+            if records:
+                cursor = records[-1].dagster_run.run_id
+
+    def _incremental_refresh(self, instance: "DagsterInstance") -> None:
+        run_ids = set(self._run_ids_to_recheck)
+        self._run_ids_to_recheck = set()
+
+        has_more = True
+        while has_more:
+            result = instance.fetch_run_status_changes(
+                DagsterEventType.RUN_ENQUEUED,
+                limit=self._page_size,
+                cursor=self._enqueued_cursor,
+                ascending=True,
+            )
+            run_ids.update(record.run_id for record in result.records)
+            self._enqueued_cursor = result.cursor
+            has_more = result.has_more
+
+        run_ids_list = sorted(run_ids)
+        for i in range(0, len(run_ids_list), self._page_size):
+            chunk = run_ids_list[i : i + self._page_size]
+            records_by_id = {
+                record.dagster_run.run_id: record
+                for record in instance.get_run_records(RunsFilter(run_ids=chunk))
+            }
+            for run_id in chunk:
+                record = records_by_id.get(run_id)
+                if record and record.dagster_run.status == DagsterRunStatus.QUEUED:
+                    self._add(record)
+                else:
+                    self._remove(run_id)
+
+    def _get_bucket_key(self, run: DagsterRun) -> BucketKey:
+        return tuple(sorted((k, v) for k, v in run.tags.items() if k in self._limit_keys))
+
+    def _add(self, record: RunRecord) -> None:
+        run = record.dagster_run
+        self._remove(run.run_id)
+
+        sort_key = (-get_run_priority(run), record.storage_id)
+        bucket_key = self._get_bucket_key(run)
+        self._runs[run.run_id] = run
+        self._sort_keys[run.run_id] = sort_key
+        self._bucket_keys[run.run_id] = bucket_key
+        bisect.insort(self._buckets.setdefault(bucket_key, []), (sort_key, run.run_id))
+
+    def _remove(self, run_id: str) -> None:
+        if run_id not in self._runs:
+            return
+
+        del self._runs[run_id]
+        sort_key = self._sort_keys.pop(run_id)
+        bucket_key = self._bucket_keys.pop(run_id)
+        bucket = self._buckets[bucket_key]
+        del bucket[bisect.bisect_left(bucket, (sort_key, run_id))]
+        if not bucket:
+            del self._buckets[bucket_key]
+
+    def _rebucket(self) -> None:
+        self._buckets = {}
+        for run_id, run in self._runs.items():
+            bucket_key = self._get_bucket_key(run)
+            self._bucket_keys[run_id] = bucket_key
+            self._buckets.setdefault(bucket_key, []).append((self._sort_keys[run_id], run_id))
+        for bucket in self._buckets.values():
+            bucket.sort()
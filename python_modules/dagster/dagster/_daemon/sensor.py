@@ -1,3 +1,4 @@
+import heapq
 import logging
 import sys
 import threading
@@ -13,6 +14,7 @@
     NamedTuple,
     Optional,
     Sequence,
+    Tuple,
     Type,
     Union,
     cast,
@@ -54,6 +56,7 @@
 from dagster._core.storage.tags import RUN_KEY_TAG, SENSOR_NAME_TAG
 from dagster._core.telemetry import SENSOR_RUN_CREATED, hash_name, log_action
 from dagster._core.workspace.context import IWorkspaceProcessContext
+from dagster._core.workspace.workspace import CodeLocationEntry
 from dagster._daemon.utils import DaemonErrorCapture
 from dagster._scheduler.stale import resolve_stale_or_missing_assets
 from dagster._utils import DebugCrashFlags, SingleInstigatorDebugCrashFlags, check_for_debug_crash
@@ -70,6 +73,10 @@
 
 FINISHED_TICK_STATES = [TickStatus.SKIPPED, TickStatus.SUCCESS, TickStatus.FAILURE]
 
+# How often a `SensorDueQueue` reloads the state of every sensor, to pick up sensors that were
+# started or stopped outside of the daemon.
+SENSOR_DUE_QUEUE_REFRESH_INTERVAL_SECONDS = 30
+
 
 class DagsterSensorDaemonError(DagsterError):
     """Error when running the SensorDaemon."""
@@ -242,6 +249,91 @@ def __exit__(
             )
 
 
+class SensorDueQueue:
+    """Priority queue of the running sensors in a workspace, ordered by when each sensor is next due
+    to be evaluated based on its `min_interval` and the time of its last tick.
+
+    Used by the sensor daemon to only load the state of sensors that are due on each iteration,
+    rather than walking every sensor in the workspace and loading the state of every sensor. The
+    full set of running sensors is only reloaded when the workspace changes, or every
+    `refresh_interval_seconds` to pick up sensors that were started or stopped outside of the
+    daemon.
+    """
+
+    def __init__(self, refresh_interval_seconds: float = SENSOR_DUE_QUEUE_REFRESH_INTERVAL_SECONDS):
+        self._refresh_interval_seconds = check.numeric_param(
+            refresh_interval_seconds, "refresh_interval_seconds"
+        )
+        self._last_refresh_timestamp: Optional[float] = None
+        self._workspace_fingerprint: Optional[Tuple] = None
+        self._sensors: Dict[str, ExternalSensor] = {}
+        self._due_timestamps: Dict[str, float] = {}
+        # (due timestamp, selector id), with entries that no longer match `_due_timestamps` ignored
+        self._heap: List[Tuple[float, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._due_timestamps)
+
+    def invalidate(self) -> None:
+        self._last_refresh_timestamp = None
+
+    def needs_refresh(
+        self, workspace_snapshot: Mapping[str, CodeLocationEntry], timestamp: float
+    ) -> bool:
+        return (
+            self._last_refresh_timestamp is None
+            or timestamp - self._last_refresh_timestamp >= self._refresh_interval_seconds
+            or _get_workspace_fingerprint(workspace_snapshot) != self._workspace_fingerprint
+        )
+
+    def refresh(
+        self,
+        workspace_snapshot: Mapping[str, CodeLocationEntry],
+        sensors: Mapping[str, ExternalSensor],
+        sensor_states: Mapping[str, InstigatorState],
+        timestamp: float,
+    ) -> None:
+        self._last_refresh_timestamp = timestamp
+        self._workspace_fingerprint = _get_workspace_fingerprint(workspace_snapshot)
+        self._sensors = dict(sensors)
+        self._due_timestamps = {}
+        self._heap = []
+        for selector_id, external_sensor in sensors.items():
+            sensor_state = sensor_states.get(selector_id)
+            self.schedule(
+                external_sensor,
+                get_sensor_due_timestamp(sensor_state, external_sensor) if sensor_state else 0,
+            )
+
+    def schedule(self, external_sensor: ExternalSensor, due_timestamp: float) -> None:
+        selector_id = external_sensor.selector_id
+        self._sensors[selector_id] = external_sensor
+        self._due_timestamps[selector_id] = due_timestamp
+        heapq.heappush(self._heap, (due_timestamp, selector_id))
+
+    def pop_due_sensors(self, timestamp: float) -> Sequence[ExternalSensor]:
+        """Removes and returns the sensors that are due at the given time. Sensors that should be
+        evaluated again must be rescheduled with `schedule`.
+        """
+        due_sensors = []
+        while self._heap and self._heap[0][0] <= timestamp:
+            due_timestamp, selector_id = heapq.heappop(self._heap)
+            if self._due_timestamps.get(selector_id) != due_timestamp:
+                continue
+            del self._due_timestamps[selector_id]
+            due_sensors.append(self._sensors[selector_id])
+        return due_sensors
+
+
+def _get_workspace_fingerprint(workspace_snapshot: Mapping[str, CodeLocationEntry]) -> Tuple:
+    return tuple(
+        sorted(
+            (location_name, entry.update_timestamp, entry.load_status.value)
+            for location_name, entry in workspace_snapshot.items()
+        )
+    )
+
+
 def execute_sensor_iteration_loop(
     workspace_process_context: IWorkspaceProcessContext,
     logger: logging.Logger,
@@ -249,6 +341,7 @@ def execute_sensor_iteration_loop(
     until: Optional[float] = None,
     threadpool_executor: Optional[ThreadPoolExecutor] = None,
     submit_threadpool_executor: Optional[ThreadPoolExecutor] = None,
+    sensor_due_queue: Optional[SensorDueQueue] = None,
 ) -> "DaemonIterator":
     """Helper function that performs sensor evaluations on a tighter loop, while reusing grpc locations
     within a given daemon interval.  Rather than relying on the daemon machinery to run the
@@ -273,6 +366,7 @@ def execute_sensor_iteration_loop(
                 threadpool_executor=threadpool_executor,
                 submit_threadpool_executor=submit_threadpool_executor,
                 sensor_tick_futures=sensor_tick_futures,
+                sensor_due_queue=sensor_due_queue,
             )
         except Exception:
             error_info = DaemonErrorCapture.on_exception(
@@ -301,6 +395,7 @@ def execute_sensor_iteration(
     submit_threadpool_executor: Optional[ThreadPoolExecutor],
     sensor_tick_futures: Optional[Dict[str, Future]] = None,
     debug_crash_flags: Optional[DebugCrashFlags] = None,
+    sensor_due_queue: Optional[SensorDueQueue] = None,
 ):
     instance = workspace_process_context.instance
 
@@ -311,6 +406,118 @@ def execute_sensor_iteration(
         .values()
     }
 
+    if sensor_due_queue is not None:
+        yield from _execute_due_sensors_iteration(
+            workspace_process_context,
+            logger,
+            workspace_snapshot,
+            sensor_due_queue,
+            threadpool_executor,
+            submit_threadpool_executor,
+            sensor_tick_futures,
+            debug_crash_flags,
+        )
+        return
+
+    sensors, all_sensor_states = _get_running_sensors(instance, workspace_snapshot)
+
+    if not sensors:
+        yield
+        return
+
+    tick_retention_settings = instance.get_tick_retention_settings(InstigatorType.SENSOR)
+
+    for external_sensor in sensors.values():
+        sensor_state = all_sensor_states.get(external_sensor.selector_id)
+        if not sensor_state:
+            assert external_sensor.default_status == DefaultSensorStatus.RUNNING
+            sensor_state = _create_declared_in_code_sensor_state(instance, external_sensor)
+        elif is_under_min_interval(sensor_state, external_sensor):
+            continue
+
+        yield from _submit_sensor_tick(
+            workspace_process_context,
+            logger,
+            external_sensor,
+            sensor_state,
+            tick_retention_settings,
+            threadpool_executor,
+            submit_threadpool_executor,
+            sensor_tick_futures,
+            debug_crash_flags,
+        )
+
+
+def _execute_due_sensors_iteration(
+    workspace_process_context: IWorkspaceProcessContext,
+    logger: logging.Logger,
+    workspace_snapshot: Mapping[str, CodeLocationEntry],
+    sensor_due_queue: SensorDueQueue,
+    threadpool_executor: Optional[ThreadPoolExecutor],
+    submit_threadpool_executor: Optional[ThreadPoolExecutor],
+    sensor_tick_futures: Optional[Dict[str, Future]],
+    debug_crash_flags: Optional[DebugCrashFlags],
+):
+    instance = workspace_process_context.instance
+    now = pendulum.now("UTC").timestamp()
+
+    if sensor_due_queue.needs_refresh(workspace_snapshot, now):
+        sensors, all_sensor_states = _get_running_sensors(instance, workspace_snapshot)
+        sensor_due_queue.refresh(workspace_snapshot, sensors, all_sensor_states, now)
+
+    due_sensors = sensor_due_queue.pop_due_sensors(now)
+    if not due_sensors:
+        yield
+        return
+
+    tick_retention_settings = instance.get_tick_retention_settings(InstigatorType.SENSOR)
+
+    for external_sensor in due_sensors:
+        if (
+            threadpool_executor
+            and sensor_tick_futures
+            and external_sensor.selector_id in sensor_tick_futures
+            and not sensor_tick_futures[external_sensor.selector_id].done()
+        ):
+            # the previous tick is still in flight, check again on the next iteration
+            sensor_due_queue.schedule(external_sensor, now)
+            continue
+
+        sensor_state = instance.get_instigator_state(
+            external_sensor.get_external_origin_id(), external_sensor.selector_id
+        )
+        if not external_sensor.get_current_instigator_state(sensor_state).is_running:
+            # the sensor was stopped since the queue was last refreshed, it will be added back on a
+            # later refresh if it is restarted
+            continue
+
+        if not sensor_state:
+            sensor_state = _create_declared_in_code_sensor_state(instance, external_sensor)
+        elif is_under_min_interval(sensor_state, external_sensor):
+            sensor_due_queue.schedule(
+                external_sensor, get_sensor_due_timestamp(sensor_state, external_sensor)
+            )
+            continue
+
+        sensor_due_queue.schedule(
+            external_sensor, now + (external_sensor.min_interval_seconds or 0)
+        )
+        yield from _submit_sensor_tick(
+            workspace_process_context,
+            logger,
+            external_sensor,
+            sensor_state,
+            tick_retention_settings,
+            threadpool_executor,
+            submit_threadpool_executor,
+            sensor_tick_futures,
+            debug_crash_flags,
+        )
+
+
+def _get_running_sensors(
+    instance: DagsterInstance, workspace_snapshot: Mapping[str, CodeLocationEntry]
+) -> Tuple[Dict[str, ExternalSensor], Dict[str, InstigatorState]]:
     all_sensor_states = {
         sensor_state.selector_id: sensor_state
         for sensor_state in instance.all_instigator_state(instigator_type=InstigatorType.SENSOR)
@@ -320,8 +527,6 @@ def execute_sensor_iteration(
         )
     }
 
-    tick_retention_settings = instance.get_tick_retention_settings(InstigatorType.SENSOR)
-
     sensors: Dict[str, ExternalSensor] = {}
     for location_entry in workspace_snapshot.values():
         code_location = location_entry.code_location
@@ -337,66 +542,76 @@ def execute_sensor_iteration(
                     ).is_running:
                         sensors[selector_id] = sensor
 
-    if not sensors:
-        yield
-        return
+    return sensors, all_sensor_states
 
-    for external_sensor in sensors.values():
-        sensor_name = external_sensor.name
-        sensor_debug_crash_flags = debug_crash_flags.get(sensor_name) if debug_crash_flags else None
-        sensor_state = all_sensor_states.get(external_sensor.selector_id)
-        if not sensor_state:
-            assert external_sensor.default_status == DefaultSensorStatus.RUNNING
-            sensor_state = InstigatorState(
-                external_sensor.get_external_origin(),
-                InstigatorType.SENSOR,
-                InstigatorStatus.DECLARED_IN_CODE,
-                SensorInstigatorData(
-                    min_interval=external_sensor.min_interval_seconds,
-                    last_sensor_start_timestamp=pendulum.now("UTC").timestamp(),
-                    sensor_type=external_sensor.sensor_type,
-                ),
-            )
-            instance.add_instigator_state(sensor_state)
-        elif is_under_min_interval(sensor_state, external_sensor):
-            continue
 
-        if threadpool_executor:
-            if sensor_tick_futures is None:
-                check.failed("sensor_tick_futures dict must be passed with threadpool_executor")
+def _create_declared_in_code_sensor_state(
+    instance: DagsterInstance, external_sensor: ExternalSensor
+) -> InstigatorState:
+    sensor_state = InstigatorState(
+        external_sensor.get_external_origin(),
+        InstigatorType.SENSOR,
+        InstigatorStatus.DECLARED_IN_CODE,
+        SensorInstigatorData(
+            min_interval=external_sensor.min_interval_seconds,
+            last_sensor_start_timestamp=pendulum.now("UTC").timestamp(),
+            sensor_type=external_sensor.sensor_type,
+        ),
+    )
+    instance.add_instigator_state(sensor_state)
+    return sensor_state
 
-            # only allow one tick per sensor to be in flight
-            if (
-                external_sensor.selector_id in sensor_tick_futures
-                and not sensor_tick_futures[external_sensor.selector_id].done()
-            ):
-                continue
 
-            future = threadpool_executor.submit(
-                _process_tick,
-                workspace_process_context,
-                logger,
-                external_sensor,
-                sensor_state,
-                sensor_debug_crash_flags,
-                tick_retention_settings,
-                submit_threadpool_executor,
-            )
-            sensor_tick_futures[external_sensor.selector_id] = future
-            yield
+def _submit_sensor_tick(
+    workspace_process_context: IWorkspaceProcessContext,
+    logger: logging.Logger,
+    external_sensor: ExternalSensor,
+    sensor_state: InstigatorState,
+    tick_retention_settings,
+    threadpool_executor: Optional[ThreadPoolExecutor],
+    submit_threadpool_executor: Optional[ThreadPoolExecutor],
+    sensor_tick_futures: Optional[Dict[str, Future]],
+    debug_crash_flags: Optional[DebugCrashFlags],
+):
+    sensor_debug_crash_flags = (
+        debug_crash_flags.get(external_sensor.name) if debug_crash_flags else None
+    )
+    if threadpool_executor:
+        if sensor_tick_futures is None:
+            check.failed("sensor_tick_futures dict must be passed with threadpool_executor")
 
-        else:
-            # evaluate the sensors in a loop, synchronously, yielding to allow the sensor daemon to
-            # heartbeat
-            yield from _process_tick_generator(
-                workspace_process_context,
-                logger,
-                external_sensor,
-                sensor_state,
-                sensor_debug_crash_flags,
-                tick_retention_settings,
-                submit_threadpool_executor=None,
-            )
+        # only allow one tick per sensor to be in flight
+        if (
+            external_sensor.selector_id in sensor_tick_futures
+            and not sensor_tick_futures[external_sensor.selector_id].done()
+        ):
+            return
+
+        future = threadpool_executor.submit(
+            _process_tick,
+            workspace_process_context,
+            logger,
+            external_sensor,
+            sensor_state,
+            sensor_debug_crash_flags,
+            tick_retention_settings,
+            submit_threadpool_executor,
+        )
+        sensor_tick_futures[external_sensor.selector_id] = future
+        yield
+
+    else:
+        # evaluate the sensors in a loop, synchronously, yielding to allow the sensor daemon to
+        # heartbeat
+        yield from _process_tick_generator(
+            workspace_process_context,
+            logger,
+            external_sensor,
+            sensor_state,
+            sensor_debug_crash_flags,
+            tick_retention_settings,
+            submit_threadpool_executor=None,
+        )
 
 
 def _process_tick(
@@ -877,6 +1092,26 @@ def submit_run_request(run_request) -> SubmitRunRequestResult:
     yield
 
 
+def get_sensor_due_timestamp(state: InstigatorState, external_sensor: ExternalSensor) -> float:
+    """The earliest time at which the sensor can next be evaluated, consistent with
+    `is_under_min_interval`.
+    """
+    instigator_data = _sensor_instigator_data(state)
+    if not instigator_data or not external_sensor.min_interval_seconds:
+        return 0
+
+    if not instigator_data.last_tick_start_timestamp and not instigator_data.last_tick_timestamp:
+        return 0
+
+    return (
+        max(
+            instigator_data.last_tick_timestamp or 0,
+            instigator_data.last_tick_start_timestamp or 0,
+        )
+        + external_sensor.min_interval_seconds
+    )
+
+
 def is_under_min_interval(state: InstigatorState, external_sensor: ExternalSensor) -> bool:
     instigator_data = _sensor_instigator_data(state)
     if not instigator_data:
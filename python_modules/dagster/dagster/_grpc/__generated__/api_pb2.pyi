@@ -3,7 +3,9 @@
 isort:skip_file
 If you make changes to this file, run "python -m dagster._grpc.compile" after."""
 import builtins
+import collections.abc
 import google.protobuf.descriptor
+import google.protobuf.internal.containers
 import google.protobuf.message
 import sys
 
@@ -462,6 +464,40 @@ class ExternalRepositoryReply(google.protobuf.message.Message):
 
 global___ExternalRepositoryReply = ExternalRepositoryReply
 
+@typing_extensions.final
+class ExternalRepositoryDeltaRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    SERIALIZED_REPOSITORY_PYTHON_ORIGIN_FIELD_NUMBER: builtins.int
+    DEFER_SNAPSHOTS_FIELD_NUMBER: builtins.int
+    KNOWN_ENTRY_HASHES_FIELD_NUMBER: builtins.int
+    serialized_repository_python_origin: builtins.str
+    defer_snapshots: builtins.bool
+    @property
+    def known_entry_hashes(
+        self,
+    ) -> google.protobuf.internal.containers.RepeatedScalarFieldContainer[builtins.str]: ...
+    def __init__(
+        self,
+        *,
+        serialized_repository_python_origin: builtins.str = ...,
+        defer_snapshots: builtins.bool = ...,
+        known_entry_hashes: collections.abc.Iterable[builtins.str] | None = ...,
+    ) -> None: ...
+    def ClearField(
+        self,
+        field_name: typing_extensions.Literal[
+            "defer_snapshots",
+            b"defer_snapshots",
+            "known_entry_hashes",
+            b"known_entry_hashes",
+            "serialized_repository_python_origin",
+            b"serialized_repository_python_origin",
+        ],
+    ) -> None: ...
+
+global___ExternalRepositoryDeltaRequest = ExternalRepositoryDeltaRequest
+
 @typing_extensions.final
 class StreamingExternalRepositoryEvent(google.protobuf.message.Message):
     DESCRIPTOR: google.protobuf.descriptor.Descriptor
@@ -0,0 +1,171 @@
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+import grpc
+
+import dagster._check as check
+
+from .utils import (
+    grpc_keepalive_time_ms,
+    grpc_keepalive_timeout_ms,
+    max_rx_bytes,
+    max_send_bytes,
+)
+
+# Upper bound on the number of idle channels kept open per process. Channels to servers that are
+# no longer in use (e.g. code servers that were replaced after a reload) fall out of the pool once
+# it is full.
+DEFAULT_MAX_POOLED_CHANNELS = 128
+
+
+def create_grpc_channel(
+    server_address: str, ssl_credentials: Optional[grpc.ChannelCredentials] = None
+) -> grpc.Channel:
+    options = [
+        ("grpc.max_receive_message_length", max_rx_bytes()),
+        ("grpc.max_send_message_length", max_send_bytes()),
+        ("grpc.keepalive_time_ms", grpc_keepalive_time_ms()),
+        ("grpc.keepalive_timeout_ms", grpc_keepalive_timeout_ms()),
+        # only ping while calls are in flight, idle connections are checked when they are next used
+        ("grpc.keepalive_permit_without_calls", 0),
+    ]
+    if ssl_credentials:
+        return grpc.secure_channel(server_address, ssl_credentials, options=options)
+    return grpc.insecure_channel(server_address, options=options)
+
+
+@lru_cache(maxsize=1)
+def get_default_ssl_credentials() -> grpc.ChannelCredentials:
+    """Returns a shared set of default SSL credentials, so that clients that use them can share
+    pooled channels.
+    """
+    return grpc.ssl_channel_credentials()
+
+
+class _PooledChannel:
+    def __init__(self, channel: grpc.Channel):
+        self.channel = channel
+        # number of requests currently using the channel
+        self.num_in_use = 0
+        # whether the channel has been removed from the pool, after which it is closed once it is
+        # no longer in use
+        self.removed = False
+
+
+class GrpcChannelPool:
+    """Process-local pool of long-lived gRPC channels, one per server address and set of
+    credentials.
+
+    gRPC channels are thread-safe and multiplex concurrent calls over a single HTTP/2 connection,
+    so reusing them avoids a new connection handshake for every request. Channels that fail with
+    UNAVAILABLE should be evicted so that the next request opens a fresh connection instead of
+    waiting out the channel's reconnect backoff. Channels that are evicted or dropped from the
+    pool are closed once the requests using them have finished.
+    """
+
+    def __init__(self, max_channels: int = DEFAULT_MAX_POOLED_CHANNELS):
+        self._max_channels = check.int_param(max_channels, "max_channels")
+        self._lock = threading.Lock()
+        self._channels: OrderedDict[
+            Tuple[str, Optional[grpc.ChannelCredentials]], _PooledChannel
+        ] = OrderedDict()
+        self._pid = os.getpid()
+        # channels inherited from a parent process, which must not be used or closed in the child
+        self._abandoned_channels: List[_PooledChannel] = []
+
+    def _check_pid(self) -> None:
+        if os.getpid() != self._pid:
+            self._abandoned_channels.extend(self._channels.values())
+            self._channels = OrderedDict()
+            self._pid = os.getpid()
+
+    @staticmethod
+    def _remove(pooled_channel: _PooledChannel) -> Optional[grpc.Channel]:
+        """Marks a channel as removed from the pool, returning it if it can be closed now."""
+        pooled_channel.removed = True
+        return pooled_channel.channel if pooled_channel.num_in_use == 0 else None
+
+    @contextmanager
+    def get_channel(
+        self, server_address: str, ssl_credentials: Optional[grpc.ChannelCredentials] = None
+    ) -> Iterator[Tuple[grpc.Channel, bool]]:
+        """Yields a channel to the given address, and whether it was reused from the pool. The
+        channel is not closed while it is in use, even if it is removed from the pool.
+        """
+        key = (server_address, ssl_credentials)
+        to_close: List[grpc.Channel] = []
+        with self._lock:
+            self._check_pid()
+            pooled_channel = self._channels.get(key)
+            reused = pooled_channel is not None
+            if pooled_channel is not None:
+                self._channels.move_to_end(key)
+            else:
+                pooled_channel = _PooledChannel(
+                    create_grpc_channel(server_address, ssl_credentials)
+                )
+                self._channels[key] = pooled_channel
+                while len(self._channels) > self._max_channels:
+                    _, dropped_channel = self._channels.popitem(last=False)
+                    to_close.extend(filter(None, [self._remove(dropped_channel)]))
+            pooled_channel.num_in_use += 1
+            pid = self._pid
+
+        _close_channels(to_close)
+        try:
+            yield pooled_channel.channel, reused
+        finally:
+            with self._lock:
+                pooled_channel.num_in_use -= 1
+                should_close = (
+                    pooled_channel.removed and pooled_channel.num_in_use == 0 and pid == os.getpid()
+                )
+            if should_close:
+                _close_channels([pooled_channel.channel])
+
+    def evict(
+        self,
+        server_address: str,
+        ssl_credentials: Optional[grpc.ChannelCredentials],
+        channel: grpc.Channel,
+    ) -> None:
+        key = (server_address, ssl_credentials)
+        to_close: List[grpc.Channel] = []
+        with self._lock:
+            pooled_channel = self._channels.get(key)
+            # another thread may have already replaced the channel
+            if pooled_channel is not None and pooled_channel.channel is channel:
+                del self._channels[key]
+                to_close.extend(filter(None, [self._remove(pooled_channel)]))
+        _close_channels(to_close)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._check_pid()
+            to_close = [
+                channel
+                for channel in map(self._remove, self._channels.values())
+                if channel is not None
+            ]
+            self._channels = OrderedDict()
+        _close_channels(to_close)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._channels)
+
+
+def _close_channels(channels: Sequence[grpc.Channel]) -> None:
+    for channel in channels:
+        channel.close()
+
+
+_GRPC_CHANNEL_POOL = GrpcChannelPool()
+
+
+def get_grpc_channel_pool() -> GrpcChannelPool:
+    return _GRPC_CHANNEL_POOL
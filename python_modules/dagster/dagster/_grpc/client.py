@@ -2,7 +2,7 @@
 import sys
 from contextlib import contextmanager
 from threading import Event
-from typing import Any, Dict, Iterator, NoReturn, Optional, Sequence, Tuple, Type, cast
+from typing import AbstractSet, Any, Dict, Iterator, NoReturn, Optional, Sequence, Tuple, Type, cast
 
 import google.protobuf.message
 import grpc
@@ -20,6 +20,11 @@
 from dagster._utils.error import serializable_error_info_from_exc_info
 
 from .__generated__ import DagsterApiStub, api_pb2
+from .channel_pool import (
+    create_grpc_channel,
+    get_default_ssl_credentials,
+    get_grpc_channel_pool,
+)
 from .server import GrpcServerProcess
 from .types import (
     CanCancelExecutionRequest,
@@ -38,8 +43,8 @@
     default_repository_grpc_timeout,
     default_schedule_grpc_timeout,
     default_sensor_grpc_timeout,
-    max_rx_bytes,
-    max_send_bytes,
+    grpc_channel_pooling_enabled,
+    grpc_compression_min_bytes,
 )
 
 CLIENT_HEARTBEAT_INTERVAL = 1
@@ -49,6 +54,27 @@
 DEFAULT_SENSOR_GRPC_TIMEOUT = default_sensor_grpc_timeout()
 DEFAULT_REPOSITORY_GRPC_TIMEOUT = default_repository_grpc_timeout()
 
+# Calls that are retried once on a new connection if a pooled channel turns out to be unavailable.
+# The server may have acted on the first attempt before the connection was lost, so only calls that
+# read snapshots or server metadata are listed. Calls that launch or cancel runs, evaluate sensors
+# and schedules, or call partition functions are never sent twice.
+RETRYABLE_GRPC_METHODS = frozenset(
+    {
+        "Ping",
+        "Heartbeat",
+        "GetServerId",
+        "ListRepositories",
+        "ExternalRepository",
+        "ExternalJob",
+        "ExternalPipelineSubsetSnapshot",
+        "ExecutionPlanSnapshot",
+        "ExternalNotebookData",
+        "CanCancelExecution",
+        "GetCurrentImage",
+        "GetCurrentRuns",
+    }
+)
+
 
 def client_heartbeat_thread(client: "DagsterGrpcClient", shutdown_event: Event) -> None:
     while True:
@@ -77,9 +103,11 @@ def __init__(
         self.host = check.opt_str_param(host, "host")
         self._use_ssl = check.bool_param(use_ssl, "use_ssl")
 
-        self._ssl_creds = grpc.ssl_channel_credentials() if use_ssl else None
+        self._ssl_creds = get_default_ssl_credentials() if use_ssl else None
 
         self._metadata = check.opt_sequence_param(metadata, "metadata")
+        self._use_channel_pool = grpc_channel_pooling_enabled()
+        self._compression_min_bytes = grpc_compression_min_bytes()
 
         check.invariant(
             port is not None if seven.IS_WINDOWS else True,
@@ -109,26 +137,39 @@ def use_ssl(self) -> bool:
         return self._use_ssl
 
     @contextmanager
-    def _channel(self) -> Iterator[grpc.Channel]:
-        options = [
-            ("grpc.max_receive_message_length", max_rx_bytes()),
-            ("grpc.max_send_message_length", max_send_bytes()),
-        ]
-        with (
-            grpc.secure_channel(
-                self._server_address,
-                self._ssl_creds,
-                options=options,
-                compression=grpc.Compression.Gzip,
-            )
-            if self._use_ssl
-            else grpc.insecure_channel(
-                self._server_address,
-                options=options,
-                compression=grpc.Compression.Gzip,
-            )
-        ) as channel:
-            yield channel
+    def _channel(self) -> Iterator[Tuple[grpc.Channel, bool]]:
+        """Yields a channel to the server, and whether it is a pooled channel that was opened by
+        an earlier request.
+        """
+        if self._use_channel_pool:
+            with get_grpc_channel_pool().get_channel(
+                self._server_address, self._ssl_creds
+            ) as channel_and_reused:
+                yield channel_and_reused
+        else:
+            with create_grpc_channel(self._server_address, self._ssl_creds) as channel:
+                yield channel, False
+
+    def _evict_unavailable_channel(self, channel: grpc.Channel, e: Exception) -> bool:
+        """Removes a pooled channel whose connection has failed, so that the next request opens a
+        new connection rather than waiting for the channel to reconnect. Returns whether the
+        channel was evicted.
+        """
+        if (
+            self._use_channel_pool
+            and isinstance(e, grpc.RpcError)
+            and e.code() == grpc.StatusCode.UNAVAILABLE  # type: ignore  # (bad stubs)
+        ):
+            get_grpc_channel_pool().evict(self._server_address, self._ssl_creds, channel)
+            return True
+        return False
+
+    def _compression(self, request: google.protobuf.message.Message) -> grpc.Compression:
+        return (
+            grpc.Compression.Gzip
+            if request.ByteSize() >= self._compression_min_bytes
+            else grpc.Compression.NoCompression
+        )
 
     def _get_response(
         self,
@@ -136,9 +177,30 @@ def _get_response(
         request: google.protobuf.message.Message,
         timeout: int = DEFAULT_GRPC_TIMEOUT,
     ):
-        with self._channel() as channel:
-            stub = DagsterApiStub(channel)
-            return getattr(stub, method)(request, metadata=self._metadata, timeout=timeout)
+        compression = self._compression(request)
+        with self._channel() as (channel, reused):
+            try:
+                return getattr(DagsterApiStub(channel), method)(
+                    request, metadata=self._metadata, timeout=timeout, compression=compression
+                )
+            except Exception as e:
+                # A reused channel may have been connected to a server that has since restarted,
+                # in which case the request is retried once on a new connection
+                if not (
+                    self._evict_unavailable_channel(channel, e)
+                    and reused
+                    and method in RETRYABLE_GRPC_METHODS
+                ):
+                    raise
+
+        with self._channel() as (channel, _):
+            try:
+                return getattr(DagsterApiStub(channel), method)(
+                    request, metadata=self._metadata, timeout=timeout, compression=compression
+                )
+            except Exception as e:
+                self._evict_unavailable_channel(channel, e)
+                raise
 
     def _raise_grpc_exception(
         self,
@@ -180,9 +242,17 @@ def _get_streaming_response(
         request: google.protobuf.message.Message,
         timeout: int = DEFAULT_GRPC_TIMEOUT,
     ) -> Iterator[Any]:
-        with self._channel() as channel:
-            stub = DagsterApiStub(channel)
-            yield from getattr(stub, method)(request, metadata=self._metadata, timeout=timeout)
+        with self._channel() as (channel, _):
+            try:
+                yield from getattr(DagsterApiStub(channel), method)(
+                    request,
+                    metadata=self._metadata,
+                    timeout=timeout,
+                    compression=self._compression(request),
+                )
+            except Exception as e:
+                self._evict_unavailable_channel(channel, e)
+                raise
 
     def _streaming_query(
         self,
@@ -380,6 +450,33 @@ def streaming_external_repository(
                 "serialized_external_repository_chunk": res.serialized_external_repository_chunk,
             }
 
+    def streaming_external_repository_delta(
+        self,
+        external_repository_origin: RemoteRepositoryOrigin,
+        known_entry_hashes: AbstractSet[str],
+        defer_snapshots: bool = False,
+        timeout=DEFAULT_REPOSITORY_GRPC_TIMEOUT,
+    ) -> Optional[str]:
+        """Returns the serialized delta of the repository snapshot, or None if the server is too old
+        to serve deltas.
+        """
+        try:
+            chunks = list(
+                self._streaming_query(
+                    "StreamingExternalRepositoryDelta",
+                    api_pb2.ExternalRepositoryDeltaRequest,
+                    serialized_repository_python_origin=serialize_value(external_repository_origin),
+                    defer_snapshots=defer_snapshots,
+                    known_entry_hashes=sorted(known_entry_hashes),
+                    timeout=timeout,
+                )
+            )
+        except Exception as e:
+            if self._is_unimplemented_error(e):
+                return None
+            raise
+        return "".join([chunk.serialized_chunk for chunk in chunks])
+
     def _is_unimplemented_error(self, e: Exception) -> bool:
         return (
             isinstance(e.__cause__, grpc.RpcError)
@@ -570,10 +667,14 @@ def get_current_runs(self) -> str:
 
     def health_check_query(self):
         try:
-            with self._channel() as channel:
-                response = HealthStub(channel).Check(
-                    health_pb2.HealthCheckRequest(service="DagsterApi")
-                )
+            with self._channel() as (channel, _):
+                try:
+                    response = HealthStub(channel).Check(
+                        health_pb2.HealthCheckRequest(service="DagsterApi")
+                    )
+                except grpc.RpcError as e:
+                    self._evict_unavailable_channel(channel, e)
+                    raise
         except grpc.RpcError as e:
             print(e)  # noqa: T201
             return health_pb2.HealthCheckResponse.UNKNOWN
@@ -220,6 +220,9 @@ def GetCurrentImage(self, request, context):
     def StreamingExternalRepository(self, request, context):
         return self._streaming_query("StreamingExternalRepository", request, context)
 
+    def StreamingExternalRepositoryDelta(self, request, context):
+        return self._streaming_query("StreamingExternalRepositoryDelta", request, context)
+
     def Heartbeat(self, request, context):
         return self._query("Heartbeat", request, context)
 
@@ -1,6 +1,5 @@
 import json
 import logging
-import math
 import multiprocessing
 import os
 import queue
@@ -36,7 +35,10 @@
 import dagster._seven as seven
 from dagster._core.code_pointer import CodePointer
 from dagster._core.definitions.reconstruct import ReconstructableRepository
-from dagster._core.definitions.repository_definition import RepositoryDefinition
+from dagster._core.definitions.repository_definition import (
+    CachingRepositoryData,
+    RepositoryDefinition,
+)
 from dagster._core.errors import (
     DagsterUserCodeLoadError,
     DagsterUserCodeUnreachableError,
@@ -54,6 +56,11 @@
     external_job_data_from_def,
     external_repository_data_from_def,
 )
+from dagster._core.remote_representation.external_data_delta import (
+    ExternalRepositoryManifest,
+    external_repository_data_delta,
+    external_repository_manifest_from_data,
+)
 from dagster._core.remote_representation.origin import RemoteRepositoryOrigin
 from dagster._core.types.loadable_target_origin import (
     LoadableTargetOrigin,
@@ -325,6 +332,20 @@ def _get_code_pointer(
         check.failed("Invalid loadable target origin")
 
 
+def _split_into_chunks(serialized_data: str) -> Iterator[str]:
+    for start_index in range(0, len(serialized_data), STREAMING_CHUNK_SIZE):
+        yield serialized_data[start_index : start_index + STREAMING_CHUNK_SIZE]
+
+
+def _has_static_definitions(repository_def: RepositoryDefinition) -> bool:
+    # A custom RepositoryData can return different definitions each time it is called, so its
+    # snapshot can't be cached for the lifetime of the server
+    return isinstance(
+        repository_def._repository_data,  # noqa: SLF001
+        CachingRepositoryData,
+    )
+
+
 class DagsterApiServer(DagsterApiServicer):
     # The loadable_target_origin is currently Noneable to support instaniating a server.
     # This helps us test the ping methods, and incrementally migrate each method to
@@ -379,6 +400,20 @@ def __init__(
 
         self._serializable_load_error = None
 
+        # Content-addressed manifests and serialized entries of the snapshot of each repository,
+        # keyed by repository name and value of defer_snapshots. The definitions loaded into a
+        # CachingRepositoryData do not change for the lifetime of the server, so their snapshot only
+        # needs to be computed once.
+        self._external_repository_manifests: Dict[
+            Tuple[str, bool], Tuple[ExternalRepositoryManifest, Mapping[str, str]]
+        ] = {}
+        # The full serialized snapshots, only cached for clients that do not request deltas
+        self._serialized_external_repository_data: Dict[Tuple[str, bool], str] = {}
+        # Snapshots are built under a lock per repository, so that building a slow snapshot for one
+        # repository does not block requests for the others
+        self._repository_snapshot_locks: Dict[Tuple[str, bool], threading.Lock] = {}
+        self._repository_snapshot_locks_lock = threading.Lock()
+
         self._entry_point = (
             check.sequence_param(entry_point, "entry_point", of_type=str)
             if entry_point is not None
@@ -761,6 +796,12 @@ def ExternalPipelineSubsetSnapshot(
             serialized_external_pipeline_subset_result=serialized_external_pipeline_subset_result
         )
 
+    def _get_repository_snapshot_lock(self, cache_key: Tuple[str, bool]) -> threading.Lock:
+        with self._repository_snapshot_locks_lock:
+            if cache_key not in self._repository_snapshot_locks:
+                self._repository_snapshot_locks[cache_key] = threading.Lock()
+            return self._repository_snapshot_locks[cache_key]
+
     def _get_serialized_external_repository_data(
         self, request: api_pb2.ExternalRepositoryRequest
     ) -> str:
@@ -769,13 +810,24 @@ def _get_serialized_external_repository_data(
                 request.serialized_repository_python_origin,
                 RemoteRepositoryOrigin,
             )
+            repository_def = self._get_repo_for_origin(repository_origin)
 
-            return serialize_value(
-                external_repository_data_from_def(
-                    self._get_repo_for_origin(repository_origin),
-                    defer_snapshots=request.defer_snapshots,
+            if not _has_static_definitions(repository_def):
+                return serialize_value(
+                    external_repository_data_from_def(
+                        repository_def, defer_snapshots=request.defer_snapshots
+                    )
                 )
-            )
+
+            cache_key = (repository_origin.repository_name, request.defer_snapshots)
+            with self._get_repository_snapshot_lock(cache_key):
+                if cache_key not in self._serialized_external_repository_data:
+                    self._serialized_external_repository_data[cache_key] = serialize_value(
+                        external_repository_data_from_def(
+                            repository_def, defer_snapshots=request.defer_snapshots
+                        )
+                    )
+                return self._serialized_external_repository_data[cache_key]
         except Exception:
             return serialize_value(
                 ExternalRepositoryErrorData(serializable_error_info_from_exc_info(sys.exc_info()))
@@ -814,41 +866,65 @@ def ExternalJob(
     def StreamingExternalRepository(
         self, request: api_pb2.ExternalRepositoryRequest, _context: grpc.ServicerContext
     ) -> Iterable[api_pb2.StreamingExternalRepositoryEvent]:
-        serialized_external_repository_data = self._get_serialized_external_repository_data(request)
-
-        num_chunks = int(
-            math.ceil(float(len(serialized_external_repository_data)) / STREAMING_CHUNK_SIZE)
-        )
+        for i, chunk in enumerate(
+            _split_into_chunks(self._get_serialized_external_repository_data(request))
+        ):
+            yield api_pb2.StreamingExternalRepositoryEvent(
+                sequence_number=i,
+                serialized_external_repository_chunk=chunk,
+            )
 
-        for i in range(num_chunks):
-            start_index = i * STREAMING_CHUNK_SIZE
-            end_index = min(
-                (i + 1) * STREAMING_CHUNK_SIZE,
-                len(serialized_external_repository_data),
+    def _get_serialized_external_repository_delta(
+        self, request: api_pb2.ExternalRepositoryDeltaRequest
+    ) -> str:
+        try:
+            repository_origin = deserialize_value(
+                request.serialized_repository_python_origin,
+                RemoteRepositoryOrigin,
             )
+            repository_def = self._get_repo_for_origin(repository_origin)
+
+            if _has_static_definitions(repository_def):
+                cache_key = (repository_origin.repository_name, request.defer_snapshots)
+                with self._get_repository_snapshot_lock(cache_key):
+                    if cache_key not in self._external_repository_manifests:
+                        self._external_repository_manifests[cache_key] = (
+                            external_repository_manifest_from_data(
+                                external_repository_data_from_def(
+                                    repository_def, defer_snapshots=request.defer_snapshots
+                                )
+                            )
+                        )
+                    manifest, serialized_entries = self._external_repository_manifests[cache_key]
+            else:
+                manifest, serialized_entries = external_repository_manifest_from_data(
+                    external_repository_data_from_def(
+                        repository_def, defer_snapshots=request.defer_snapshots
+                    )
+                )
 
-            yield api_pb2.StreamingExternalRepositoryEvent(
-                sequence_number=i,
-                serialized_external_repository_chunk=serialized_external_repository_data[
-                    start_index:end_index
-                ],
+            return serialize_value(
+                external_repository_data_delta(
+                    manifest, serialized_entries, set(request.known_entry_hashes)
+                )
+            )
+        except Exception:
+            return serialize_value(
+                ExternalRepositoryErrorData(serializable_error_info_from_exc_info(sys.exc_info()))
             )
 
+    def StreamingExternalRepositoryDelta(
+        self, request: api_pb2.ExternalRepositoryDeltaRequest, _context: grpc.ServicerContext
+    ) -> Iterable[api_pb2.StreamingChunkEvent]:
+        yield from self._split_serialized_data_into_chunk_events(
+            self._get_serialized_external_repository_delta(request)
+        )
+
     def _split_serialized_data_into_chunk_events(
         self, serialized_data: str
     ) -> Iterable[api_pb2.StreamingChunkEvent]:
-        num_chunks = int(math.ceil(float(len(serialized_data)) / STREAMING_CHUNK_SIZE))
-        for i in range(num_chunks):
-            start_index = i * STREAMING_CHUNK_SIZE
-            end_index = min(
-                (i + 1) * STREAMING_CHUNK_SIZE,
-                len(serialized_data),
-            )
-
-            yield api_pb2.StreamingChunkEvent(
-                sequence_number=i,
-                serialized_chunk=serialized_data[start_index:end_index],
-            )
+        for i, chunk in enumerate(_split_into_chunks(serialized_data)):
+            yield api_pb2.StreamingChunkEvent(sequence_number=i, serialized_chunk=chunk)
 
     def ExternalScheduleExecution(
         self, request: api_pb2.ExternalScheduleExecutionRequest, _context: grpc.ServicerContext
@@ -128,3 +128,37 @@ def default_grpc_server_shutdown_grace_period():
     return max(
         default_grpc_timeout(), default_schedule_grpc_timeout(), default_sensor_grpc_timeout()
     )
+
+
+def grpc_channel_pooling_enabled() -> bool:
+    # Set DAGSTER_GRPC_DISABLE_CHANNEL_POOLING to open a new channel for every request
+    return not os.getenv("DAGSTER_GRPC_DISABLE_CHANNEL_POOLING")
+
+
+def grpc_keepalive_time_ms() -> int:
+    env_set = os.getenv("DAGSTER_GRPC_KEEPALIVE_TIME_MS")
+    if env_set:
+        return int(env_set)
+
+    # default 5 minutes, the minimum ping interval that gRPC servers accept by default
+    return 5 * 60 * 1000
+
+
+def grpc_keepalive_timeout_ms() -> int:
+    env_set = os.getenv("DAGSTER_GRPC_KEEPALIVE_TIMEOUT_MS")
+    if env_set:
+        return int(env_set)
+
+    # default 20 seconds
+    return 20 * 1000
+
+
+def grpc_compression_min_bytes() -> int:
+    # Requests smaller than this are sent uncompressed, since gzip costs more than it saves on
+    # small payloads like pings and sensor ticks. Set to 0 to compress every request.
+    env_set = os.getenv("DAGSTER_GRPC_COMPRESSION_MIN_BYTES")
+    if env_set:
+        return int(env_set)
+
+    # default 1 KB
+    return 1024
@@ -1,3 +1,7 @@
+from .binary import (
+    deserialize_value_from_bytes as deserialize_value_from_bytes,
+    serialize_value_to_bytes as serialize_value_to_bytes,
+)
 from .config_class import (
     ConfigurableClass as ConfigurableClass,
     ConfigurableClassData as ConfigurableClassData,
@@ -9,6 +13,7 @@
     SerializableNonScalarKeyMapping as SerializableNonScalarKeyMapping,
     WhitelistMap as WhitelistMap,
     deserialize_value as deserialize_value,
+    get_packed_field as get_packed_field,
     pack_value as pack_value,
     serialize_value as serialize_value,
     unpack_value as unpack_value,
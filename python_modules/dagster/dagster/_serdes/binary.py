@@ -0,0 +1,193 @@
+"""Binary encoding for serdes values.
+
+`serialize_value_to_bytes` and `deserialize_value_from_bytes` serialize the same `WhitelistMap`
+object model as `serialize_value` and `deserialize_value`, for callers that store or transfer
+bytes. By default the bytes are the utf-8 encoded JSON text produced by `serialize_value`.
+
+Setting the `DAGSTER_SERDES_MSGPACK` environment variable to `1` writes values in msgpack
+instead, which requires the optional `msgpack` package. Values are packed with
+`_transform_for_serialization` exactly as they are for JSON, and each decoded map is handed to the
+same `_unpack_object` hook that `json.loads` uses, so unknown classes and enums, old storage
+names, old fields and `UnknownSerdesValue` handling behave identically in both formats. msgpack
+payloads start with MAGIC and a format version byte, which can never begin JSON text, so
+`deserialize_value_from_bytes` reads both formats regardless of the environment variable and the
+variable can be turned on once every reader has msgpack installed.
+"""
+
+import os
+from functools import partial
+from typing import Any, NamedTuple, Optional, Tuple, Type, Union, overload
+
+import dagster._check as check
+import dagster._seven as seven
+from dagster._utils import is_named_tuple_instance
+from dagster._utils.warnings import disable_dagster_warnings
+
+from .errors import DeserializationError, SerializationError
+from .serdes import (
+    _WHITELIST_MAP,
+    PackableValue,
+    T_PackableValue,
+    U_PackableValue,
+    UnpackContext,
+    UnpackedValue,
+    WhitelistMap,
+    _pack_object,
+    _root,
+    _transform_for_serialization,
+    _unpack_object,
+    deserialize_value,
+    serialize_value,
+)
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+MAGIC = b"DSB"
+FORMAT_VERSION = 1
+
+# msgpack ext type code for integers outside of the 64 bit range that msgpack supports natively
+_EXT_TYPE_BIG_INT = 0
+
+
+def _should_serialize_msgpack() -> bool:
+    return os.getenv("DAGSTER_SERDES_MSGPACK") == "1"
+
+
+###################################################################################################
+# Serialize
+###################################################################################################
+
+
+def serialize_value_to_bytes(
+    val: PackableValue,
+    whitelist_map: WhitelistMap = _WHITELIST_MAP,
+) -> bytes:
+    """Serialize an object to bytes, as msgpack if DAGSTER_SERDES_MSGPACK is set to 1 and as utf-8
+    encoded JSON otherwise.
+    """
+    if not _should_serialize_msgpack():
+        return serialize_value(val, whitelist_map).encode("utf-8")
+
+    if msgpack is None:
+        raise SerializationError(
+            "DAGSTER_SERDES_MSGPACK is set, but the msgpack package is not installed."
+        )
+
+    packed = _transform_for_serialization(
+        val,
+        whitelist_map=whitelist_map,
+        object_handler=_pack_object,
+        descent_path=_root(val),
+    )
+    return (
+        MAGIC
+        + bytes([FORMAT_VERSION])
+        + msgpack.packb(
+            packed, default=_pack_big_int, use_bin_type=True, unicode_errors="surrogatepass"
+        )
+    )
+
+
+def _pack_big_int(val: Any) -> Any:
+    if isinstance(val, int):
+        return msgpack.ExtType(_EXT_TYPE_BIG_INT, str(val).encode("ascii"))
+    raise TypeError(f"Can not serialize {type(val).__name__}")
+
+
+###################################################################################################
+# Deserialize
+###################################################################################################
+
+
+@overload
+def deserialize_value_from_bytes(
+    val: bytes,
+    as_type: Tuple[Type[T_PackableValue], Type[U_PackableValue]],
+    whitelist_map: WhitelistMap = ...,
+) -> Union[T_PackableValue, U_PackableValue]: ...
+
+
+@overload
+def deserialize_value_from_bytes(
+    val: bytes,
+    as_type: Type[T_PackableValue],
+    whitelist_map: WhitelistMap = ...,
+) -> T_PackableValue: ...
+
+
+@overload
+def deserialize_value_from_bytes(
+    val: bytes,
+    as_type: None = ...,
+    whitelist_map: WhitelistMap = ...,
+) -> PackableValue: ...
+
+
+def deserialize_value_from_bytes(
+    val: bytes,
+    as_type: Optional[
+        Union[Type[T_PackableValue], Tuple[Type[T_PackableValue], Type[U_PackableValue]]]
+    ] = None,
+    whitelist_map: WhitelistMap = _WHITELIST_MAP,
+) -> Union[PackableValue, T_PackableValue, Union[T_PackableValue, U_PackableValue]]:
+    """Deserialize bytes written by `serialize_value_to_bytes` in either format to a Python
+    object, optionally checking that it is of the expected type.
+    """
+    check.inst_param(val, "val", bytes)
+
+    if not val.startswith(MAGIC):
+        return deserialize_value(val.decode("utf-8"), as_type, whitelist_map)
+
+    if msgpack is None:
+        raise DeserializationError(
+            "Value was serialized with msgpack, but the msgpack package is not installed."
+        )
+
+    version = val[len(MAGIC) : len(MAGIC) + 1]
+    if version != bytes([FORMAT_VERSION]):
+        raise DeserializationError(f"Unsupported serdes msgpack format version {version!r}")
+
+    # Never issue warnings when deserializing deprecated objects.
+    with disable_dagster_warnings():
+        context = UnpackContext()
+        unpacked_value = msgpack.unpackb(
+            val[len(MAGIC) + 1 :],
+            object_hook=partial(_unpack_map, whitelist_map=whitelist_map, context=context),
+            ext_hook=_unpack_ext,
+            raw=False,
+            strict_map_key=False,
+            unicode_errors="surrogatepass",
+        )
+        unpacked_value = context.finalize_unpack(unpacked_value)
+        if as_type and not (
+            is_named_tuple_instance(unpacked_value)
+            if as_type is NamedTuple
+            else isinstance(unpacked_value, as_type)
+        ):
+            raise DeserializationError(
+                f"Deserialized object was not expected type {as_type}, got {type(unpacked_value)}"
+            )
+
+    return unpacked_value
+
+
+def _unpack_map(val: dict, whitelist_map: WhitelistMap, context: UnpackContext) -> UnpackedValue:
+    # json.dumps writes int, float, bool and None keys as strings, so coerce them the same way to
+    # unpack identically to the JSON path
+    for key in val:
+        if key.__class__ is not str:
+            val = {
+                key if isinstance(key, str) else seven.json.dumps(key): value
+                for key, value in val.items()
+            }
+            break
+    return _unpack_object(val, whitelist_map, context)
+
+
+def _unpack_ext(code: int, data: bytes) -> Any:
+    if code == _EXT_TYPE_BIG_INT:
+        return int(data)
+    raise DeserializationError(f"Unknown msgpack ext type {code}")
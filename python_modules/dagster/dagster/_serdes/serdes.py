@@ -1185,6 +1185,21 @@ def _unpack_value(
     return val
 
 
+def get_packed_field(
+    packed: Mapping[str, Any],
+    field_name: str,
+    whitelist_map: WhitelistMap = _WHITELIST_MAP,
+) -> Any:
+    """Read a single field from the packed form of an object without unpacking the object.
+
+    Accounts for fields that are stored under a different name and for objects that were stored
+    under an old class name. Returns None if the field is not present.
+    """
+    serializer = whitelist_map.object_deserializers.get(packed.get("__class__", ""))
+    storage_name = serializer.storage_field_names.get(field_name) if serializer else None
+    return packed.get(storage_name or field_name)
+
+
 ###################################################################################################
 # Validation
 ###################################################################################################
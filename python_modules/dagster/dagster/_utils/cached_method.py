@@ -1,4 +1,5 @@
 from functools import wraps
+from threading import Lock
 from typing import Callable, Hashable, Mapping, Tuple, TypeVar
 
 from typing_extensions import Concatenate, ParamSpec
@@ -15,6 +16,10 @@
 
 CACHED_METHOD_CACHE_FIELD = "_cached_method_cache__internal__"
 
+# Guards the creation of the per-instance cache, so that two threads calling a cached method on the
+# same object for the first time cannot each install a cache and lose the other's entries.
+_CACHE_INIT_LOCK = Lock()
+
 
 def cached_method(method: Callable[Concatenate[S, P], T]) -> Callable[Concatenate[S, P], T]:
     """Caches the results of a method call.
@@ -65,14 +70,16 @@ def a_method(self, arg1, arg2):
 
     @wraps(method)
     def _cached_method_wrapper(self: S, *args: P.args, **kwargs: P.kwargs) -> T:
-        if not hasattr(self, CACHED_METHOD_CACHE_FIELD):
-            setattr(self, CACHED_METHOD_CACHE_FIELD, {})
-
-        cache_dict = getattr(self, CACHED_METHOD_CACHE_FIELD)
-        if method.__name__ not in cache_dict:
-            cache_dict[method.__name__] = {}
-
-        cache = cache_dict[method.__name__]
+        cache_dict = getattr(self, CACHED_METHOD_CACHE_FIELD, None)
+        if cache_dict is None:
+            with _CACHE_INIT_LOCK:
+                if not hasattr(self, CACHED_METHOD_CACHE_FIELD):
+                    setattr(self, CACHED_METHOD_CACHE_FIELD, {})
+            cache_dict = getattr(self, CACHED_METHOD_CACHE_FIELD)
+
+        cache = cache_dict.get(method.__name__)
+        if cache is None:
+            cache = cache_dict.setdefault(method.__name__, {})
 
         canonical_kwargs = None
         if args:
@@ -1,11 +1,15 @@
 import logging
+import threading
 from collections import defaultdict
+from contextlib import contextmanager
 from datetime import datetime
 from typing import (
     TYPE_CHECKING,
     AbstractSet,
     Dict,
     Iterable,
+    Iterator,
+    List,
     Mapping,
     Optional,
     Sequence,
@@ -49,6 +53,7 @@
     DagsterRun,
     DagsterRunStatus,
     RunRecord,
+    RunsFilter,
 )
 from dagster._core.storage.tags import PARTITION_NAME_TAG
 from dagster._utils.cached_method import cached_method
@@ -64,7 +69,8 @@
 class CachingInstanceQueryer(DynamicPartitionsStore):
     """Provides utility functions for querying for asset-materialization related data from the
     instance which will attempt to limit redundant expensive calls. Intended for use within the
-    scope of a single "request" (e.g. GQL request, sensor tick).
+    scope of a single "request" (e.g. GQL request, sensor tick). May be shared between the threads
+    of a single request; concurrent cache misses for the same data may each query the instance.
 
     Args:
         instance (DagsterInstance): The instance to query.
@@ -81,7 +87,14 @@ def __init__(
         self._asset_graph = asset_graph
         self._logger = logger or logging.getLogger("dagster")
 
-        self._batch_asset_record_loader = BatchAssetRecordLoader(self._instance, set())
+        self._batch_asset_record_loader = BatchAssetRecordLoader(
+            self._instance, set(), on_fetch=lambda: self._record_query("get_asset_records")
+        )
+        self._latest_storage_ids_by_partition_cache: Dict[AssetKey, Mapping[str, int]] = {}
+        self._prefetched_run_records_by_id: Dict[str, Optional[RunRecord]] = {}
+        self._query_counts: Dict[str, int] = defaultdict(int)
+        self._query_counts_lock = threading.Lock()
+        self._thread_local = threading.local()
 
         self._asset_partitions_cache: Dict[Optional[int], Dict[AssetKey, Set[str]]] = defaultdict(
             dict
@@ -114,11 +127,97 @@ def evaluation_time(self) -> datetime:
     # QUERY BATCHING
     ####################
 
+    @property
+    def query_counts(self) -> Mapping[str, int]:
+        """The number of queries issued to the instance by this queryer, keyed by query type."""
+        with self._query_counts_lock:
+            return dict(self._query_counts)
+
+    @property
+    def total_query_count(self) -> int:
+        return sum(self.query_counts.values())
+
+    @contextmanager
+    def count_queries(self) -> Iterator[Mapping[str, int]]:
+        """Yields a mapping which counts the queries issued by this queryer on the current thread
+        while the context is open, keyed by query type.
+        """
+        query_counts: Dict[str, int] = defaultdict(int)
+        active_query_counts = getattr(self._thread_local, "active_query_counts", [])
+        self._thread_local.active_query_counts = [*active_query_counts, query_counts]
+        try:
+            yield query_counts
+        finally:
+            self._thread_local.active_query_counts = active_query_counts
+
+    def _record_query(self, query_type: str) -> None:
+        with self._query_counts_lock:
+            self._query_counts[query_type] += 1
+        for query_counts in getattr(self._thread_local, "active_query_counts", []):
+            query_counts[query_type] += 1
+
     def prefetch_asset_records(self, asset_keys: Iterable[AssetKey]):
         """For performance, batches together queries for selected assets."""
         self._batch_asset_record_loader.add_asset_keys(asset_keys)
         self._batch_asset_record_loader.fetch()
 
+    def prefetch_for_asset_keys(
+        self,
+        asset_keys: Iterable[AssetKey],
+        run_record_asset_keys: Iterable[AssetKey] = (),
+    ) -> None:
+        """For performance, fetches everything that evaluating the given assets will need in a
+        small number of bulk queries, rather than one or more queries per asset: their asset
+        records, the latest storage id of each partition of the partitioned assets, and, for the
+        assets in run_record_asset_keys, the latest run that targeted them. Data that has already
+        been fetched is not fetched again.
+        """
+        asset_keys = [asset_key for asset_key in asset_keys if self.asset_graph.has(asset_key)]
+        self.prefetch_asset_records(asset_keys)
+
+        partitioned_asset_keys_by_event_type: Dict[DagsterEventType, List[AssetKey]] = defaultdict(
+            list
+        )
+        for asset_key in asset_keys:
+            if (
+                self.asset_graph.get(asset_key).is_partitioned
+                and asset_key not in self._latest_storage_ids_by_partition_cache
+            ):
+                partitioned_asset_keys_by_event_type[self._event_type_for_key(asset_key)].append(
+                    asset_key
+                )
+        for event_type, partitioned_asset_keys in partitioned_asset_keys_by_event_type.items():
+            self._record_query("get_latest_storage_ids_by_partition")
+            self._latest_storage_ids_by_partition_cache.update(
+                self.instance.get_latest_storage_ids_by_partition(
+                    partitioned_asset_keys, event_type=event_type
+                )
+            )
+
+        run_ids = set()
+        for asset_key in run_record_asset_keys:
+            if not self.asset_graph.has(asset_key):
+                continue
+            asset_record = self.get_asset_record(asset_key)
+            if asset_record is not None and asset_record.asset_entry.last_run_id:
+                run_ids.add(asset_record.asset_entry.last_run_id)
+        self.prefetch_run_records(run_ids)
+
+    def prefetch_run_records(self, run_ids: Iterable[str]) -> None:
+        """For performance, batches together queries for the selected runs."""
+        run_ids = [
+            run_id for run_id in set(run_ids) if run_id not in self._prefetched_run_records_by_id
+        ]
+        if not run_ids:
+            return
+
+        self._record_query("get_run_records")
+        run_records = self.instance.get_run_records(RunsFilter(run_ids=run_ids))
+        self._prefetched_run_records_by_id.update({run_id: None for run_id in run_ids})
+        self._prefetched_run_records_by_id.update(
+            {run_record.dagster_run.run_id: run_record for run_record in run_records}
+        )
+
     ####################
     # ASSET STATUS CACHE
     ####################
@@ -131,6 +230,7 @@ def _get_updated_cache_value(self, *, asset_key: AssetKey) -> Optional["AssetSta
 
         partitions_def = check.not_none(self.asset_graph.get(asset_key).partitions_def)
         self._batch_asset_record_loader.add_asset_keys([asset_key])
+        self._record_query("get_and_update_asset_status_cache_value")
         return get_and_update_asset_status_cache_value(
             instance=self.instance,
             asset_key=asset_key,
@@ -185,14 +285,8 @@ def get_in_progress_asset_subset(self, *, asset_key: AssetKey) -> ValidAssetSubs
             # be launched, and then run B completes before run A. In these cases, the computation
             # below will consider the asset to not be in progress, as the latest planned event
             # will be associated with a completed run.
-            planned_materialization_info = (
-                self.instance.event_log_storage.get_latest_planned_materialization_info(asset_key)
-            )
-            if not planned_materialization_info:
-                value = False
-            else:
-                dagster_run = self.instance.get_run_by_id(planned_materialization_info.run_id)
-                value = dagster_run is not None and dagster_run.status in IN_PROGRESS_RUN_STATUSES
+            dagster_run = self._get_latest_planned_materialization_run(asset_key=asset_key)
+            value = dagster_run is not None and dagster_run.status in IN_PROGRESS_RUN_STATUSES
 
         return ValidAssetSubset(asset_key=asset_key, value=value)
 
@@ -210,18 +304,26 @@ def get_failed_asset_subset(self, *, asset_key: AssetKey) -> ValidAssetSubset:
                 value = cache_value.deserialize_failed_partition_subsets(partitions_def)
         else:
             # ideally, unpartitioned assets would also be handled by the asset status cache
-            planned_materialization_info = (
-                self.instance.event_log_storage.get_latest_planned_materialization_info(asset_key)
-            )
-            if not planned_materialization_info:
-                value = False
-            else:
-                dagster_run = self.instance.get_run_by_id(planned_materialization_info.run_id)
-
-                value = dagster_run is not None and dagster_run.status == DagsterRunStatus.FAILURE
+            dagster_run = self._get_latest_planned_materialization_run(asset_key=asset_key)
+            value = dagster_run is not None and dagster_run.status == DagsterRunStatus.FAILURE
 
         return ValidAssetSubset(asset_key=asset_key, value=value)
 
+    @cached_method
+    def _get_latest_planned_materialization_run(
+        self, *, asset_key: AssetKey
+    ) -> Optional[DagsterRun]:
+        """Returns the run of the latest planned materialization of the given unpartitioned asset,
+        shared between the in progress and failed subset computations.
+        """
+        self._record_query("get_latest_planned_materialization_info")
+        planned_materialization_info = (
+            self.instance.event_log_storage.get_latest_planned_materialization_info(asset_key)
+        )
+        if not planned_materialization_info:
+            return None
+        return self._get_run_by_id(planned_materialization_info.run_id)
+
     ####################
     # ASSET RECORDS / STORAGE IDS
     ####################
@@ -260,6 +362,15 @@ def _get_latest_materialization_or_observation_record(
             if asset_record is None:
                 return None
             return asset_record.asset_entry.last_materialization_record
+        elif (
+            before_cursor is None
+            and asset_partition.partition_key is None
+            and self.instance.event_log_storage.asset_records_have_last_observation
+        ):
+            asset_record = self.get_asset_record(asset_partition.asset_key)
+            if asset_record is None:
+                return None
+            return asset_record.asset_entry.last_observation_record
 
         records_filter = AssetRecordsFilter(
             asset_key=asset_partition.asset_key,
@@ -269,10 +380,12 @@ def _get_latest_materialization_or_observation_record(
             before_storage_id=before_cursor,
         )
         if self.asset_graph.get(asset_partition.asset_key).is_observable:
+            self._record_query("fetch_observations")
             records = self.instance.fetch_observations(
                 records_filter, ascending=False, limit=1
             ).records
         else:
+            self._record_query("fetch_materializations")
             records = self.instance.fetch_materializations(
                 records_filter, ascending=False, limit=1
             ).records
@@ -296,12 +409,19 @@ def _get_latest_materialization_or_observation_storage_ids_by_asset_partition(
             asset_partition: latest_record.storage_id if latest_record is not None else None
         }
         if self.asset_graph.get(asset_key).is_partitioned:
+            if asset_key not in self._latest_storage_ids_by_partition_cache:
+                self._record_query("get_latest_storage_id_by_partition")
+                self._latest_storage_ids_by_partition_cache[asset_key] = (
+                    self.instance.get_latest_storage_id_by_partition(
+                        asset_key, event_type=self._event_type_for_key(asset_key)
+                    )
+                )
             latest_storage_ids.update(
                 {
                     AssetKeyPartitionKey(asset_key, partition_key): storage_id
-                    for partition_key, storage_id in self.instance.get_latest_storage_id_by_partition(
-                        asset_key, event_type=self._event_type_for_key(asset_key)
-                    ).items()
+                    for partition_key, storage_id in self._latest_storage_ids_by_partition_cache[
+                        asset_key
+                    ].items()
                 }
             )
         return latest_storage_ids
@@ -408,6 +528,7 @@ def next_version_record(
         has_more = True
         cursor = None
         while has_more:
+            self._record_query("fetch_observations")
             result = self.instance.fetch_observations(
                 AssetRecordsFilter(asset_key=asset_key, after_storage_id=after_cursor),
                 limit=RECORD_BATCH_SIZE,
@@ -430,6 +551,9 @@ def next_version_record(
 
     @cached_method
     def _get_run_record_by_id(self, *, run_id: str) -> Optional[RunRecord]:
+        if run_id in self._prefetched_run_records_by_id:
+            return self._prefetched_run_records_by_id[run_id]
+        self._record_query("get_run_record_by_id")
         return self.instance.get_run_record_by_id(run_id)
 
     def _get_run_by_id(self, run_id: str) -> Optional[DagsterRun]:
@@ -461,6 +585,7 @@ def _get_planned_materializations_for_run_from_events(
         Args:
             run_id (str): The run id
         """
+        self._record_query("get_records_for_run")
         materializations_planned = self.instance.get_records_for_run(
             run_id=run_id, of_type=DagsterEventType.ASSET_MATERIALIZATION_PLANNED
         ).records
@@ -505,6 +630,7 @@ def get_current_materializations_for_run(self, *, run_id: str) -> AbstractSet[As
         Args:
             run_id (str): The run id
         """
+        self._record_query("get_records_for_run")
         materializations = self.instance.get_records_for_run(
             run_id=run_id,
             of_type=DagsterEventType.ASSET_MATERIALIZATION,
@@ -522,6 +648,7 @@ def get_active_backfill_target_asset_graph_subset(self) -> AssetGraphSubset:
         """
         from dagster._core.execution.backfill import BulkActionStatus
 
+        self._record_query("get_backfills")
         asset_backfills = [
             backfill
             for backfill in self.instance.get_backfills(status=BulkActionStatus.REQUESTED)
@@ -562,6 +689,7 @@ def get_materialized_partitions(
             before_cursor not in self._asset_partitions_cache
             or asset_key not in self._asset_partitions_cache[before_cursor]
         ):
+            self._record_query("get_materialized_partitions")
             self._asset_partitions_cache[before_cursor][asset_key] = (
                 self.instance.get_materialized_partitions(
                     asset_key=asset_key, before_cursor=before_cursor
@@ -577,6 +705,7 @@ def get_materialized_partitions(
     def get_dynamic_partitions(self, partitions_def_name: str) -> Sequence[str]:
         """Returns a list of partitions for a partitions definition."""
         if partitions_def_name not in self._dynamic_partitions_cache:
+            self._record_query("get_dynamic_partitions")
             self._dynamic_partitions_cache[partitions_def_name] = (
                 self.instance.get_dynamic_partitions(partitions_def_name)
             )
@@ -768,6 +897,7 @@ def _asset_partitions_data_versions(
                 else {}
             )
         else:
+            self._record_query("get_latest_tags_by_partition")
             query_result = self.instance._event_storage.get_latest_tags_by_partition(  # noqa
                 asset_key,
                 event_type=self._event_type_for_key(asset_key),
@@ -923,11 +1053,12 @@ def get_asset_subset_updated_after_time(
         """Returns the AssetSubset of the given asset that has been updated after the given time."""
         partitions_def = self.asset_graph.get(asset_key).partitions_def
 
-        method = (
-            self.instance.fetch_materializations
-            if self._event_type_for_key(asset_key) == DagsterEventType.ASSET_MATERIALIZATION
-            else self.instance.fetch_observations
-        )
+        if self._event_type_for_key(asset_key) == DagsterEventType.ASSET_MATERIALIZATION:
+            method = self.instance.fetch_materializations
+            self._record_query("fetch_materializations")
+        else:
+            method = self.instance.fetch_observations
+            self._record_query("fetch_observations")
         first_event_after_time = next(
             iter(
                 method(
@@ -10,7 +10,7 @@ def get_fixed_minute_interval(cron_schedule: str):
     """Given a cronstring, returns whether or not it is safe to
     assume there is a fixed number of minutes between every tick. For
     many cronstrings this is not the case due to Daylight Savings Time,
-    but for basic hourly cron schedules and cron schedules like */15 it
+    but for hourly cron schedules and cron schedules like */15 it
     is safe to assume that there are a fixed number of minutes between each
     tick.
     """
@@ -18,25 +18,38 @@ def get_fixed_minute_interval(cron_schedule: str):
         return 60
 
     cron_parts = cron_schedule.split()
-    is_wildcard = [part == "*" for part in cron_parts]
 
-    # To match this criteria, every other field besides the first must end in *
-    # since it must be an every-n-minutes cronstring like */15
-    if not is_wildcard[1:]:
+    # To match this criteria, every other field besides the first must be *
+    # since it must be an hourly or every-n-minutes cronstring like */15
+    if len(cron_parts) != 5 or not all(part == "*" for part in cron_parts[1:]):
         return None
 
-    if not cron_parts[0].startswith("*/"):
+    minute_part = cron_parts[0]
+    if minute_part.startswith("*/"):
+        try:
+            # interval makes up the characters after the "*/"
+            interval = int(minute_part[2:])
+        except ValueError:
+            return None
+
+        # cronstrings like */7 do not have a fixed interval because they jump
+        # from :54 to :07, but divisors of 60 do
+        if interval > 0 and interval < 60 and 60 % interval == 0:
+            return interval
         return None
 
+    # cronstrings like 15 * * * * or 0,30 * * * * have a fixed interval if the listed minutes are
+    # evenly spaced around the hour
     try:
-        # interval makes up the characters after the "*/"
-        interval = int(cron_parts[0][2:])
+        minutes = sorted(int(minute) for minute in minute_part.split(","))
     except ValueError:
         return None
 
-    # cronstrings like */7 do not have a fixed interval because they jump
-    # from :54 to :07, but divisors of 60 do
-    if interval > 0 and interval < 60 and 60 % interval == 0:
-        return interval
+    if not minutes or minutes[0] < 0 or minutes[-1] >= 60 or 60 % len(minutes) != 0:
+        return None
+
+    interval = 60 // len(minutes)
+    if any(minutes[i + 1] - minutes[i] != interval for i in range(len(minutes) - 1)):
+        return None
 
-    return None
+    return interval
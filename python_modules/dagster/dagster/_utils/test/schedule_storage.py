@@ -965,3 +965,54 @@ def test_purge_asset_evaluations(self, storage) -> None:
             asset_key=AssetKey("asset_one"), limit=100
         )
         assert len(res) == 0
+
+    def test_instigator_leases(self, storage) -> None:
+        if not storage.supports_instigator_leases:
+            pytest.skip("Storage does not support instigator leases")
+
+        # expiration times come from the clock of the storage, so the lease is given a short
+        # duration and left to expire rather than freezing the time
+        lease_duration_seconds = 2
+        start_time = time.time()
+        assert storage.acquire_instigator_lease("sensors/foo", "worker_a", lease_duration_seconds)
+        # the lease is held by another owner
+        assert not storage.acquire_instigator_lease("sensors/foo", "worker_b", 60)
+        # the owner can renew it
+        assert storage.acquire_instigator_lease("sensors/foo", "worker_a", lease_duration_seconds)
+        assert storage.acquire_instigator_lease("sensors/bar", "worker_b", 60)
+        assert storage.acquire_instigator_lease("workers/worker_a", "worker_a", 60)
+
+        leases = storage.get_instigator_leases()
+        assert [(lease.lease_key, lease.owner_id) for lease in leases] == [
+            ("sensors/bar", "worker_b"),
+            ("sensors/foo", "worker_a"),
+            ("workers/worker_a", "worker_a"),
+        ]
+        assert leases[0].expiration_timestamp == pytest.approx(start_time + 60, abs=5)
+        assert [lease.lease_key for lease in storage.get_instigator_leases("sensors/")] == [
+            "sensors/bar",
+            "sensors/foo",
+        ]
+
+        # releasing a lease held by another owner has no effect
+        storage.release_instigator_lease("sensors/foo", "worker_b")
+        assert not storage.acquire_instigator_lease("sensors/foo", "worker_b", 60)
+
+        # the lease has expired, so can be taken over
+        time.sleep(lease_duration_seconds + 0.5)
+        assert [lease.lease_key for lease in storage.get_instigator_leases("sensors/")] == [
+            "sensors/bar",
+            "sensors/foo",
+        ]
+        assert [
+            lease.lease_key
+            for lease in storage.get_instigator_leases("sensors/", include_expired=False)
+        ] == ["sensors/bar"]
+        assert storage.acquire_instigator_lease("sensors/foo", "worker_b", 60)
+        assert not storage.acquire_instigator_lease("sensors/foo", "worker_a", 60)
+
+        storage.release_instigator_lease("sensors/foo", "worker_b")
+        assert storage.acquire_instigator_lease("sensors/foo", "worker_a", 60)
+        assert [lease.owner_id for lease in storage.get_instigator_leases("sensors/foo")] == [
+            "worker_a"
+        ]
@@ -1,8 +1,11 @@
+import logging
 import sys
+import threading
 from contextlib import contextmanager
+from unittest import mock
 
 import pytest
-from dagster import IntMetadataValue, TextMetadataValue, job, op, repository
+from dagster import IntMetadataValue, TextMetadataValue, file_relative_path, job, op, repository
 from dagster._api.snapshot_repository import (
     sync_get_streaming_external_repositories_data_grpc,
 )
@@ -14,11 +17,20 @@
 )
 from dagster._core.remote_representation.external import ExternalRepository
 from dagster._core.remote_representation.external_data import ExternalJobData
+from dagster._core.remote_representation.external_data_delta import (
+    CONTENT_ADDRESSED_FIELDS,
+    MANIFEST_FIELDS,
+    ExternalRepositoryDataDelta,
+    RepositorySnapshotCache,
+)
 from dagster._core.remote_representation.handle import RepositoryHandle
 from dagster._core.remote_representation.origin import RemoteRepositoryOrigin
 from dagster._core.test_utils import instance_for_test
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
-from dagster._serdes.serdes import deserialize_value
+from dagster._core.utils import FuturesAwareThreadPoolExecutor
+from dagster._grpc import server as grpc_server
+from dagster._grpc.__generated__ import api_pb2
+from dagster._serdes.serdes import deserialize_value, serialize_value
 
 from .utils import get_bar_repo_code_location
 
@@ -41,6 +53,73 @@ def test_streaming_external_repositories_api_grpc(instance):
         }
 
 
+def test_streaming_external_repositories_delta_api_grpc(instance):
+    with get_bar_repo_code_location(instance) as code_location:
+        full_repo_data = sync_get_streaming_external_repositories_data_grpc(
+            code_location.client, code_location
+        )["bar_repo"]
+
+        snapshot_cache = RepositorySnapshotCache()
+        assert not snapshot_cache.known_entry_hashes
+        repo_data = sync_get_streaming_external_repositories_data_grpc(
+            code_location.client, code_location, snapshot_cache=snapshot_cache
+        )["bar_repo"]
+        assert repo_data == full_repo_data
+        known_entry_hashes = snapshot_cache.known_entry_hashes
+        assert len(known_entry_hashes) > 0
+
+        # once every entry is cached, the server only sends the manifest
+        delta = deserialize_value(
+            code_location.client.streaming_external_repository_delta(
+                external_repository_origin=RemoteRepositoryOrigin(code_location.origin, "bar_repo"),
+                known_entry_hashes=known_entry_hashes,
+            ),
+            ExternalRepositoryDataDelta,
+        )
+        assert delta.serialized_entries == {}
+        assert delta.manifest.entry_hashes == known_entry_hashes
+
+        repo_data = sync_get_streaming_external_repositories_data_grpc(
+            code_location.client, code_location, snapshot_cache=snapshot_cache
+        )["bar_repo"]
+        assert repo_data == full_repo_data
+        assert snapshot_cache.known_entry_hashes == known_entry_hashes
+
+        # entries for repositories that are no longer in the location are evicted
+        snapshot_cache.retain_repositories(set())
+        assert not snapshot_cache.known_entry_hashes
+
+
+def test_delta_transfers_every_external_repository_data_field():
+    # a field that is neither transferred entry by entry nor in the manifest would be dropped
+    # whenever a repository is reassembled from a delta
+    assert not set(CONTENT_ADDRESSED_FIELDS) & MANIFEST_FIELDS
+    assert set(CONTENT_ADDRESSED_FIELDS) | MANIFEST_FIELDS == set(ExternalRepositoryData._fields)
+
+
+def test_streaming_external_repositories_without_delta_api(instance):
+    with get_bar_repo_code_location(instance) as code_location:
+        full_repo_data = sync_get_streaming_external_repositories_data_grpc(
+            code_location.client, code_location
+        )["bar_repo"]
+
+        # servers that do not implement the delta API are asked for the full snapshot
+        snapshot_cache = RepositorySnapshotCache()
+        with mock.patch.object(
+            code_location.client, "streaming_external_repository_delta", return_value=None
+        ), mock.patch.object(
+            code_location.client,
+            "streaming_external_repository",
+            wraps=code_location.client.streaming_external_repository,
+        ) as streaming_external_repository_spy:
+            repo_data = sync_get_streaming_external_repositories_data_grpc(
+                code_location.client, code_location, snapshot_cache=snapshot_cache
+            )["bar_repo"]
+        assert repo_data == full_repo_data
+        assert streaming_external_repository_spy.call_count == 1
+        assert not snapshot_cache.known_entry_hashes
+
+
 def test_streaming_external_repositories_error(instance):
     with get_bar_repo_code_location(instance) as code_location:
         code_location.repository_names = {"does_not_exist"}
@@ -167,3 +246,66 @@ def _ref_to_data(ref):
         job = repo.get_all_external_jobs()[0]
         _ = job.job_snapshot
         assert _state.get("cnt", 0) == 1
+
+
+def test_serialized_external_repository_data_cached():
+    loadable_target_origin = LoadableTargetOrigin(
+        executable_path=sys.executable,
+        python_file=file_relative_path(__file__, "api_tests_repo.py"),
+        attribute="bar_repo",
+    )
+    server_termination_event = threading.Event()
+    with FuturesAwareThreadPoolExecutor(max_workers=1) as executor:
+        api_servicer = grpc_server.DagsterApiServer(
+            server_termination_event=server_termination_event,
+            logger=logging.getLogger("test_serialized_external_repository_data_cached"),
+            server_threadpool_executor=executor,
+            loadable_target_origin=loadable_target_origin,
+        )
+        try:
+            request = api_pb2.ExternalRepositoryRequest(
+                serialized_repository_python_origin=serialize_value(
+                    RemoteRepositoryOrigin(
+                        ManagedGrpcPythonEnvCodeLocationOrigin(
+                            loadable_target_origin, "bar_code_location"
+                        ),
+                        "bar_repo",
+                    )
+                ),
+                defer_snapshots=True,
+            )
+
+            with mock.patch.object(
+                grpc_server,
+                "external_repository_data_from_def",
+                wraps=grpc_server.external_repository_data_from_def,
+            ) as external_repository_data_spy:
+                with mock.patch.object(grpc_server, "STREAMING_CHUNK_SIZE", 1000):
+                    events = list(
+                        api_servicer.StreamingExternalRepository(request, None)  # type: ignore
+                    )
+                    assert len(events) > 1
+                    assert [event.sequence_number for event in events] == list(range(len(events)))
+                    streamed_data = "".join(
+                        event.serialized_external_repository_chunk for event in events
+                    )
+
+                    reply = api_servicer.ExternalRepository(request, None)  # type: ignore
+                    assert reply.serialized_external_repository_data == streamed_data
+                    assert external_repository_data_spy.call_count == 1
+
+                external_repository_data = deserialize_value(streamed_data, ExternalRepositoryData)
+                assert external_repository_data.name == "bar_repo"
+                assert external_repository_data.external_job_datas is None
+
+                # snapshots are cached separately when they are not deferred
+                request.defer_snapshots = False
+                reply = api_servicer.ExternalRepository(request, None)  # type: ignore
+                assert external_repository_data_spy.call_count == 2
+                external_repository_data = deserialize_value(
+                    reply.serialized_external_repository_data, ExternalRepositoryData
+                )
+                assert external_repository_data.external_job_datas
+        finally:
+            server_termination_event.set()
+            api_servicer.cleanup()
@@ -1,5 +1,6 @@
 from datetime import datetime, timezone
 from typing import Optional, Sequence
+from unittest import mock
 
 import pytest
 from dagster import (
@@ -946,3 +947,79 @@ def test_partition_mapping_output_has_no_overlap_ranges() -> None:
     assert downstream_partitions.get_partition_key_ranges(partitions_def) == [
         PartitionKeyRange(start="2023-09-27", end="2024-03-05")
     ]
+
+
+@pytest.mark.parametrize("partitions_timezone", ["UTC", "America/New_York"])
+@pytest.mark.parametrize("start_offset, end_offset", [(0, 0), (-1, 0), (0, 1), (-2, 3)])
+@pytest.mark.parametrize("allow_nonexistent_upstream_partitions", [True, False])
+def test_index_arithmetic_mapping_matches_time_window_mapping(
+    partitions_timezone: str,
+    start_offset: int,
+    end_offset: int,
+    allow_nonexistent_upstream_partitions: bool,
+) -> None:
+    current_time = datetime(2023, 12, 20, 5, tzinfo=timezone.utc)
+    partitions_defs = [
+        HourlyPartitionsDefinition(start_date="2023-03-01-00:00", timezone=partitions_timezone),
+        DailyPartitionsDefinition(start_date="2023-02-15", timezone=partitions_timezone),
+        DailyPartitionsDefinition(
+            start_date="2023-03-10", timezone=partitions_timezone, hour_offset=7
+        ),
+        WeeklyPartitionsDefinition(start_date="2023-01-01", timezone=partitions_timezone),
+        MonthlyPartitionsDefinition(start_date="2023-02-01", timezone=partitions_timezone),
+        TimeWindowPartitionsDefinition(
+            cron_schedule="*/15 * * * *",
+            start="2023-11-01-00:00",
+            fmt="%Y-%m-%d-%H:%M",
+            timezone=partitions_timezone,
+        ),
+    ]
+    mapping = TimeWindowPartitionMapping(
+        start_offset=start_offset,
+        end_offset=end_offset,
+        allow_nonexistent_upstream_partitions=allow_nonexistent_upstream_partitions,
+    )
+
+    for from_partitions_def in partitions_defs:
+        from_partition_keys = from_partitions_def.get_partition_keys(current_time=current_time)
+        num_from_partitions = len(from_partition_keys)
+        from_subset = subset_with_keys(
+            from_partitions_def,
+            from_partition_keys[:2]
+            + from_partition_keys[num_from_partitions // 2 : num_from_partitions // 2 + 3]
+            + from_partition_keys[-1:],
+        )
+        for to_partitions_def in partitions_defs:
+            if to_partitions_def == from_partitions_def:
+                continue
+
+            def _map_both_directions():
+                upstream_result = mapping.get_upstream_mapped_partitions_result_for_partitions(
+                    from_subset, from_partitions_def, to_partitions_def, current_time
+                )
+                downstream_subset = mapping.get_downstream_partitions_for_partitions(
+                    from_subset, from_partitions_def, to_partitions_def, current_time
+                )
+                return (
+                    set(upstream_result.partitions_subset.get_partition_keys()),
+                    upstream_result.required_but_nonexistent_partition_keys,
+                    set(downstream_subset.get_partition_keys()),
+                )
+
+            index_arithmetic_result = _map_both_directions()
+            with mock.patch.object(
+                TimeWindowPartitionMapping,
+                "_map_partitions_by_index",
+                side_effect=AssertionError("index arithmetic path used"),
+            ), mock.patch.object(
+                TimeWindowPartitionsDefinition,
+                "_has_fixed_period",
+                new_callable=mock.PropertyMock,
+                return_value=False,
+            ):
+                time_window_result = _map_both_directions()
+
+            assert index_arithmetic_result == time_window_result, (
+                from_partitions_def,
+                to_partitions_def,
+            )
@@ -1,3 +1,4 @@
+import json
 from typing import cast
 from unittest.mock import Mock
 
@@ -5,10 +6,16 @@
 import pytest
 from dagster import (
     DailyPartitionsDefinition,
+    DynamicPartitionsDefinition,
     MultiPartitionsDefinition,
     StaticPartitionsDefinition,
 )
-from dagster._core.definitions.partition import AllPartitionsSubset, DefaultPartitionsSubset
+from dagster._core.definitions.multi_dimensional_partitions import MultiPartitionsSubset
+from dagster._core.definitions.partition import (
+    AllPartitionsSubset,
+    DefaultPartitionsSubset,
+    KeyBitmapPartitionsSubset,
+)
 from dagster._core.definitions.time_window_partitions import (
     PartitionKeysTimeWindowPartitionsSubset,
     TimeWindowPartitionsDefinition,
@@ -86,7 +93,7 @@ def test_get_subset_type():
 
 
 def test_empty_subsets():
-    assert type(static_partitions.empty_subset()) is DefaultPartitionsSubset
+    assert type(static_partitions.empty_subset()) is KeyBitmapPartitionsSubset
     assert type(time_window_partitions.empty_subset()) is PartitionKeysTimeWindowPartitionsSubset
 
 
@@ -213,3 +220,243 @@ def test_partitions_set_short_circuiting() -> None:
 
     # Test short-circuiting of -. Returns an empty DefaultPartitionsSubset
     assert (default_ps - all_ps) == DefaultPartitionsSubset.empty_subset()
+
+
+def test_key_bitmap_subset_set_operations():
+    partitions_def = StaticPartitionsDefinition([str(i) for i in range(1000)])
+    evens = partitions_def.subset_with_partition_keys([str(i) for i in range(0, 1000, 2)])
+    first_half = partitions_def.subset_with_partition_keys([str(i) for i in range(500)])
+
+    assert len(evens) == 500
+    assert "2" in evens and "3" not in evens and "unknown" not in evens
+    assert (evens & first_half).get_partition_keys() == {str(i) for i in range(0, 500, 2)}
+    assert len(evens | first_half) == 750
+    assert (evens - first_half).get_partition_keys() == {str(i) for i in range(500, 1000, 2)}
+
+    # operations with other subset types fall back to partition keys
+    default_subset = DefaultPartitionsSubset({"1", "2", "3"})
+    assert (evens & default_subset) == DefaultPartitionsSubset({"2"})
+    assert default_subset == partitions_def.subset_with_partition_keys(["1", "2", "3"])
+    assert (evens - default_subset).get_partition_keys() == evens.get_partition_keys() - {"2"}
+
+    assert partitions_def.empty_subset().get_partition_key_ranges(partitions_def) == []
+    assert [
+        (key_range.start, key_range.end)
+        for key_range in first_half.get_partition_key_ranges(partitions_def)
+    ] == [("0", "499")]
+
+
+def test_key_bitmap_subset_serialization(monkeypatch):
+    partitions_def = StaticPartitionsDefinition([str(i) for i in range(10000)])
+    subset = partitions_def.subset_with_partition_keys([str(i) for i in range(0, 10000, 3)])
+
+    # by default, subsets are serialized as a list of keys that older versions can read
+    default_subset = DefaultPartitionsSubset(subset.get_partition_keys())
+    assert subset.serialize() == default_subset.serialize()
+    assert serialize_value(subset) == serialize_value(default_subset)
+    assert deserialize_value(serialize_value(subset)) == default_subset
+
+    monkeypatch.setenv("DAGSTER_SERIALIZE_PARTITIONS_SUBSET_BITMAPS", "1")
+    serialized = subset.serialize()
+    assert len(serialized) < len(default_subset.serialize())
+    assert partitions_def.can_deserialize_subset(serialized, None, None)
+    assert partitions_def.deserialize_subset(serialized) == subset
+    # the deserialized subset shares ordinals with the partitions definition
+    assert cast(
+        KeyBitmapPartitionsSubset, partitions_def.deserialize_subset(serialized)
+    ).bitmap == (subset.bitmap)
+
+    other_partitions_def = StaticPartitionsDefinition([str(i) for i in range(10001)])
+    assert not other_partitions_def.can_deserialize_subset(serialized, None, None)
+    with pytest.raises(DagsterInvalidDeserializationVersionError):
+        other_partitions_def.deserialize_subset(serialized)
+
+
+def test_key_bitmap_subset_unknown_keys():
+    partitions_def = StaticPartitionsDefinition(["a", "b", "c"])
+    subset = partitions_def.subset_with_partition_keys(["a"])
+
+    # keys outside of a static partitions definition fall back to a key list subset, without
+    # changing the ordinals of the definition
+    with_unknown_key = subset.with_partition_keys(["unknown"])
+    assert isinstance(with_unknown_key, DefaultPartitionsSubset)
+    assert with_unknown_key.get_partition_keys() == {"a", "unknown"}
+    assert (subset | DefaultPartitionsSubset({"unknown"})) == with_unknown_key
+    assert partitions_def.get_partition_key_ordinals().get_ordinal("unknown") is None
+    assert partitions_def.deserialize_subset(with_unknown_key.serialize()) == with_unknown_key
+
+
+def test_key_bitmap_subset_dynamic_partitions():
+    partitions_def = DynamicPartitionsDefinition(name="fruits")
+    subset = partitions_def.subset_with_partition_keys(["apple", "banana"])
+    other_subset = partitions_def.subset_with_partition_keys(["banana", "cherry"])
+    assert subset.ordinals is other_subset.ordinals
+
+    assert (subset | other_subset).get_partition_keys() == {"apple", "banana", "cherry"}
+    assert (subset & other_subset).get_partition_keys() == {"banana"}
+    assert (subset - other_subset).get_partition_keys() == {"apple"}
+
+    # separate definitions with the same name have their own ordinals
+    separate_subset = DynamicPartitionsDefinition(name="fruits").subset_with_partition_keys(
+        ["cherry", "apple"]
+    )
+    assert separate_subset.ordinals is not subset.ordinals
+    assert (subset | separate_subset).get_partition_keys() == {"apple", "banana", "cherry"}
+    assert (subset & separate_subset).get_partition_keys() == {"apple"}
+
+    serialized = subset.serialize()
+    assert json.loads(serialized) == {"version": 1, "subset": ["apple", "banana"]}
+    assert DynamicPartitionsDefinition(name="fruits").deserialize_subset(serialized) == subset
+    assert DefaultPartitionsSubset.from_serialized(
+        DynamicPartitionsDefinition(name="fruits"), serialized
+    ) == DefaultPartitionsSubset({"apple", "banana"})
+
+
+def test_time_window_subset_range_set_operations():
+    partitions_def = DailyPartitionsDefinition(start_date="2023-01-01", end_date="2023-03-01")
+    keys = partitions_def.get_partition_keys()
+    first_half = partitions_def.subset_with_partition_keys(keys[:30])
+    evens = partitions_def.subset_with_partition_keys(keys[::2])
+
+    for result, expected_keys in [
+        (first_half | evens, set(keys[:30]) | set(keys[::2])),
+        (first_half & evens, set(keys[:30]) & set(keys[::2])),
+        (first_half - evens, set(keys[:30]) - set(keys[::2])),
+        (evens - first_half, set(keys[::2]) - set(keys[:30])),
+    ]:
+        assert isinstance(result, TimeWindowPartitionsSubset)
+        assert set(result.get_partition_keys()) == expected_keys
+        assert len(result) == len(expected_keys)
+        # equal to the subset built from the keys, so time windows are merged
+        assert result == partitions_def.subset_with_partition_keys(expected_keys)
+
+
+def test_multi_partitions_subset(monkeypatch):
+    partitions_def = MultiPartitionsDefinition(
+        {
+            "date": DailyPartitionsDefinition(start_date="2023-01-01", end_date="2023-02-01"),
+            "static": StaticPartitionsDefinition([str(i) for i in range(50)]),
+        }
+    )
+    all_keys = partitions_def.get_partition_keys()
+    evens = partitions_def.subset_with_partition_keys(all_keys[::2])
+    first_half = partitions_def.subset_with_partition_keys(all_keys[: len(all_keys) // 2])
+
+    assert isinstance(evens, MultiPartitionsSubset)
+    assert set(evens.subsets_by_secondary_key.keys()) == {
+        key.keys_by_dimension["static"] for key in all_keys[::2]
+    }
+    assert all(
+        isinstance(subset, TimeWindowPartitionsSubset)
+        for subset in evens.subsets_by_secondary_key.values()
+    )
+
+    assert len(evens) == len(set(all_keys[::2]))
+    assert all_keys[0] in evens and all_keys[1] not in evens
+    assert "2023-01-01|unknown" not in evens and "unknown" not in evens
+
+    default_evens = DefaultPartitionsSubset(set(all_keys[::2]))
+    default_first_half = DefaultPartitionsSubset(set(all_keys[: len(all_keys) // 2]))
+    assert evens == default_evens and default_evens == evens
+    assert (evens | first_half) == default_evens | default_first_half
+    assert (evens & first_half) == default_evens & default_first_half
+    assert (evens - first_half) == default_evens - default_first_half
+    assert (evens - evens) == partitions_def.empty_subset()
+    assert len(evens - evens) == 0
+
+    # operations with other subset types fall back to partition keys
+    assert (evens | default_first_half) == evens | first_half
+    assert (evens & default_first_half) == evens & first_half
+    assert (evens - default_first_half) == evens - first_half
+
+    assert set(evens.get_partition_keys_not_in_subset(partitions_def)) == set(all_keys[1::2])
+
+    # subsets are serialized as partition keys by default
+    assert evens.serialize() == default_evens.serialize()
+    assert partitions_def.deserialize_subset(evens.serialize()) == evens
+    assert deserialize_value(serialize_value(evens.to_serializable_subset())) == default_evens
+
+    monkeypatch.setenv("DAGSTER_SERIALIZE_PARTITIONS_SUBSET_BITMAPS", "1")
+    serialized = evens.serialize()
+    assert partitions_def.can_deserialize_subset(serialized, None, None)
+    assert partitions_def.deserialize_subset(serialized) == evens
+    assert len(serialized) < len(default_evens.serialize())
+
+    # subsets serialized as partition keys can still be deserialized
+    assert partitions_def.can_deserialize_subset(default_evens.serialize(), None, None)
+    assert partitions_def.deserialize_subset(default_evens.serialize()) == evens
+
+    serialized_value = serialize_value(evens.to_serializable_subset())
+    assert len(serialized_value) < len(serialize_value(default_evens))
+    deserialized = deserialize_value(serialized_value)
+    assert isinstance(deserialized, MultiPartitionsSubset)
+    assert deserialized == default_evens
+    assert len(deserialized) == len(evens)
+
+
+def test_multi_partitions_subset_static_dimensions(monkeypatch):
+    partitions_def = MultiPartitionsDefinition(
+        {
+            "a": StaticPartitionsDefinition(["1", "2", "3"]),
+            "b": StaticPartitionsDefinition(["x", "y"]),
+        }
+    )
+    subset = partitions_def.subset_with_partition_keys(["1|x", "2|x", "3|y"])
+    assert all(
+        isinstance(row, KeyBitmapPartitionsSubset)
+        for row in subset.subsets_by_secondary_key.values()
+    )
+    assert subset.get_partition_keys() == {"1|x", "2|x", "3|y"}
+    assert (subset - partitions_def.subset_with_partition_keys(["1|x"])).get_partition_keys() == {
+        "2|x",
+        "3|y",
+    }
+    assert partitions_def.deserialize_subset(subset.serialize()) == subset
+
+    other_partitions_def = MultiPartitionsDefinition(
+        {
+            "a": StaticPartitionsDefinition(["1", "2", "3", "4"]),
+            "b": StaticPartitionsDefinition(["x", "y"]),
+        }
+    )
+    # rows serialized as keys are valid for any definition that contains the keys
+    assert other_partitions_def.can_deserialize_subset(subset.serialize(), None, None)
+
+    monkeypatch.setenv("DAGSTER_SERIALIZE_PARTITIONS_SUBSET_BITMAPS", "1")
+    assert partitions_def.deserialize_subset(subset.serialize()) == subset
+    assert not other_partitions_def.can_deserialize_subset(subset.serialize(), None, None)
+
+
+def test_multi_partitions_subset_invalid_keys(monkeypatch):
+    partitions_def = MultiPartitionsDefinition(
+        {
+            "date": DailyPartitionsDefinition(start_date="2023-01-01", end_date="2023-02-01"),
+            "static": StaticPartitionsDefinition(["a", "b"]),
+        }
+    )
+    valid_keys = {"2023-01-01|a", "2023-01-02|b"}
+    # keys outside of the time window, with a non-canonical date, with an unparseable date, or
+    # with the wrong number of dimensions are kept as they are, like DefaultPartitionsSubset does
+    invalid_keys = {"2024-01-01|a", "2023-1-3|a", "not_a_date|b", "2023-01-04"}
+    subset = partitions_def.subset_with_partition_keys(valid_keys | invalid_keys)
+    default_subset = DefaultPartitionsSubset(valid_keys | invalid_keys)
+
+    assert isinstance(subset, MultiPartitionsSubset)
+    assert subset.other_partition_keys == invalid_keys
+    assert subset.get_partition_keys() == valid_keys | invalid_keys
+    assert len(subset) == len(default_subset)
+    assert all(key in subset for key in valid_keys | invalid_keys)
+    assert subset == default_subset
+
+    other = partitions_def.subset_with_partition_keys({"2023-01-01|a", "2024-01-01|a"})
+    default_other = DefaultPartitionsSubset({"2023-01-01|a", "2024-01-01|a"})
+    assert (subset | other) == default_subset | default_other
+    assert (subset & other) == default_subset & default_other
+    assert (subset - other) == default_subset - default_other
+    assert (subset & default_other) == default_subset & default_other
+    assert (subset - default_other) == default_subset - default_other
+
+    assert partitions_def.deserialize_subset(subset.serialize()) == subset
+    monkeypatch.setenv("DAGSTER_SERIALIZE_PARTITIONS_SUBSET_BITMAPS", "1")
+    assert partitions_def.deserialize_subset(subset.serialize()) == subset
+    assert deserialize_value(serialize_value(subset.to_serializable_subset())) == subset
@@ -1,6 +1,7 @@
 import os
 import re
 import tempfile
+import time
 from typing import Any, Mapping, Optional
 from unittest.mock import MagicMock, patch
 
@@ -31,6 +32,8 @@
     DagsterInvalidConfigError,
     DagsterInvariantViolationError,
 )
+from dagster._core.events import DagsterEventType
+from dagster._core.events.log import EventLogEntry
 from dagster._core.execution.api import create_execution_plan
 from dagster._core.instance import DagsterInstance, InstanceRef
 from dagster._core.instance.config import DEFAULT_LOCAL_CODE_SERVER_STARTUP_TIMEOUT
@@ -41,6 +44,7 @@
     create_job_snapshot_id,
     snapshot_from_execution_plan,
 )
+from dagster._core.storage.dagster_run import DagsterRunStatus
 from dagster._core.storage.partition_status_cache import (
     AssetPartitionStatus,
     AssetStatusCacheValue,
@@ -61,6 +65,7 @@
     instance_for_test,
     new_cwd,
 )
+from dagster._core.utils import make_new_run_id
 from dagster._daemon.asset_daemon import AssetDaemon
 from dagster._serdes import ConfigurableClass
 from dagster._serdes.config_class import ConfigurableClassData
@@ -781,3 +786,122 @@ def test_invalid_run_id():
             match="run_id must be a valid UUID. Got invalid_run_id",
         ):
             create_run_for_test(instance, job_name="foo_job", run_id="invalid_run_id")
+
+
+def test_run_event_buffering():
+    @op
+    def chatty_op(context):
+        for i in range(12):
+            context.log.info(f"log {i}")
+
+    @job
+    def chatty_job():
+        chatty_op()
+
+    with environ(
+        {
+            "DAGSTER_RUN_EVENT_BUFFER_SIZE": "5",
+            "DAGSTER_RUN_EVENT_BUFFER_MAX_LATENCY_SECONDS": "60",
+        }
+    ), instance_for_test() as instance:
+        storage = instance.event_log_storage
+        with patch.object(
+            storage, "store_event_batch", wraps=storage.store_event_batch
+        ) as store_event_batch:
+            result = chatty_job.execute_in_process(instance=instance)
+        assert result.success
+
+        logs = instance.all_logs(result.run_id)
+        assert [log.user_message for log in logs if not log.is_dagster_event] == [
+            f"log {i}" for i in range(12)
+        ]
+        assert logs[-1].dagster_event_type == DagsterEventType.RUN_SUCCESS
+        assert instance.get_run_by_id(result.run_id).status == DagsterRunStatus.SUCCESS
+        assert store_event_batch.call_count > 0
+        assert all(len(call.args[0]) <= 5 for call in store_event_batch.call_args_list)
+
+        # events are held until the max latency passes or the buffer is flushed
+        run_id = make_new_run_id()
+        instance.handle_new_event(
+            EventLogEntry(
+                error_info=None,
+                level="INFO",
+                user_message="buffered",
+                run_id=run_id,
+                timestamp=time.time(),
+            )
+        )
+        assert instance.all_logs(run_id) == []
+        instance.flush_run_event_buffers()
+        assert [log.user_message for log in instance.all_logs(run_id)] == ["buffered"]
+
+    with environ(
+        {
+            "DAGSTER_RUN_EVENT_BUFFER_SIZE": "5",
+            "DAGSTER_RUN_EVENT_BUFFER_MAX_LATENCY_SECONDS": "0.5",
+        }
+    ), instance_for_test() as instance:
+        run_id = make_new_run_id()
+
+        def _log_event(message):
+            instance.handle_new_event(
+                EventLogEntry(
+                    error_info=None,
+                    level="INFO",
+                    user_message=message,
+                    run_id=run_id,
+                    timestamp=time.time(),
+                )
+            )
+
+        # a buffered event is written once the max latency passes, even if no other events arrive
+        _log_event("first")
+        assert instance.all_logs(run_id) == []
+        start_time = time.time()
+        while not instance.all_logs(run_id):
+            assert time.time() - start_time < 10
+            time.sleep(0.05)
+        assert [log.user_message for log in instance.all_logs(run_id)] == ["first"]
+
+        _log_event("second")
+        _log_event("third")
+        start_time = time.time()
+        while len(instance.all_logs(run_id)) < 3:
+            assert time.time() - start_time < 10
+            time.sleep(0.05)
+        assert [log.user_message for log in instance.all_logs(run_id)] == [
+            "first",
+            "second",
+            "third",
+        ]
+
+
+def test_run_event_buffer_write_errors_are_raised():
+    with environ(
+        {
+            "DAGSTER_RUN_EVENT_BUFFER_SIZE": "2",
+            "DAGSTER_RUN_EVENT_BUFFER_MAX_LATENCY_SECONDS": "60",
+        }
+    ), instance_for_test() as instance:
+        run_id = make_new_run_id()
+        storage = instance.event_log_storage
+
+        def _log_event(message):
+            instance.handle_new_event(
+                EventLogEntry(
+                    error_info=None,
+                    level="INFO",
+                    user_message=message,
+                    run_id=run_id,
+                    timestamp=time.time(),
+                )
+            )
+
+        # a failed batch may have been partially written, so it is not stored again event by event
+        with patch.object(
+            storage, "store_event_batch", side_effect=Exception("batch failed")
+        ), patch.object(storage, "store_event", wraps=storage.store_event) as store_event:
+            _log_event("first")
+            with pytest.raises(Exception, match="batch failed"):
+                _log_event("second")
+            assert store_event.call_count == 0
@@ -0,0 +1,113 @@
+from dagster import (
+    AssetKey,
+    DagsterInstance,
+    DailyPartitionsDefinition,
+    Definitions,
+    asset,
+    materialize,
+)
+from dagster._core.definitions.events import AssetKeyPartitionKey
+from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
+
+daily_partitions_def = DailyPartitionsDefinition(start_date="2024-01-01")
+
+
+def _make_assets(num_assets: int):
+    unpartitioned_assets = []
+    partitioned_assets = []
+    for i in range(num_assets):
+
+        @asset(name=f"unpartitioned_{i}")
+        def _unpartitioned(): ...
+
+        @asset(name=f"partitioned_{i}", partitions_def=daily_partitions_def)
+        def _partitioned(): ...
+
+        unpartitioned_assets.append(_unpartitioned)
+        partitioned_assets.append(_partitioned)
+    return unpartitioned_assets, partitioned_assets
+
+
+def test_prefetch_for_asset_keys():
+    unpartitioned_assets, partitioned_assets = _make_assets(10)
+    asset_graph = (
+        Definitions(assets=[*unpartitioned_assets, *partitioned_assets])
+        .get_repository_def()
+        .asset_graph
+    )
+    asset_keys = list(asset_graph.all_asset_keys)
+
+    with DagsterInstance.ephemeral() as instance:
+        materialize(unpartitioned_assets[:5], instance=instance)
+        for partition_key in ["2024-01-01", "2024-01-02"]:
+            materialize(partitioned_assets[:5], instance=instance, partition_key=partition_key)
+
+        unbatched_queryer = CachingInstanceQueryer(instance, asset_graph)
+        queryer = CachingInstanceQueryer(instance, asset_graph)
+
+        queryer.prefetch_for_asset_keys(asset_keys, run_record_asset_keys=asset_keys)
+        # one query each for the asset records, the partition storage ids and the runs
+        assert queryer.query_counts == {
+            "get_asset_records": 1,
+            "get_latest_storage_ids_by_partition": 1,
+            "get_run_records": 1,
+        }
+
+        asset_partitions = [AssetKeyPartitionKey(asset_key) for asset_key in asset_keys] + [
+            AssetKeyPartitionKey(asset_key, partition_key)
+            for asset_key in asset_keys
+            if asset_graph.get(asset_key).is_partitioned
+            for partition_key in ["2024-01-01", "2024-01-02", "2024-01-03"]
+        ]
+        for asset_partition in asset_partitions:
+            assert queryer.get_latest_materialization_or_observation_storage_id(
+                asset_partition
+            ) == unbatched_queryer.get_latest_materialization_or_observation_storage_id(
+                asset_partition
+            )
+            if asset_partition.partition_key is None:
+                record = queryer.get_latest_materialization_or_observation_record(asset_partition)
+                if record is not None:
+                    assert queryer.run_has_tag(record.run_id, "foo", None) is False
+
+        # everything was answered from the prefetched data
+        assert queryer.total_query_count == 3
+        assert unbatched_queryer.query_counts["get_latest_storage_id_by_partition"] == 10
+
+        assert (
+            queryer.get_latest_materialization_or_observation_storage_id(
+                AssetKeyPartitionKey(AssetKey("partitioned_0"), "2024-01-02")
+            )
+            is not None
+        )
+
+        # prefetching again does not issue any new queries
+        queryer.prefetch_for_asset_keys(asset_keys, run_record_asset_keys=asset_keys)
+        assert queryer.total_query_count == 3
+
+
+def test_prefetch_for_asset_keys_without_runs():
+    unpartitioned_assets, partitioned_assets = _make_assets(2)
+    asset_graph = (
+        Definitions(assets=[*unpartitioned_assets, *partitioned_assets])
+        .get_repository_def()
+        .asset_graph
+    )
+
+    with DagsterInstance.ephemeral() as instance:
+        materialize(unpartitioned_assets, instance=instance)
+
+        queryer = CachingInstanceQueryer(instance, asset_graph)
+        # runs are only fetched for the assets which read them
+        queryer.prefetch_for_asset_keys(asset_graph.all_asset_keys)
+        assert "get_run_records" not in queryer.query_counts
+
+        asset_key = unpartitioned_assets[0].key
+        with queryer.count_queries() as query_counts:
+            assert queryer.get_in_progress_asset_subset(asset_key=asset_key).is_empty
+            assert queryer.get_failed_asset_subset(asset_key=asset_key).is_empty
+        assert query_counts == {
+            "get_latest_planned_materialization_info": 1,
+            "get_run_record_by_id": 1,
+        }
+        assert queryer.query_counts["get_run_record_by_id"] == 1
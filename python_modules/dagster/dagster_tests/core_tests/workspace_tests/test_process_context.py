@@ -0,0 +1,247 @@
+import threading
+import time
+from unittest import mock
+
+from dagster import job, repository
+from dagster._core.remote_representation.origin import InProcessCodeLocationOrigin
+from dagster._core.test_utils import InProcessTestWorkspaceLoadTarget, instance_for_test
+from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
+from dagster._core.workspace.context import WorkspaceProcessContext
+from dagster._core.workspace.workspace import CodeLocationLoadStatus
+
+
+@job
+def noop_job():
+    pass
+
+
+@repository
+def repo():
+    return [noop_job]
+
+
+def _origin(location_name: str, attribute: str = "repo") -> InProcessCodeLocationOrigin:
+    return InProcessCodeLocationOrigin(
+        loadable_target_origin=LoadableTargetOrigin(
+            python_file=__file__,
+            attribute=attribute,
+        ),
+        location_name=location_name,
+    )
+
+
+_original_load_location = WorkspaceProcessContext._load_location  # noqa: SLF001
+
+
+def test_load_locations_concurrently():
+    lock = threading.Lock()
+    num_loading = 0
+    max_num_loading = 0
+
+    def _load_location(self, origin, reload):
+        nonlocal num_loading, max_num_loading
+        with lock:
+            num_loading += 1
+            max_num_loading = max(max_num_loading, num_loading)
+        time.sleep(0.5)
+        try:
+            return _original_load_location(self, origin, reload)
+        finally:
+            with lock:
+                num_loading -= 1
+
+    origins = [_origin(f"location_{i}") for i in range(4)] + [
+        _origin("error_location", attribute="missing_repo")
+    ]
+    with instance_for_test(overrides={"code_servers": {"max_concurrent_loads": 2}}) as instance:
+        with mock.patch.object(WorkspaceProcessContext, "_load_location", _load_location):
+            with WorkspaceProcessContext(
+                instance, InProcessTestWorkspaceLoadTarget(origins)
+            ) as process_context:
+                assert max_num_loading == 2
+                assert process_context.code_location_names == [
+                    origin.location_name for origin in origins
+                ]
+
+                # an error loading one location does not affect the others
+                for i in range(4):
+                    assert process_context.has_code_location(f"location_{i}")
+                assert process_context.has_code_location_error("error_location")
+
+                max_num_loading = 0
+                process_context.refresh_workspace()
+                assert max_num_loading == 2
+                assert process_context.code_location_names == [
+                    origin.location_name for origin in origins
+                ]
+                for i in range(4):
+                    assert process_context.has_code_location(f"location_{i}")
+
+
+def test_location_load_timeout():
+    slow_location_event = threading.Event()
+
+    def _load_location(self, origin, reload):
+        if origin.location_name == "slow_location":
+            slow_location_event.wait(10)
+        return _original_load_location(self, origin, reload)
+
+    origins = [_origin("slow_location"), _origin("fast_location")]
+    with instance_for_test(overrides={"code_servers": {"location_load_timeout": 1}}) as instance:
+        with mock.patch.object(WorkspaceProcessContext, "_load_location", _load_location):
+            try:
+                with WorkspaceProcessContext(
+                    instance, InProcessTestWorkspaceLoadTarget(origins)
+                ) as process_context:
+                    assert process_context.has_code_location("fast_location")
+                    assert not process_context.has_code_location("slow_location")
+                    assert process_context.has_code_location_error("slow_location")
+
+                    entry = process_context.create_snapshot()["slow_location"]
+                    assert entry.load_status == CodeLocationLoadStatus.LOADED
+                    assert "Timed out after 1 seconds" in entry.load_error.message
+            finally:
+                slow_location_event.set()
+
+
+def test_locations_available_while_refreshing():
+    slow_location_event = threading.Event()
+    is_refreshing = False
+
+    def _load_location(self, origin, reload):
+        if is_refreshing and origin.location_name == "slow_location":
+            slow_location_event.wait(10)
+        return _original_load_location(self, origin, reload)
+
+    origins = [_origin("slow_location"), _origin("fast_location")]
+    with instance_for_test() as instance:
+        with mock.patch.object(WorkspaceProcessContext, "_load_location", _load_location):
+            with WorkspaceProcessContext(
+                instance, InProcessTestWorkspaceLoadTarget(origins)
+            ) as process_context:
+                initial_snapshot = process_context.create_snapshot()
+
+                is_refreshing = True
+                refresh_thread = threading.Thread(target=process_context.refresh_workspace)
+                refresh_thread.start()
+                try:
+                    # the fast location is swapped in without waiting for the slow one, which
+                    # continues to be served from its previous entry in the meantime
+                    start_time = time.time()
+                    while (
+                        process_context.create_snapshot()["fast_location"]
+                        is initial_snapshot["fast_location"]
+                    ):
+                        assert time.time() - start_time < 10
+                        time.sleep(0.1)
+
+                    snapshot = process_context.create_snapshot()
+                    assert snapshot["slow_location"] is initial_snapshot["slow_location"]
+                    assert process_context.has_code_location("slow_location")
+                finally:
+                    slow_location_event.set()
+                    refresh_thread.join()
+
+                assert (
+                    process_context.create_snapshot()["slow_location"]
+                    is not initial_snapshot["slow_location"]
+                )
+                assert process_context.has_code_location("slow_location")
+
+
+def test_removed_location_snapshot_cache_pruned():
+    load_target = InProcessTestWorkspaceLoadTarget([_origin("location_1"), _origin("location_2")])
+    with instance_for_test() as instance:
+        with WorkspaceProcessContext(instance, load_target) as process_context:
+            snapshot_cache = process_context._get_snapshot_cache("location_1")  # noqa: SLF001
+            assert process_context._get_snapshot_cache("location_1") is snapshot_cache  # noqa: SLF001
+            process_context._get_snapshot_cache("location_2")  # noqa: SLF001
+
+            with mock.patch.object(
+                load_target, "create_origins", return_value=[_origin("location_2")]
+            ):
+                process_context.reload_workspace()
+
+            assert process_context.code_location_names == ["location_2"]
+            assert set(process_context._snapshot_caches) == {"location_2"}  # noqa: SLF001
+
+
+def test_load_in_background():
+    slow_location_event = threading.Event()
+
+    def _load_location(self, origin, reload):
+        if origin.location_name == "slow_location":
+            slow_location_event.wait(10)
+        return _original_load_location(self, origin, reload)
+
+    origins = [_origin("slow_location"), _origin("fast_location")]
+    with instance_for_test() as instance:
+        with mock.patch.object(WorkspaceProcessContext, "_load_location", _load_location):
+            try:
+                with WorkspaceProcessContext(
+                    instance, InProcessTestWorkspaceLoadTarget(origins), load_in_background=True
+                ) as process_context:
+                    # returns without waiting for the slow location, which is shown as loading
+                    assert process_context.code_location_names == [
+                        origin.location_name for origin in origins
+                    ]
+                    assert (
+                        process_context.create_snapshot()["slow_location"].load_status
+                        == CodeLocationLoadStatus.LOADING
+                    )
+
+                    start_time = time.time()
+                    while not process_context.has_code_location("fast_location"):
+                        assert time.time() - start_time < 10
+                        time.sleep(0.1)
+                    assert not process_context.has_code_location("slow_location")
+
+                    slow_location_event.set()
+                    start_time = time.time()
+                    while not process_context.has_code_location("slow_location"):
+                        assert time.time() - start_time < 10
+                        time.sleep(0.1)
+            finally:
+                slow_location_event.set()
+
+
+def test_exit_while_loading_in_background():
+    slow_location_event = threading.Event()
+    slow_location_entries = []
+
+    def _load_location(self, origin, reload):
+        if origin.location_name == "slow_location":
+            slow_location_event.wait(10)
+            entry = _original_load_location(self, origin, reload)
+            entry.code_location.cleanup = mock.MagicMock(wraps=entry.code_location.cleanup)
+            slow_location_entries.append(entry)
+            return entry
+        return _original_load_location(self, origin, reload)
+
+    origins = [_origin("slow_location"), _origin("fast_location")]
+    with instance_for_test() as instance:
+        with mock.patch.object(WorkspaceProcessContext, "_load_location", _load_location):
+            try:
+                start_time = time.time()
+                with WorkspaceProcessContext(
+                    instance, InProcessTestWorkspaceLoadTarget(origins), load_in_background=True
+                ) as process_context:
+                    while not process_context.has_code_location("fast_location"):
+                        assert time.time() - start_time < 10
+                        time.sleep(0.1)
+
+                # closing the workspace does not wait for the slow location to finish loading
+                assert time.time() - start_time < 5
+                assert not slow_location_entries
+
+                # once it finishes loading, the abandoned location is cleaned up
+                slow_location_event.set()
+                while not slow_location_entries:
+                    assert time.time() - start_time < 10
+                    time.sleep(0.1)
+                start_time = time.time()
+                while not slow_location_entries[0].code_location.cleanup.called:
+                    assert time.time() - start_time < 10
+                    time.sleep(0.1)
+            finally:
+                slow_location_event.set()
@@ -88,7 +88,11 @@
 from dagster._core.workspace.context import WorkspaceProcessContext
 from dagster._daemon import get_default_daemon_logger
 from dagster._daemon.daemon import SpanMarker
-from dagster._daemon.sensor import execute_sensor_iteration, execute_sensor_iteration_loop
+from dagster._daemon.sensor import (
+    SensorDueQueue,
+    execute_sensor_iteration,
+    execute_sensor_iteration_loop,
+)
 from dagster._seven.compat.pendulum import (
     _IS_PENDULUM_3,
     create_pendulum_time,
@@ -972,7 +976,13 @@ def asset_sensor_repo():
 FUTURES_TIMEOUT = 75
 
 
-def evaluate_sensors(workspace_context, executor, submit_executor=None, timeout=FUTURES_TIMEOUT):
+def evaluate_sensors(
+    workspace_context,
+    executor,
+    submit_executor=None,
+    timeout=FUTURES_TIMEOUT,
+    sensor_due_queue=None,
+):
     logger = get_default_daemon_logger("SensorDaemon")
     futures = {}
     list(
@@ -982,6 +992,7 @@ def evaluate_sensors(workspace_context, executor, submit_executor=None, timeout=
             threadpool_executor=executor,
             sensor_tick_futures=futures,
             submit_threadpool_executor=submit_executor,
+            sensor_due_queue=sensor_due_queue,
         )
     )
 
@@ -1591,6 +1602,78 @@ def test_custom_interval_sensor(executor, instance, workspace_context, external_
         validate_tick(ticks[0], external_sensor, expected_datetime, TickStatus.SKIPPED)
 
 
+def test_sensor_due_queue(executor, instance, workspace_context, external_repo):
+    sensor_due_queue = SensorDueQueue(refresh_interval_seconds=300)
+    freeze_datetime = to_timezone(
+        create_pendulum_time(year=2019, month=2, day=28, tz="UTC"), "US/Central"
+    )
+    with mock.patch.object(
+        instance, "all_instigator_state", wraps=instance.all_instigator_state
+    ) as all_instigator_state_spy:
+        with pendulum_freeze_time(freeze_datetime):
+            external_sensor = external_repo.get_external_sensor("custom_interval_sensor")
+            instance.add_instigator_state(
+                InstigatorState(
+                    external_sensor.get_external_origin(),
+                    InstigatorType.SENSOR,
+                    InstigatorStatus.RUNNING,
+                )
+            )
+
+            evaluate_sensors(workspace_context, executor, sensor_due_queue=sensor_due_queue)
+            ticks = instance.get_ticks(
+                external_sensor.get_external_origin_id(), external_sensor.selector_id
+            )
+            assert len(ticks) == 1
+            validate_tick(ticks[0], external_sensor, freeze_datetime, TickStatus.SKIPPED)
+            assert all_instigator_state_spy.call_count == 1
+
+            freeze_datetime = freeze_datetime.add(seconds=30)
+
+        with pendulum_freeze_time(freeze_datetime):
+            evaluate_sensors(workspace_context, executor, sensor_due_queue=sensor_due_queue)
+            ticks = instance.get_ticks(
+                external_sensor.get_external_origin_id(), external_sensor.selector_id
+            )
+            # not due yet
+            assert len(ticks) == 1
+
+            freeze_datetime = freeze_datetime.add(seconds=30)
+
+        with pendulum_freeze_time(freeze_datetime):
+            evaluate_sensors(workspace_context, executor, sensor_due_queue=sensor_due_queue)
+            ticks = instance.get_ticks(
+                external_sensor.get_external_origin_id(), external_sensor.selector_id
+            )
+            assert len(ticks) == 2
+            validate_tick(ticks[0], external_sensor, freeze_datetime, TickStatus.SKIPPED)
+
+            # the running sensors were not reloaded after the first iteration
+            assert all_instigator_state_spy.call_count == 1
+
+            instance.stop_sensor(
+                external_sensor.get_external_origin_id(),
+                external_sensor.selector_id,
+                external_sensor,
+            )
+            freeze_datetime = freeze_datetime.add(seconds=60)
+
+        with pendulum_freeze_time(freeze_datetime):
+            evaluate_sensors(workspace_context, executor, sensor_due_queue=sensor_due_queue)
+            ticks = instance.get_ticks(
+                external_sensor.get_external_origin_id(), external_sensor.selector_id
+            )
+            # stopped sensors are dropped from the queue once they are due
+            assert len(ticks) == 2
+            assert all_instigator_state_spy.call_count == 1
+
+            freeze_datetime = freeze_datetime.add(seconds=300)
+
+        with pendulum_freeze_time(freeze_datetime):
+            evaluate_sensors(workspace_context, executor, sensor_due_queue=sensor_due_queue)
+            assert all_instigator_state_spy.call_count == 2
+
+
 def test_sensor_spans(workspace_context):
     loop = execute_sensor_iteration_loop(
         workspace_context,
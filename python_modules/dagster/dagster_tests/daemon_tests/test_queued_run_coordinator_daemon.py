@@ -1,6 +1,7 @@
 import time
 from abc import ABC, abstractmethod
 from typing import Iterator
+from unittest import mock
 
 import pytest
 from dagster._core.definitions.events import AssetKey
@@ -22,6 +23,7 @@
 from dagster._daemon.run_coordinator.queued_run_coordinator_daemon import QueuedRunCoordinatorDaemon
 from dagster._seven.compat.pendulum import create_pendulum_time, pendulum_freeze_time, to_timezone
 from dagster._utils import file_relative_path
+from dagster._utils.tags import TagConcurrencyLimitsCounter
 
 from dagster_tests.api_tests.utils import (
     get_foo_job_handle,
@@ -1118,12 +1120,19 @@ def test_multiple_blocks(
 
 class TestQueuedRunCoordinatorDaemon(QueuedRunCoordinatorDaemonTests):
     @pytest.fixture
-    def instance(self, run_coordinator_config):
+    def use_run_queue_index(self):
+        return False
+
+    @pytest.fixture
+    def instance(self, run_coordinator_config, use_run_queue_index):
         overrides = {
             "run_coordinator": {
                 "module": "dagster._core.run_coordinator",
                 "class": "QueuedRunCoordinator",
-                "config": {**run_coordinator_config},
+                "config": {
+                    **run_coordinator_config,
+                    **({"dequeue_use_run_queue_index": True} if use_run_queue_index else {}),
+                },
             },
             "run_launcher": {
                 "module": "dagster._core.test_utils",
@@ -1141,3 +1150,57 @@ def instance(self, run_coordinator_config):
     @pytest.fixture()
     def daemon(self, page_size):
         return QueuedRunCoordinatorDaemon(interval_seconds=1, page_size=page_size)
+
+
+class TestQueuedRunCoordinatorDaemonWithRunQueueIndex(TestQueuedRunCoordinatorDaemon):
+    @pytest.fixture
+    def use_run_queue_index(self):
+        return True
+
+    @pytest.mark.parametrize(
+        "run_coordinator_config",
+        [
+            {
+                "max_concurrent_runs": 10,
+                "tag_concurrency_limits": [{"key": "database", "value": "tiny", "limit": 1}],
+            },
+        ],
+    )
+    def test_run_queue_index_updates(self, workspace_context, job_handle, daemon, instance):
+        tiny_run_ids = [make_new_run_id() for _ in range(20)]
+        for run_id in tiny_run_ids:
+            self.create_queued_run(instance, job_handle, run_id=run_id, tags={"database": "tiny"})
+        other_run_id = make_new_run_id()
+        self.create_queued_run(instance, job_handle, run_id=other_run_id)
+
+        list(daemon.run_iteration(workspace_context))
+        assert self.get_run_ids(instance.run_launcher.queue()) == [tiny_run_ids[0], other_run_id]
+
+        # runs that are enqueued after the index was built are picked up incrementally
+        hi_pri_run_id = make_new_run_id()
+        self.create_queued_run(instance, job_handle, run_id=hi_pri_run_id, tags={PRIORITY_TAG: "3"})
+
+        # the runs blocked by the tag concurrency limit share a bucket, so only the first run in
+        # the bucket is checked against the limit
+        with mock.patch.object(
+            TagConcurrencyLimitsCounter,
+            "is_blocked",
+            autospec=True,
+            side_effect=TagConcurrencyLimitsCounter.is_blocked,
+        ) as is_blocked_mock:
+            list(daemon.run_iteration(workspace_context))
+        assert is_blocked_mock.call_count == 2
+        assert self.get_run_ids(instance.run_launcher.queue()) == [
+            tiny_run_ids[0],
+            other_run_id,
+            hi_pri_run_id,
+        ]
+
+        # the index is updated once a run is no longer queued
+        instance.report_dagster_event(
+            DagsterEvent(event_type_value=DagsterEventType.RUN_SUCCESS.value, job_name="foo"),
+            run_id=tiny_run_ids[0],
+        )
+        list(daemon.run_iteration(workspace_context))
+        assert self.get_run_ids(instance.run_launcher.queue())[-1] == tiny_run_ids[1]
+        assert len(daemon._run_queue_index) == len(tiny_run_ids) - 2  # noqa: SLF001
@@ -1,8 +1,13 @@
 import dataclasses
 import datetime
+import multiprocessing
+import threading
+import time
 from contextlib import contextmanager, nullcontext
-from typing import Any, Generator, Mapping, Optional, Sequence, cast
+from typing import Any, Generator, List, Mapping, Optional, Sequence, cast
+from unittest import mock
 
+import dagster._check as check
 import pendulum
 import pytest
 from dagster import (
@@ -11,6 +16,7 @@
     DagsterInstance,
     instance_for_test,
 )
+from dagster._core.definitions.asset_daemon_context import AssetDaemonContext
 from dagster._core.definitions.asset_daemon_cursor import AssetDaemonCursor
 from dagster._core.definitions.asset_selection import AssetSelection
 from dagster._core.definitions.auto_materialize_policy import AutoMaterializePolicy
@@ -18,6 +24,7 @@
     AutoMaterializeSensorDefinition,
 )
 from dagster._core.definitions.sensor_definition import DefaultSensorStatus
+from dagster._core.instance.ref import InstanceRef
 from dagster._core.scheduler.instigation import (
     InstigatorStatus,
     InstigatorTick,
@@ -38,11 +45,16 @@
     _PRE_SENSOR_AUTO_MATERIALIZE_INSTIGATOR_NAME,
     _PRE_SENSOR_AUTO_MATERIALIZE_ORIGIN_ID,
     _PRE_SENSOR_AUTO_MATERIALIZE_SELECTOR_ID,
+    AssetDaemon,
+    _get_assigned_worker_id,
     asset_daemon_cursor_from_instigator_serialized_cursor,
     get_has_migrated_to_sensors,
     set_auto_materialize_paused,
 )
+from dagster._daemon.daemon import SpanMarker
 from dagster._serdes.serdes import serialize_value
+from dagster._seven.compat.pendulum import pendulum_freeze_time
+from dagster._utils.error import SerializableErrorInfo
 
 from dagster_tests.definitions_tests.auto_materialize_tests.scenario_state import ScenarioSpec
 
@@ -56,12 +68,14 @@
 )
 from .updated_scenarios.asset_daemon_scenario import (
     AssetDaemonScenario,
+    AssetDaemonScenarioState,
     AssetRuleEvaluationSpec,
 )
 from .updated_scenarios.basic_scenarios import basic_scenarios
 from .updated_scenarios.cron_scenarios import (
     basic_hourly_cron_rule,
     basic_hourly_cron_schedule,
+    cron_scenarios,
     get_cron_policy,
 )
 from .updated_scenarios.partition_scenarios import partition_scenarios
@@ -202,6 +216,34 @@ def test_asset_daemon_without_sensor(scenario: AssetDaemonScenario) -> None:
         scenario.evaluate_daemon(instance)
 
 
+# includes non-subsettable multi-assets, whose members must be evaluated serially
+daemon_scenarios_with_concurrent_evaluation = [*daemon_scenarios, *cron_scenarios]
+
+
+@pytest.mark.parametrize(
+    "scenario",
+    daemon_scenarios_with_concurrent_evaluation,
+    ids=[scenario.id for scenario in daemon_scenarios_with_concurrent_evaluation],
+)
+def test_asset_daemon_with_concurrent_evaluation(scenario: AssetDaemonScenario) -> None:
+    with get_daemon_instance(
+        extra_overrides={"auto_materialize": {"num_evaluation_workers": 4}}
+    ) as instance:
+        scenario.evaluate_daemon(instance)
+
+
+@pytest.mark.parametrize(
+    "scenario",
+    daemon_scenarios_with_concurrent_evaluation,
+    ids=[scenario.id for scenario in daemon_scenarios_with_concurrent_evaluation],
+)
+def test_asset_daemon_reusing_unchanged_evaluations(scenario: AssetDaemonScenario) -> None:
+    with get_daemon_instance(
+        extra_overrides={"auto_materialize": {"reuse_unchanged_evaluations": True}}
+    ) as instance:
+        scenario.evaluate_daemon(instance)
+
+
 daemon_scenarios_with_threadpool_without_sensor = basic_scenarios[:5]
 
 
@@ -718,6 +760,256 @@ def test_auto_materialize_sensor_ticks(num_threads):
                     prev_evaluation_id = evaluation_id
 
 
+def test_asset_daemon_leases() -> None:
+    with get_daemon_instance(
+        paused=True,
+        extra_overrides={"auto_materialize": {"use_sensors": True, "use_leases": True}},
+    ) as instance:
+        sensor_names = [
+            "auto_materialize_sensor_a",
+            "auto_materialize_sensor_b",
+            "default_auto_materialize_sensor",
+        ]
+        state = AssetDaemonScenarioState(
+            daemon_sensor_scenario.initial_spec, instance=instance, is_daemon=True
+        )
+        for sensor_name in sensor_names:
+            state = state.start_sensor(sensor_name)
+
+        # two asset daemon processes running against the same instance
+        daemons = [
+            AssetDaemon(
+                settings=instance.get_auto_materialize_settings(), pre_sensor_interval_seconds=42
+            )
+            for _ in range(2)
+        ]
+        worker_ids = {daemon.worker_id for daemon in daemons}
+        schedule_storage = check.not_none(instance.schedule_storage)
+
+        def _get_num_ticks() -> int:
+            return sum(
+                len(instance.get_ticks(sensor_state.instigator_origin_id, sensor_state.selector_id))
+                for sensor_state in schedule_storage.all_instigator_state(
+                    instigator_type=InstigatorType.SENSOR
+                )
+            )
+
+        def _get_sensor_lease_owners() -> Mapping[str, str]:
+            return {
+                lease.lease_key: lease.owner_id
+                for lease in schedule_storage.get_instigator_leases("asset_daemon/sensors/")
+            }
+
+        freeze_datetime = pendulum.now("UTC")
+        with state._create_workspace_context() as workspace_context:  # noqa: SLF001
+            with pendulum_freeze_time(freeze_datetime):
+
+                def _run_iteration(daemon: AssetDaemon) -> None:
+                    list(
+                        daemon._run_iteration_impl(  # noqa: SLF001
+                            workspace_context,
+                            threadpool_executor=None,
+                            amp_tick_futures={},
+                            debug_crash_flags={},
+                        )
+                    )
+
+                # the first daemon does not know about the second one yet, so takes every sensor
+                _run_iteration(daemons[0])
+                assert _get_num_ticks() == 3
+                assert set(_get_sensor_lease_owners().values()) == {daemons[0].worker_id}
+
+                # the second daemon cannot take over the sensors until the first one hands them off
+                _run_iteration(daemons[1])
+                assert _get_num_ticks() == 3
+                assert set(_get_sensor_lease_owners().values()) == {daemons[0].worker_id}
+
+                _run_iteration(daemons[0])
+                _run_iteration(daemons[1])
+                sensor_lease_owners = _get_sensor_lease_owners()
+                assert len(sensor_lease_owners) == 3
+                for lease_key, owner_id in sensor_lease_owners.items():
+                    assert owner_id == _get_assigned_worker_id(worker_ids, lease_key)
+                assert _get_num_ticks() == 3
+
+            # each sensor is evaluated by a single daemon
+            with pendulum_freeze_time(freeze_datetime.add(seconds=31)):
+                _run_iteration(daemons[0])
+                _run_iteration(daemons[1])
+                assert _get_num_ticks() == 6
+                seen_evaluation_ids = set()
+                for sensor_state in schedule_storage.all_instigator_state(
+                    instigator_type=InstigatorType.SENSOR
+                ):
+                    for tick in instance.get_ticks(
+                        sensor_state.instigator_origin_id, sensor_state.selector_id
+                    ):
+                        assert tick.status != TickStatus.FAILURE
+                        evaluation_id = tick.tick_data.auto_materialize_evaluation_id
+                        assert evaluation_id not in seen_evaluation_ids
+                        seen_evaluation_ids.add(evaluation_id)
+
+                # the second daemon shuts down, so the first one takes over its sensors
+                daemons[1]._release_leases(instance)  # noqa: SLF001
+                _run_iteration(daemons[0])
+                assert set(_get_sensor_lease_owners().values()) == {daemons[0].worker_id}
+
+
+_LEASE_DURATION_SECONDS = 2
+# longer than the lease, so that other processes would take over sensors that are being evaluated
+# unless their leases are renewed while they are
+_LEASED_TICK_SECONDS = 3
+_LEASED_SENSOR_INTERVAL_SECONDS = 10
+
+leased_sensors_spec = three_assets.with_sensors(
+    [
+        AutoMaterializeSensorDefinition(
+            name="leased_sensor_a",
+            asset_selection=AssetSelection.assets("A"),
+            minimum_interval_seconds=_LEASED_SENSOR_INTERVAL_SECONDS,
+        ),
+        AutoMaterializeSensorDefinition(
+            name="leased_sensor_b",
+            asset_selection=AssetSelection.assets("B", "C"),
+            minimum_interval_seconds=_LEASED_SENSOR_INTERVAL_SECONDS,
+        ),
+    ]
+).with_asset_properties(auto_materialize_policy=AutoMaterializePolicy.lazy())
+
+spawn_ctx = multiprocessing.get_context("spawn")
+
+
+def _run_leased_asset_daemon(instance_ref: InstanceRef, run_seconds: float) -> None:
+    with DagsterInstance.from_ref(instance_ref) as instance:
+        state = AssetDaemonScenarioState(leased_sensors_spec, instance=instance, is_daemon=True)
+        evaluate = AssetDaemonContext.evaluate
+
+        def _slow_evaluate(self):
+            time.sleep(_LEASED_TICK_SECONDS)
+            return evaluate(self)
+
+        with mock.patch.object(AssetDaemonContext, "evaluate", _slow_evaluate):
+            with state._create_workspace_context() as workspace_context:  # noqa: SLF001
+                daemon = AssetDaemon(
+                    settings=instance.get_auto_materialize_settings(),
+                    pre_sensor_interval_seconds=42,
+                )
+                end_time = time.time() + run_seconds
+                daemon_loop = daemon.core_loop(workspace_context, threading.Event())
+                for result in daemon_loop:
+                    assert not isinstance(result, SerializableErrorInfo), result.to_string()
+                    if result == SpanMarker.END_SPAN and time.time() > end_time:
+                        break
+                # releases the leases of the daemon
+                daemon_loop.close()
+
+
+def test_asset_daemon_processes_share_sensors() -> None:
+    with get_daemon_instance(
+        extra_overrides={
+            "auto_materialize": {
+                "use_sensors": True,
+                "use_leases": True,
+                "use_threads": False,
+                "lease_duration_seconds": _LEASE_DURATION_SECONDS,
+            }
+        },
+    ) as instance:
+        state = AssetDaemonScenarioState(leased_sensors_spec, instance=instance, is_daemon=True)
+        for sensor_name in ["leased_sensor_a", "leased_sensor_b"]:
+            state = state.start_sensor(sensor_name)
+
+        daemon_processes = [
+            spawn_ctx.Process(target=_run_leased_asset_daemon, args=[instance.get_ref(), 40])
+            for _ in range(2)
+        ]
+        for daemon_process in daemon_processes:
+            daemon_process.start()
+        for daemon_process in daemon_processes:
+            daemon_process.join(timeout=180)
+            assert daemon_process.exitcode == 0
+
+        sensor_states = check.not_none(instance.schedule_storage).all_instigator_state(
+            instigator_type=InstigatorType.SENSOR
+        )
+        assert len(sensor_states) == 2
+        seen_evaluation_ids = set()
+        for sensor_state in sensor_states:
+            ticks = sorted(
+                instance.get_ticks(sensor_state.instigator_origin_id, sensor_state.selector_id),
+                key=lambda tick: tick.timestamp,
+            )
+            # each sensor keeps being evaluated while both processes are running
+            assert len(ticks) >= 2
+            for tick in ticks:
+                # every tick ran to completion, rather than being taken over by another process
+                assert tick.status == TickStatus.SKIPPED
+                assert tick.tick_data.skip_reason is None
+                assert tick.tick_data.end_timestamp
+                evaluation_id = tick.tick_data.auto_materialize_evaluation_id
+                assert evaluation_id not in seen_evaluation_ids
+                seen_evaluation_ids.add(evaluation_id)
+
+            # and a single process evaluates the sensor once per interval
+            for previous_tick, tick in zip(ticks, ticks[1:]):
+                assert (
+                    tick.tick_data.auto_materialize_evaluation_id
+                    > previous_tick.tick_data.auto_materialize_evaluation_id
+                )
+                assert tick.timestamp >= previous_tick.tick_data.end_timestamp
+                assert tick.timestamp - previous_tick.timestamp >= _LEASED_SENSOR_INTERVAL_SECONDS
+
+            assert (
+                asset_daemon_cursor_from_instigator_serialized_cursor(
+                    cast(SensorInstigatorData, sensor_state.instigator_data).cursor, None
+                ).evaluation_id
+                == ticks[-1].tick_data.auto_materialize_evaluation_id
+            )
+
+
+def test_asset_daemon_reserves_evaluation_ids(monkeypatch) -> None:
+    with get_daemon_instance(
+        extra_overrides={"auto_materialize": {"use_sensors": True, "use_leases": True}}
+    ) as instance:
+        daemons = [
+            AssetDaemon(
+                settings=instance.get_auto_materialize_settings(), pre_sensor_interval_seconds=42
+            )
+            for _ in range(2)
+        ]
+        for daemon in daemons:
+            daemon._initialize_evaluation_id(instance)  # noqa: SLF001
+
+        schedule_storage = check.not_none(instance.schedule_storage)
+        acquired_lease_keys = []
+        acquire_instigator_lease = schedule_storage.acquire_instigator_lease
+
+        def _acquire_instigator_lease(lease_key, owner_id, duration_seconds):
+            acquired_lease_keys.append(lease_key)
+            return acquire_instigator_lease(lease_key, owner_id, duration_seconds)
+
+        monkeypatch.setattr(schedule_storage, "acquire_instigator_lease", _acquire_instigator_lease)
+
+        daemons[0]._reserve_evaluation_ids(instance, 3)  # noqa: SLF001
+        daemons[1]._reserve_evaluation_ids(instance, 2)  # noqa: SLF001
+        assert len(acquired_lease_keys) == 2
+
+        def _get_next_evaluation_ids(daemon: AssetDaemon, num_evaluation_ids: int) -> List[int]:
+            return [
+                daemon._get_next_evaluation_id(instance)  # noqa: SLF001
+                for _ in range(num_evaluation_ids)
+            ]
+
+        # the reserved evaluation IDs are handed out without acquiring the lease again
+        assert _get_next_evaluation_ids(daemons[0], 3) == [1, 2, 3]
+        assert _get_next_evaluation_ids(daemons[1], 2) == [4, 5]
+        assert len(acquired_lease_keys) == 2
+
+        # once the block is used up, the next evaluation ID is reserved on its own
+        assert _get_next_evaluation_ids(daemons[0], 1) == [6]
+        assert len(acquired_lease_keys) == 3
+
+
 def test_default_purge() -> None:
     with get_daemon_instance() as instance:
         scenario_time = daemon_scenario.initial_spec.current_time
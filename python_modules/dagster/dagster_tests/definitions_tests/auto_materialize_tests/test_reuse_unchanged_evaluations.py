@@ -0,0 +1,129 @@
+import logging
+from typing import AbstractSet, Tuple
+
+import dagster._check as check
+from dagster import (
+    AssetKey,
+    AutoMaterializePolicy,
+    AutoMaterializeRule,
+    DagsterInstance,
+    Definitions,
+    asset,
+    materialize,
+)
+from dagster._core.asset_graph_view.asset_graph_view import AssetGraphView
+from dagster._core.definitions.asset_daemon_cursor import AssetDaemonCursor
+from dagster._core.definitions.data_time import CachingDataTimeResolver
+from dagster._core.definitions.declarative_scheduling.scheduling_condition_evaluator import (
+    SchedulingConditionEvaluator,
+)
+from dagster._core.definitions.events import AssetKeyPartitionKey
+
+
+@asset(auto_materialize_policy=AutoMaterializePolicy.eager())
+def upstream() -> None: ...
+
+
+@asset(deps=[upstream], auto_materialize_policy=AutoMaterializePolicy.eager())
+def downstream() -> None: ...
+
+
+@asset(
+    deps=[upstream],
+    auto_materialize_policy=AutoMaterializePolicy.eager().with_rules(
+        AutoMaterializeRule.materialize_on_cron("0 0 1 1 *")
+    ),
+)
+def cron_downstream() -> None: ...
+
+
+defs = Definitions(assets=[upstream, downstream, cron_downstream])
+
+
+def _evaluate_tick(
+    instance: DagsterInstance, cursor: AssetDaemonCursor, reuse_unchanged_evaluations: bool
+) -> Tuple[AssetDaemonCursor, AbstractSet[AssetKeyPartitionKey], AbstractSet[AssetKey]]:
+    asset_graph = defs.get_asset_graph()
+    asset_graph_view = AssetGraphView.for_test(defs, instance)
+    evaluator = SchedulingConditionEvaluator(
+        asset_graph=asset_graph,
+        asset_keys=asset_graph.all_asset_keys,
+        asset_graph_view=asset_graph_view,
+        logger=logging.getLogger(__name__),
+        data_time_resolver=CachingDataTimeResolver(
+            asset_graph_view.get_inner_queryer_for_back_compat()
+        ),
+        cursor=cursor,
+        respect_materialization_data_versions=False,
+        auto_materialize_run_tags={},
+        reuse_unchanged_evaluations=reuse_unchanged_evaluations,
+    )
+    evaluation_states, to_request = evaluator.evaluate()
+    # the queries issued while evaluating each asset are part of the results
+    assert evaluator.query_counts_by_asset_key.keys() == asset_graph.all_asset_keys
+    assert sum(
+        sum(query_counts.values()) for query_counts in evaluator.query_counts_by_asset_key.values()
+    ) <= sum(evaluator.query_counts.values())
+    new_cursor = cursor.with_updates(
+        evaluation_id=cursor.evaluation_id + 1,
+        evaluation_timestamp=asset_graph_view.effective_dt.timestamp(),
+        newly_observe_requested_asset_keys=[],
+        evaluation_state=evaluation_states,
+    )
+    return new_cursor, to_request, evaluator.reused_asset_keys
+
+
+def test_reuse_unchanged_evaluations() -> None:
+    with DagsterInstance.ephemeral() as instance:
+        cursor = AssetDaemonCursor.empty()
+
+        def _evaluate_tick_and_compare() -> (
+            Tuple[AbstractSet[AssetKeyPartitionKey], AbstractSet[AssetKey]]
+        ):
+            nonlocal cursor
+            # the results must be the same as when every asset is evaluated
+            expected_cursor, expected_to_request, _ = _evaluate_tick(
+                instance, cursor, reuse_unchanged_evaluations=False
+            )
+            cursor, to_request, reused_asset_keys = _evaluate_tick(
+                instance, cursor, reuse_unchanged_evaluations=True
+            )
+            assert to_request == expected_to_request
+            for asset_key in reused_asset_keys:
+                assert check.not_none(
+                    cursor.get_previous_evaluation_state(asset_key)
+                ).previous_evaluation.equivalent_to_stored_evaluation(
+                    check.not_none(
+                        expected_cursor.get_previous_evaluation_state(asset_key)
+                    ).previous_evaluation
+                )
+            return to_request, reused_asset_keys
+
+        # everything is missing
+        to_request, reused_asset_keys = _evaluate_tick_and_compare()
+        assert {ap.asset_key for ap in to_request} == {
+            upstream.key,
+            downstream.key,
+            cron_downstream.key,
+        }
+        assert reused_asset_keys == set()
+
+        materialize([upstream, downstream, cron_downstream], instance=instance)
+        to_request, reused_asset_keys = _evaluate_tick_and_compare()
+        assert to_request == set()
+        assert reused_asset_keys == set()
+
+        # nothing has changed since the previous tick. the root asset is always evaluated, as the
+        # storage ids of its own events are not tracked in its evaluation state
+        to_request, reused_asset_keys = _evaluate_tick_and_compare()
+        assert to_request == set()
+        assert reused_asset_keys == {downstream.key, cron_downstream.key}
+
+        # the parent has been updated
+        materialize([upstream], instance=instance)
+        to_request, reused_asset_keys = _evaluate_tick_and_compare()
+        assert to_request == {
+            AssetKeyPartitionKey(downstream.key),
+            AssetKeyPartitionKey(cron_downstream.key),
+        }
+        assert reused_asset_keys == set()
@@ -1178,6 +1178,93 @@ def test_unique_identifier():
     )
 
 
+@pytest.mark.parametrize(
+    "cron_schedule",
+    [
+        "0 * * * *",
+        "15 * * * *",
+        "*/15 * * * *",
+        "0 0 * * *",
+        "30 7 * * *",
+        "30 1 * * *",
+        "0 0 * * 1",
+        "0 3 5 * *",
+    ],
+)
+@pytest.mark.parametrize("timezone", ["UTC", "US/Pacific", "Australia/Sydney", "Asia/Kathmandu"])
+@pytest.mark.parametrize("end_offset", [0, 2, -2])
+def test_fixed_period_index_arithmetic(cron_schedule: str, timezone: str, end_offset: int):
+    is_minutely = cron_schedule.endswith("* * * *")
+    # minutely schedules around DST transitions in both hemispheres, other schedules over multiple
+    # years
+    date_ranges = (
+        [
+            ("2021-03-13", "2021-03-15"),
+            ("2021-04-03", "2021-04-05"),
+            ("2021-10-02", "2021-10-04"),
+            ("2021-11-06", "2021-11-08"),
+        ]
+        if is_minutely
+        else [("2020-01-01", "2022-06-15")]
+    )
+    for start, current in date_ranges:
+        partitions_def = TimeWindowPartitionsDefinition(
+            cron_schedule=cron_schedule,
+            start=start + "-00:00",
+            timezone=timezone,
+            fmt="%Y-%m-%d-%H:%M",
+            end_offset=end_offset,
+        )
+        current_time = pendulum.instance(datetime.strptime(current, "%Y-%m-%d"), tz=timezone)
+        partition_keys = partitions_def.get_partition_keys(current_time)
+        assert partitions_def.get_num_partitions(current_time) == len(partition_keys)
+        assert partitions_def.get_last_partition_key(current_time) == partition_keys[-1]
+        assert (
+            partitions_def.get_partition_keys_between_indexes(
+                len(partition_keys) - 5, len(partition_keys) + 5, current_time
+            )
+            == partition_keys[-5:]
+        )
+
+        for partition_key, time_window in zip(
+            partition_keys,
+            partitions_def._iterate_time_windows(partitions_def.start),  # noqa: SLF001
+        ):
+            assert partitions_def.time_window_for_partition_key(partition_key) == time_window
+            assert partitions_def.has_partition_key(partition_key, current_time)
+            for timestamp in [
+                time_window.start.timestamp(),
+                (time_window.start.timestamp() + time_window.end.timestamp()) / 2,
+            ]:
+                assert partitions_def.get_partition_key_for_timestamp(timestamp) == partition_key
+            assert (
+                partitions_def.get_partition_key_for_timestamp(
+                    time_window.end.timestamp(), end_closed=True
+                )
+                == partition_key
+            )
+
+
+def test_fixed_period_without_pytz_transition_tables(monkeypatch):
+    import pytz
+
+    partitions_def = HourlyPartitionsDefinition(
+        start_date="2021-03-13-00:00", end_date="2021-03-16-00:00", timezone="US/Central"
+    )
+    expected_keys = partitions_def.get_partition_keys()
+    assert partitions_def._fixed_minute_interval == 60  # noqa: SLF001
+
+    # without pytz's private transition tables, index arithmetic falls back to iterating
+    monkeypatch.delattr(type(pytz.timezone("US/Central")), "_utc_transition_times")
+    partitions_def = HourlyPartitionsDefinition(
+        start_date="2021-03-13-00:00", end_date="2021-03-16-00:00", timezone="US/Central"
+    )
+    assert partitions_def._fixed_minute_interval is None  # noqa: SLF001
+    assert partitions_def.get_partition_keys() == expected_keys
+    assert partitions_def.get_num_partitions() == len(expected_keys)
+    assert partitions_def.get_last_partition_key() == expected_keys[-1]
+
+
 def test_time_window_partition_len():
     partitions_def = HourlyPartitionsDefinition(start_date="2021-05-05-01:00", minute_offset=15)
     assert partitions_def.get_num_partitions() == len(partitions_def.get_partition_keys())
@@ -8,6 +8,7 @@
     ChildProcessCrashException,
     ChildProcessDoneEvent,
     ChildProcessEvent,
+    ChildProcessEventSelector,
     ChildProcessStartEvent,
     ChildProcessSystemErrorEvent,
     execute_child_process_command,
@@ -50,6 +51,44 @@ def execute(self):
         yield 1
 
 
+class SleepThenReturnCommand(ChildProcessCommand):
+    def __init__(self, seconds, value):
+        self.seconds = seconds
+        self.value = value
+
+    def execute(self):
+        time.sleep(self.seconds)
+        yield self.value
+
+
+def _run_with_selector(commands):
+    event_selector = ChildProcessEventSelector()
+    iters = {
+        i: execute_child_process_command(multiprocessing, command, event_selector)
+        for i, command in enumerate(commands)
+    }
+    results = []
+    while iters:
+        made_progress = False
+        for i, child_iter in list(iters.items()):
+            try:
+                event = next(child_iter)
+            except StopIteration:
+                del iters[i]
+                made_progress = True
+                continue
+            if event is not None:
+                made_progress = True
+                if not isinstance(event, ChildProcessEvent):
+                    results.append(event)
+        if not made_progress:
+            assert event_selector.wait(timeout=10)
+
+    # finished child processes are unregistered
+    assert not event_selector.wait(timeout=0)
+    return results
+
+
 def test_basic_child_process_command():
     events = list(
         filter(
@@ -102,6 +141,20 @@ def test_child_process_segfault():
     assert exc.value.exit_code == -11
 
 
+def test_child_process_event_selector():
+    results = _run_with_selector(
+        [SleepThenReturnCommand(1, "slow")]
+        + [SleepThenReturnCommand(0, f"fast_{i}") for i in range(4)]
+    )
+    assert results[-1] == "slow"
+    assert sorted(results[:-1]) == [f"fast_{i}" for i in range(4)]
+
+
+def test_child_process_event_selector_crash():
+    with pytest.raises(ChildProcessCrashException):
+        _run_with_selector([SleepThenReturnCommand(1, "slow"), CrashyCommand()])
+
+
 @pytest.mark.skip("too long")
 def test_long_running_command():
     list(execute_child_process_command(multiprocessing, LongRunningCommand()))
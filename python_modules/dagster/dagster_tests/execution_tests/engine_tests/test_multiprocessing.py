@@ -1,6 +1,7 @@
 import os
 import sys
 import time
+from typing import Set
 
 import pytest
 from dagster import (
@@ -515,3 +516,70 @@ def get_dynamic_op_failure_job():
 )
 def test_dynamic_failure_retry(job_fn, config_fn):
     assert_expected_failure_behavior(job_fn, config_fn)
+
+
+def _worker_pids(result) -> Set[str]:
+    return {
+        event.event_specific_data.metadata["pid"].text
+        for event in result.all_events
+        if event.event_type == DagsterEventType.STEP_WORKER_STARTED
+    }
+
+
+def test_worker_pool_execution():
+    with instance_for_test() as instance:
+        with execute_job(
+            reconstructable(define_diamond_job),
+            run_config={
+                "execution": {
+                    "config": {
+                        "multiprocess": {
+                            "max_concurrent": 1,
+                            "worker_pool": {"max_steps_per_worker": 2},
+                        }
+                    }
+                },
+            },
+            instance=instance,
+        ) as result:
+            assert result.success
+            assert result.output_for_node("adder") == 11
+            # four steps, two per worker
+            assert len(_worker_pids(result)) == 2
+
+
+@op(tags={"dagster/priority": "1"})
+def sys_exit_first(_):
+    os._exit(1)
+
+
+@op
+def after_crash(_):
+    return 1
+
+
+@job
+def sys_exit_and_noop_job():
+    sys_exit_first()
+    after_crash()
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Different crash output on Windows: See issue #2791")
+def test_worker_pool_crash():
+    with instance_for_test() as instance:
+        with execute_job(
+            reconstructable(sys_exit_and_noop_job),
+            run_config={
+                "execution": {"config": {"multiprocess": {"max_concurrent": 1, "worker_pool": {}}}},
+            },
+            instance=instance,
+            raise_on_error=False,
+        ) as result:
+            assert not result.success
+            failure_data = result.failure_data_for_node("sys_exit_first")
+            assert failure_data
+            assert failure_data.error.cls_name == "ChildProcessCrashException"
+
+            # the crashed worker is replaced for the next step
+            assert result.is_node_success("after_crash")
+            assert len(_worker_pids(result)) == 2
@@ -167,6 +167,38 @@ def test_execute_with_tailer_offset():
     assert TestStepHandler.verify_step_count == 0
 
 
+def test_execute_orchestration_events_only():
+    from .test_jobs import define_dynamic_job
+
+    TestStepHandler.reset()
+    with instance_for_test() as instance:
+        result = execute_job(
+            reconstructable(define_dynamic_job),
+            instance=instance,
+            run_config={"execution": {"config": {"orchestration_events_only": True}}},
+        )
+        TestStepHandler.wait_for_processes()
+
+        assert result.success
+        assert (
+            len(
+                [
+                    e
+                    for e in result.all_events
+                    if e.event_type_value == DagsterEventType.STEP_START.value
+                ]
+            )
+            == 11
+        )
+        # events that are not needed to orchestrate the steps are stored, but not tailed
+        assert not any(
+            e.event_type_value == DagsterEventType.HANDLED_OUTPUT.value for e in result.all_events
+        )
+        assert instance.get_records_for_run(
+            result.run_id, of_type=DagsterEventType.HANDLED_OUTPUT
+        ).records
+
+
 def test_skip_execute():
     from .test_jobs import define_dynamic_skipping_job
 
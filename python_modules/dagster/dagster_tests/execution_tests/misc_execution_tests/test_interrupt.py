@@ -94,7 +94,8 @@ def write_a_file_job():
 
 
 @pytest.mark.skipif(_seven.IS_WINDOWS, reason="Interrupts handled differently on windows")
-def test_interrupt_multiproc():
+@pytest.mark.parametrize("worker_pool", [False, True])
+def test_interrupt_multiproc(worker_pool):
     with tempfile.TemporaryDirectory() as tempdir:
         with instance_for_test(temp_dir=tempdir) as instance:
             file_1 = os.path.join(tempdir, "file_1")
@@ -117,7 +118,14 @@ def test_interrupt_multiproc():
                         "write_3": {"config": {"tempfile": file_3}},
                         "write_4": {"config": {"tempfile": file_4}},
                     },
-                    "execution": {"config": {"multiprocess": {"max_concurrent": 4}}},
+                    "execution": {
+                        "config": {
+                            "multiprocess": {
+                                "max_concurrent": 4,
+                                **({"worker_pool": {}} if worker_pool else {}),
+                            }
+                        }
+                    },
                 },
                 instance=instance,
             ) as result:
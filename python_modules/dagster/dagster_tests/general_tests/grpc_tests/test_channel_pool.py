@@ -0,0 +1,198 @@
+import grpc
+import pytest
+from dagster import _seven as seven
+from dagster._core.errors import DagsterUserCodeUnreachableError
+from dagster._core.test_utils import environ, instance_for_test
+from dagster._grpc import (
+    DagsterGrpcClient,
+    channel_pool,
+    client as grpc_client,
+)
+from dagster._grpc.__generated__ import api_pb2
+from dagster._grpc.channel_pool import GrpcChannelPool, get_grpc_channel_pool
+from dagster._grpc.server import open_server_process
+from dagster._serdes.ipc import interrupt_ipc_subprocess_pid
+from dagster._utils import safe_tempfile_path
+
+
+def _shutdown(server_process):
+    interrupt_ipc_subprocess_pid(server_process.pid)
+    server_process.wait()
+
+
+class _FakeChannel:
+    def __init__(self, server_address, ssl_credentials):
+        self.server_address = server_address
+        self.ssl_credentials = ssl_credentials
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def _get_channel(pool, server_address, ssl_credentials=None):
+    with pool.get_channel(server_address, ssl_credentials) as channel_and_reused:
+        return channel_and_reused
+
+
+def test_channel_pool(monkeypatch):
+    monkeypatch.setattr(channel_pool, "create_grpc_channel", _FakeChannel)
+    pool = GrpcChannelPool(max_channels=2)
+
+    channel, reused = _get_channel(pool, "localhost:1234")
+    assert not reused
+    assert _get_channel(pool, "localhost:1234") == (channel, True)
+    assert len(pool) == 1
+
+    # evicted channels are closed, and evicting a channel that was already replaced is a no-op
+    pool.evict("localhost:1234", None, channel)
+    assert channel.closed
+    new_channel, reused = _get_channel(pool, "localhost:1234")
+    assert not reused
+    assert new_channel is not channel
+    pool.evict("localhost:1234", None, channel)
+    assert _get_channel(pool, "localhost:1234") == (new_channel, True)
+
+    # least recently used channels are dropped and closed once the pool is full
+    dropped_channel, _ = _get_channel(pool, "localhost:2345")
+    _get_channel(pool, "localhost:1234")
+    _get_channel(pool, "localhost:3456")
+    assert len(pool) == 2
+    assert dropped_channel.closed
+    assert not new_channel.closed
+    assert _get_channel(pool, "localhost:1234") == (new_channel, True)
+    assert not _get_channel(pool, "localhost:2345")[1]
+
+    pool.clear()
+    assert len(pool) == 0
+    assert new_channel.closed
+
+
+def test_channel_pool_credentials(monkeypatch):
+    monkeypatch.setattr(channel_pool, "create_grpc_channel", _FakeChannel)
+    pool = GrpcChannelPool()
+
+    credentials = object()
+    other_credentials = object()
+    insecure_channel, _ = _get_channel(pool, "localhost:1234")
+    secure_channel, reused = _get_channel(pool, "localhost:1234", credentials)
+    assert not reused
+    assert secure_channel.ssl_credentials is credentials
+    assert _get_channel(pool, "localhost:1234", credentials) == (secure_channel, True)
+    assert not _get_channel(pool, "localhost:1234", other_credentials)[1]
+    assert _get_channel(pool, "localhost:1234") == (insecure_channel, True)
+    assert len(pool) == 3
+
+
+def test_channel_pool_closes_channels_after_use(monkeypatch):
+    monkeypatch.setattr(channel_pool, "create_grpc_channel", _FakeChannel)
+    pool = GrpcChannelPool(max_channels=1)
+
+    with pool.get_channel("localhost:1234") as (channel, _):
+        # channels that are removed from the pool while in use are closed once they are released
+        pool.evict("localhost:1234", None, channel)
+        with pool.get_channel("localhost:1234") as (new_channel, reused):
+            assert not reused
+            assert new_channel is not channel
+            _get_channel(pool, "localhost:2345")
+            assert not channel.closed
+            assert not new_channel.closed
+        assert new_channel.closed
+        assert not channel.closed
+    assert channel.closed
+
+
+@pytest.mark.skipif(seven.IS_WINDOWS, reason="Unix-only test")
+def test_pooled_channel_reconnects_after_server_restart():
+    get_grpc_channel_pool().clear()
+    with instance_for_test() as instance:
+        with safe_tempfile_path() as skt:
+            server_process = open_server_process(instance.get_ref(), port=None, socket=skt)
+            try:
+                client = DagsterGrpcClient(socket=skt)
+                assert client.ping("foo")["echo"] == "foo"
+                assert client.ping("bar")["echo"] == "bar"
+                # a second client for the same server shares the connection
+                assert DagsterGrpcClient(socket=skt).ping("baz")["echo"] == "baz"
+                assert len(get_grpc_channel_pool()) == 1
+            finally:
+                _shutdown(server_process)
+
+            server_process = open_server_process(instance.get_ref(), port=None, socket=skt)
+            try:
+                assert client.ping("foo")["echo"] == "foo"
+                assert client.heartbeat("bar") == "bar"
+            finally:
+                _shutdown(server_process)
+
+
+class _UnavailableError(grpc.RpcError):
+    def code(self):
+        return grpc.StatusCode.UNAVAILABLE
+
+
+def test_only_read_only_calls_are_retried(monkeypatch):
+    calls = []
+
+    class _UnavailableStub:
+        def __init__(self, channel):
+            pass
+
+        def __getattr__(self, method):
+            def _call(request, **kwargs):
+                calls.append(method)
+                raise _UnavailableError()
+
+            return _call
+
+    monkeypatch.setattr(channel_pool, "create_grpc_channel", _FakeChannel)
+    monkeypatch.setattr(grpc_client, "DagsterApiStub", _UnavailableStub)
+    get_grpc_channel_pool().clear()
+    client = DagsterGrpcClient(port=1234)
+
+    def _call_on_reused_channel(method):
+        calls.clear()
+        # open a channel to the server, so that the next request reuses it from the pool
+        _get_channel(get_grpc_channel_pool(), "localhost:1234")
+        with pytest.raises(DagsterUserCodeUnreachableError):
+            client._query(method, api_pb2.Empty)  # noqa: SLF001
+        return list(calls)
+
+    assert _call_on_reused_channel("GetServerId") == ["GetServerId", "GetServerId"]
+    assert _call_on_reused_channel("ListRepositories") == ["ListRepositories", "ListRepositories"]
+    for method in [
+        "SyncExternalSensorExecution",
+        "SyncExternalScheduleExecution",
+        "ExternalPartitionConfig",
+        "StartRun",
+        "CancelExecution",
+        "ShutdownServer",
+    ]:
+        assert _call_on_reused_channel(method) == [method]
+
+    get_grpc_channel_pool().clear()
+
+
+@pytest.mark.skipif(seven.IS_WINDOWS, reason="Unix-only test")
+@pytest.mark.parametrize(
+    "env",
+    [
+        {"DAGSTER_GRPC_COMPRESSION_MIN_BYTES": "0"},
+        {"DAGSTER_GRPC_DISABLE_CHANNEL_POOLING": "1"},
+    ],
+)
+def test_channel_settings(env):
+    get_grpc_channel_pool().clear()
+    with environ(env), instance_for_test() as instance:
+        with safe_tempfile_path() as skt:
+            server_process = open_server_process(instance.get_ref(), port=None, socket=skt)
+            try:
+                client = DagsterGrpcClient(socket=skt)
+                assert client.ping("foo" * 1000)["echo"] == "foo" * 1000
+                assert len(list(client.streaming_ping(sequence_length=10, echo="foo"))) == 10
+                assert client.health_check_query() == "SERVING"
+            finally:
+                _shutdown(server_process)
+    assert len(get_grpc_channel_pool()) == (
+        0 if "DAGSTER_GRPC_DISABLE_CHANNEL_POOLING" in env else 1
+    )
@@ -275,3 +275,51 @@ def test_failure_on_open_server_process(instance):
                 loadable_target_origin=loadable_target_origin,
             ):
                 pass
+
+
+def test_registry_starts_servers_concurrently(instance):
+    origins = [
+        ManagedGrpcPythonEnvCodeLocationOrigin(
+            loadable_target_origin=LoadableTargetOrigin(
+                executable_path=sys.executable,
+                attribute=attribute,
+                python_file=file_relative_path(__file__, "test_grpc_server_registry.py"),
+            ),
+        )
+        for attribute in ["repo", "other_repo"]
+    ]
+
+    # each server only finishes starting up once the other one has started starting up too
+    barrier = threading.Barrier(len(origins), timeout=30)
+
+    class _BarrierGrpcServerProcess(GrpcServerProcess):
+        def __init__(self, *args, **kwargs):
+            barrier.wait()
+            super().__init__(*args, **kwargs)
+
+    with mock.patch(
+        "dagster._core.remote_representation.grpc_server_registry.GrpcServerProcess",
+        _BarrierGrpcServerProcess,
+    ):
+        with GrpcServerRegistry(
+            instance_ref=instance.get_ref(),
+            reload_interval=300,
+            heartbeat_ttl=600,
+            startup_timeout=30,
+            wait_for_processes_on_shutdown=True,
+        ) as registry:
+            endpoints = {}
+
+            def _get_endpoint(origin):
+                endpoints[origin.get_id()] = registry.get_grpc_endpoint(origin)
+
+            threads = [threading.Thread(target=_get_endpoint, args=(origin,)) for origin in origins]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            assert len(endpoints) == 2
+            assert len({endpoint.server_id for endpoint in endpoints.values()}) == 2
+            for origin in origins:
+                assert _can_connect(origin, endpoints[origin.get_id()], instance)
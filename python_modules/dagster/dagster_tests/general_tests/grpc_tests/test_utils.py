@@ -5,6 +5,9 @@
     default_repository_grpc_timeout,
     default_schedule_grpc_timeout,
     default_sensor_grpc_timeout,
+    grpc_channel_pooling_enabled,
+    grpc_compression_min_bytes,
+    grpc_keepalive_time_ms,
 )
 
 
@@ -108,3 +111,27 @@ def test_override_grpc_timeouts():
         assert default_sensor_grpc_timeout() == 60
         assert default_grpc_server_shutdown_grace_period() == 60
         assert default_repository_grpc_timeout() == 300
+
+
+def test_grpc_channel_settings():
+    with environ(
+        {
+            "DAGSTER_GRPC_DISABLE_CHANNEL_POOLING": None,
+            "DAGSTER_GRPC_KEEPALIVE_TIME_MS": None,
+            "DAGSTER_GRPC_COMPRESSION_MIN_BYTES": None,
+        }
+    ):
+        assert grpc_channel_pooling_enabled()
+        assert grpc_keepalive_time_ms() == 300000
+        assert grpc_compression_min_bytes() == 1024
+
+    with environ(
+        {
+            "DAGSTER_GRPC_DISABLE_CHANNEL_POOLING": "1",
+            "DAGSTER_GRPC_KEEPALIVE_TIME_MS": "60000",
+            "DAGSTER_GRPC_COMPRESSION_MIN_BYTES": "0",
+        }
+    ):
+        assert not grpc_channel_pooling_enabled()
+        assert grpc_keepalive_time_ms() == 60000
+        assert grpc_compression_min_bytes() == 0
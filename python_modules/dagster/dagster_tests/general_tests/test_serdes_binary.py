@@ -0,0 +1,242 @@
+import math
+from enum import Enum
+from typing import Any, List, NamedTuple, Optional
+
+import pytest
+from dagster._check import ParameterCheckError
+from dagster._serdes.binary import (
+    FORMAT_VERSION,
+    MAGIC,
+    deserialize_value_from_bytes,
+    serialize_value_to_bytes,
+)
+from dagster._serdes.errors import DeserializationError
+from dagster._serdes.serdes import (
+    SerializableNonScalarKeyMapping,
+    WhitelistMap,
+    _whitelist_for_serdes,
+    deserialize_value,
+    serialize_value,
+)
+
+
+@pytest.fixture(params=[False, True], ids=["json", "msgpack"])
+def msgpack_enabled(request, monkeypatch) -> bool:
+    if request.param:
+        monkeypatch.setenv("DAGSTER_SERDES_MSGPACK", "1")
+    else:
+        monkeypatch.delenv("DAGSTER_SERDES_MSGPACK", raising=False)
+    return request.param
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        None,
+        True,
+        False,
+        0,
+        -1,
+        127,
+        2**64,
+        -(2**70),
+        98765432109876543210,
+        1.5,
+        -0.0,
+        math.inf,
+        "",
+        "hello",
+        "snowman ☃ and \U0001f600",
+        "lone surrogate \ud800",
+        [],
+        [1, "two", [3.0, None]],
+        ("a", "b"),
+        {},
+        {"a": 1, "b": {"c": [1, 2, {"d": None}]}},
+        {0.5: "half", 1: "one", 2: "two"},
+        {True: "yes", False: "no"},
+        {None: "none"},
+        set(),
+        {1, 2, 3},
+        frozenset(["x", "y"]),
+    ],
+)
+def test_roundtrip_matches_json(msgpack_enabled: bool, value: Any) -> None:
+    serialized = serialize_value_to_bytes(value)
+    assert serialized.startswith(MAGIC) == msgpack_enabled
+
+    from_bytes = deserialize_value_from_bytes(serialized)
+    from_json = deserialize_value(serialize_value(value))
+    assert from_bytes == from_json
+    assert type(from_bytes) is type(from_json)
+
+
+def test_roundtrip_objects(msgpack_enabled: bool) -> None:
+    test_map = WhitelistMap.create()
+
+    @_whitelist_for_serdes(whitelist_map=test_map)
+    class Color(Enum):
+        RED = "red"
+        BLUE = "blue"
+
+    @_whitelist_for_serdes(whitelist_map=test_map)
+    class Node(NamedTuple):
+        name: str
+        color: Color
+        children: List["Node"]
+        weight: Optional[float] = None
+
+    tree = Node(
+        "root",
+        Color.RED,
+        [Node(f"child_{i}", Color.BLUE, [], weight=i / 3) for i in range(200)],
+    )
+    serialized = serialize_value_to_bytes(tree, whitelist_map=test_map)
+    assert deserialize_value_from_bytes(serialized, as_type=Node, whitelist_map=test_map) == tree
+
+    if msgpack_enabled:
+        assert len(serialized) < len(serialize_value(tree, whitelist_map=test_map))
+
+
+def test_non_scalar_key_mapping(msgpack_enabled: bool) -> None:
+    test_map = WhitelistMap.create()
+
+    @_whitelist_for_serdes(whitelist_map=test_map)
+    class Bar(NamedTuple):
+        color: str
+
+    mapping = SerializableNonScalarKeyMapping({Bar("red"): 1, Bar("blue"): 2})
+    serialized = serialize_value_to_bytes(mapping, whitelist_map=test_map)
+    assert deserialize_value_from_bytes(serialized, whitelist_map=test_map) == mapping
+
+
+def test_forward_compat(msgpack_enabled: bool) -> None:
+    old_map = WhitelistMap.create()
+
+    # Separate scope since we redefine Quux
+    def register_orig() -> Any:
+        @_whitelist_for_serdes(whitelist_map=old_map)
+        class Quux(NamedTuple):
+            bar: str
+            baz: str
+
+        return Quux
+
+    orig_klass = register_orig()
+
+    # new version has a new field with a new type
+    new_map = WhitelistMap.create()
+
+    @_whitelist_for_serdes(whitelist_map=new_map)
+    class Quux(NamedTuple):
+        foo: "Foo"
+        bar: str
+        baz: str
+        buried: dict
+
+    @_whitelist_for_serdes(whitelist_map=new_map)
+    class Foo(NamedTuple):
+        s: str
+
+    new_quux = Quux(
+        foo=Foo("wow"),
+        bar="bar",
+        baz="baz",
+        buried={
+            "top": Foo("d"),
+            "list": [Foo("l"), 2, 3],
+            "set": {Foo("s"), 2, 3},
+            "frozenset": frozenset((1, 2, Foo("fs"))),
+            "deep": {"1": [{"2": {"3": [Foo("d")]}}]},
+        },
+    )
+
+    # write from new, read from old, Foo ignored
+    serialized = serialize_value_to_bytes(new_quux, whitelist_map=new_map)
+    deserialized = deserialize_value_from_bytes(
+        serialized, as_type=orig_klass, whitelist_map=old_map
+    )
+    assert deserialized.bar == "bar"
+    assert deserialized.baz == "baz"
+
+
+def test_unknown_values_match_json(msgpack_enabled: bool) -> None:
+    new_map = WhitelistMap.create()
+
+    @_whitelist_for_serdes(whitelist_map=new_map)
+    class Mystery(NamedTuple):
+        s: str
+
+    @_whitelist_for_serdes(whitelist_map=new_map)
+    class Shade(Enum):
+        DARK = "dark"
+
+    empty_map = WhitelistMap.create()
+    for value in [Mystery("?"), [Shade.DARK]]:
+        with pytest.raises(DeserializationError) as json_error:
+            deserialize_value(serialize_value(value, new_map), whitelist_map=empty_map)
+        with pytest.raises(DeserializationError) as bytes_error:
+            deserialize_value_from_bytes(
+                serialize_value_to_bytes(value, new_map), whitelist_map=empty_map
+            )
+        assert str(bytes_error.value) == str(json_error.value)
+
+
+def test_old_fields_and_storage_names(msgpack_enabled: bool) -> None:
+    legacy_map = WhitelistMap.create()
+
+    @_whitelist_for_serdes(whitelist_map=legacy_map)
+    class OldThing(NamedTuple):
+        name: str
+        removed: int
+
+    serialized = serialize_value_to_bytes(OldThing("a", 1), whitelist_map=legacy_map)
+
+    test_map = WhitelistMap.create()
+
+    @_whitelist_for_serdes(
+        whitelist_map=test_map, old_storage_names={"OldThing"}, old_fields={"removed": 0}
+    )
+    class NewThing(NamedTuple):
+        name: str
+
+    assert deserialize_value_from_bytes(serialized, whitelist_map=test_map) == NewThing("a")
+
+
+def test_type_check(msgpack_enabled: bool) -> None:
+    serialized = serialize_value_to_bytes({"foo": "bar"})
+    assert deserialize_value_from_bytes(serialized, as_type=dict) == {"foo": "bar"}
+    with pytest.raises(DeserializationError, match="was not expected type"):
+        deserialize_value_from_bytes(serialized, NamedTuple)
+
+
+def test_reads_both_formats(monkeypatch) -> None:
+    value = {"a": [1, 2, 3]}
+    monkeypatch.setenv("DAGSTER_SERDES_MSGPACK", "1")
+    msgpack_serialized = serialize_value_to_bytes(value)
+    monkeypatch.delenv("DAGSTER_SERDES_MSGPACK")
+    json_serialized = serialize_value_to_bytes(value)
+
+    assert msgpack_serialized != json_serialized
+    assert json_serialized == serialize_value(value).encode("utf-8")
+    assert deserialize_value_from_bytes(msgpack_serialized) == value
+    assert deserialize_value_from_bytes(json_serialized) == value
+
+
+def test_invalid_input(monkeypatch) -> None:
+    monkeypatch.setenv("DAGSTER_SERDES_MSGPACK", "1")
+
+    with pytest.raises(ParameterCheckError):
+        deserialize_value_from_bytes("not bytes")  # type: ignore
+
+    serialized = serialize_value_to_bytes({"a": [1, 2, 3]})
+    with pytest.raises(ValueError):
+        deserialize_value_from_bytes(serialized[:-1])
+
+    with pytest.raises(ValueError):
+        deserialize_value_from_bytes(serialized + b"\x00")
+
+    with pytest.raises(DeserializationError, match="Unsupported serdes msgpack format version"):
+        deserialize_value_from_bytes(
+            MAGIC + bytes([FORMAT_VERSION + 1]) + serialized[len(MAGIC) + 1 :]
+        )
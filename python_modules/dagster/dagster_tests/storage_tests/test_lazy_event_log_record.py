@@ -0,0 +1,72 @@
+import json
+import time
+
+from dagster import AssetKey, AssetMaterialization
+from dagster._core.event_api import LazyEventLogRecord
+from dagster._core.events import DagsterEvent, DagsterEventType, StepMaterializationData
+from dagster._core.events.log import EventLogEntry
+from dagster._core.utils import make_new_run_id
+from dagster._serdes import serialize_value
+
+
+def _materialization_entry(run_id: str) -> EventLogEntry:
+    return EventLogEntry(
+        error_info=None,
+        user_message="",
+        level="debug",
+        run_id=run_id,
+        timestamp=time.time(),
+        step_key="my_step",
+        job_name="my_job",
+        dagster_event=DagsterEvent(
+            DagsterEventType.ASSET_MATERIALIZATION.value,
+            "my_job",
+            step_key="my_step",
+            event_specific_data=StepMaterializationData(
+                AssetMaterialization(asset_key=AssetKey("my_asset"), partition="a")
+            ),
+        ),
+    )
+
+
+def test_lazy_record_parses_on_access():
+    run_id = make_new_run_id()
+    entry = _materialization_entry(run_id)
+    serialized = serialize_value(entry)
+
+    # the run id and asset key can be passed in from indexed columns
+    record = LazyEventLogRecord(1, serialized, run_id=run_id, asset_key=AssetKey("my_asset"))
+    assert record.run_id == run_id
+    assert record.asset_key == AssetKey("my_asset")
+    assert not record._is_envelope_parsed  # noqa: SLF001
+
+    assert record.timestamp == entry.timestamp
+    assert record._is_envelope_parsed  # noqa: SLF001
+    assert record.dagster_event_type == DagsterEventType.ASSET_MATERIALIZATION
+    assert record.partition_key == "a"
+    assert record.step_key == "my_step"
+    assert record.job_name == "my_job"
+    assert not record.is_deserialized
+
+    assert record.event_log_entry == entry
+    assert record.is_deserialized
+
+    # without column values, the envelope is parsed on first access
+    record = LazyEventLogRecord(1, serialized)
+    assert not record._is_envelope_parsed  # noqa: SLF001
+    assert record.run_id == run_id
+    assert record.asset_key == AssetKey("my_asset")
+
+
+def test_lazy_record_unknown_event_type():
+    run_id = make_new_run_id()
+    packed = json.loads(serialize_value(_materialization_entry(run_id)))
+    packed["dagster_event"]["event_type_value"] = "SOME_NEW_EVENT_TYPE"
+    packed["dagster_event"]["event_specific_data"] = None
+
+    record = LazyEventLogRecord(1, json.dumps(packed))
+    # unknown event types are resolved like the eager deserializer does
+    assert record.dagster_event_type == DagsterEventType.ENGINE_EVENT
+    assert record.dagster_event_type == record.event_log_entry.dagster_event_type
+    assert record.asset_key is None
+    assert record.run_id == run_id
@@ -9,3 +9,10 @@ class TestSqlPartitionStatusCache(TestPartitionStatusCache):
     def instance(self):
         with instance_for_test() as the_instance:
             yield the_instance
+
+    @pytest.fixture
+    def write_through_instance(self):
+        with instance_for_test(
+            overrides={"asset_status_cache": {"write_through": True}}
+        ) as the_instance:
+            yield the_instance
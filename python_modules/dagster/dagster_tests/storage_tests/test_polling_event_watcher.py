@@ -1,29 +1,31 @@
 import tempfile
+import threading
 import time
 from contextlib import contextmanager
 from typing import Any, Callable, Mapping, Optional
 
 import dagster._check as check
+import mock
+import pytest
 from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
 from dagster._core.events.log import EventLogEntry
-from dagster._core.storage.event_log import SqliteEventLogStorage, SqlPollingEventWatcher
+from dagster._core.storage.event_log import (
+    ConsolidatedSqliteEventLogStorage,
+    SqliteEventLogStorage,
+    SqlPollingEventWatcher,
+)
 from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.utils import make_new_run_id
 from dagster._serdes.config_class import ConfigurableClassData
 from typing_extensions import Self
 
 
-class SqlitePollingEventLogStorage(SqliteEventLogStorage):
-    """SQLite-backed event log storage that uses SqlPollingEventWatcher for watching runs.
-
-    This class is a subclass of SqliteEventLogStorage that uses the SqlPollingEventWatcher class
-    (polling via SELECT queries) instead of the SqliteEventLogStorageWatchdog (filesystem watcher) to
-    observe runs.
+class PollingWatcherMixin:
+    """Mixin for SQLite-backed event log storages that uses SqlPollingEventWatcher (polling via
+    SELECT queries) instead of the filesystem watcher to observe runs.
     """
 
-    def __init__(self, *args, **kwargs) -> None:
-        super(SqlitePollingEventLogStorage, self).__init__(*args, **kwargs)
-        self._watcher: Optional[SqlPollingEventWatcher] = None
+    _watcher: Optional[SqlPollingEventWatcher] = None
 
     @classmethod
     def from_config_value(
@@ -61,6 +63,20 @@ def dispose(self) -> None:
             self._watcher = None
 
 
+class SqlitePollingEventLogStorage(PollingWatcherMixin, SqliteEventLogStorage):
+    """Run-sharded SQLite-backed event log storage that uses SqlPollingEventWatcher for watching
+    runs.
+    """
+
+
+class ConsolidatedSqlitePollingEventLogStorage(
+    PollingWatcherMixin, ConsolidatedSqliteEventLogStorage
+):
+    """Consolidated SQLite-backed event log storage that uses SqlPollingEventWatcher for watching
+    runs, which polls all watched runs with a shared query.
+    """
+
+
 RUN_ID = make_new_run_id()
 
 
@@ -87,6 +103,20 @@ def create_sqlite_run_event_logstorage():
         storage.dispose()
 
 
+@contextmanager
+def create_consolidated_sqlite_event_logstorage():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage = ConsolidatedSqlitePollingEventLogStorage(tmpdir_path)
+        yield storage
+        storage.dispose()
+
+
+def _wait_for(condition: Callable[[], bool], attempts: int = 50):
+    while not condition() and attempts > 0:
+        time.sleep(0.1)
+        attempts -= 1
+
+
 def test_using_logstorage():
     with create_sqlite_run_event_logstorage() as storage:
         watched_1 = []
@@ -146,3 +176,151 @@ def watch_two(event, _cursor):
 
     # calling end_watch after dispose does not error
     storage.end_watch(RUN_ID, watch_two)
+
+
+@pytest.mark.parametrize(
+    "storage_cm_fn",
+    [create_sqlite_run_event_logstorage, create_consolidated_sqlite_event_logstorage],
+)
+def test_watch_many_runs(storage_cm_fn):
+    num_runs = 20
+    run_ids = [make_new_run_id() for _ in range(num_runs)]
+
+    with storage_cm_fn() as storage:
+        for run_id in run_ids:
+            storage.store_event(create_event(0, run_id=run_id))
+
+        thread_count_before = threading.active_count()
+
+        watched = {run_id: [] for run_id in run_ids}
+        callbacks = {}
+        for run_id in run_ids:
+            callbacks[run_id] = lambda event, _cursor, run_id=run_id: watched[run_id].append(event)
+            storage.watch(run_id, None, callbacks[run_id])
+
+        # a single thread tails the event log on behalf of every watched run
+        assert threading.active_count() == thread_count_before + 1
+
+        for run_id in run_ids:
+            storage.store_event(create_event(1, run_id=run_id))
+
+        _wait_for(lambda: all(len(events) == 2 for events in watched.values()))
+        for run_id in run_ids:
+            assert [int(event.message) for event in watched[run_id]] == [0, 1]
+            assert {event.run_id for event in watched[run_id]} == {run_id}
+
+        for run_id in run_ids[: num_runs // 2]:
+            storage.end_watch(run_id, callbacks[run_id])
+
+        for run_id in run_ids:
+            storage.store_event(create_event(2, run_id=run_id))
+
+        _wait_for(lambda: all(len(watched[run_id]) == 3 for run_id in run_ids[num_runs // 2 :]))
+        for run_id in run_ids[: num_runs // 2]:
+            assert len(watched[run_id]) == 2
+        for run_id in run_ids[num_runs // 2 :]:
+            assert [int(event.message) for event in watched[run_id]] == [0, 1, 2]
+
+
+def test_shared_query_for_unsharded_storage():
+    run_ids = [make_new_run_id() for _ in range(10)]
+
+    with create_consolidated_sqlite_event_logstorage() as storage:
+        watched = []
+        for run_id in run_ids:
+            storage.watch(run_id, None, lambda event, _cursor: watched.append(event))
+        watcher = check.not_none(storage._watcher)  # noqa: SLF001
+        _wait_for(
+            lambda: all(run.caught_up for run in watcher._watched_runs.values())  # noqa: SLF001
+        )
+
+        with mock.patch.object(
+            storage, "get_records_for_run", wraps=storage.get_records_for_run
+        ) as get_records_for_run, mock.patch.object(
+            storage, "get_records_for_runs", wraps=storage.get_records_for_runs
+        ) as get_records_for_runs:
+            for run_id in run_ids:
+                storage.store_event(create_event(1, run_id=run_id))
+
+            _wait_for(lambda: len(watched) == len(run_ids))
+            assert len(watched) == len(run_ids)
+
+            # caught-up runs are polled together, rather than with a query per run
+            assert get_records_for_run.call_count == 0
+            assert get_records_for_runs.call_count >= 1
+            for call in get_records_for_runs.call_args_list:
+                assert set(call.args[0]) == set(run_ids)
+
+
+def test_cursor_only_advances_past_dispatched_events():
+    run_id, other_run_id = make_new_run_id(), make_new_run_id()
+
+    with create_consolidated_sqlite_event_logstorage() as storage:
+        storage.store_event(create_event(0, run_id=run_id))
+        watcher = SqlPollingEventWatcher(storage)
+        try:
+            watched = []
+            watcher.watch_run(run_id, None, lambda event, _cursor: watched.append(event))
+            watcher.poll()
+            assert [int(event.message) for event in watched] == [0]
+
+            # events for other runs do not advance the cursor of the watched run
+            storage.store_event(create_event(0, run_id=other_run_id))
+            watcher.poll()
+            assert watcher._watched_runs[run_id].cursor == 1  # noqa: SLF001
+
+            storage.store_event(create_event(1, run_id=run_id))
+            watcher.poll()
+            assert [int(event.message) for event in watched] == [0, 1]
+        finally:
+            watcher.close()
+
+
+def test_callback_error_stops_watch():
+    run_id, other_run_id = make_new_run_id(), make_new_run_id()
+
+    with create_consolidated_sqlite_event_logstorage() as storage:
+        watcher = SqlPollingEventWatcher(storage)
+        try:
+            watched = []
+
+            def _failing_callback(_event, _cursor):
+                raise Exception("callback failed")
+
+            watcher.watch_run(run_id, None, _failing_callback)
+            watcher.watch_run(other_run_id, None, lambda event, _cursor: watched.append(event))
+            storage.store_event(create_event(0, run_id=run_id))
+            storage.store_event(create_event(0, run_id=other_run_id))
+
+            with pytest.raises(Exception, match="callback failed"):
+                watcher.poll()
+
+            # the other run is still dispatched, and the failing run is no longer watched
+            assert len(watched) == 1
+            assert not watcher.has_run_id(run_id)
+            assert watcher.has_run_id(other_run_id)
+        finally:
+            watcher.close()
+
+
+def test_thread_exits_when_idle():
+    with create_consolidated_sqlite_event_logstorage() as storage:
+        watched = []
+
+        def _callback(event, _cursor):
+            watched.append(event)
+
+        storage.watch(RUN_ID, None, _callback)
+        watcher = check.not_none(storage._watcher)  # noqa: SLF001
+        thread = check.not_none(watcher._thread)  # noqa: SLF001
+
+        storage.end_watch(RUN_ID, _callback)
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+        assert watcher._thread is None  # noqa: SLF001
+
+        # watching again starts a new polling thread
+        storage.watch(RUN_ID, None, _callback)
+        storage.store_event(create_event(1))
+        _wait_for(lambda: len(watched) == 1)
+        assert len(watched) == 1
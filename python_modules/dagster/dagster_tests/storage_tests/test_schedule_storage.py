@@ -1,3 +1,4 @@
+import multiprocessing
 import tempfile
 from contextlib import contextmanager
 
@@ -64,3 +65,32 @@ class TestLegacyStorage(TestScheduleStorage):
     def schedule_storage(self, request):
         with request.param() as s:
             yield s
+
+
+def _acquire_lease(tempdir, owner_id, queue):
+    storage = SqliteScheduleStorage.from_local(tempdir)
+    queue.put((owner_id, storage.acquire_instigator_lease("sensors/foo", owner_id, 60)))
+
+
+def test_instigator_lease_contention():
+    ctx = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as tempdir:
+        # create the storage before the processes race to acquire the lease
+        storage = SqliteScheduleStorage.from_local(tempdir)
+        queue = ctx.Queue()
+        processes = [
+            ctx.Process(target=_acquire_lease, args=[tempdir, f"worker_{i}", queue])
+            for i in range(4)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(timeout=60)
+
+        results = dict(queue.get(timeout=5) for _ in processes)
+        winners = [owner_id for owner_id, acquired in results.items() if acquired]
+        assert len(winners) == 1
+        assert [lease.owner_id for lease in storage.get_instigator_leases()] == winners
+
+        storage.release_instigator_lease("sensors/foo", winners[0])
+        assert storage.acquire_instigator_lease("sensors/foo", "worker_other", 60)
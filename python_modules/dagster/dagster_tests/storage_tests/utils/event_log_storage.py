@@ -23,6 +23,7 @@
     EventRecordsFilter,
     Field,
     In,
+    IntMetadataValue,
     JobDefinition,
     Out,
     Output,
@@ -81,7 +82,7 @@
 from dagster._core.execution.job_execution_result import JobExecutionResult
 from dagster._core.execution.plan.handle import StepHandle
 from dagster._core.execution.plan.objects import StepFailureData, StepSuccessData
-from dagster._core.execution.stats import StepEventStatus
+from dagster._core.execution.stats import StepEventStatus, build_run_step_stats_from_events
 from dagster._core.instance import RUNLESS_JOB_NAME, RUNLESS_RUN_ID
 from dagster._core.remote_representation.external_data import (
     external_partitions_definition_from_def,
@@ -1248,6 +1249,125 @@ def foo():
             result = storage.fetch_materializations(foo.key, limit=100)
             assert len(result.records) == 2
 
+    def test_store_event_batch(self, storage, instance):
+        asset_key_a = AssetKey(["batch_a"])
+        asset_key_b = AssetKey(["batch_b"])
+
+        @op
+        def materialize_and_observe(_):
+            yield AssetMaterialization(asset_key=asset_key_a, tags={DATA_VERSION_TAG: "1"})
+            yield AssetObservation(asset_key=asset_key_b)
+            yield AssetMaterialization(asset_key=asset_key_a, tags={DATA_VERSION_TAG: "2"})
+            yield Output(1)
+
+        def _ops():
+            materialize_and_observe()
+
+        run_id_1, run_id_2 = make_new_run_id(), make_new_run_id()
+        with create_and_delete_test_runs(instance, [run_id_1, run_id_2]):
+            events_one, _ = _synthesize_events(_ops, run_id=run_id_1)
+            events_two, _ = _synthesize_events(_ops, run_id=run_id_2)
+
+            storage.store_event_batch(events_one + events_two)
+
+            for run_id, events in [(run_id_1, events_one), (run_id_2, events_two)]:
+                out_events = storage.get_logs_for_run(run_id)
+                assert _event_types(out_events) == _event_types(events)
+                assert storage.get_stats_for_run(run_id).steps_succeeded == 1
+
+            result = storage.fetch_materializations(asset_key_a, limit=100)
+            assert len(result.records) == 4
+            assert result.records[0].run_id == run_id_2
+            assert len(storage.fetch_observations(asset_key_b, limit=100).records) == 2
+
+            [record_a, record_b] = storage.get_asset_records([asset_key_a, asset_key_b])
+            last_materialization = record_a.asset_entry.last_materialization_record
+            assert last_materialization
+            assert last_materialization.storage_id == result.records[0].storage_id
+            assert last_materialization.event_log_entry.run_id == run_id_2
+            assert record_b.asset_entry.asset_key == asset_key_b
+
+            tags = storage.get_event_tags_for_asset(asset_key_a)
+            assert sorted(t[DATA_VERSION_TAG] for t in tags) == ["1", "1", "2", "2"]
+            assert storage.get_event_tags_for_asset(
+                asset_key_a, filter_event_id=result.records[0].storage_id
+            ) == [{DATA_VERSION_TAG: "2"}]
+
+            status_changes = storage.fetch_run_status_changes(
+                DagsterEventType.RUN_SUCCESS, limit=100
+            )
+            assert {r.run_id for r in status_changes.records} == {run_id_1, run_id_2}
+
+    def test_get_lazy_records_for_run(self, storage, instance):
+        asset_key = AssetKey(["lazy", "asset"])
+
+        @op
+        def materialize_and_observe(_):
+            yield AssetMaterialization(asset_key=asset_key, partition="a", metadata={"rows": 1})
+            yield AssetObservation(asset_key=asset_key, partition="b")
+            yield Output(1)
+
+        def _ops():
+            materialize_and_observe()
+
+        run_id = make_new_run_id()
+        with create_and_delete_test_runs(instance, [run_id]):
+            events, _ = _synthesize_events(_ops, run_id=run_id)
+            for event in events:
+                storage.store_event(event)
+
+            records = storage.get_records_for_run(run_id).records
+            lazy_records = storage.get_lazy_records_for_run(run_id)
+            assert len(lazy_records) == len(records)
+            for record, lazy_record in zip(records, lazy_records):
+                assert lazy_record.storage_id == record.storage_id
+                assert lazy_record.run_id == record.run_id
+                assert lazy_record.timestamp == record.timestamp
+                assert lazy_record.step_key == record.event_log_entry.step_key
+                assert lazy_record.job_name == record.event_log_entry.job_name
+                assert lazy_record.dagster_event_type == record.event_log_entry.dagster_event_type
+                assert lazy_record.asset_key == record.asset_key
+                assert lazy_record.partition_key == record.partition_key
+            # only entries without a nested dagster event are deserialized up front
+            assert all(
+                lazy_record.is_deserialized == (lazy_record.dagster_event_type is None)
+                for lazy_record in lazy_records
+            )
+
+            [materialization, observation] = storage.get_lazy_records_for_run(
+                run_id,
+                of_type={
+                    DagsterEventType.ASSET_MATERIALIZATION,
+                    DagsterEventType.ASSET_OBSERVATION,
+                },
+            )
+            assert materialization.asset_key == asset_key
+            assert materialization.partition_key == "a"
+            assert observation.partition_key == "b"
+            assert not materialization.is_deserialized
+            assert materialization.asset_materialization
+            assert materialization.asset_materialization.metadata["rows"] == IntMetadataValue(1)
+            assert materialization.is_deserialized
+            assert materialization.to_event_log_record() in records
+            assert observation.asset_materialization is None
+
+            cursor = EventLogCursor.from_storage_id(records[1].storage_id).to_string()
+            assert [
+                r.storage_id for r in storage.get_lazy_records_for_run(run_id, cursor, limit=2)
+            ] == [r.storage_id for r in records[2:4]]
+
+            [status_change] = storage.fetch_lazy_run_status_changes(
+                DagsterEventType.RUN_SUCCESS, limit=100
+            )
+            assert status_change.run_id == run_id
+            assert status_change.event_type == DagsterEventType.RUN_SUCCESS
+            assert (
+                status_change.storage_id
+                == storage.fetch_run_status_changes(DagsterEventType.RUN_SUCCESS, limit=100)
+                .records[0]
+                .storage_id
+            )
+
     def test_asset_materialization_fetch(self, storage, test_run_id):
         asset_key = AssetKey(["path", "to", "asset_one"])
 
@@ -1748,6 +1868,42 @@ def _pipeline():
         assert len(step_stats[0].markers) == 1
         assert step_stats[0].markers[0].end_time >= step_stats[0].markers[0].start_time + 0.1
 
+    def test_run_step_stats_match_events(self, storage, test_run_id):
+        @op
+        def materialize_and_expect(_):
+            yield AssetMaterialization(asset_key="my_asset", metadata={"rows": 1})
+            yield ExpectationResult(success=True, label="my_expectation")
+            yield Output(1)
+
+        @op
+        def should_retry(_, _input):
+            raise RetryRequested(max_retries=2)
+
+        def _job():
+            should_retry(materialize_and_expect())
+
+        events, result = _synthesize_events(_job, check_success=False, run_id=test_run_id)
+        for event in events:
+            storage.store_event(event)
+
+        expected = {
+            stats.step_key: stats
+            for stats in build_run_step_stats_from_events(
+                result.run_id, storage.get_logs_for_run(result.run_id)
+            )
+        }
+        step_stats = {
+            stats.step_key: stats for stats in storage.get_step_stats_for_run(test_run_id)
+        }
+        assert set(step_stats.keys()) == {"materialize_and_expect", "should_retry"}
+        assert step_stats["materialize_and_expect"].materialization_events
+        assert step_stats["materialize_and_expect"].expectation_results
+        assert step_stats["should_retry"].attempts == 3
+
+        # step stats are built from the same event timestamps, whether they are aggregated in the
+        # storage or folded from the events
+        assert step_stats == expected
+
     @pytest.mark.parametrize(
         "cursor_dt", cursor_datetime_args()
     )  # test both tz-aware and naive datetimes
@@ -2664,6 +2820,15 @@ def _assert_storage_matches(expected):
                 )
                 == expected
             )
+            # the bulk query should agree with the per-asset query for every asset key
+            assert storage.get_latest_storage_ids_by_partition(
+                [a, b], DagsterEventType.ASSET_MATERIALIZATION
+            ) == {
+                a: expected,
+                b: storage.get_latest_storage_id_by_partition(
+                    b, DagsterEventType.ASSET_MATERIALIZATION
+                ),
+            }
 
         def _store_partition_event(asset_key, partition) -> int:
             storage.store_event(
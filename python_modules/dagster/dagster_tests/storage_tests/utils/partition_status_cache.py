@@ -48,6 +48,11 @@ def instance(self, request):
     def delete_runs_instance(self, instance):
         return instance
 
+    @pytest.fixture(name="write_through_instance", params=[])
+    def write_through_instance(self, request):
+        with request.param() as s:
+            yield s
+
     def test_get_cached_status_unpartitioned(self, instance):
         @asset
         def asset1():
@@ -889,6 +894,133 @@ def test_batch_canceled_partitions(self, instance, delete_runs_instance):
             assert failed_subset.get_partition_keys() == set()
             assert in_progress_subset.get_partition_keys() == set()
 
+    def test_write_through_cache(self, write_through_instance):
+        instance = write_through_instance
+        partitions_def = DailyPartitionsDefinition(start_date="2022-01-01")
+
+        @asset(partitions_def=partitions_def)
+        def asset1():
+            return 1
+
+        asset_graph = AssetGraph.from_assets([asset1])
+        asset_job = define_asset_job("asset_job").resolve(asset_graph=asset_graph)
+        asset_key = AssetKey("asset1")
+
+        asset_job.execute_in_process(instance=instance, partition_key="2022-02-01")
+        cached_status = get_and_update_asset_status_cache_value(instance, asset_key, partitions_def)
+        assert cached_status
+        assert cached_status.partitions_def_id
+
+        asset_job.execute_in_process(instance=instance, partition_key="2022-02-02")
+
+        # the stored cache value is updated as the events are written
+        stored_cache_value = next(
+            iter(instance.get_asset_records([asset_key]))
+        ).asset_entry.cached_status
+        assert stored_cache_value
+        assert (
+            stored_cache_value.latest_storage_id
+            == next(iter(instance.fetch_materializations(asset_key, limit=1).records)).storage_id
+        )
+        assert stored_cache_value.earliest_in_progress_materialization_event_id is None
+        assert set(
+            stored_cache_value.deserialize_materialized_partition_subsets(
+                partitions_def
+            ).get_partition_keys()
+        ) == {"2022-02-01", "2022-02-02"}
+        assert stored_cache_value.deserialize_in_progress_partition_subsets(partitions_def).is_empty
+
+        traced_counter.set(Counter())
+        cached_status = get_and_update_asset_status_cache_value(instance, asset_key, partitions_def)
+        assert cached_status == stored_cache_value
+        counts = traced_counter.get().counts()
+        assert counts.get("DagsterInstance.get_materialized_partitions") is None
+
+        # a run that fails before materializing is resolved when the cache value is read
+        run_id = make_new_run_id()
+        create_run_for_test(instance, run_id=run_id, status=DagsterRunStatus.STARTED)
+        instance.event_log_storage.store_event(
+            _create_test_planned_materialization_record(run_id, asset_key, "2022-02-03")
+        )
+        stored_cache_value = next(
+            iter(instance.get_asset_records([asset_key]))
+        ).asset_entry.cached_status
+        assert stored_cache_value
+        assert stored_cache_value.earliest_in_progress_materialization_event_id
+        assert stored_cache_value.deserialize_in_progress_partition_subsets(
+            partitions_def
+        ).get_partition_keys() == ["2022-02-03"]
+
+        run = instance.get_run_by_id(run_id)
+        assert run
+        instance.report_run_failed(run)
+        cached_status = get_and_update_asset_status_cache_value(instance, asset_key, partitions_def)
+        assert cached_status
+        assert cached_status.deserialize_failed_partition_subsets(
+            partitions_def
+        ).get_partition_keys() == ["2022-02-03"]
+        assert cached_status.deserialize_in_progress_partition_subsets(partitions_def).is_empty
+
+    def test_write_through_cache_batch(self, write_through_instance):
+        instance = write_through_instance
+        partitions_def = DailyPartitionsDefinition(start_date="2022-01-01")
+
+        @asset(partitions_def=partitions_def)
+        def asset1():
+            return 1
+
+        asset_graph = AssetGraph.from_assets([asset1])
+        asset_job = define_asset_job("asset_job").resolve(asset_graph=asset_graph)
+        asset_key = AssetKey("asset1")
+
+        asset_job.execute_in_process(instance=instance, partition_key="2022-02-01")
+        assert get_and_update_asset_status_cache_value(instance, asset_key, partitions_def)
+
+        run_id = make_new_run_id()
+        create_run_for_test(instance, run_id=run_id, status=DagsterRunStatus.STARTED)
+        instance.event_log_storage.store_event_batch(
+            [
+                _create_test_planned_materialization_record(run_id, asset_key, "2022-02-02"),
+                _create_test_planned_materialization_record(run_id, asset_key, "2022-02-03"),
+                _create_test_materialization_record(run_id, asset_key, "2022-02-02"),
+            ]
+        )
+
+        # every event in the batch is applied to the stored cache value
+        stored_cache_value = next(
+            iter(instance.get_asset_records([asset_key]))
+        ).asset_entry.cached_status
+        assert stored_cache_value
+        assert (
+            stored_cache_value.latest_storage_id
+            == next(iter(instance.fetch_materializations(asset_key, limit=1).records)).storage_id
+        )
+        assert set(
+            stored_cache_value.deserialize_materialized_partition_subsets(
+                partitions_def
+            ).get_partition_keys()
+        ) == {"2022-02-01", "2022-02-02"}
+        assert stored_cache_value.deserialize_in_progress_partition_subsets(
+            partitions_def
+        ).get_partition_keys() == ["2022-02-03"]
+
+
+def _create_test_materialization_record(run_id: str, asset_key: AssetKey, partition: str):
+    return EventLogEntry(
+        error_info=None,
+        user_message="",
+        level="debug",
+        run_id=run_id,
+        timestamp=time.time(),
+        dagster_event=DagsterEvent(
+            DagsterEventType.ASSET_MATERIALIZATION.value,
+            "nonce",
+            event_specific_data=StepMaterializationData(
+                AssetMaterialization(asset_key=asset_key, partition=partition)
+            ),
+        ),
+    )
+
 
 def _create_test_planned_materialization_record(run_id: str, asset_key: AssetKey, partition: str):
     return EventLogEntry(
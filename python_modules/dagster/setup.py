@@ -120,11 +120,13 @@ def get_version() -> str:
     ],
     extras_require={
         "docker": ["docker"],
+        "msgpack": ["msgpack>=1.0"],
         "test": [
             "buildkite-test-collector",
             "docker",
             f"grpcio-tools>={GRPC_VERSION_FLOOR}",
             "mock==3.0.5",
+            "msgpack>=1.0",
             "mypy-protobuf",
             "objgraph",
             "pytest-cov==2.10.1",
@@ -1,4 +1,4 @@
-from typing import ContextManager, Optional, cast
+from typing import ContextManager, Optional, Sequence, cast
 
 import dagster._check as check
 import sqlalchemy as db
@@ -6,7 +6,9 @@
 import sqlalchemy.exc as db_exc
 import sqlalchemy.pool as db_pool
 from dagster._config.config_schema import UserConfigSchema
+from dagster._core.errors import DagsterInvariantViolationError
 from dagster._core.event_api import EventHandlerFn
+from dagster._core.events import ASSET_CHECK_EVENTS, ASSET_EVENTS
 from dagster._core.events.log import EventLogEntry
 from dagster._core.storage.config import MySqlStorageConfig, mysql_config
 from dagster._core.storage.event_log import (
@@ -141,10 +143,66 @@ def get_server_version(self) -> Optional[str]:
 
         return cast(str, row[0])
 
+    def store_event_batch(self, events: Sequence[EventLogEntry]) -> None:
+        check.sequence_param(events, "event", of_type=EventLogEntry)
+        if not events:
+            return
+
+        # MySQL does not return the ids of the rows inserted by a multi-row insert, and they are not
+        # guaranteed to be consecutive, so the events are inserted one at a time. They still share a
+        # single connection and transaction.
+        with self._connect() as conn:
+            event_ids = [
+                cast(int, conn.execute(self.prepare_insert_event(event)).inserted_primary_key[0])
+                for event in events
+            ]
+
+        if any((event_id is None for event_id in event_ids)):
+            raise DagsterInvariantViolationError("Cannot store asset event tags for null event id.")
+
+        asset_events_and_ids = [
+            (event, event_id)
+            for event, event_id in zip(events, event_ids)
+            if event.is_dagster_event
+            and event.dagster_event_type in ASSET_EVENTS
+            and event.get_dagster_event().asset_key
+        ]
+        if asset_events_and_ids:
+            # We only update the asset table with the last event of each type for each asset
+            last_asset_event_and_id_by_key = {
+                (event.get_dagster_event().asset_key, event.dagster_event_type): (event, event_id)
+                for event, event_id in asset_events_and_ids
+            }
+            for event, event_id in sorted(
+                last_asset_event_and_id_by_key.values(), key=lambda event_and_id: event_and_id[1]
+            ):
+                self._store_asset_entry(event, event_id)
+
+            asset_events, asset_event_ids = zip(*asset_events_and_ids)
+            if self._is_asset_status_cache_write_through_enabled():
+                # every event in the batch is applied to the cached asset statuses, not just the
+                # last one of each type
+                with self.index_connection() as conn:
+                    self._update_asset_cached_status_data_for_events(
+                        conn, asset_events, asset_event_ids
+                    )
+            self.store_asset_event_tags(asset_events, asset_event_ids)
+
+        for event, event_id in zip(events, event_ids):
+            if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
+                self.store_asset_check_event(event, event_id)
+
     def store_asset_event(self, event: EventLogEntry, event_id: int) -> None:
         # last_materialization_timestamp is updated upon observation, materialization, materialization_planned
         # See SqlEventLogStorage.store_asset_event method for more details
+        if not (event.dagster_event and event.dagster_event.asset_key):
+            return
+
+        self._store_asset_entry(event, event_id)
+        self._update_asset_cached_status_data_for_event(event, event_id)
 
+    def _store_asset_entry(self, event: EventLogEntry, event_id: int) -> None:
+        """Upserts the asset key row for an asset event."""
         values = self._get_asset_entry_values(
             event, event_id, self.has_secondary_index(ASSET_KEY_INDEX_COLS)
         )
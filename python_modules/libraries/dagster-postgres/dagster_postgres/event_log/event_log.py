@@ -8,9 +8,9 @@
 from dagster._config.config_schema import UserConfigSchema
 from dagster._core.errors import DagsterInvariantViolationError
 from dagster._core.event_api import EventHandlerFn
-from dagster._core.events import ASSET_CHECK_EVENTS, ASSET_EVENTS, BATCH_WRITABLE_EVENTS
+from dagster._core.events import ASSET_CHECK_EVENTS, ASSET_EVENTS
 from dagster._core.events.log import EventLogEntry
-from dagster._core.storage.config import pg_config
+from dagster._core.storage.config import pg_event_log_config
 from dagster._core.storage.event_log import (
     AssetKeyTable,
     DynamicPartitionsTable,
@@ -40,6 +40,7 @@
     retry_pg_connection_fn,
     retry_pg_creation_fn,
 )
+from .event_watcher import PostgresEventWatcher
 
 CHANNEL_NAME = "run_events"
 
@@ -78,12 +79,16 @@ def __init__(
         postgres_url: str,
         should_autocreate_tables: bool = True,
         inst_data: Optional[ConfigurableClassData] = None,
+        use_listen_notify_event_watcher: bool = False,
     ):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self.postgres_url = check.str_param(postgres_url, "postgres_url")
         self.should_autocreate_tables = check.bool_param(
             should_autocreate_tables, "should_autocreate_tables"
         )
+        self.use_listen_notify_event_watcher = check.bool_param(
+            use_listen_notify_event_watcher, "use_listen_notify_event_watcher"
+        )
 
         # Default to not holding any connections open to prevent accumulating connections per DagsterInstance
         self._engine = create_engine(
@@ -137,7 +142,7 @@ def inst_data(self) -> Optional[ConfigurableClassData]:
 
     @classmethod
     def config_type(cls) -> UserConfigSchema:
-        return pg_config()
+        return pg_event_log_config()
 
     @classmethod
     def from_config_value(
@@ -147,11 +152,16 @@ def from_config_value(
             inst_data=inst_data,
             postgres_url=pg_url_from_config(config_value),
             should_autocreate_tables=config_value.get("should_autocreate_tables", True),
+            use_listen_notify_event_watcher=config_value.get(
+                "use_listen_notify_event_watcher", False
+            ),
         )
 
     @staticmethod
     def create_clean_storage(
-        conn_string: str, should_autocreate_tables: bool = True
+        conn_string: str,
+        should_autocreate_tables: bool = True,
+        use_listen_notify_event_watcher: bool = False,
     ) -> "PostgresEventLogStorage":
         engine = create_engine(
             conn_string, isolation_level="AUTOCOMMIT", poolclass=db_pool.NullPool
@@ -161,7 +171,11 @@ def create_clean_storage(
         finally:
             engine.dispose()
 
-        return PostgresEventLogStorage(conn_string, should_autocreate_tables)
+        return PostgresEventLogStorage(
+            conn_string,
+            should_autocreate_tables,
+            use_listen_notify_event_watcher=use_listen_notify_event_watcher,
+        )
 
     def store_event(self, event: EventLogEntry) -> None:
         """Store an event corresponding to a run.
@@ -181,7 +195,8 @@ def store_event(self, event: EventLogEntry) -> None:
             res = result.fetchone()
             result.close()
 
-            # LISTEN/NOTIFY no longer used for pg event watch - preserved here to support version skew
+            # LISTEN/NOTIFY is used by the opt-in PostgresEventWatcher, and is also preserved here
+            # to support version skew
             conn.execute(
                 db.text(f"""NOTIFY {CHANNEL_NAME}, :notify_id; """),
                 {"notify_id": res[0] + "_" + str(res[1])},  # type: ignore
@@ -207,30 +222,72 @@ def store_event(self, event: EventLogEntry) -> None:
 
     def store_event_batch(self, events: Sequence[EventLogEntry]) -> None:
         check.sequence_param(events, "event", of_type=EventLogEntry)
-
-        check.invariant(
-            all(event.get_dagster_event().event_type in BATCH_WRITABLE_EVENTS for event in events),
-            f"{BATCH_WRITABLE_EVENTS} are the only currently supported events for batch writes.",
-        )
+        if not events:
+            return
 
         insert_event_statement = self.prepare_insert_event_batch(events)
         with self._connect() as conn:
-            result = conn.execute(insert_event_statement.returning(SqlEventLogStorageTable.c.id))
-            event_ids = [cast(int, row[0]) for row in result.fetchall()]
-
-        # We only update the asset table with the last event
-        self.store_asset_event(events[-1], event_ids[-1])
+            result = conn.execute(
+                insert_event_statement.returning(
+                    SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.id
+                )
+            )
+            rows = result.fetchall()
+            event_ids = [cast(int, row[1]) for row in rows]
+
+            # notify once per run with the latest storage id, which is sufficient to wake watchers
+            latest_event_id_by_run_id = {row[0]: row[1] for row in rows}
+            for run_id, event_id in latest_event_id_by_run_id.items():
+                conn.execute(
+                    db.text(f"""NOTIFY {CHANNEL_NAME}, :notify_id; """),
+                    {"notify_id": run_id + "_" + str(event_id)},
+                )
 
         if any((event_id is None for event_id in event_ids)):
             raise DagsterInvariantViolationError("Cannot store asset event tags for null event id.")
 
-        self.store_asset_event_tags(events, event_ids)
+        asset_events_and_ids = [
+            (event, event_id)
+            for event, event_id in zip(events, event_ids)
+            if event.is_dagster_event
+            and event.dagster_event_type in ASSET_EVENTS
+            and event.get_dagster_event().asset_key
+        ]
+        if asset_events_and_ids:
+            # We only update the asset table with the last event of each type for each asset
+            last_asset_event_and_id_by_key = {
+                (event.get_dagster_event().asset_key, event.dagster_event_type): (event, event_id)
+                for event, event_id in asset_events_and_ids
+            }
+            for event, event_id in sorted(
+                last_asset_event_and_id_by_key.values(), key=lambda event_and_id: event_and_id[1]
+            ):
+                self._store_asset_entry(event, event_id)
+
+            asset_events, asset_event_ids = zip(*asset_events_and_ids)
+            if self._is_asset_status_cache_write_through_enabled():
+                # every event in the batch is applied to the cached asset statuses, not just the
+                # last one of each type
+                with self.index_connection() as conn:
+                    self._update_asset_cached_status_data_for_events(
+                        conn, asset_events, asset_event_ids
+                    )
+            self.store_asset_event_tags(asset_events, asset_event_ids)
+
+        for event, event_id in zip(events, event_ids):
+            if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
+                self.store_asset_check_event(event, event_id)
 
     def store_asset_event(self, event: EventLogEntry, event_id: int) -> None:
         check.inst_param(event, "event", EventLogEntry)
         if not (event.dagster_event and event.dagster_event.asset_key):
             return
 
+        self._store_asset_entry(event, event_id)
+        self._update_asset_cached_status_data_for_event(event, event_id)
+
+    def _store_asset_entry(self, event: EventLogEntry, event_id: int) -> None:
+        """Upserts the asset key row for an asset event."""
         # We switched to storing the entire event record of the last materialization instead of just
         # the AssetMaterialization object, so that we have access to metadata like timestamp,
         # job, run_id, etc.
@@ -266,7 +323,7 @@ def store_asset_event(self, event: EventLogEntry, event_id: int) -> None:
         )
         with self.index_connection() as conn:
             query = db_dialects.postgresql.insert(AssetKeyTable).values(
-                asset_key=event.dagster_event.asset_key.to_string(),
+                asset_key=check.not_none(event.get_dagster_event().asset_key).to_string(),
                 **values,
             )
             if values:
@@ -342,7 +399,11 @@ def watch(
         if cursor and EventLogCursor.parse(cursor).is_offset_cursor():
             check.failed("Cannot call `watch` with an offset cursor")
         if self._event_watcher is None:
-            self._event_watcher = SqlPollingEventWatcher(self)
+            self._event_watcher = (
+                PostgresEventWatcher(self, self.postgres_url, CHANNEL_NAME)
+                if self.use_listen_notify_event_watcher
+                else SqlPollingEventWatcher(self)
+            )
 
         self._event_watcher.watch_run(run_id, cursor, callback)
 
@@ -0,0 +1,174 @@
+import logging
+import select
+import threading
+import time
+from typing import AbstractSet, Callable, Optional, Set
+
+import dagster._check as check
+import sqlalchemy.pool as db_pool
+from dagster._core.events.log import EventLogEntry
+from dagster._core.storage.event_log.base import EventLogStorage
+from dagster._core.storage.event_log.polling_event_watcher import (
+    INIT_POLL_PERIOD,
+    MAX_POLL_PERIOD,
+    SqlPollingEventWatcher,
+)
+from dagster._core.storage.sql import create_engine
+
+# how long the listener blocks waiting for notifications before checking whether it should exit
+LISTEN_TIMEOUT = 1.0
+
+
+def run_id_from_notify_payload(payload: str) -> str:
+    # payloads are of the form `{run_id}_{storage_id}`
+    return payload.rsplit("_", 1)[0]
+
+
+class PostgresEventWatcher(SqlPollingEventWatcher):
+    """Event log watcher that is woken by Postgres NOTIFY messages, which are sent on `channel`
+    for each stored event.
+
+    A single PostgresEventWatcherListenerThread holds a dedicated connection that LISTENs on the
+    channel. When a notification arrives for a watched run, the polling thread is woken immediately
+    to fetch new events for just the notified runs. While the listener is connected, the watched
+    runs are only otherwise polled every MAX_POLL_PERIOD as a safety net. If the listener connection
+    drops, the watcher falls back to regular polling until the listener reconnects.
+    """
+
+    def __init__(self, event_log_storage: EventLogStorage, postgres_url: str, channel: str):
+        super().__init__(event_log_storage)
+        self._postgres_url = check.str_param(postgres_url, "postgres_url")
+        self._channel = check.str_param(channel, "channel")
+        self._notified_run_ids: Set[str] = set()
+        self._is_listening = False
+        self._last_full_poll_time = 0.0
+        self._listener: Optional[PostgresEventWatcherListenerThread] = None
+
+    @property
+    def is_listening(self) -> bool:
+        return self._is_listening
+
+    def watch_run(
+        self,
+        run_id: str,
+        cursor: Optional[str],
+        callback: Callable[[EventLogEntry, str], None],
+    ) -> None:
+        super().watch_run(run_id, cursor, callback)
+        with self._lock:
+            if self._listener is None:
+                self._listener = PostgresEventWatcherListenerThread(
+                    self, self._postgres_url, self._channel
+                )
+                self._listener.daemon = True
+                self._listener.start()
+
+    def close(self) -> None:
+        with self._lock:
+            listener = self._listener
+            self._listener = None
+        if listener:
+            listener.should_thread_exit.set()
+            listener.join()
+        super().close()
+
+    def on_listen_state_change(self, is_listening: bool) -> None:
+        with self._lock:
+            self._is_listening = is_listening
+            # events may have been missed while the listener was disconnected, so make sure that
+            # the next poll covers all of the watched runs
+            self._last_full_poll_time = 0.0
+            thread = self._thread
+        if thread:
+            thread.wake()
+
+    def on_notify(self, run_ids: AbstractSet[str]) -> None:
+        with self._lock:
+            notified_run_ids = {run_id for run_id in run_ids if run_id in self._watched_runs}
+            self._notified_run_ids.update(notified_run_ids)
+            thread = self._thread
+        if notified_run_ids and thread:
+            thread.wake()
+
+    def get_poll_period(self, previous_poll_period: float, is_active: bool) -> float:
+        if self._is_listening:
+            return MAX_POLL_PERIOD
+        return super().get_poll_period(previous_poll_period, is_active)
+
+    def poll(self, run_ids: Optional[AbstractSet[str]] = None) -> bool:
+        with self._lock:
+            notified_run_ids = self._notified_run_ids
+            self._notified_run_ids = set()
+            is_full_poll_due = time.time() - self._last_full_poll_time >= MAX_POLL_PERIOD
+
+        if self._is_listening and not is_full_poll_due:
+            return super().poll(
+                run_ids=notified_run_ids if run_ids is None else run_ids & notified_run_ids
+            )
+
+        self._last_full_poll_time = time.time()
+        return super().poll(run_ids)
+
+
+class PostgresEventWatcherListenerThread(threading.Thread):
+    """subclass of Thread that LISTENs for event notifications on a dedicated connection and
+    forwards the notified run ids to a PostgresEventWatcher.
+
+    Reconnects with exponential backoff if the connection is lost.
+    Exits when `self.should_thread_exit` is set.
+    """
+
+    def __init__(self, event_watcher: PostgresEventWatcher, postgres_url: str, channel: str):
+        super(PostgresEventWatcherListenerThread, self).__init__()
+        self._event_watcher = check.inst_param(event_watcher, "event_watcher", PostgresEventWatcher)
+        self._engine = create_engine(
+            postgres_url, isolation_level="AUTOCOMMIT", poolclass=db_pool.NullPool
+        )
+        self._channel = check.str_param(channel, "channel")
+        self._should_thread_exit = threading.Event()
+        self.name = "postgres-event-watch-listener"
+
+    @property
+    def should_thread_exit(self) -> threading.Event:
+        return self._should_thread_exit
+
+    def run(self) -> None:
+        reconnect_wait = INIT_POLL_PERIOD
+        while not self._should_thread_exit.is_set():
+            try:
+                self._listen()
+                reconnect_wait = INIT_POLL_PERIOD
+            except Exception:
+                logging.exception(
+                    "Lost connection listening for event notifications, falling back to polling."
+                )
+            finally:
+                self._event_watcher.on_listen_state_change(False)
+
+            if self._should_thread_exit.wait(reconnect_wait):
+                break
+            reconnect_wait = min(reconnect_wait * 2, MAX_POLL_PERIOD)
+
+        self._engine.dispose()
+
+    def _listen(self) -> None:
+        conn = self._engine.raw_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute(f"LISTEN {self._channel};")
+            cursor.close()
+            conn.commit()
+            self._event_watcher.on_listen_state_change(True)
+
+            while not self._should_thread_exit.is_set():
+                if select.select([conn], [], [], LISTEN_TIMEOUT) == ([], [], []):
+                    continue
+
+                conn.poll()  # type: ignore  # (psycopg2 connection)
+                run_ids = set()
+                while conn.notifies:  # type: ignore  # (psycopg2 connection)
+                    notify = conn.notifies.pop(0)  # type: ignore  # (psycopg2 connection)
+                    run_ids.add(run_id_from_notify_payload(notify.payload))
+                self._event_watcher.on_notify(run_ids)
+        finally:
+            conn.close()
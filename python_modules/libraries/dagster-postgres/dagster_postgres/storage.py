@@ -3,7 +3,7 @@
 from dagster import _check as check
 from dagster._config.config_schema import UserConfigSchema
 from dagster._core.storage.base_storage import DagsterStorage
-from dagster._core.storage.config import PostgresStorageConfig, pg_config
+from dagster._core.storage.config import PostgresStorageConfig, pg_event_log_config
 from dagster._core.storage.event_log import EventLogStorage
 from dagster._core.storage.runs import RunStorage
 from dagster._core.storage.schedules import ScheduleStorage
@@ -39,6 +39,7 @@ def __init__(
         postgres_url,
         should_autocreate_tables=True,
         inst_data: Optional[ConfigurableClassData] = None,
+        use_listen_notify_event_watcher: bool = False,
     ):
         self.postgres_url = postgres_url
         self.should_autocreate_tables = check.bool_param(
@@ -46,7 +47,11 @@ def __init__(
         )
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self._run_storage = PostgresRunStorage(postgres_url, should_autocreate_tables)
-        self._event_log_storage = PostgresEventLogStorage(postgres_url, should_autocreate_tables)
+        self._event_log_storage = PostgresEventLogStorage(
+            postgres_url,
+            should_autocreate_tables,
+            use_listen_notify_event_watcher=use_listen_notify_event_watcher,
+        )
         self._schedule_storage = PostgresScheduleStorage(postgres_url, should_autocreate_tables)
         super().__init__()
 
@@ -56,7 +61,7 @@ def inst_data(self) -> Optional[ConfigurableClassData]:
 
     @classmethod
     def config_type(cls) -> UserConfigSchema:
-        return pg_config()
+        return pg_event_log_config()
 
     @classmethod
     def from_config_value(
@@ -66,6 +71,9 @@ def from_config_value(
             inst_data=inst_data,
             postgres_url=pg_url_from_config(config_value),
             should_autocreate_tables=config_value.get("should_autocreate_tables", True),
+            use_listen_notify_event_watcher=config_value.get(
+                "use_listen_notify_event_watcher", False
+            ),
         )
 
     @property
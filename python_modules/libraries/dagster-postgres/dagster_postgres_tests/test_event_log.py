@@ -4,11 +4,14 @@
 
 import objgraph
 import pytest
+import sqlalchemy as db
 import yaml
 from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.test_utils import ensure_dagster_tests_import, instance_for_test
 from dagster._core.utils import make_new_run_id
 from dagster_postgres.event_log import PostgresEventLogStorage
+from dagster_postgres.event_log.event_log import CHANNEL_NAME
+from dagster_postgres.event_log.event_watcher import PostgresEventWatcher
 
 ensure_dagster_tests_import()
 from dagster_tests.storage_tests.utils.event_log_storage import (
@@ -99,6 +102,48 @@ def watch_two(event, _cursor):
         gc.collect()
         assert len(objgraph.by_type("SqlPollingEventWatcher")) == 0
 
+    def test_listen_notify_event_watcher(self, conn_string):
+        storage = PostgresEventLogStorage.create_clean_storage(
+            conn_string, use_listen_notify_event_watcher=True
+        )
+        try:
+            run_id = make_new_run_id()
+            watched = []
+
+            def _wait_for(condition, attempts=50):
+                while not condition() and attempts > 0:
+                    time.sleep(0.1)
+                    attempts -= 1
+                assert condition()
+
+            storage.watch(run_id, None, lambda event, _cursor: watched.append(event))
+            watcher = storage._event_watcher  # noqa: SLF001
+            assert isinstance(watcher, PostgresEventWatcher)
+            _wait_for(lambda: watcher.is_listening)
+
+            # events are pushed to the watcher well before the safety-net poll period elapses
+            storage.store_event(create_test_event_log_record(str(1), run_id=run_id))
+            _wait_for(lambda: len(watched) == 1, attempts=20)
+
+            # dropping the listener connection falls back to polling, and then reconnects
+            with storage._engine.connect() as conn:  # noqa: SLF001
+                conn.execute(
+                    db.text(
+                        "SELECT pg_terminate_backend(pid) FROM pg_stat_activity"
+                        f" WHERE query LIKE 'LISTEN {CHANNEL_NAME}%'"
+                    )
+                )
+            _wait_for(lambda: not watcher.is_listening)
+            storage.store_event(create_test_event_log_record(str(2), run_id=run_id))
+            _wait_for(lambda: len(watched) == 2)
+            _wait_for(lambda: watcher.is_listening)
+
+            storage.store_event(create_test_event_log_record(str(3), run_id=run_id))
+            _wait_for(lambda: len(watched) == 3, attempts=20)
+            assert [int(evt.message) for evt in watched] == [1, 2, 3]
+        finally:
+            storage.dispose()
+
     def test_load_from_config(self, hostname):
         url_cfg = f"""
         event_log_storage:
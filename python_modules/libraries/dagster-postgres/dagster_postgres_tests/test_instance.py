@@ -4,10 +4,17 @@
 import pytest
 import sqlalchemy as db
 import yaml
+from dagster._config import process_config
 from dagster._core.instance import DagsterInstance
 from dagster._core.instance.ref import InstanceRef
 from dagster._core.test_utils import instance_for_test
 from dagster._utils.test.postgres_instance import TestPostgresInstance
+from dagster_postgres import (
+    DagsterPostgresStorage,
+    PostgresEventLogStorage,
+    PostgresRunStorage,
+    PostgresScheduleStorage,
+)
 from dagster_postgres.utils import get_conn, get_conn_string
 
 
@@ -291,6 +298,14 @@ def test_conn_str():
     assert parsed.scheme == custom_scheme
 
 
+def test_listen_notify_config_is_event_log_only():
+    config = {"postgres_url": "postgresql://test", "use_listen_notify_event_watcher": True}
+    for storage_class in [PostgresEventLogStorage, DagsterPostgresStorage]:
+        assert process_config(storage_class.config_type(), config).success
+    for storage_class in [PostgresRunStorage, PostgresScheduleStorage]:
+        assert not process_config(storage_class.config_type(), config).success
+
+
 def test_configured_other_schema(hostname):
     with db.create_engine(
         get_conn_string(